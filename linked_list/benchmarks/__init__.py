@@ -0,0 +1,19 @@
+"""
+Linked List Benchmarks
+======================
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.async_queue
+    python3 -m benchmarks.bytes_per_element
+    python3 -m benchmarks.bulk_build
+    python3 -m benchmarks.delete_burst
+    python3 -m benchmarks.node_pool [size] [steps] [max_size]
+    python3 -m benchmarks.positions [size] [operations]
+    python3 -m benchmarks.producer_consumer
+    python3 -m benchmarks.singly [size]
+    python3 -m benchmarks.suite [--sizes ...] [--output results.json] [--compare previous.json]
+    python3 -m benchmarks.teardown [size] [rounds]
+    python3 -m benchmarks.unrolled [size] [operations] [K ...]
+"""
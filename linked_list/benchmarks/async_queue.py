@@ -0,0 +1,76 @@
+"""
+Async Queue
+===========
+
+* Throughput of `linked_list_async.AsyncLinkedQueue` against `asyncio.Queue` ,
+    one producer & one consumer task moving `items` items .
+* `get` : one item per call , `get_many` : batches of `batch` items .
+* bounded runs use `maxsize=1000` , producers wait for room ( backpressure ) .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.async_queue [items] [batch]
+"""
+import sys
+import time
+import asyncio
+from typing import Any, Callable
+
+import linked_list_async
+
+
+async def single(queue: Any, items: int, batch: int) -> None:
+    """Producer `put`s , consumer `get`s one item at a time."""
+    async def produce():
+        for item in range(items):
+            await queue.put(item)
+
+    async def consume():
+        for _ in range(items):
+            await queue.get()
+
+    await asyncio.gather(produce(), consume())
+
+
+async def batched(queue: linked_list_async.AsyncLinkedQueue, items: int, batch: int) -> None:
+    """Producer `put`s , consumer takes batches with `get_many` ."""
+    async def produce():
+        for item in range(items):
+            await queue.put(item)
+
+    async def consume():
+        taken = 0
+        while taken < items:
+            taken += len(await queue.get_many(batch))
+
+    await asyncio.gather(produce(), consume())
+
+
+def rate(new: Callable[[], Any], scenario, items: int, batch: int) -> float:
+    """Items per second for `scenario` on a fresh queue."""
+    async def main():
+        queue = new()
+        start = time.perf_counter()
+        await scenario(queue, items, batch)
+        return items / (time.perf_counter() - start)
+    return asyncio.run(main())
+
+
+def main(items: int, batch: int) -> None:
+    cases = [
+        ('asyncio.Queue : get', lambda: asyncio.Queue(), single),
+        ('AsyncLinkedQueue : get', lambda: linked_list_async.AsyncLinkedQueue(), single),
+        (f'AsyncLinkedQueue : get_many({batch})', lambda: linked_list_async.AsyncLinkedQueue(), batched),
+        ('asyncio.Queue(1000) : get', lambda: asyncio.Queue(1000), single),
+        ('AsyncLinkedQueue(1000) : get', lambda: linked_list_async.AsyncLinkedQueue(1000), single),
+        (f'AsyncLinkedQueue(1000) : get_many({batch})', lambda: linked_list_async.AsyncLinkedQueue(1000), batched),
+    ]
+    print(f"{items} items ( items / second )")
+    for title, new, scenario in cases:
+        print(f"{title:>40} : {rate(new, scenario, items, batch):>12.0f}")
+
+
+if __name__ == '__main__':
+    arguments = [int(arg) for arg in sys.argv[1:]]
+    main(*(arguments + [200_000, 256][len(arguments):]))
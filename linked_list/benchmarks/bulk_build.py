@@ -0,0 +1,59 @@
+"""
+Bulk Build
+==========
+
+* Compares building a `LinkedList` with an `append` per value
+    against the bulk path of `Operations.ll_from` / `extend` .
+* sizes default to 10^5 & 10^6 , pass more ( e.g. 10000000 ) as arguments .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.bulk_build [size ...]
+"""
+import sys
+import time
+from typing import Any, Callable, List
+
+import linked_list
+
+
+def append_loop(values: List[Any]) -> linked_list.LinkedList:
+    """Builds the list the way `ll_from` used to , an `append` per value."""
+    _ll = linked_list.LinkedList()
+    for value in values:
+        _ll.append(value)
+    return _ll
+
+
+def ll_from(values: List[Any]) -> linked_list.LinkedList:
+    """Builds the list in one pass."""
+    return linked_list.Operations.ll_from(values)
+
+
+def extend(values: List[Any]) -> linked_list.LinkedList:
+    """Builds the list with `extend` ."""
+    _ll = linked_list.LinkedList()
+    _ll.extend(values)
+    return _ll
+
+
+def timed(build: Callable[[List[Any]], Any], values: List[Any]) -> float:
+    """Seconds taken by `build(values)` ."""
+    start = time.perf_counter()
+    build(values)
+    return time.perf_counter() - start
+
+
+def main(sizes: List[int]) -> None:
+    print(f"{'size':>10} {'append':>10} {'ll_from':>10} {'extend':>10} {'speedup':>10}")
+    for size in sizes:
+        values = list(range(size))
+        baseline = timed(append_loop, values)
+        bulk = timed(ll_from, values)
+        extended = timed(extend, values)
+        print(f"{size:>10} {baseline:>9.3f}s {bulk:>9.3f}s {extended:>9.3f}s {baseline / bulk:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10 ** 5, 10 ** 6])
@@ -0,0 +1,163 @@
+"""
+Bytes per Element
+=================
+
+* Measures the memory taken per element by the linked list
+    node layouts , before and after moving them to `__slots__` .
+* `before` : replica of the old layout , every node carries a
+    `__dict__` and a freshly created `Metadata` object .
+* `after`  : the current slotted layout of `linked_list` & `linked_list_v2` .
+* `weak_back_links` : a `weakref` per node for it's left link .
+* `linked_list_array` : columns , no object per element .
+* `TypedLinkedList` : the data column is an `array('q')` too , numbers
+    aren't boxed ( the payload ints are read , not kept ) .
+* `linked_list_unrolled` : a node & it's list per `block_size` elements .
+* `linked_list_singly` : one forward link per node , no back-link .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.bytes_per_element [size]
+"""
+import sys
+import itertools
+import dataclasses
+import tracemalloc
+from typing import Any, Callable, List
+
+import linked_list
+import linked_list_v2
+import linked_list_array
+import linked_list_unrolled
+import linked_list_singly
+
+
+class LegacyMemoryBlock:
+    """`MemoryBlock` as it was before `__slots__` ( per-instance `__dict__` )."""
+
+    def __init__(self, data: Any, left=None, right=None):
+        self._data = data
+        self._left = left
+        self._right = right
+
+
+@dataclasses.dataclass(frozen=True)
+class LegacyMetadata:
+    """`Metadata` as it was before `__slots__` ."""
+    created_at: Any = None
+
+
+class LegacyLinkedListNode(LegacyMemoryBlock):
+    """`LinkedListNode` as it was before `__slots__` ."""
+
+    def __init__(self, data, left=None, right=None, metadata: LegacyMetadata = LegacyMetadata()):
+        self._metadata = metadata
+        super().__init__(data, left, right)
+
+
+def legacy_chain(values: List[int]) -> LegacyLinkedListNode:
+    """Links legacy nodes , one `Metadata` per node like the old `append` did."""
+    first = previous = LegacyLinkedListNode(values[0], metadata=LegacyMetadata())
+    for value in itertools.islice(values, 1, None):
+        node = LegacyLinkedListNode(value, left=previous, metadata=LegacyMetadata())
+        previous._right = node
+        previous = node
+    return first
+
+
+def slotted_chain(values: List[int]) -> linked_list.LinkedListNode:
+    """Links slotted nodes , sharing the default `Metadata` ."""
+    first = previous = linked_list.LinkedListNode(values[0])
+    for value in itertools.islice(values, 1, None):
+        node = linked_list.LinkedListNode(value, left=previous)
+        previous._right = node
+        previous = node
+    return first
+
+
+def v1_list(values: List[int]) -> linked_list.LinkedList:
+    ll = linked_list.LinkedList()
+    for value in values:
+        ll.append(value)
+    return ll
+
+
+def weak_list(values: List[int]) -> linked_list.LinkedList:
+    ll = linked_list.LinkedList(weak_back_links=True)
+    for value in values:
+        ll.append(value)
+    return ll
+
+
+def v2_list(values: List[int]) -> linked_list_v2.LinkedList:
+    ll = linked_list_v2.LinkedList()
+    for value in values:
+        ll.append(value)
+    return ll
+
+
+def array_list(values: List[int]) -> linked_list_array.LinkedList:
+    ll = linked_list_array.LinkedList()
+    for value in values:
+        ll.append(value)
+    return ll
+
+
+def typed_list(values: List[int]) -> linked_list_array.TypedLinkedList:
+    ll = linked_list_array.TypedLinkedList('q')
+    for value in values:
+        ll.append(value)
+    return ll
+
+
+def unrolled_list(values: List[int]) -> linked_list_unrolled.LinkedList:
+    ll = linked_list_unrolled.LinkedList()
+    for value in values:
+        ll.append(value)
+    return ll
+
+
+def singly_list(values: List[int]) -> linked_list_singly.SinglyLinkedList:
+    ll = linked_list_singly.SinglyLinkedList()
+    for value in values:
+        ll.append(value)
+    return ll
+
+
+def bytes_per_element(build: Callable[[List[int]], Any], size: int) -> float:
+    """
+    Traces the allocations made while building `size` elements .
+
+    * payload integers are allocated upfront , only the structure is measured .
+    """
+    payload = list(range(size))
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build(payload)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del structure, payload
+    return (after - before) / size
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    cases = [
+        ('nodes : before ( __dict__ )', legacy_chain),
+        ('nodes : after ( __slots__ )', slotted_chain),
+        ('linked_list.LinkedList', v1_list),
+        ('LinkedList(weak_back_links=True)', weak_list),
+        ('linked_list_v2.LinkedList', v2_list),
+        ('linked_list_array.LinkedList', array_list),
+        ('linked_list_array.TypedLinkedList', typed_list),
+        ('linked_list_unrolled.LinkedList', unrolled_list),
+        ('linked_list_singly.SinglyLinkedList', singly_list),
+    ]
+    print(f"Bytes per Element ( size={size} )")
+    print("-" * 53)
+    for title, build in cases:
+        print(f"| {title:<35} | {bytes_per_element(build, size):>10.2f} |")
+    print("-" * 53)
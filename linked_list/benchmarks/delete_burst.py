@@ -0,0 +1,45 @@
+"""
+Delete Burst
+============
+
+* Times a burst of deletes at random positions followed by a single
+    positional read , for the index stores of `linked_list` .
+* `LazyIndexStore` only leaves holes on delete , the read packs them .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.delete_burst [size] [deletes]
+"""
+import sys
+import time
+import random
+
+import linked_list
+
+
+def delete_burst(index_store_cls: str, size: int, deletes: int) -> float:
+    """Seconds taken by `deletes` random deletes & one read in the middle."""
+    rng = random.Random(0)
+    ll = linked_list.LinkedList(index_store_cls=index_store_cls)
+    ll.extend(range(size))
+    positions = [rng.randrange(size - deletes) for _ in range(deletes)]
+    start = time.perf_counter()
+    for index in positions:
+        del ll[index]
+    ll[len(ll) // 2]
+    return time.perf_counter() - start
+
+
+def main(size: int, deletes: int) -> None:
+    print(f"{size} elements , {deletes} deletes + 1 read")
+    for name in linked_list.INDEX_STORES:
+        if name == 'EndsIndexStore':
+            # no index : every delete walks up to N/2 links
+            continue
+        print(f"{name:>20} : {delete_burst(name, size, deletes):.3f}s")
+
+
+if __name__ == '__main__':
+    arguments = [int(arg) for arg in sys.argv[1:]]
+    main(*(arguments + [10 ** 6, 10 ** 4][len(arguments):]))
@@ -0,0 +1,85 @@
+"""
+Node Pool
+=========
+
+* Churn workloads on `linked_list.LinkedList` , each node allocated vs
+    recycled through a `NodePool` ( `node_pool=` ) .
+* `queue` : an `append` & a `popleft` per step , ~ 100 elements buffered .
+* `stack` : an `append` & a `del ll[-1]` per step , over `size` elements .
+* `random` : an `insert` & a `del` at random positions per step , over
+    `size` elements ( `SkipListIndexStore` ) .
+* `allocations` : nodes created ( without a pool , one per insertion ) ,
+    `gen0 GCs` : collections of the youngest generation during the run .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.node_pool [size] [steps] [max_size]
+"""
+import gc
+import sys
+import time
+import random
+from typing import Any, Callable, Dict, Optional
+
+import linked_list
+
+
+def _queue(ll: linked_list.LinkedList, size: int, steps: int) -> None:
+    for step in range(steps):
+        ll.append(step)
+        if step >= 100:
+            ll.popleft()
+
+
+def _stack(ll: linked_list.LinkedList, size: int, steps: int) -> None:
+    ll.extend(range(size))
+    for step in range(steps):
+        ll.append(step)
+        del ll[size]
+
+
+def _random(ll: linked_list.LinkedList, size: int, steps: int) -> None:
+    rng = random.Random(0)
+    ll.extend(range(size))
+    for step in range(steps):
+        ll.insert(rng.randrange(size), step)
+        del ll[rng.randrange(size)]
+
+
+WORKLOADS: Dict[str, Callable[[linked_list.LinkedList, int, int], None]] = {
+    'queue': _queue,
+    'stack': _stack,
+    'random': _random,
+}
+
+
+def measure(workload: Callable[..., None], size: int, steps: int, pool: Optional[linked_list.NodePool]) -> Dict[str, float]:
+    """Seconds & young collections taken by a workload , with or without a pool."""
+    index_store_cls = 'SkipListIndexStore' if workload is _random else 'IndexStore'
+    ll = linked_list.LinkedList(index_store_cls=index_store_cls, node_pool=pool)
+    collections = gc.get_stats()[0]['collections']
+    start = time.perf_counter()
+    workload(ll, size, steps)
+    seconds = time.perf_counter() - start
+    return {'seconds': seconds, 'gen0 GCs': gc.get_stats()[0]['collections'] - collections}
+
+
+def main(size: int, steps: int, max_size: int) -> None:
+    print(f"{steps} steps over {size} elements , NodePool(max_size={max_size})")
+    print(f"| {'':<8} | {'seconds':>17} | {'gen0 GCs':>13} | {'allocations':>17} | {'saved':>6} |")
+    for name, workload in WORKLOADS.items():
+        pool = linked_list.NodePool(max_size)
+        before = measure(workload, size, steps, None)
+        after = measure(workload, size, steps, pool)
+        nodes = pool.allocations + pool.reuses
+        print(
+            f"| {name:<8} | {before['seconds']:>7.4f} -> {after['seconds']:<6.4f} "
+            f"| {before['gen0 GCs']:>5} -> {after['gen0 GCs']:<4} "
+            f"| {nodes:>7} -> {pool.allocations:<7} | {pool.reuses / nodes:>6.1%} |"
+        )
+
+
+if __name__ == '__main__':
+    arguments = [int(arg) for arg in sys.argv[1:]]
+    main(*(arguments + [10 ** 4, 2 * 10 ** 5, 1024][len(arguments):])[:3])
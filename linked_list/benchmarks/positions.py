@@ -0,0 +1,78 @@
+"""
+Positions
+=========
+
+* Times positional work on `linked_list` ( every index store ) against
+    the Fenwick index store of `linked_list_v2` .
+* `insert` / `del` in the middle : O(N) `memmove` for `IndexStore` ,
+    O(log N) for `SkipListIndexStore` & `linked_list_v2` .
+* `position of a node` : `from_start` of `linked_list_v2` is O(log N) ,
+    `linked_list` has no position per node , the links are walked .
+* `ll[i]` : O(1) for `IndexStore` , O(log N) for the others .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.positions [size] [operations]
+"""
+import sys
+import time
+import random
+from typing import Any, Callable, Dict, List
+
+import linked_list
+import linked_list_v2
+
+
+def _timed(run: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def _v1_position(ll: linked_list.LinkedList, node: linked_list.LinkedListNode) -> int:
+    """Position of `node` in a v1 list , walking from the head."""
+    for position, pointer in enumerate(ll):
+        if pointer is node:
+            return position
+    raise ValueError('node is not in the list')
+
+
+def measure(new: Callable[[], Any], position_of: Callable[[Any, Any], int], size: int, operations: int) -> Dict[str, float]:
+    """Seconds taken by `operations` of each kind on a list of `size` elements."""
+    rng = random.Random(0)
+    ll = new()
+    for value in range(size):
+        ll.append(value)
+    indices = [rng.randrange(size // 4, size // 2) for _ in range(operations)]
+    results = {
+        'insert ( middle )': _timed(lambda: [ll.insert(index, index) for index in indices]),
+        'del ( middle )': _timed(lambda: [ll.__delitem__(index) for index in indices]),
+        'prepend': _timed(lambda: [ll.prepend(index) for index in indices]),
+        'll[i]': _timed(lambda: [ll[index] for index in indices]),
+    }
+    nodes = [ll[index] for index in indices[:operations // 10]]
+    results['position of a node ( /10 )'] = _timed(lambda: [position_of(ll, node) for node in nodes])
+    return results
+
+
+def main(size: int, operations: int) -> None:
+    subjects: Dict[str, Callable[[], Any]] = {
+        f'v1 {name}': (lambda name=name: linked_list.LinkedList(index_store_cls=name))
+        for name in ('IndexStore', 'SkipListIndexStore')
+    }
+    subjects['v2 FenwickIndexStore'] = linked_list_v2.LinkedList
+    results: Dict[str, Dict[str, float]] = {}
+    for name, new in subjects.items():
+        position_of = _v1_position if name.startswith('v1') else (lambda ll, node: node.metadata.indexation.from_start)
+        results[name] = measure(new, position_of, size, operations)
+    operation_names: List[str] = list(next(iter(results.values())))
+    print(f"{size} elements , {operations} operations of each kind ( seconds )")
+    print(f"| {'operation':<28} | " + " | ".join(f"{name:>22}" for name in results) + " |")
+    for operation in operation_names:
+        print(f"| {operation:<28} | " + " | ".join(f"{results[name][operation]:>22.4f}" for name in results) + " |")
+
+
+if __name__ == '__main__':
+    arguments = [int(arg) for arg in sys.argv[1:]]
+    main(*(arguments + [10 ** 5, 10 ** 4][len(arguments):]))
@@ -0,0 +1,106 @@
+"""
+Producer / Consumer
+===================
+
+* Multi-threaded throughput of `linked_list_concurrent.ConcurrentLinkedList`
+    ( a lock per end ) against linked list V1 behind a single lock ,
+    `collections.deque` & `queue.SimpleQueue` .
+* every run has `threads` producers appending & as many consumers calling
+    `popleft` , for `items` items in total .
+* on a GIL build , python code runs one thread at a time : the figures show
+    the locking overhead & contention , not parallel speedups .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.producer_consumer [items]
+"""
+import sys
+import time
+import queue
+import threading
+import collections
+from typing import Any, Callable, Tuple
+
+import linked_list
+import linked_list_concurrent
+
+THREADS = [1, 2, 4, 8]
+
+
+class GlobalLockLinkedList:
+    """Linked list V1 with every call behind one lock ( the baseline )."""
+
+    def __init__(self):
+        self._ll = linked_list.LinkedList()
+        self._lock = threading.Lock()
+
+    def append(self, data: Any) -> None:
+        with self._lock:
+            self._ll.append(data)
+
+    def popleft(self) -> Any:
+        with self._lock:
+            return self._ll.popleft()
+
+
+class SimpleQueueAdapter:
+    """`queue.SimpleQueue` under the names used here."""
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self.append = self._queue.put
+
+    def popleft(self) -> Any:
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            raise IndexError('popleft from an empty queue') from None
+
+
+SUBJECTS: Tuple[Tuple[str, Callable[[], Any]], ...] = (
+    ('ConcurrentLinkedList', linked_list_concurrent.ConcurrentLinkedList),
+    ('LinkedList + 1 lock', GlobalLockLinkedList),
+    ('deque', collections.deque),
+    ('queue.SimpleQueue', SimpleQueueAdapter),
+)
+
+
+def throughput(new: Callable[[], Any], threads: int, items: int) -> float:
+    """Items per second moved through a fresh structure by `threads` producer / consumer pairs."""
+    structure = new()
+    share = items // threads
+
+    def produce():
+        append = structure.append
+        for item in range(share):
+            append(item)
+
+    def consume():
+        popleft = structure.popleft
+        taken = 0
+        while taken < share:
+            try:
+                popleft()
+                taken += 1
+            except IndexError:
+                time.sleep(0)
+
+    workers = [threading.Thread(target=target) for _ in range(threads) for target in (produce, consume)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return share * threads / (time.perf_counter() - start)
+
+
+def main(items: int) -> None:
+    print(f"{items} items , producer / consumer pairs : {THREADS}  ( items / second )")
+    print(f"{'':>22}" + "".join(f"{threads:>12}" for threads in THREADS))
+    for name, new in SUBJECTS:
+        print(f"{name:>22}" + "".join(f"{throughput(new, threads, items):>12.0f}" for threads in THREADS))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,90 @@
+"""
+Singly
+======
+
+* Compares the forward only `linked_list_singly.SinglyLinkedList` with the
+    doubly linked `linked_list.LinkedList` , on forward only work :
+    building , scanning , a queue ( `append` + `popleft` ) & the digits
+    of 18 digit numbers ( `problem_solving/palindrome.py` ) , `size` digits in all .
+* `bytes / elem` is traced while building the list , the payload aside .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.singly [size]
+"""
+import sys
+import time
+import collections
+from typing import Any, Callable, Dict, List
+
+import linked_list
+import linked_list_singly
+from benchmarks.bytes_per_element import bytes_per_element
+
+
+def _timed(run: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def _append_all(new: Callable[[], Any]) -> Callable[[List[int]], Any]:
+    """Builds with an `append` per value."""
+    def build(values: List[int]) -> Any:
+        ll = new()
+        for value in values:
+            ll.append(value)
+        return ll
+    return build
+
+
+def _queue(new: Callable[[], Any], values: List[int]) -> None:
+    """Keeps ~ 100 elements buffered : an `append` & a `popleft` per value."""
+    ll = new()
+    for value in values:
+        ll.append(value)
+        if value >= 100:
+            ll.popleft()
+
+
+def _digits(new: Callable[[], Any], number: int) -> List[int]:
+    """Digits in order , pushed in front ( like `palindrome.digits` )."""
+    ll = new()
+    while number:
+        ll.prepend(number % 10)
+        number //= 10
+    return list(ll.values())
+
+
+def measure(new: Callable[[], Any], ll_from: Callable[[List[int]], Any], size: int) -> Dict[str, float]:
+    """Seconds taken by each kind of work , on `size` elements."""
+    values = list(range(size))
+    build = _append_all(new)
+    ll = ll_from(values)
+    numbers = [123456789012345678 + value for value in range(size // 18)]
+    return {
+        'append': _timed(lambda: build(values)),
+        'll_from': _timed(lambda: ll_from(values)),
+        'values': _timed(lambda: collections.deque(ll.values(), maxlen=0)),
+        'iterate': _timed(lambda: collections.deque(iter(ll), maxlen=0)),
+        'queue': _timed(lambda: _queue(new, values)),
+        'digits': _timed(lambda: [_digits(new, number) for number in numbers]),
+        'bytes / elem': bytes_per_element(build, size),
+    }
+
+
+def main(size: int) -> None:
+    results = {
+        'LinkedList': measure(linked_list.LinkedList, linked_list.Operations.ll_from, size),
+        'SinglyLinkedList': measure(linked_list_singly.SinglyLinkedList, linked_list_singly.Operations.ll_from, size),
+    }
+    print(f"{size} elements ( seconds , bytes )")
+    print(f"| {'':<16} | " + " | ".join(f"{name:>16}" for name in results) + " | gain  |")
+    for operation in results['LinkedList']:
+        before, after = results['LinkedList'][operation], results['SinglyLinkedList'][operation]
+        print(f"| {operation:<16} | {before:>16.4f} | {after:>16.4f} | x{before / after:.2f} |")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
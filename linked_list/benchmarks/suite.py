@@ -0,0 +1,260 @@
+"""
+Benchmark Suite
+===============
+
+* Times the common operations of `linked_list.LinkedList` ,
+    `linked_list_v2.LinkedList` , `linked_list_unrolled.LinkedList` ,
+    `list` & `collections.deque` .
+* operations : append , prepend , get ( by index ) , delete ( by index ) ,
+    iterate , values ( the data of every element ) , reverse , compare ( == ) ,
+    concat ( + ) & memory .
+* `append` , `iterate` & `values` go over all the elements , `prepend` / `get` / `delete`
+    do a fixed number of operations on a structure of `size` elements .
+* operations that are O(N) per call ( e.g. `list` prepend ) are
+    done fewer times & skipped past `--linear-cap` elements .
+* results are printed & written as JSON , a previous JSON can be passed
+    with `--compare` to print the ratios against it .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.suite
+    python3 -m benchmarks.suite --sizes 100 1000 10000 100000 1000000 10000000
+    python3 -m benchmarks.suite --output new.json --compare old.json
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import datetime
+import platform
+import collections
+import dataclasses
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+import linked_list
+import linked_list_v2
+import linked_list_unrolled
+from benchmarks.bytes_per_element import bytes_per_element
+
+OPERATIONS = ['append', 'prepend', 'get', 'delete', 'iterate', 'values', 'reverse', 'compare', 'concat', 'memory']
+
+# operations per measurement , for the per-call operations
+CALLS = 1000
+# ... & for the ones that are O(N) per call
+LINEAR_CALLS = 100
+
+
+@dataclasses.dataclass(frozen=True)
+class Subject:
+    """A structure under benchmark , with adapters for each operation."""
+    name: str
+    new: Callable[[], Any]
+    append: Callable[[Any, Any], Any]
+    prepend: Callable[[Any, Any], Any]
+    build: Callable[[List[Any]], Any]
+    # generates the data of every element
+    values: Callable[[Any], Iterable[Any]] = iter
+    # operations that cost O(N) per call
+    linear: FrozenSet[str] = frozenset()
+
+
+def _append_all(new: Callable[[], Any]) -> Callable[[List[Any]], Any]:
+    """Builds with an `append` per value , the way user code does."""
+    def build(values: List[Any]) -> Any:
+        structure = new()
+        for value in values:
+            structure.append(value)
+        return structure
+    return build
+
+
+SUBJECTS: List[Subject] = [
+    Subject(
+        name='linked_list',
+        new=linked_list.LinkedList,
+        append=linked_list.LinkedList.append,
+        prepend=linked_list.LinkedList.prepend,
+        build=_append_all(linked_list.LinkedList),
+        values=linked_list.LinkedList.values,
+        linear=frozenset({'delete'}),
+    ),
+    Subject(
+        name='linked_list_v2',
+        new=linked_list_v2.LinkedList,
+        append=linked_list_v2.LinkedList.append,
+        prepend=linked_list_v2.LinkedList.prepend,
+        build=_append_all(linked_list_v2.LinkedList),
+        values=lambda structure: (node.data for node in structure),
+    ),
+    Subject(
+        name='linked_list_unrolled',
+        new=linked_list_unrolled.LinkedList,
+        append=linked_list_unrolled.LinkedList.append,
+        prepend=linked_list_unrolled.LinkedList.prepend,
+        build=_append_all(linked_list_unrolled.LinkedList),
+        values=linked_list_unrolled.LinkedList.values,
+        # a positional access walks N / block_size blocks
+        linear=frozenset({'get', 'delete'}),
+    ),
+    Subject(
+        name='list',
+        new=list,
+        append=list.append,
+        prepend=lambda structure, value: structure.insert(0, value),
+        build=list,
+        linear=frozenset({'prepend', 'delete'}),
+    ),
+    Subject(
+        name='deque',
+        new=collections.deque,
+        append=collections.deque.append,
+        prepend=collections.deque.appendleft,
+        build=collections.deque,
+        linear=frozenset({'get', 'delete'}),
+    ),
+]
+
+
+def _timed(function: Callable[[], Any]) -> float:
+    """Seconds taken by `function()` ."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def measure(subject: Subject, operation: str, size: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Measures one operation of `subject` at `size` elements.
+
+    Returns:
+        Dict[str, Any]: `calls` , `seconds` & `per_call_ns` ( `bytes_per_element` for memory ) .
+    """
+    values = list(range(size))
+    calls = min(size, LINEAR_CALLS if operation in subject.linear else CALLS)
+    if operation == 'memory':
+        return {'bytes_per_element': bytes_per_element(subject.build, size)}
+    if operation == 'append':
+        structure = subject.new()
+        append = subject.append
+        seconds = _timed(lambda: [append(structure, value) for value in values])
+        calls = size
+    elif operation == 'prepend':
+        structure = subject.build(values)
+        prepend = subject.prepend
+        seconds = _timed(lambda: [prepend(structure, value) for value in range(calls)])
+    elif operation == 'get':
+        structure = subject.build(values)
+        indices = [rng.randrange(size) for _ in range(calls)]
+        seconds = _timed(lambda: [structure[index] for index in indices])
+    elif operation == 'delete':
+        structure = subject.build(values)
+        # every index stays in range while the structure shrinks
+        calls = max(min(calls, size // 2), 1)
+        indices = [rng.randrange(size - calls) for _ in range(calls)]
+        def delete():
+            for index in indices:
+                del structure[index]
+        seconds = _timed(delete)
+    elif operation == 'iterate':
+        structure = subject.build(values)
+        seconds = _timed(lambda: collections.deque(iter(structure), maxlen=0))
+        calls = size
+    elif operation == 'values':
+        structure = subject.build(values)
+        seconds = _timed(lambda: collections.deque(subject.values(structure), maxlen=0))
+        calls = size
+    elif operation == 'reverse':
+        structure = subject.build(values)
+        seconds = _timed(structure.reverse)
+        calls = 1
+    elif operation == 'compare':
+        left, right = subject.build(values), subject.build(values)
+        seconds = _timed(lambda: left == right)
+        calls = 1
+    elif operation == 'concat':
+        left, right = subject.build(values), subject.build(values)
+        seconds = _timed(lambda: left + right)
+        calls = 1
+    else:
+        raise ValueError(f'unknown operation : {operation}')
+    return {'calls': calls, 'seconds': seconds, 'per_call_ns': seconds / calls * 1e9}
+
+
+def run(sizes: List[int], subjects: List[Subject], operations: List[str], linear_cap: int, seed: int = 0) -> Dict[str, Any]:
+    """Runs every operation of every subject , at every size."""
+    results = []
+    for size in sizes:
+        for subject in subjects:
+            for operation in operations:
+                entry = {'subject': subject.name, 'operation': operation, 'size': size}
+                if operation in subject.linear and size > linear_cap:
+                    entry['skipped'] = f'O(N) per call , size above --linear-cap={linear_cap}'
+                else:
+                    entry.update(measure(subject, operation, size, random.Random(seed)))
+                results.append(entry)
+                print(_format(entry), flush=True)
+    return {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'sizes': sizes,
+            'calls': CALLS,
+            'linear_calls': LINEAR_CALLS,
+            'linear_cap': linear_cap,
+        },
+        'results': results,
+    }
+
+
+def _value(entry: Dict[str, Any]) -> Optional[float]:
+    """The figure an entry is compared by ."""
+    return entry.get('bytes_per_element', entry.get('per_call_ns'))
+
+
+def _format(entry: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """A result line , with the ratio against `baseline` if any."""
+    line = f"{entry['subject']:>20} | {entry['operation']:>8} | {entry['size']:>9} | "
+    if 'skipped' in entry:
+        return line + 'skipped'
+    unit = 'B/elem' if 'bytes_per_element' in entry else 'ns/call'
+    line += f"{_value(entry):>14.1f} {unit}"
+    if baseline and _value(baseline):
+        line += f" | x{_value(entry) / _value(baseline):.2f} vs baseline"
+    return line
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    """Prints the results of `current` against a `previous` run."""
+    key = lambda entry: (entry['subject'], entry['operation'], entry['size'])
+    baselines = {key(entry): entry for entry in previous['results'] if 'skipped' not in entry}
+    print(f"\nagainst the run of {previous['meta']['timestamp']} :")
+    for entry in current['results']:
+        print(_format(entry, baselines.get(key(entry))))
+
+
+def main(arguments: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description='linked_list v1 vs v2 vs unrolled vs list vs deque')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5])
+    parser.add_argument('--subjects', nargs='+', default=[subject.name for subject in SUBJECTS])
+    parser.add_argument('--operations', nargs='+', default=OPERATIONS, choices=OPERATIONS)
+    parser.add_argument('--linear-cap', type=int, default=10 ** 5, help='largest size for O(N) per call operations')
+    parser.add_argument('--output', default='benchmark-results.json')
+    parser.add_argument('--compare', help='JSON of a previous run')
+    args = parser.parse_args(arguments)
+
+    subjects = [subject for subject in SUBJECTS if subject.name in args.subjects]
+    report = run(args.sizes, subjects, args.operations, args.linear_cap)
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f"\nwritten to {args.output}")
+    if args.compare:
+        with open(args.compare) as file:
+            compare(report, json.load(file))
+    return report
+
+
+if __name__ == '__main__':
+    main()
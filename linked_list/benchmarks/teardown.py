@@ -0,0 +1,101 @@
+"""
+Teardown
+========
+
+* Drops large `linked_list.LinkedList` s & times the gen-2 collections that
+    follow ( through `gc.callbacks` ) , for three ways of letting go :
+* `drop` : the list is dropped as is , every node is in a reference cycle
+    with it's neighbours , only the cyclic GC frees them .
+* `clear() + drop` : `clear` breaks the links first , the nodes are freed
+    by reference counting .
+* `weak_back_links` : the nodes make no cycle at all , dropping the list
+    frees them .
+* `teardown` is the time taken to let go ( `clear` / `del` ) , `gen-2 pause`
+    the collection ran right after , while other objects are alive .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.teardown [size] [rounds]
+"""
+import gc
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import linked_list
+
+
+class _Gen2Pauses:
+    """Records the duration of every gen-2 collection , while in use."""
+
+    def __init__(self):
+        self.pauses: List[float] = []
+        self._started = 0.0
+
+    def _callback(self, phase: str, info: Dict[str, Any]) -> None:
+        if info['generation'] != 2:
+            return
+        if phase == 'start':
+            self._started = time.perf_counter()
+        else:
+            self.pauses.append(time.perf_counter() - self._started)
+
+    def __enter__(self) -> '_Gen2Pauses':
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        gc.callbacks.remove(self._callback)
+
+
+def _drop(ll: linked_list.LinkedList) -> None:
+    del ll
+
+
+def _clear(ll: linked_list.LinkedList) -> None:
+    ll.clear()
+
+
+CASES: Dict[str, Callable[[], linked_list.LinkedList]] = {
+    'drop': linked_list.LinkedList,
+    'clear() + drop': linked_list.LinkedList,
+    'weak_back_links': lambda: linked_list.LinkedList(weak_back_links=True),
+}
+
+
+def measure(new: Callable[[], linked_list.LinkedList], teardown: Callable[[linked_list.LinkedList], None], size: int, rounds: int) -> Dict[str, float]:
+    """Worst & total teardown / gen-2 pause over `rounds` lists of `size` elements."""
+    teardowns: List[float] = []
+    gc.collect()
+    with _Gen2Pauses() as recorded:
+        for _ in range(rounds):
+            ll = new()
+            ll.extend(range(size))
+            start = time.perf_counter()
+            teardown(ll)
+            del ll
+            teardowns.append(time.perf_counter() - start)
+            gc.collect()
+    return {
+        'teardown max': max(teardowns), 'teardown sum': sum(teardowns),
+        'gen-2 pause max': max(recorded.pauses), 'gen-2 pause sum': sum(recorded.pauses),
+    }
+
+
+def main(size: int, rounds: int) -> None:
+    # long lived objects , scanned by every gen-2 collection whatever the case
+    ballast = [[index] for index in range(10 ** 5)]
+    results = {
+        name: measure(new, _clear if name.startswith('clear') else _drop, size, rounds)
+        for name, new in CASES.items()
+    }
+    print(f"{rounds} lists of {size} elements , {len(ballast)} objects alive ( seconds )")
+    print(f"| {'':<16} | " + " | ".join(f"{name:>15}" for name in results) + " |")
+    for metric in results['drop']:
+        print(f"| {metric:<16} | " + " | ".join(f"{results[name][metric]:>15.4f}" for name in results) + " |")
+
+
+if __name__ == '__main__':
+    arguments = [int(arg) for arg in sys.argv[1:]]
+    main(*(arguments + [10 ** 6, 5][len(arguments):])[:2])
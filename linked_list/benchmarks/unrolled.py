@@ -0,0 +1,77 @@
+"""
+Unrolled
+========
+
+* Times the unrolled engine ( `linked_list_unrolled` ) for a range of
+    block sizes K , against the node per element `linked_list.LinkedList` .
+* `values` & `iterate` scan the whole list , `append` / `prepend` / `popleft`
+    work at the ends , `ll[i]` / `insert` / `del` at random positions .
+* `bytes / elem` is traced while building the list , the payload aside .
+
+How to Run :
+============
+    cd linked_list
+    python3 -m benchmarks.unrolled [size] [operations] [K ...]
+"""
+import sys
+import time
+import random
+import collections
+from typing import Any, Callable, Dict, List
+
+import linked_list
+from benchmarks.bytes_per_element import bytes_per_element
+
+BLOCK_SIZES = [4, 8, 16, 32, 64, 128, 256]
+
+
+def _timed(run: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def _build(new: Callable[[], Any]) -> Callable[[List[int]], Any]:
+    """Builds with an `append` per value."""
+    def build(values: List[int]) -> Any:
+        ll = new()
+        for value in values:
+            ll.append(value)
+        return ll
+    return build
+
+
+def measure(new: Callable[[], Any], size: int, operations: int) -> Dict[str, float]:
+    """Seconds taken by each kind of work , on a list of `size` elements."""
+    rng = random.Random(0)
+    values = list(range(size))
+    build = _build(new)
+    results = {'append': _timed(lambda: build(values))}
+    ll = build(values)
+    indices = [rng.randrange(size) for _ in range(operations)]
+    results['values'] = _timed(lambda: collections.deque(ll.values(), maxlen=0))
+    results['iterate'] = _timed(lambda: collections.deque(iter(ll), maxlen=0))
+    results['ll[i]'] = _timed(lambda: [ll[index] for index in indices])
+    results['insert'] = _timed(lambda: [ll.insert(index, index) for index in indices])
+    results['del'] = _timed(lambda: [ll.__delitem__(index) for index in indices])
+    results['prepend'] = _timed(lambda: [ll.prepend(index) for index in indices])
+    results['popleft'] = _timed(lambda: [ll.popleft() for _ in indices])
+    results['bytes / elem'] = bytes_per_element(build, size)
+    return results
+
+
+def main(size: int, operations: int, block_sizes: List[int]) -> None:
+    subjects: Dict[str, Callable[[], Any]] = {'v1 ( K=1 )': linked_list.LinkedList}
+    for block_size in block_sizes:
+        subjects[f'K={block_size}'] = lambda block_size=block_size: linked_list.LinkedList(block_size=block_size)
+    results = {name: measure(new, size, operations) for name, new in subjects.items()}
+    print(f"{size} elements , {operations} random positions ( seconds , bytes )")
+    print(f"| {'':<12} | " + " | ".join(f"{name:>10}" for name in results) + " |")
+    for operation in next(iter(results.values())):
+        print(f"| {operation:<12} | " + " | ".join(f"{results[name][operation]:>10.4f}" for name in results) + " |")
+
+
+if __name__ == '__main__':
+    arguments = [int(arg) for arg in sys.argv[1:]]
+    size, operations = (arguments + [10 ** 5, 10 ** 4][len(arguments):])[:2]
+    main(size, operations, arguments[2:] or BLOCK_SIZES)
@@ -23,15 +23,35 @@ Notes :
 * Hence a link between two elements is double .
 * we can traverse from [1st elem] to [nth elem] as well as from [nth elem] to [1st elem] .
 """
+import gc
 import sys
-import inspect
+import array
+import bisect
+import random
+import contextlib
+import operator
+import itertools
 import dataclasses
 import datetime
-from typing import Any, Optional, TypeVar, Dict, Union, Iterable, Generator, Tuple, Type, Self
+import weakref
+from typing import Any, Callable, Optional, TypeVar, Dict, List, Set, Union, Iterable, Generator, Tuple, Type, Self
 from collections.abc import Iterator
 
 T = TypeVar('T')
 
+@contextlib.contextmanager
+def _gc_paused():
+    """
+    Pauses the cyclic garbage collector for the duration of the block.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
 class MemoryBlock:
     """
     Represents a memory block in a doubly linked list.
@@ -40,7 +60,12 @@ class MemoryBlock:
         data (Any): The data stored in the memory block.
         left (Optional[MemoryBlock]): The left (previous) memory block.
         right (Optional[MemoryBlock]): The right (next) memory block.
+
+    Notes:
+        * `__slots__` keeps the block free of a per-instance `__dict__` ,
+            every element of a list is one of these , so it adds up .
     """
+    __slots__ = ('_data', '_left', '_right')
 
     def __init__(self, data: Any, left: Optional['MemoryBlock'] = None, right: Optional['MemoryBlock'] = None):
         """
@@ -96,10 +121,14 @@ class MemoryBlock:
         """Returns a detailed string representation of the memory block."""
         return f"MemoryBlock({self._data}, left={self._left}, right={self._right})"
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Metadata:
     """
     Metadata for a LinkedList Node.
+
+    Notes:
+        * it is immutable , hence a single instance is shared by all
+            the nodes created with the default metadata .
     """
     created_at: Optional[str] = datetime.datetime.now()
 
@@ -111,6 +140,7 @@ class LinkedListNode(MemoryBlock):
     Attributes:
         metadata (Metadata): Metadata associated with the node.
     """
+    __slots__ = ('_metadata',)
 
     def __init__(self, data, left=None, right=None, metadata: Metadata = Metadata()):
         """
@@ -131,6 +161,29 @@ class LinkedListNode(MemoryBlock):
         return self._metadata
 
 
+class WeakBackLinkNode(LinkedListNode):
+    """
+    A LinkedListNode whose left link is weak.
+
+    Notes:
+        * the right links alone hold the nodes , so the nodes of a list make
+            no reference cycle : a dropped list is freed by reference counting
+            at once , the cyclic GC neither waits for it nor pauses on it .
+        * a node kept after it's list is dropped may lose it's left neighbour .
+        * costs a `weakref` per node & a call per left link read .
+    """
+    __slots__ = ('_back', '__weakref__')
+
+    @property
+    def _left(self) -> Optional[LinkedListNode]:
+        back = self._back
+        return None if back is None else back()
+
+    @_left.setter
+    def _left(self, node: Optional[LinkedListNode]) -> None:
+        self._back = None if node is None else weakref.ref(node)
+
+
 class LRIterator(Iterator):
     """
     Iterator for traversing a linked list from left to right.
@@ -157,7 +210,7 @@ class LRIterator(Iterator):
         """
         if self._pointer:
             value = self._pointer
-            self._pointer = self._pointer.right
+            self._pointer = self._pointer._right
             return value
         else:
             raise StopIteration
@@ -189,227 +242,1921 @@ class RLIterator(Iterator):
         """
         if self._pointer:
             value = self._pointer
-            self._pointer = self._pointer.left
+            self._pointer = self._pointer._left
             return value
         else:
             raise StopIteration
 
-class LinkedList:
+class BaseIndexStore:
     """
-    Doubly Linked List Implementation
+    Positional index of a linked list : `index -> node` .
 
-    -----
-    Usage
-    -----
+    * reads like a `dict` : `len` , `[]` , `in` , `keys` , `values` , `items` , `get` .
+    * subclasses implement the storage .
+    """
+    __slots__ = ()
 
-    # Prepare
-    >>> ll = LinkedList()
-    >>> ll.append(3)
-    >>> ll.prepend(4)
-    >>> ll.append(8)
-    >>> print(ll)
-    [4, 3, 8]
+    def append(self, node: LinkedListNode) -> None:
+        raise NotImplementedError('...')
 
-    # Fetch Node data
-    >>> value=ll[1]
-    >>> value.data
-    3
-    
-    # Prepend Node
-    >>> ll.prepend(6)
-    >>> print(ll)
-    [6, 4, 3, 8]
+    def prepend(self, node: LinkedListNode) -> None:
+        raise NotImplementedError('...')
 
-    # Get Node by Index
-    >>> value=ll[2]
-    >>> value.data
-    3
+    def extend(self, nodes: Iterable[LinkedListNode]) -> None:
+        raise NotImplementedError('...')
 
-    # Index Map
-    >>> ll.index_store
-    {0: MemoryBlock(6, left=None, right=4), 1: MemoryBlock(4, left=6, right=3), 2: MemoryBlock(3, left=4, right=8), 3: MemoryBlock(8, left=3, right=None)}
-    
-    # Length
-    >>> len(ll)
-    4
+    def insert(self, index: int, node: LinkedListNode) -> None:
+        raise NotImplementedError('...')
 
-    # Iteration
-    >>> [v.data for v in ll]
-    [6, 4, 3, 8]
+    def reverse(self) -> None:
+        raise NotImplementedError('...')
 
-    # Reverse Iteration
-    # # ( It Sets the order of linkedlist in reverse )
-    >>> ll.root_iterator_cls=RLIterator
-    >>> [v.data for v in ll]
-    [8, 3, 4, 6]
+    def clear(self) -> None:
+        raise NotImplementedError('...')
 
-    # Reverse Iteration : Method 2
-    # # - using Operations.reversed(...) function
-    >>> ll.root_iterator_cls=LRIterator
-    >>> print([v.data for v in Operations.reversed(ll)])
-    [8, 3, 4, 6]
+    def values(self) -> Iterator[LinkedListNode]:
+        raise NotImplementedError('...')
+
+    def pop(self, index: int) -> LinkedListNode:
+        """Removes the entry at `index` & returns it's node."""
+        node = self[index]
+        del self[index]
+        return node
+
+    def popleft(self) -> LinkedListNode:
+        """Removes the first entry & returns it's node."""
+        return self.pop(0)
+
+    def discard(self, node: LinkedListNode) -> bool:
+        """
+        Drops the entry of `node` , before it's unlinked from the list.
+
+        Returns:
+            bool: False if the store can't without a rebuild ( the default ).
+        """
+        return False
+
+    def __contains__(self, index: int) -> bool:
+        return isinstance(index, int) and 0 <= index < len(self)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self)))
+
+    def keys(self) -> range:
+        return range(len(self))
+
+    def items(self) -> Iterator[Tuple[int, LinkedListNode]]:
+        return zip(itertools.count(), self.values())
+
+    def get(self, index: int, default: Any = None) -> Any:
+        return self[index] if index in self else default
+
+    def __repr__(self) -> str:
+        return f"{{{', '.join(f'{index}: {node!r}' for index, node in self.items())}}}"
+
+
+class IndexStore(BaseIndexStore):
+    """
+    Positional index of a linked list , with O(1) ends : `index -> node` .
+
+    Layout :
+    --------
+        _slots : [ None, None, None, node_0, node_1, ..., node_n ]
+                                      \
+                                    _offset
+
+    Notes :
+    -------
+    * entries live in a single python list , with free room kept in
+        front of the first entry ( `_offset` ) .
+    * `append`  : takes a slot at the end of the list .
+    * `prepend` : takes a slot out of the front room , the room is doubled
+        whenever it runs out , hence no entry is ever shifted one by one .
+    * lookup is `_slots[_offset + index]` .
+    * it costs a pointer per entry , where a `dict` of int -> node costs a
+        hash table entry plus an int object per entry .
+    * subclasses may back it with another sequence type by overriding
+        `_allocate` and `_vacant` ( the filler of the front room ) .
+    """
+    __slots__ = ('_slots', '_offset')
+
+    # filler for the unused front room
+    _vacant: Any = None
+
+    @staticmethod
+    def _allocate(entries: Iterable) -> List[Optional[LinkedListNode]]:
+        """Creates the backing sequence out of `entries` ."""
+        return list(entries)
+
+    def __init__(self, nodes: Iterable[LinkedListNode] = ()):
+        """
+        Initializes an IndexStore instance.
+
+        Args:
+            nodes (Iterable[LinkedListNode]): nodes in positional order.
+        """
+        self._slots: List[Optional[LinkedListNode]] = self._allocate(nodes)
+        self._offset: int = 0
+
+    def append(self, node: LinkedListNode) -> None:
+        """
+        Indexes a node after the last entry.
+
+        Complexity:
+            O(1) amortized
+        """
+        self._slots.append(node)
+
+    def prepend(self, node: LinkedListNode) -> None:
+        """
+        Indexes a node before the first entry.
+
+        Complexity:
+            O(1) amortized
+        """
+        if not self._offset:
+            room = max(len(self._slots), 8)
+            self._slots[:0] = self._allocate(itertools.repeat(self._vacant, room))
+            self._offset = room
+        self._offset -= 1
+        self._slots[self._offset] = node
+
+    def extend(self, nodes: Iterable[LinkedListNode]) -> None:
+        """
+        Indexes `nodes` after the last entry , in one step.
+
+        Complexity:
+            O(K)
+        """
+        self._slots.extend(nodes)
+
+    def insert(self, index: int, node: LinkedListNode) -> None:
+        """
+        Indexes a node at `index` , shifting the later entries.
+
+        Complexity:
+            O(N) ( a single `memmove` of the list )
+        """
+        self._slots.insert(self._offset + index, node)
+
+    def reverse(self) -> None:
+        """
+        Reverses the positional order of the entries.
+
+        Complexity:
+            O(N)
+        """
+        del self._slots[:self._offset]
+        self._offset = 0
+        self._slots.reverse()
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+        self._slots = self._allocate(())
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return len(self._slots) - self._offset
+
+    def __getitem__(self, index: int) -> LinkedListNode:
+        if 0 <= index < len(self._slots) - self._offset:
+            return self._slots[self._offset + index]
+        raise KeyError(index)
+
+    def __setitem__(self, index: int, node: LinkedListNode) -> None:
+        if not 0 <= index < len(self):
+            raise KeyError(index)
+        self._slots[self._offset + index] = node
+
+    def __delitem__(self, index: int) -> None:
+        """
+        Removes the entry at `index` , shifting the shorter side.
+
+        Complexity:
+            O(min(index, N-index))
+        """
+        if not 0 <= index < len(self):
+            raise KeyError(index)
+        offset = self._offset
+        if index < len(self) // 2:
+            # shift the entries before `index` one slot to the right
+            self._slots[offset+1:offset+index+1] = self._slots[offset:offset+index]
+            self._slots[offset] = self._vacant
+            self._offset += 1
+            self._trim()
+        else:
+            del self._slots[offset + index]
+
+    def popleft(self) -> LinkedListNode:
+        """
+        Removes the first entry & returns it's node.
+
+        Complexity:
+            O(1) amortized
+        """
+        if not len(self):
+            raise KeyError(0)
+        node = self._slots[self._offset]
+        self._slots[self._offset] = self._vacant
+        self._offset += 1
+        self._trim()
+        return node
+
+    def _trim(self) -> None:
+        """
+        Gives back the front room once it outgrows the entries.
+
+        * a queue ( `append` + `popleft` ) would grow it without a bound .
+        * the room dropped is more than the entries moved , hence O(1) amortized .
+        """
+        if self._offset > 64 and self._offset > len(self._slots) - self._offset:
+            del self._slots[:self._offset]
+            self._offset = 0
+
+    def values(self) -> Iterator[LinkedListNode]:
+        return itertools.islice(self._slots, self._offset, None)
+
+    def __sizeof__(self) -> int:
+        return super().__sizeof__() + sys.getsizeof(self._slots)
+
+
+class LazyIndexStore(IndexStore):
+    """
+    Positional index of a linked list , where deletes only leave a hole.
+
+    Layout :
+    --------
+        _slots : [ None, node_0, None, node_1, node_2, None, None, node_3 ]
+                          \       |                   |     |
+                        _offset  `---------- _holes ---------'
+
+    Notes :
+    -------
+    * `del store[i]` blanks the slot & records it in `_holes` ( sorted ) ,
+        the later entries are not shifted .
+    * a position is translated into a slot with a binary search over the
+        holes : hole `m` has `_holes[m] - _offset - m` entries before it .
+    * a lookup packs the holes in front of the slot it reads ( and at least
+        as many entries beyond them ) into a single run , so the index is
+        rebuilt only over the range the reads actually reach .
+    * hence a burst of K deletes followed by a read costs O(K log K + N) ,
+        where shifting on every delete costs O(N * K) .
+    * holes at either end are dropped right away .
+    """
+    __slots__ = ('_holes',)
+
+    def __init__(self, nodes: Iterable[LinkedListNode] = ()):
+        """
+        Initializes a LazyIndexStore instance.
+
+        Args:
+            nodes (Iterable[LinkedListNode]): nodes in positional order.
+        """
+        super().__init__(nodes)
+        self._holes: List[int] = []
+
+    def _slot(self, index: int) -> int:
+        """
+        Translates a position into it's slot in `_slots` .
+
+        Complexity:
+            O(log K) , for K holes
+        """
+        holes, offset = self._holes, self._offset
+        before = bisect.bisect_right(range(len(holes)), index, key=lambda m: holes[m] - offset - m)
+        return offset + index + before
+
+    def _pack(self, stop: int) -> None:
+        """
+        Moves the holes before slot `stop` into a single run , ending at `stop` .
+
+        Complexity:
+            O(stop - first hole)
+        """
+        holes = self._holes
+        start = holes[0]
+        count = bisect.bisect_left(holes, stop)
+        if stop == len(self._slots):
+            # the run would end the list : drop it instead
+            self._slots[start:] = [node for node in itertools.islice(self._slots, start, None) if node is not self._vacant]
+            self._holes = []
+            return
+        self._slots[start:stop] = [node for node in itertools.islice(self._slots, start, stop) if node is not self._vacant] + [self._vacant] * count
+        holes[:count] = range(stop - count, stop)
+
+    def prepend(self, node: LinkedListNode) -> None:
+        """
+        Indexes a node before the first entry.
+
+        Complexity:
+            O(1) amortized
+        """
+        size = len(self._slots)
+        super().prepend(node)
+        room = len(self._slots) - size
+        if room and self._holes:
+            # front room was added , the holes moved along
+            self._holes = [hole + room for hole in self._holes]
+
+    def insert(self, index: int, node: LinkedListNode) -> None:
+        """
+        Indexes a node at `index` , shifting the later entries.
+
+        Complexity:
+            O(N)
+        """
+        self.compact()
+        super().insert(index, node)
+
+    def reverse(self) -> None:
+        """
+        Reverses the positional order of the entries.
+
+        Complexity:
+            O(N)
+        """
+        self.compact()
+        super().reverse()
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+        super().clear()
+        self._holes = []
+
+    def compact(self) -> None:
+        """
+        Drops all the holes.
+
+        Complexity:
+            O(N)
+        """
+        if self._holes:
+            self._pack(len(self._slots))
+
+    def __len__(self) -> int:
+        return len(self._slots) - self._offset - len(self._holes)
+
+    def __getitem__(self, index: int) -> LinkedListNode:
+        if not 0 <= index < len(self):
+            raise KeyError(index)
+        if not self._holes:
+            return self._slots[self._offset + index]
+        slot = self._slot(index)
+        start = self._holes[0]
+        if start < slot:
+            # pack the holes in front of the slot , along with at least as
+            # many entries past it , so repeated reads don't re-pack them
+            count = bisect.bisect_left(self._holes, slot)
+            self._pack(min(max(slot + 1, start + 2 * count), len(self._slots)))
+            slot = self._slot(index)
+        return self._slots[slot]
+
+    def __setitem__(self, index: int, node: LinkedListNode) -> None:
+        if not 0 <= index < len(self):
+            raise KeyError(index)
+        self._slots[self._slot(index)] = node
+
+    def __delitem__(self, index: int) -> None:
+        """
+        Removes the entry at `index` , leaving a hole.
+
+        Complexity:
+            O(log K) , plus a `memmove` of the holes
+        """
+        self.pop(index)
+
+    def pop(self, index: int) -> LinkedListNode:
+        """
+        Removes the entry at `index` & returns it's node , without packing.
+
+        Complexity:
+            O(log K) , plus a `memmove` of the holes
+        """
+        if not 0 <= index < len(self):
+            raise KeyError(index)
+        slot = self._slot(index)
+        holes = self._holes
+        node = self._slots[slot]
+        self._slots[slot] = self._vacant
+        if index == 0:
+            # every slot before it is a hole : move the offset past them
+            del holes[:bisect.bisect_left(holes, slot)]
+            self._offset = slot + 1
+        elif slot == len(self._slots) - 1:
+            del self._slots[slot]
+            while holes and holes[-1] == len(self._slots) - 1:
+                holes.pop()
+                self._slots.pop()
+        else:
+            bisect.insort(holes, slot)
+        return node
+
+    def popleft(self) -> LinkedListNode:
+        return self.pop(0)
+
+    def values(self) -> Iterator[LinkedListNode]:
+        return (node for node in itertools.islice(self._slots, self._offset, None) if node is not self._vacant)
+
+    def __sizeof__(self) -> int:
+        return super().__sizeof__() + sys.getsizeof(self._holes)
+
+
+class SkipListIndexStore(BaseIndexStore):
+    """
+    Positional index of a linked list , as an indexable skip list .
+
+    Layout :
+    --------
+        level 2 : head -----------------------> [c] ---------------> None
+        level 1 : head --------> [a] ---------> [c] --------> [e] -> None
+        level 0 : head -> [x] -> [a] -> [b] -> [c] -> [d] -> [e] -> None
+
+    Notes :
+    -------
+    * every link also keeps it's width , i.e the number of positions it
+        skips , which turns a skip list search into a positional lookup .
+    * an entry reaches level `k` with probability `1/4^k` .
+    * lookup , insert & delete at any position : O(log N) expected ,
+        where `IndexStore` has to shift the later entries on insert / delete .
+    * it costs more memory per entry than `IndexStore` , use it for lists
+        edited in the middle .
+    """
+    __slots__ = ('_head', '_size', '_level')
+
+    MAX_LEVEL = 32
+
+    def __init__(self, nodes: Iterable[LinkedListNode] = ()):
+        """
+        Initializes a SkipListIndexStore instance.
+
+        Args:
+            nodes (Iterable[LinkedListNode]): nodes in positional order.
+        """
+        self._head: _SkipEntry = _SkipEntry(None, self.MAX_LEVEL)
+        self._size: int = 0
+        # number of levels in use
+        self._level: int = 1
+        self.extend(nodes)
+
+    def _height(self) -> int:
+        """Draws the number of levels of a new entry."""
+        height = 1
+        while height < self.MAX_LEVEL and random.random() < 0.25:
+            height += 1
+        return height
+
+    def _search(self, index: int) -> Tuple[List['_SkipEntry'], List[int]]:
+        """
+        Finds the entries preceding position `index` on every level in use.
+
+        * the head sits at position `0` , the entry for `index` at `index+1` .
+
+        Returns:
+            Tuple[List[_SkipEntry], List[int]]: predecessors & their positions , per level .
+        """
+        chain = [self._head] * self._level
+        positions = [0] * self._level
+        entry, position = self._head, 0
+        for level in range(self._level - 1, -1, -1):
+            link = entry.links[level]
+            while link is not None and position + entry.widths[level] <= index:
+                position += entry.widths[level]
+                entry, link = link, link.links[level]
+            chain[level] = entry
+            positions[level] = position
+        return chain, positions
+
+    def _entry(self, index: int) -> '_SkipEntry':
+        """
+        Finds the entry at `index` .
+
+        Complexity:
+            O(log N) expected
+        """
+        if not 0 <= index < self._size:
+            raise KeyError(index)
+        entry, position = self._head, 0
+        for level in range(self._level - 1, -1, -1):
+            link = entry.links[level]
+            while link is not None and position + entry.widths[level] <= index:
+                position += entry.widths[level]
+                entry, link = link, link.links[level]
+        return entry.links[0]
+
+    def append(self, node: LinkedListNode) -> None:
+        """
+        Indexes a node after the last entry.
+
+        Complexity:
+            O(log N) expected
+        """
+        self.insert(self._size, node)
+
+    def prepend(self, node: LinkedListNode) -> None:
+        """
+        Indexes a node before the first entry.
+
+        Complexity:
+            O(log N) expected
+        """
+        self.insert(0, node)
+
+    def extend(self, nodes: Iterable[LinkedListNode]) -> None:
+        """
+        Indexes `nodes` after the last entry.
+
+        * the predecessors of the end position are searched once ,
+            every new entry then becomes the predecessor on it's levels .
+
+        Complexity:
+            O(log N + K) expected
+        """
+        chain, positions = self._search(self._size)
+        chain += [self._head] * (self.MAX_LEVEL - self._level)
+        positions += [0] * (self.MAX_LEVEL - self._level)
+        for node in nodes:
+            height = self._height()
+            entry = _SkipEntry(node, height)
+            self._size += 1
+            for level in range(height):
+                chain[level].links[level] = entry
+                chain[level].widths[level] = self._size - positions[level]
+                chain[level] = entry
+                positions[level] = self._size
+            if height > self._level:
+                self._level = height
+
+    def insert(self, index: int, node: LinkedListNode) -> None:
+        """
+        Indexes a node at `index` , the later entries move one position right.
+
+        Complexity:
+            O(log N) expected
+        """
+        if not 0 <= index <= self._size:
+            raise KeyError(index)
+        height = self._height()
+        if height > self._level:
+            self._level = height
+        chain, positions = self._search(index)
+        entry = _SkipEntry(node, height)
+        position = index + 1
+        for level in range(height):
+            previous = chain[level]
+            link = previous.links[level]
+            entry.links[level] = link
+            if link is not None:
+                # the old link now starts one position further , from the new entry
+                entry.widths[level] = positions[level] + previous.widths[level] + 1 - position
+            previous.links[level] = entry
+            previous.widths[level] = position - positions[level]
+        for level in range(height, self._level):
+            if chain[level].links[level] is not None:
+                chain[level].widths[level] += 1
+        self._size += 1
+
+    def reverse(self) -> None:
+        """
+        Reverses the positional order of the entries.
+
+        Complexity:
+            O(N)
+        """
+        nodes = list(self.values())
+        nodes.reverse()
+        self.clear()
+        self.extend(nodes)
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+        self._head = _SkipEntry(None, self.MAX_LEVEL)
+        self._size = 0
+        self._level = 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> LinkedListNode:
+        return self._entry(index).node
+
+    def __setitem__(self, index: int, node: LinkedListNode) -> None:
+        self._entry(index).node = node
+
+    def __delitem__(self, index: int) -> None:
+        """
+        Removes the entry at `index` , the later entries move one position left.
+
+        Complexity:
+            O(log N) expected
+        """
+        if not 0 <= index < self._size:
+            raise KeyError(index)
+        chain, _ = self._search(index)
+        target = chain[0].links[0]
+        for level in range(self._level):
+            previous = chain[level]
+            if previous.links[level] is target:
+                previous.links[level] = target.links[level]
+                if target.links[level] is not None:
+                    previous.widths[level] += target.widths[level] - 1
+            elif previous.links[level] is not None:
+                previous.widths[level] -= 1
+        while self._level > 1 and self._head.links[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+
+    def values(self) -> Iterator[LinkedListNode]:
+        entry = self._head.links[0]
+        while entry is not None:
+            yield entry.node
+            entry = entry.links[0]
+
+    def __sizeof__(self) -> int:
+        size = super().__sizeof__()
+        entry = self._head
+        while entry is not None:
+            size += sys.getsizeof(entry) + sys.getsizeof(entry.links) + sys.getsizeof(entry.widths)
+            entry = entry.links[0]
+        return size
+
+
+class _SkipEntry:
+    """
+    An entry of `SkipListIndexStore` .
+
+    Attributes:
+        node (LinkedListNode): The indexed node.
+        links (List[Optional[_SkipEntry]]): next entry , per level.
+        widths (List[int]): positions skipped by each link.
+    """
+    __slots__ = ('node', 'links', 'widths')
+
+    def __init__(self, node: Optional[LinkedListNode], height: int):
+        self.node = node
+        self.links: List[Optional['_SkipEntry']] = [None] * height
+        self.widths: List[int] = [1] * height
+
+
+def _walk(first: LinkedListNode, last: LinkedListNode, size: int, index: int) -> LinkedListNode:
+    """
+    Walks the links to `index` , from whichever end is closer.
+
+    Raises:
+        KeyError: If `index` is out of range.
+
+    Complexity:
+        O(min(index, N-index))
+    """
+    if not 0 <= index < size:
+        raise KeyError(index)
+    if index <= (size - 1) // 2:
+        _pointer = first
+        for _ in range(index):
+            _pointer = _pointer._right
+    else:
+        _pointer = last
+        for _ in range(size - 1 - index):
+            _pointer = _pointer._left
+    return _pointer
+
+
+class EndsIndexStore(BaseIndexStore):
+    """
+    No positional index : only the ends of the list & it's size are kept.
+
+    Layout :
+    --------
+        _first --> [a] <=> [b] <=> [c] <=> [d] <-- _last        _size : 4
+
+    Notes :
+    -------
+    * a lookup walks the links from whichever end is closer , hence it
+        takes at most N/2 steps .
+    * nothing is kept per element , edits anywhere are O(1) once the
+        position is reached .
+    * `discard` drops a node unlinked by `LinkedList.delete` right away ,
+        the store is never rebuilt .
+    """
+    __slots__ = ('_first', '_last', '_size')
+
+    def __init__(self, nodes: Iterable[LinkedListNode] = ()):
+        """
+        Initializes an EndsIndexStore instance.
+
+        Args:
+            nodes (Iterable[LinkedListNode]): nodes in positional order ( already linked ).
+        """
+        self.clear()
+        self.extend(nodes)
+
+    def append(self, node: LinkedListNode) -> None:
+        if not self._size:
+            self._first = node
+        self._last = node
+        self._size += 1
+
+    def prepend(self, node: LinkedListNode) -> None:
+        if not self._size:
+            self._last = node
+        self._first = node
+        self._size += 1
+
+    def extend(self, nodes: Iterable[LinkedListNode]) -> None:
+        for node in nodes:
+            self.append(node)
+
+    def insert(self, index: int, node: LinkedListNode) -> None:
+        if index <= 0:
+            self.prepend(node)
+        elif index >= self._size:
+            self.append(node)
+        else:
+            self._size += 1
+
+    def reverse(self) -> None:
+        self._first, self._last = self._last, self._first
+
+    def clear(self) -> None:
+        self._first: Optional[LinkedListNode] = None
+        self._last: Optional[LinkedListNode] = None
+        self._size = 0
+
+    def discard(self, node: LinkedListNode) -> bool:
+        """
+        Drops the entry of `node` , before it's unlinked from the list.
+
+        Complexity:
+            O(1)
+        """
+        if self._size == 1:
+            self.clear()
+            return True
+        if node is self._first:
+            self._first = node._right
+        if node is self._last:
+            self._last = node._left
+        self._size -= 1
+        return True
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> LinkedListNode:
+        return _walk(self._first, self._last, self._size, index)
+
+    def __delitem__(self, index: int) -> None:
+        """
+        Removes the entry at `index` , before it's node is unlinked.
+
+        Complexity:
+            O(1)
+        """
+        if not 0 <= index < self._size:
+            raise KeyError(index)
+        if 0 < index < self._size - 1:
+            self._size -= 1
+        else:
+            self.discard(self._first if index == 0 else self._last)
+
+    def values(self) -> Iterator[LinkedListNode]:
+        _pointer = self._first
+        for _ in range(self._size):
+            yield _pointer
+            _pointer = _pointer._right
+
+
+class ValueIndex:
+    """
+    Index of a linked list by value : `data -> nodes holding it` .
+
+    Layout :
+    --------
+        _entries : { 'a': node , 'b': { node: None , node: None } , ... }
+
+    Notes :
+    -------
+    * a value held once maps to it's node , a repeated value to a `dict`
+        of it's nodes ( used as an ordered set ) , so unique values don't
+        pay for a container .
+    * nodes hash by identity , removing a node is O(1) whatever the count .
+    * the data must be hashable , like the keys of a `dict` .
+    * equality is the `dict` one , as for `list.count` : `1 == 1.0 == True` .
+    """
+    __slots__ = ('_entries',)
+
+    def __init__(self, nodes: Iterable[LinkedListNode] = ()):
+        """
+        Initializes a ValueIndex instance.
+
+        Args:
+            nodes (Iterable[LinkedListNode]): nodes to index.
+        """
+        self._entries: Dict[Any, Union[LinkedListNode, Dict[LinkedListNode, None]]] = {}
+        self.extend(nodes)
+
+    def add(self, node: LinkedListNode) -> None:
+        """
+        Indexes a node under it's data.
+
+        Raises:
+            TypeError: If the data is unhashable.
+
+        Complexity:
+            O(1)
+        """
+        entry = self._entries.setdefault(node._data, node)
+        if entry is node:
+            return
+        if type(entry) is dict:
+            entry[node] = None
+        else:
+            self._entries[node._data] = {entry: None, node: None}
+
+    def extend(self, nodes: Iterable[LinkedListNode]) -> None:
+        """
+        Indexes all the nodes , or none of them if a data is unhashable.
+
+        Raises:
+            TypeError: If a data is unhashable.
+
+        Complexity:
+            O(K)
+        """
+        added: List[LinkedListNode] = []
+        try:
+            for node in nodes:
+                self.add(node)
+                added.append(node)
+        except TypeError:
+            for node in added:
+                self.discard(node)
+            raise
+
+    def update(self, other: 'ValueIndex') -> None:
+        """
+        Indexes the nodes of `other` as well.
+
+        Complexity:
+            O(K) for K values of `other`
+        """
+        if not self._entries:
+            self._entries, other._entries = other._entries, {}
+            return
+        for entry in other._entries.values():
+            self.extend(entry if type(entry) is dict else (entry,))
+
+    def discard(self, node: LinkedListNode) -> None:
+        """
+        Removes a node from the index , if it's there.
+
+        Complexity:
+            O(1)
+        """
+        entry = self._entries.get(node._data)
+        if entry is node:
+            del self._entries[node._data]
+        elif type(entry) is dict and node in entry:
+            del entry[node]
+            if len(entry) == 1:
+                # back to a single node
+                self._entries[node._data] = next(iter(entry))
+
+    def nodes(self, value: Any) -> Union[Tuple[()], Tuple[LinkedListNode], Dict[LinkedListNode, None]]:
+        """
+        The nodes holding `value` , as a container supporting `in` & `len` .
+
+        Raises:
+            TypeError: If the value is unhashable.
+        """
+        entry = self._entries.get(value)
+        if entry is None:
+            return ()
+        return entry if type(entry) is dict else (entry,)
+
+    def count(self, value: Any) -> int:
+        """Number of nodes holding `value` ."""
+        return len(self.nodes(value))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._entries
+
+    def __len__(self) -> int:
+        """Number of distinct values."""
+        return len(self._entries)
+
+    def __sizeof__(self) -> int:
+        return sys.getsizeof(self._entries) + sum(sys.getsizeof(entry) for entry in self._entries.values() if type(entry) is dict)
+
+    def __repr__(self) -> str:
+        return f"ValueIndex({ {value: self.count(value) for value in self._entries} })"
+
+
+# `index_store_cls` names accepted by `LinkedList`
+INDEX_STORES: Dict[str, Type[BaseIndexStore]] = {
+    'IndexStore': IndexStore,
+    'SkipListIndexStore': SkipListIndexStore,
+    'LazyIndexStore': LazyIndexStore,
+    'EndsIndexStore': EndsIndexStore,
+}
+
+
+class NodePool:
+    """
+    Free-list of unlinked nodes , recycled by the next insertions.
+
+    Layout :
+    --------
+        _free : [ node , node , ... ]   ( cleared : no data , no links )
+
+    Notes :
+    -------
+    * a list built with `node_pool=` gives the nodes it drops ( `del ll[i]` ,
+        `popleft` ) to the pool , and takes it's new nodes from it , so a
+        churn of inserts & deletes stops allocating once the pool is warm .
+    * at most `max_size` nodes are kept , the extra ones are left to the
+        garbage collector .
+    * one pool per list , or a pool shared by lists ( `SHARED_NODE_POOL` )
+        for a per process free-list .
+    * a recycled node is cleared & handed out again , handles to a dropped
+        node must not be kept . `delete(node)` never recycles , the caller
+        holds that node .
+    * the counters tell how many allocations the pool saved ( `reuses` ) ,
+        they aren't locked , concurrent lists may miss a few increments .
+    """
+    __slots__ = ('max_size', '_free', 'allocations', 'reuses', 'releases', 'overflows')
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initializes a NodePool instance.
+
+        Args:
+            max_size (int): most nodes kept for reuse.
+
+        Raises:
+            ValueError: If `max_size` is negative.
+        """
+        if max_size < 0:
+            raise ValueError('max_size must not be negative')
+        self.max_size: int = max_size
+        self._free: List[LinkedListNode] = []
+        # # nodes created while the pool was empty
+        self.allocations: int = 0
+        # # nodes taken from the pool , each one an allocation saved
+        self.reuses: int = 0
+        # # nodes given back & kept
+        self.releases: int = 0
+        # # nodes given back while the pool was full , dropped
+        self.overflows: int = 0
+
+    def acquire(self, data: Any) -> LinkedListNode:
+        """
+        A node holding `data` , recycled if the pool has one.
+
+        Complexity:
+            O(1)
+        """
+        if self._free:
+            node = self._free.pop()
+            node._data = data
+            self.reuses += 1
+            return node
+        self.allocations += 1
+        return LinkedListNode(data)
+
+    def release(self, node: LinkedListNode) -> None:
+        """
+        Gives back an unlinked node , it's data & links are cleared.
+
+        Complexity:
+            O(1)
+        """
+        node._data = node._left = node._right = None
+        if len(self._free) >= self.max_size:
+            self.overflows += 1
+            return
+        self._free.append(node)
+        self.releases += 1
+
+    def stats(self) -> Dict[str, int]:
+        """The counters , plus the nodes currently pooled ( `free` )."""
+        return {
+            'allocations': self.allocations, 'reuses': self.reuses,
+            'releases': self.releases, 'overflows': self.overflows, 'free': len(self._free),
+        }
+
+    def clear(self) -> None:
+        """Drops the pooled nodes , the counters are kept."""
+        self._free.clear()
+
+    def __len__(self) -> int:
+        """Number of nodes pooled."""
+        return len(self._free)
+
+    def __repr__(self) -> str:
+        return f"NodePool(max_size={self.max_size}, {self.stats()})"
+
+
+# a per process pool , to share among lists ( `LinkedList(node_pool=SHARED_NODE_POOL)` )
+SHARED_NODE_POOL: NodePool = NodePool()
+
+class LinkedList:
+    """
+    Doubly Linked List Implementation
+
+    -----
+    Usage
+    -----
+
+    # Prepare
+    >>> ll = LinkedList()
+    >>> ll.append(3)
+    >>> ll.prepend(4)
+    >>> ll.append(8)
+    >>> print(ll)
+    [4, 3, 8]
+
+    # Fetch Node data
+    >>> value=ll[1]
+    >>> value.data
+    3
+    
+    # Prepend Node
+    >>> ll.prepend(6)
+    >>> print(ll)
+    [6, 4, 3, 8]
+
+    # Get Node by Index
+    >>> value=ll[2]
+    >>> value.data
+    3
+
+    # Index Map
+    >>> ll.index_store
+    {0: MemoryBlock(6, left=None, right=4), 1: MemoryBlock(4, left=6, right=3), 2: MemoryBlock(3, left=4, right=8), 3: MemoryBlock(8, left=3, right=None)}
+    
+    # Length
+    >>> len(ll)
+    4
+
+    # Insert & Delete in the middle
+    # # ( O(log N) with `index_store_cls=SkipListIndexStore` )
+    >>> ll.insert(2, 5)
+    >>> print(ll)
+    [6, 4, 5, 3, 8]
+    >>> del ll[2]
+
+    # Iteration
+    >>> [v.data for v in ll]
+    [6, 4, 3, 8]
+
+    # Reverse Iteration
+    # # ( It Sets the order of linkedlist in reverse )
+    >>> ll.root_iterator_cls=RLIterator
+    >>> [v.data for v in ll]
+    [8, 3, 4, 6]
+
+    # Reverse Iteration : Method 2
+    # # - using Operations.reversed(...) function
+    >>> ll.root_iterator_cls=LRIterator
+    >>> print([v.data for v in Operations.reversed(ll)])
+    [8, 3, 4, 6]
+
+    # Reverse Iteration : Method 3
+    # # - using builtin reversed(...) function
+    >>> ll.root_iterator_cls=LRIterator
+    >>> print([v.data for v in reversed(ll)])
+    [8, 3, 4, 6]
+
+    ---
+
+    NOTES
+        - -ve indices count from the end , as for `list` .
+
+    """
+
+    def __new__(cls, *args, block_size: Optional[int] = None, **kwargs):
+        """
+        Creates a LinkedList instance , an unrolled one when `block_size` is given.
+
+        * `LinkedList(block_size=K)` gives a `linked_list_unrolled.LinkedList` ,
+            with blocks of up to K elements per node , only `root_iterator_cls`
+            applies to it .
+
+        Raises:
+            NotImplementedError: If `block_size` is given with another option ,
+                or to a subclass.
+        """
+        if block_size is None:
+            return super().__new__(cls)
+        if cls is not LinkedList or args[1:] or kwargs.keys() - {'root_iterator_cls'}:
+            raise NotImplementedError('the unrolled backend takes `root_iterator_cls` & `block_size` only')
+        # imported here , `linked_list_unrolled` is built on this module
+        import linked_list_unrolled
+        return linked_list_unrolled.LinkedList(block_size, *args, **kwargs)
+
+    def __init__(self, root_iterator_cls: Union[str, Type[Iterator]] = 'LRIterator', index_store_cls: Union[None, str, Type[BaseIndexStore]] = 'IndexStore', slice_views: bool = False, value_index: bool = False, block_size: Optional[int] = None, node_pool: Optional[NodePool] = None, weak_back_links: bool = False):
+        """
+        Initializes a LinkedList instance.
+
+        Args:
+            root_iterator_cls (Iterator): The iterator class used for traversal.
+            index_store_cls (BaseIndexStore): The positional index implementation.
+                * `IndexStore` : O(1) lookup & ends , O(N) insert / delete in the middle .
+                * `SkipListIndexStore` : O(log N) lookup , insert & delete anywhere .
+                * `LazyIndexStore` : deletes leave holes , rebuilt lazily by the lookups .
+                * `EndsIndexStore` or `None` : no index , lookups walk from the closer end .
+            slice_views (bool): `ll[a:b:c]` gives a `LinkedListView` instead of a copy.
+            value_index (bool): keeps a `ValueIndex` of the elements , for O(1)
+                `in` & `count` ( the data must be hashable then ).
+            block_size (int): selects the unrolled backend ( see `__new__` ) ,
+                `None` for this one.
+            node_pool (NodePool): recycles the nodes dropped by `del ll[i]` &
+                `popleft` into the next insertions , `None` allocates each node.
+            weak_back_links (bool): builds `WeakBackLinkNode` s , the list makes
+                no reference cycle , dropping it doesn't wait for the cyclic GC.
+
+        Raises:
+            NotImplementedError: If `node_pool` & `weak_back_links` are both given.
+        """
+        if node_pool is not None and weak_back_links:
+            raise NotImplementedError('node_pool & weak_back_links can`t be combined yet')
+        # Positioning Markers
+        self._head = LinkedListNode(-1)
+        self._tail = LinkedListNode(-1)
+        # Initialization
+        self._head._right = self._tail
+        self._head._left = None
+        self._tail._left = self._head
+        self._tail._right = None
+        # Index Map
+        if index_store_cls is None:
+            index_store_cls = EndsIndexStore
+        elif isinstance(index_store_cls, str):
+            if index_store_cls not in INDEX_STORES:
+                raise NotImplementedError('index_store_cls specified isn`t supported yet')
+            index_store_cls = INDEX_STORES[index_store_cls]
+        self._index_store: BaseIndexStore = index_store_cls()
+        # # stores taken over by `splice` , merged on the next positional access
+        self._pending_stores: List[BaseIndexStore] = []
+        # Value Index ( opt-in , lists without it don't pay for it )
+        self._value_index: Optional[ValueIndex] = ValueIndex() if value_index else None
+        # # nodes unlinked by `delete` , their entries are dropped from the
+        # # index store on the next positional access
+        self._deleted_nodes: Set[LinkedListNode] = set()
+        # # steps walked by the lookups while the index store is stale
+        self._stale_steps: int = 0
+        # Node Pool ( opt-in )
+        self._node_pool: Optional[NodePool] = node_pool
+        # # Node Type ( weak back-links : no reference cycle )
+        self._node_cls: Type[LinkedListNode] = WeakBackLinkNode if weak_back_links else LinkedListNode
+        # Config
+        # # Root Iterator
+        self.root_iterator_cls: Iterator = root_iterator_cls
+        # # Slicing
+        self.slice_views: bool = slice_views
+    
+    def _new_like(self) -> 'LinkedList':
+        """Creates an empty list with the same index implementation."""
+        return LinkedList(index_store_cls=type(self._index_store), slice_views=self.slice_views, value_index=self._value_index is not None, node_pool=self._node_pool, weak_back_links=self._node_cls is WeakBackLinkNode)
+    
+    @property
+    def head(self) -> LinkedListNode:
+        """Gets the head node of the list."""
+        return self._head
+    
+    @property
+    def tail(self) -> LinkedListNode:
+        """Gets the tail node of the list."""
+        return self._tail
+    
+    @property
+    def index_store(self) -> BaseIndexStore:
+        """Gets the index store of the list."""
+        self._sync_index()
+        return self._index_store
+
+    def _sync_index(self) -> None:
+        """
+        Brings the index store up to date , before a positional access.
+
+        * merges the stores taken over by `splice` .
+        * drops the entries left by `delete` , the store is rebuilt from the
+            links in one pass , once for any number of deletes .
+        * until then , `ll[i]` walks from the closer end ( see `_walk_to` ) .
+
+        Complexity:
+            O(1) if nothing is pending , else O(N)
+        """
+        self._merge_pending_stores()
+        if self._deleted_nodes:
+            self._deleted_nodes = set()
+            self._stale_steps = 0
+            self._index_store.clear()
+            self._index_store.extend(self._nodes())
+
+    @property
+    def value_index(self) -> Optional[ValueIndex]:
+        """Gets the value index of the list , `None` unless enabled."""
+        return self._value_index
+
+    @property
+    def weak_back_links(self) -> bool:
+        """Tells whether the nodes hold their left neighbour weakly."""
+        return self._node_cls is WeakBackLinkNode
+
+    @property
+    def node_pool(self) -> Optional[NodePool]:
+        """Gets the node pool of the list , `None` unless given."""
+        return self._node_pool
+
+    def _merge_pending_stores(self) -> None:
+        """
+        Moves the index entries of spliced lists into the index store.
+
+        * an empty store is swapped with the first pending one of the same
+            type , the rest is extended with the nodes ( nothing is copied ) .
+
+        Complexity:
+            O(1) if nothing is pending , else O(K) for K pending entries
+        """
+        if not self._pending_stores:
+            return
+        pending, self._pending_stores = self._pending_stores, []
+        if not len(self._index_store) and type(pending[0]) is type(self._index_store):
+            self._index_store = pending.pop(0)
+        for store in pending:
+            self._index_store.extend(store.values())
+    
+    def append(self, data: Any, return_node: bool = False) -> Optional[LinkedListNode]:
+        """
+        Adds a new element at the end of the list.
+
+        Args:
+            data (Any): The data to append.
+            return_node (bool): returns the new node , a handle for `delete` .
+
+        Returns:
+            LinkedListNode: The new node , with `return_node` set.
+
+        Complexity:
+            O(1)
+        """
+        # current : last-element <--- Tail
+        # new : last-element <--- . <--- Tail
+        # ( slots are used directly , this is the hot path of every queue )
+        last_element: LinkedListNode = self._tail._left
+        # creation
+        new_node: LinkedListNode = self._node_cls(data) if self._node_pool is None else self._node_pool.acquire(data)
+        if self._value_index is not None:
+            self._value_index.add(new_node)
+        self._tail._left = new_node
+        last_element._right = new_node
+        if last_element is self._head:
+            # last_element is head
+            self._head._data += 1
+        else:
+            new_node._left = last_element
+        # storing adjusted indexes
+        self._merge_pending_stores()
+        self._index_store.append(new_node)
+        self._tail._data += 1
+        if return_node:
+            return new_node
+    
+    def prepend(self, data: Any, return_node: bool = False) -> Optional[LinkedListNode]:
+        """
+        Adds a new element at the beginning of the list.
+
+        Args:
+            data (Any): The data to prepend.
+            return_node (bool): returns the new node , a handle for `delete` .
+
+        Returns:
+            LinkedListNode: The new node , with `return_node` set.
+
+        Complexity:
+            O(1) amortized
+        """
+        # current : Head ---> first-element
+        # new : Head ---> . ---> first-element
+        first_element: LinkedListNode = self._head._right
+        # creation
+        new_node: LinkedListNode = self._node_cls(data) if self._node_pool is None else self._node_pool.acquire(data)
+        if self._value_index is not None:
+            self._value_index.add(new_node)
+        self._head._right = new_node
+        if first_element is self._tail:
+            # first_element is tail
+            self._tail._left = new_node
+            self._head._data += 1
+        else:
+            new_node._right = first_element
+            first_element._left = new_node
+        # adjusting indexes
+        # # existing entries keep their slots , the store moves it's offset
+        self._merge_pending_stores()
+        self._index_store.prepend(new_node)
+        self._tail._data += 1
+        if return_node:
+            return new_node
+    
+    def splice(self, other: 'LinkedList') -> None:
+        """
+        Moves all the elements of `other` to the end of the list.
+
+        * nodes are relinked , not copied , `other` is left empty .
+        * the index of `other` is taken over as it is , & merged into
+            this list's index on the next positional access .
+        * `ll.splice(ll)` appends a copy of the elements instead .
+
+        Args:
+            other (LinkedList): The list whose elements are moved.
+
+        Complexity:
+            O(1) , O(K) with a value index ( K values of `other` are indexed )
+        """
+        if other is self:
+            return self._extend_values(list(self._values()))
+        other_first_element: LinkedListNode = other._head._right
+        if other_first_element is other._tail:
+            # other is empty
+            return
+        other_last_element: LinkedListNode = other._tail._left
+        other_size = other._tail._data - other._head._data + 1
+        if other._deleted_nodes and isinstance(self._index_store, EndsIndexStore):
+            # the ends store has no entries for `popleft` to skip , `other` is repaired first
+            other._sync_index()
+        # taking over the values , before any relinking ( data may be unhashable )
+        if self._value_index is not None:
+            self._value_index.update(other._value_index if other._value_index is not None else ValueIndex(other._nodes()))
+        # linking
+        last_element: LinkedListNode = self._tail._left
+        if last_element is self._head:
+            # last_element is head
+            last_element._right = other_first_element
+            self._head._data += 1
+        else:
+            self._joint(last_element, other_first_element)
+        self._tail._left = other_last_element
+        self._tail._data += other_size
+        # taking over the index
+        self._pending_stores.append(other._index_store)
+        self._pending_stores.extend(other._pending_stores)
+        self._deleted_nodes |= other._deleted_nodes
+        # other : back to the initial markers state
+        other._head._right = other._tail
+        other._tail._left = other._head
+        other._head._data = other._tail._data = -1
+        other._index_store = type(other._index_store)()
+        other._pending_stores = []
+        other._deleted_nodes = set()
+        if other._value_index is not None:
+            other._value_index = ValueIndex()
+    
+    def sort(self, *, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False):
+        """
+        Sorts the list in place , like `list.sort` .
+
+        * the existing nodes are relinked , no data is copied .
+        * the order comes from python's timsort over the nodes : a stable
+            natural merge sort , nearly sorted input costs close to O(N) .
+        * the index store is rebuilt in a single pass at the end .
+
+        Args:
+            key (Callable): computes the sort key out of an element's data.
+            reverse (bool): sorts in descending order , keeping it stable.
+
+        Complexity:
+            O(N log N)
+        """
+        first_element: LinkedListNode = self._head._right
+        if first_element is self._tail:
+            return
+        nodes: List[LinkedListNode] = []
+        _pointer = first_element
+        while _pointer is not None:
+            nodes.append(_pointer)
+            _pointer = _pointer._right
+        if key is None:
+            nodes.sort(key=operator.attrgetter('_data'), reverse=reverse)
+        else:
+            nodes.sort(key=lambda node: key(node._data), reverse=reverse)
+        # relinking
+        for left_node, right_node in zip(nodes, itertools.islice(nodes, 1, None)):
+            left_node._right = right_node
+            right_node._left = left_node
+        nodes[0]._left = None
+        nodes[-1]._right = None
+        self._head._right = nodes[0]
+        self._tail._left = nodes[-1]
+        # re-indexing
+        self._pending_stores = []
+        self._deleted_nodes = set()
+        self._index_store.clear()
+        self._index_store.extend(nodes)
+    
+    def reverse(self):
+        """
+        Reverses a linked list
+
+        * the nodes are held in a list meanwhile : with weak back-links , the
+            right link being swapped is the only strong reference to the next node .
+
+        Complexity:
+            O(N)
+        """
+        if self._head._right is self._tail:
+            # empty : the markers would be linked to themselves
+            return
+        nodes: List[LinkedListNode] = list(self._nodes())
+        for node in nodes:
+            node._left, node._right = node._right, node._left
+        self._head._right, self._tail._left = nodes[-1], nodes[0]
+        self._merge_pending_stores()
+        self._index_store.reverse()
+    
+    def pop(self):
+        raise NotImplementedError('...')
+    
+    def popleft(self) -> Any:
+        """
+        Removes the first element & returns it's data , like `deque.popleft` .
+
+        Raises:
+            IndexError: If the list is empty.
+
+        Complexity:
+            O(1) with `IndexStore` ( the store moves it's offset )
+        """
+        first_element: LinkedListNode = self._head._right
+        if first_element is self._tail:
+            raise IndexError('popleft from an empty list')
+        self._merge_pending_stores()
+        node: LinkedListNode = self._index_store.popleft()
+        if self._deleted_nodes:
+            # entries left by `delete` ahead of the first element
+            while node is not first_element:
+                self._deleted_nodes.discard(node)
+                node = self._index_store.popleft()
+        if self._value_index is not None:
+            self._value_index.discard(first_element)
+        next_node: LinkedListNode = first_element._right
+        if next_node is None:
+            # last remaining element : back to the initial markers state
+            self._head._right = self._tail
+            self._tail._left = self._head
+            self._head._data = -1
+        else:
+            next_node._left = None
+            self._head._right = next_node
+        self._tail._data -= 1
+        data = first_element._data
+        if self._node_pool is not None:
+            self._node_pool.release(first_element)
+        return data
+    
+    def insert(self, index: int, data: Any):
+        """
+        Adds a new element before position `index` , like `list.insert` .
+
+        Args:
+            index (int): position of the new element , clamped to the list bounds.
+            data (Any): The data to insert.
+
+        Complexity:
+            O(log N) with `SkipListIndexStore` , O(N) with `IndexStore`
+        """
+        self._sync_index()
+        size = len(self._index_store)
+        if index < 0:
+            index = max(index + size, 0)
+        if index >= size:
+            return self.append(data)
+        if index == 0:
+            return self.prepend(data)
+        # current : left-node <=> right-node
+        # new : left-node <=> . <=> right-node
+        right_node: LinkedListNode = self._index_store[index]
+        left_node: LinkedListNode = right_node._left
+        new_node: LinkedListNode = self._node_cls(data) if self._node_pool is None else self._node_pool.acquire(data)
+        if self._value_index is not None:
+            self._value_index.add(new_node)
+        self._joint(left_node, new_node)
+        self._joint(new_node, right_node)
+        self._index_store.insert(index, new_node)
+        self._tail.data += 1
+    
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        """
+        Position of the first element holding `value` , like `list.index` .
+
+        * with a value index , the walk compares node identities only and
+            is skipped altogether when `value` isn't in the list .
+
+        Args:
+            value (Any): The data to look for.
+            start (int): first position searched.
+            stop (int): position the search stops before.
+
+        Raises:
+            ValueError: If no element in `start:stop` holds `value` .
+
+        Complexity:
+            O(index) , O(1) with a value index when `value` is missing
+        """
+        return self._find(value, start, stop)[0]
+    
+    def extend(self, values: Iterable[Any]):
+        """
+        Adds all the `values` at the end of the list , in one pass.
+
+        Args:
+            values (Iterable): The values to add , a `LinkedList` adds it's data.
+
+        Complexity:
+            O(K)
+        """
+        if isinstance(values, LinkedList):
+            values = values._values()
+        self._extend_values(values)
+    
+    def count(self, value: Any) -> int:
+        """
+        Number of elements holding `value` , like `list.count` .
+
+        Complexity:
+            O(N) , O(1) with a value index
+        """
+        nodes = self._indexed_nodes(value)
+        if nodes is not None:
+            return len(nodes)
+        return sum(1 for data in self._values() if data == value)
+    
+    def copy(self) -> 'LinkedList':
+        """
+        Returns a shallow copy of the list , built in one pass.
+
+        * for O(1) snapshots , see `linked_list_persistent.PersistentLinkedList` .
+
+        Complexity:
+            O(N)
+        """
+        _ll = self._new_like()
+        _ll.root_iterator_cls = self.root_iterator_cls
+        _ll._extend_values(self._values())
+        return _ll
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickles the list as it's config & a flat `list` of data.
 
-    # Reverse Iteration : Method 3
-    # # - using builtin reversed(...) function
-    >>> ll.root_iterator_cls=LRIterator
-    >>> print([v.data for v in reversed(ll)])
-    [8, 3, 4, 6]
+        * no node , link or index is pickled , hence no recursion along the
+            links , the list is rebuilt in a single bulk pass ( `_rebuild` ).
+        """
+        config = (self.root_iterator_cls, type(self._index_store), self.slice_views, self._value_index is not None)
+        if self._node_cls is WeakBackLinkNode:
+            # # `block_size` & `node_pool` aren't pickled
+            config += (None, None, True)
+        return _rebuild, (type(self), config, list(self._values()))
 
-    ---
+    def to_bytes(self, typecode: str = 'q') -> bytes:
+        """
+        Packs the data into bytes , like `array.array(typecode).tobytes()` .
 
-    NOTES
-        - does not support -ve indices as of now
+        * a fast path for numeric data , e.g. to ship a list to another
+            process , the bytes are in the machine's native byte order .
 
-    """
+        Args:
+            typecode (str): `array` typecode of the data , e.g. `'q'` , `'d'` .
+
+        Raises:
+            TypeError: If some data doesn't fit the typecode.
+            OverflowError: If some number doesn't fit the typecode.
 
-    def __init__(self, root_iterator_cls: Union[str, Type[Iterator]] = 'LRIterator'):
+        Complexity:
+            O(N)
         """
-        Initializes a LinkedList instance.
+        return array.array(typecode, self._values()).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, typecode: str = 'q', **kwargs) -> 'LinkedList':
+        """
+        Builds a list out of bytes given by `to_bytes` .
 
         Args:
-            root_iterator_cls (Iterator): The iterator class used for traversal.
+            data (bytes): The packed data.
+            typecode (str): `array` typecode the data was packed with.
+            kwargs: passed to the constructor ( `index_store_cls` , ... ).
+
+        Raises:
+            ValueError: If the size of `data` isn't a multiple of the item size.
+
+        Complexity:
+            O(N)
         """
-        # Positioning Markers
-        self._head = LinkedListNode(-1)
-        self._tail = LinkedListNode(-1)
-        # Initialization
+        values = array.array(typecode)
+        values.frombytes(data)
+        _ll = cls(**kwargs)
+        _ll._extend_values(values)
+        return _ll
+    
+    def clear(self):
+        """
+        Removes all the elements , like `list.clear` .
+
+        * the links of every node are broken on the way , so the nodes make
+            no reference cycle & are freed at once by reference counting ,
+            instead of being left to ( & pausing ) the cyclic GC , as when a
+            list is dropped as is .
+        * with a node pool , the nodes are recycled .
+
+        Complexity:
+            O(N)
+        """
+        _pointer: Optional[LinkedListNode] = self._head._right
+        if self._node_pool is not None:
+            # the pool clears the links
+            for node in list(self._nodes()):
+                self._node_pool.release(node)
+        elif _pointer is not self._tail:
+            # the last element has no right link
+            while _pointer is not None:
+                next_node = _pointer._right
+                _pointer._left = _pointer._right = None
+                _pointer = next_node
+        # back to the initial markers state
         self._head._right = self._tail
-        self._head._left = None
         self._tail._left = self._head
-        self._tail._right = None
-        # Index Map
-        self._index_store: Dict[int, LinkedListNode] = {}
-        # Config
-        # # Root Iterator
-        self.root_iterator_cls: Iterator = root_iterator_cls
-    
-    @property
-    def head(self) -> LinkedListNode:
-        """Gets the head node of the list."""
-        return self._head
+        self._head._data = self._tail._data = -1
+        self._index_store.clear()
+        self._pending_stores = []
+        self._deleted_nodes = set()
+        self._stale_steps = 0
+        if self._value_index is not None:
+            self._value_index.clear()
     
-    @property
-    def tail(self) -> LinkedListNode:
-        """Gets the tail node of the list."""
-        return self._tail
-    
-    @property
-    def index_store(self) -> LinkedListNode:
-        """Gets the index store of the list."""
-        return self._index_store
+    def remove(self, value: Any) -> None:
+        """
+        Deletes the first element holding `value` , like `list.remove` .
+
+        Raises:
+            ValueError: If no element holds `value` .
+
+        Complexity:
+            O(index) to find it , plus the cost of `del ll[index]`
+        """
+        index, _ = self._find(value, 0, sys.maxsize)
+        del self[index]
+
+    def _indexed_nodes(self, value: Any) -> Optional[Union[Tuple[LinkedListNode, ...], Dict[LinkedListNode, None]]]:
+        """The nodes holding `value` per the value index , `None` without one ( or for unhashable values )."""
+        if self._value_index is None:
+            return None
+        try:
+            return self._value_index.nodes(value)
+        except TypeError:
+            # unhashable values are never indexed , the caller scans
+            return None
+
+    def _find(self, value: Any, start: int, stop: int) -> Tuple[int, LinkedListNode]:
+        """
+        First element holding `value` in the positions `start:stop` .
+
+        Raises:
+            ValueError: If there's none.
+        """
+        self._sync_index()
+        start, stop, _ = slice(start, stop).indices(len(self._index_store))
+        nodes = self._indexed_nodes(value)
+        if start < stop and (nodes is None or nodes):
+            if nodes is None:
+                matches = lambda node: node._data == value
+            else:
+                matches = nodes.__contains__
+            _pointer: LinkedListNode = self._index_store[start]
+            for index in range(start, stop):
+                if matches(_pointer):
+                    return index, _pointer
+                _pointer = _pointer._right
+        raise ValueError(f'{value!r} is not in list')
     
-    def append(self, data: Any):
+    def delete(self, node: LinkedListNode):
         """
-        Adds a new element at the end of the list.
+        Deletes the element of `node` , without searching for it.
+
+        * `node` is a handle given by `append` / `prepend` ( `return_node=True` ) ,
+            `ll[index]` or iteration , it stays valid while the node is in the list .
+        * the node is unlinked at once , it's index entry is dropped on the next
+            positional access ( see `_sync_index` ) , so deletes in a row cost
+            O(1) each , e.g. moving an entry to the end of an LRU list :
+
+                ll.delete(node) ; node = ll.append(node.data, return_node=True)
+
+        * the links of the deleted node are cleared .
+        * precondition : `node` is an element of this list . nodes carry no
+            owner , an unlinked node or an end node of another list is rejected ,
+            a middle node of another list is only caught with `value_index=True`
+            ( it's looked up there , for hashable data ) , otherwise it's
+            unlinked from it's own list & the lengths of both lists go wrong .
 
         Args:
-            data (Any): The data to append.
+            node (LinkedListNode): The node to delete.
+
+        Raises:
+            ValueError: If the node is a marker or is not linked in the list
+                ( e.g. it was deleted already , or belongs to another list ).
 
         Complexity:
-            O(1)
+            O(1) amortized
         """
-        # current : last-element <--- Tail
-        # new : last-element <--- . <--- Tail
-        last_element: LinkedListNode = self._tail.left
-        
-        # adjusting indexes
-        index = self._tail.data
-        index += 1
-        # creation
-        new_node: LinkedListNode = LinkedListNode(data, metadata=Metadata())
-        self._tail.left = new_node
-        if last_element is self._head:
-            # last_element is head
-            last_element.right = new_node
-            new_node.left = None
-            self._head.data += 1
+        prev_node: Optional[LinkedListNode] = node._left
+        next_node: Optional[LinkedListNode] = node._right
+        if (
+            node is self._head or node is self._tail
+            or (prev_node is None and self._head._right is not node)
+            or (next_node is None and self._tail._left is not node)
+        ):
+            raise ValueError('node is not in list')
+        indexed = self._indexed_nodes(node._data)
+        if indexed is not None and node not in indexed:
+            raise ValueError('node is not in list')
+        self._merge_pending_stores()
+        stale = not self._index_store.discard(node)
+        if prev_node is None and next_node is None:
+            # last remaining element : back to the initial markers state
+            self._head._right = self._tail
+            self._tail._left = self._head
+            self._head._data = -1
         else:
-            self._joint(last_element, new_node)
-        # storing adjusted indexes
-        self._index_store[index] = new_node
-        self._tail.data = index
+            if prev_node is not None:
+                prev_node._right = next_node
+            else:
+                self._head._right = next_node
+            if next_node is not None:
+                next_node._left = prev_node
+            else:
+                self._tail._left = prev_node
+        node._left = node._right = None
+        self._tail._data -= 1
+        if self._value_index is not None:
+            self._value_index.discard(node)
+        if not stale:
+            return
+        self._deleted_nodes.add(node)
+        # keeps the stale entries below the live ones ( amortized O(1) repair )
+        if len(self._deleted_nodes) > max(len(self), 64):
+            self._sync_index()
     
-    def prepend(self, data: Any):
+    def values(self) -> Generator[Any, None, None]:
         """
-        Adds a new element at the beginning of the list.
+        Generates the data of the elements , left to right.
+
+        * a faster `[node.data for node in ll]` : the links are read directly ,
+            no iterator object , no property per element , markers excluded .
+
+        Complexity:
+            O(N)
+        """
+        return self._values()
+
+    def values_reversed(self) -> Generator[Any, None, None]:
+        """
+        Generates the data of the elements , right to left.
+
+        Complexity:
+            O(N)
+        """
+        _pointer = self._tail._left
+        if _pointer is self._head:
+            return
+        # the first element has no left link
+        while _pointer is not None:
+            yield _pointer._data
+            _pointer = _pointer._left
+
+    def iter_chunks(self, size: int, typecode: Optional[str] = None) -> Generator[Union[List[Any], array.array], None, None]:
+        """
+        Generates the data of the elements , left to right , `size` at a time.
+
+        * every chunk is a new `list` ( or an `array.array` of `typecode` ) ,
+            the last one may be shorter .
 
         Args:
-            data (Any): The data to prepend.
+            size (int): elements per chunk.
+            typecode (str): builds `array.array(typecode, chunk)` chunks instead of lists.
+
+        Raises:
+            ValueError: If `size` is lower than 1.
 
         Complexity:
             O(N)
         """
-        # current : Head ---> first-element
-        # new : Head ---> . ---> first-element
-        first_element: LinkedListNode = self._head.right
-        # creation
-        new_node: LinkedListNode = LinkedListNode(data, metadata=Metadata())
-        self._head.right = new_node
-        if first_element is self._tail:
-            # first_element is tail
-            self._tail.left = new_node
-            new_node.right = None
-            self._head.data += 1
-        else:
-            self._joint(new_node, first_element)
-        # adjusting indexes
-        index = self._tail.data
-        index += 1
-        for idx in range(index, 0, -1):
-            self._index_store[idx] = self._index_store[idx-1]
-        else:
-            self._index_store[0] = new_node
-        self._tail.data = index
-    
-    def sort(self):
-        raise NotImplementedError('...')
-    
-    def reverse(self):
+        if size < 1:
+            raise ValueError('chunk size must be at least 1')
+        return self._chunks(self._values(), size, typecode)
+
+    @staticmethod
+    def _chunks(values: Iterator[Any], size: int, typecode: Optional[str]) -> Generator[Union[List[Any], array.array], None, None]:
+        """Splits `values` into chunks of `size` ."""
+        while True:
+            chunk = list(itertools.islice(values, size))
+            if not chunk:
+                return
+            yield chunk if typecode is None else array.array(typecode, chunk)
+
+    def iter_from(self, index: int, direction: str = 'right') -> Generator[Any, None, None]:
         """
-        Reverses a linked list
+        Generates the data of the elements , from position `index` on.
+
+        * the walk starts at the node given by the index store ,
+            none of the elements before it are visited .
+
+        Args:
+            index (int): position of the first element generated.
+            direction (str): `'right'` walks towards the end , `'left'` towards the start.
+
+        Raises:
+            KeyError: If `index` is out of range ( like `ll[index]` ).
+            ValueError: If `direction` is neither `'right'` nor `'left'` .
 
         Complexity:
-            O(1)
+            O(1) to start ( `IndexStore` ) , then O(1) per element
         """
-        temp = self._head._right
-        while temp:
-            current_node = temp
-            next_node = temp._right
-            current_node._left, current_node._right = current_node._right, current_node._left
-            temp = next_node
-        self._head._right, self._tail._left = self._tail._left, self._head._right
-    
-    def pop(self):
-        raise NotImplementedError('...')
-    
-    def insert(self):
-        raise NotImplementedError('...')
-    
-    def index(self):
-        raise NotImplementedError('...')
-    
-    def extend(self):
-        raise NotImplementedError('...')
-    
-    def count(self):
-        raise NotImplementedError('...')
-    
-    def copy(self):
-        raise NotImplementedError('...')
-    
-    def clear(self):
-        raise NotImplementedError('...')
-    
-    def remove(self):
-        raise NotImplementedError('...')
-    
-    def delete(self, node: LinkedListNode):
+        if direction not in ('right', 'left'):
+            raise ValueError("direction must be 'right' or 'left'")
+        # resolved now , not on the first `next()`
+        return self._walk_from(self[index], direction == 'left')
+
+    @staticmethod
+    def _walk_from(node: LinkedListNode, leftwards: bool) -> Generator[Any, None, None]:
+        """Generates the data from `node` up to an end of the list."""
+        _pointer: Optional[LinkedListNode] = node
+        if leftwards:
+            while _pointer is not None:
+                yield _pointer._data
+                _pointer = _pointer._left
+        else:
+            while _pointer is not None:
+                yield _pointer._data
+                _pointer = _pointer._right
+
+    def _nodes(self) -> Generator[LinkedListNode, None, None]:
+        """Generates the nodes of the elements , left to right ( markers excluded )."""
+        _pointer = self._head._right
+        if _pointer is self._tail:
+            return
+        # the last element has no right link
+        while _pointer is not None:
+            yield _pointer
+            _pointer = _pointer._right
+
+    def _values(self) -> Generator[Any, None, None]:
+        """Generates the data of the elements , left to right ( markers excluded )."""
+        _pointer = self._head._right
+        if _pointer is self._tail:
+            return
+        # the last element has no right link
+        while _pointer is not None:
+            yield _pointer._data
+            _pointer = _pointer._right
+
+    def _extend_values(self, values: Iterable[Any]) -> None:
         """
-        special functionality
-            - it saves the time to search the node
+        Links all `values` after the last element , in one pass.
+
+        * nodes are created & chained first , then attached to the list
+            and indexed in a single step , instead of an `append` per value .
+        * the garbage collector is paused meanwhile , every node created
+            here stays alive , so collecting in between only re-scans them .
+
+        Complexity:
+            O(K)
         """
-        raise NotImplementedError('...')
-    
+        with _gc_paused():
+            new_node = self._node_cls if self._node_pool is None else self._node_pool.acquire
+            nodes: List[LinkedListNode] = [new_node(data) for data in values]
+            if not nodes:
+                return
+            for left_node, right_node in zip(nodes, itertools.islice(nodes, 1, None)):
+                left_node._right = right_node
+                right_node._left = left_node
+            if self._value_index is not None:
+                self._value_index.extend(nodes)
+        last_element: LinkedListNode = self._tail._left
+        if last_element is self._head:
+            # last_element is head
+            last_element._right = nodes[0]
+            self._head._data += 1
+        else:
+            self._joint(last_element, nodes[0])
+        self._tail._left = nodes[-1]
+        self._merge_pending_stores()
+        self._index_store.extend(nodes)
+        self._tail._data += len(nodes)
+
     def _joint(self, left_node: LinkedListNode, right_node: LinkedListNode) -> None:
         """
         Joins two memory blocks.
@@ -425,51 +2172,28 @@ class LinkedList:
         raise NotImplementedError('...')
 
     def __mul__(self, value: int):
-        _ll = LinkedList()
-        while value:
-            _pointer = self._head._right
-            while _pointer:
-                _ll.append(_pointer._data)
-                _pointer=_pointer._right
-            value -= 1
+        _ll = self._new_like()
+        _ll._extend_values(list(self._values()) * value)
         return _ll
     
     def __imul__(self, value: int) -> 'LinkedList':
-        self_last_node = self._tail.left
-        while value:
-            _pointer = self._head._right
-            while _pointer != self_last_node:
-                self.append(_pointer.data)
-                _pointer=_pointer._right
-            else:
-                self.append(self_last_node)
-            value -= 1
+        # `value` more copies of the list are appended
+        self._extend_values(list(self._values()) * value)
         return self
     
     def __add__(self, other: 'LinkedList') -> 'LinkedList':
-        new_ll = LinkedList()
-        _pointer = self._head._right
-        while _pointer:
-            new_ll.append(_pointer.data)
-            _pointer = _pointer.right
-        _pointer = other._head._right
-        while _pointer:
-            new_ll.append(_pointer.data)
-            _pointer = _pointer.right
+        new_ll = self._new_like()
+        new_ll._extend_values(itertools.chain(self._values(), other._values()))
         return new_ll
     
     def __iadd__(self, other: 'LinkedList') -> Self:
-        # first node @ self
-        self_last_element_pointer = self._tail._left
-        # last node @ other
-        other_first_element_pointer = other._head._right
-        # linking
-        self_last_element_pointer._right = other_first_element_pointer
-        other_first_element_pointer.left = self_last_element_pointer
-        self._tail = other._tail
+        # the nodes of `other` are moved , `other` is left empty
+        self.splice(other)
         return self
     
     def __lt__(self, other: 'LinkedList') -> Optional[bool]:
+        if not isinstance(other, LinkedList):
+            return NotImplemented
 
         self_pointer = self._head._right
         other_pointer = other._head._right
@@ -494,6 +2218,8 @@ class LinkedList:
         
 
     def __ge__(self, other: 'LinkedList'):
+        if not isinstance(other, LinkedList):
+            return NotImplemented
         self_pointer = self._head._right
         other_pointer = other._head._right
 
@@ -516,6 +2242,8 @@ class LinkedList:
             return True
     
     def __gt__(self, other: 'LinkedList'):
+        if not isinstance(other, LinkedList):
+            return NotImplemented
 
         self_pointer = self._head._right
         other_pointer = other._head._right
@@ -540,6 +2268,8 @@ class LinkedList:
         
     
     def __le__(self, other: 'LinkedList'):
+        if not isinstance(other, LinkedList):
+            return NotImplemented
         self_pointer = self._head._right
         other_pointer = other._head._right
 
@@ -565,6 +2295,8 @@ class LinkedList:
         """
         Comapring two linked lists for equlity
         """
+        if not isinstance(other, LinkedList):
+            return NotImplemented
         self_pointer = self._head._right 
         other_pointer = other.head.right
 
@@ -578,49 +2310,50 @@ class LinkedList:
         return False
     
     def __ne__(self, other: 'LinkedList'):
-        return not self.__eq__(other)
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
     
     def __delitem__(self, index: int):
+        """
+        Deletes the element at `index` , out of range indices are ignored.
 
-        _pointer = self._head._right
-        index_counter = 0
-        while _pointer:
-            if index_counter == index:
-                prev_node = _pointer.left
-                next_node = _pointer.right
-                # link prev --> next
-                if prev_node:
-                    prev_node.right = next_node
-                else:   # this means current pointer is first node
-                    self._head.right = next_node
-                # link next <-- prev
-                if next_node:
-                    next_node.left = prev_node
-                else:   # this means current pointer is last node
-                    self._tail.left = prev_node
-                # resume the pointer
-                _pointer = _pointer.right
-                index_counter += 1
-                break # break from here & resume in next loop --- (1)
-            _pointer = _pointer.right
-            index_counter += 1
-        else:
-            # if loop completes without being able to search a valid index
+        Complexity:
+            O(log N) with `SkipListIndexStore` , O(min(index, N-index)) with `IndexStore`
+        """
+        self._sync_index()
+        if index not in self._index_store:
             return
-        
         # post node deletion : adjust the indexes in index_store.
-        # decrement the indexes of remaining nodes --- (1) resuming from prev loop break
-        while _pointer:
-            self._index_store[index_counter-1] = _pointer
-            _pointer = _pointer.right
-            index_counter += 1
+        node: LinkedListNode = self._index_store.pop(index)
+        if self._value_index is not None:
+            self._value_index.discard(node)
+        prev_node = node._left
+        next_node = node._right
+        if prev_node is None and next_node is None:
+            # last remaining element : back to the initial markers state
+            self._head._right = self._tail
+            self._tail._left = self._head
+            self._head._data = -1
         else:
-            # updating tail with last index value
-            self._tail._data = index_counter-2
-            # removing the stale index entry from index_store
-            self._index_store.pop(index_counter-1, None)
+            # link prev --> next
+            if prev_node:
+                prev_node._right = next_node
+            else:   # this means current node is first node
+                self._head._right = next_node
+            # link next <-- prev
+            if next_node:
+                next_node._left = prev_node
+            else:   # this means current node is last node
+                self._tail._left = prev_node
+        # updating tail with last index value
+        self._tail._data -= 1
+        if self._node_pool is not None:
+            self._node_pool.release(node)
         
     def __contains__(self, value: Union[Any, LinkedListNode]) -> bool:
+        nodes = self._indexed_nodes(value.data if isinstance(value, LinkedListNode) else value)
+        if nodes is not None:
+            return bool(nodes)
         _pointer = self._head.right
         while _pointer:
             if (isinstance(value, LinkedListNode) and _pointer.data == value.data) or _pointer.data == value:
@@ -637,27 +2370,58 @@ class LinkedList:
 
         Returns:
             LinkedListNode or LinkedList: The node or sublist corresponding to the key.
+                ( a `LinkedListView` for slices , with `slice_views` set )
 
         Raises:
             TypeError: If the key is not an integer or slice.
+            KeyError: If the index is out of range.
+
+        Complexity:
+            O(1) with `IndexStore` , O(min(index, N-index)) with `EndsIndexStore`
+                or after a `delete` ( see `_walk_to` )
         """
+        self._merge_pending_stores()
+        size = self._tail._data + 1
         if isinstance(key, int):
             # Handle integer indexing
+            if key < 0:
+                key += size
+            if self._deleted_nodes:
+                return self._walk_to(key)
             return self._index_store[key]
         elif isinstance(key, slice):
-            # Handle slicing
-            _ll = LinkedList()
-            step = key.step if key.step is not None else 1
-            stop = key.stop if key.stop and 0 <= key.stop < len(self._index_store) else len(self._index_store)
-            start = key.start if key.start and 0 <= key.start < len(self._index_store) else 0
-            
-            for idx in range(start, stop, step):
-                obj = self._index_store[idx]
-                _ll.append(obj.data)
-            return _ll
+            # Handle slicing ( -ve bounds count from the end , as for `list` )
+            self._sync_index()
+            view = LinkedListView(self, range(*key.indices(size)))
+            if self.slice_views:
+                return view
+            return view.copy()
         else:
             raise TypeError("Invalid key type")
 
+    def _walk_to(self, index: int) -> LinkedListNode:
+        """
+        Finds the node at `index` while the index store is stale , from
+        whichever end is closer.
+
+        * the steps walked are counted , once they add up to N the store is
+            rebuilt ( `_sync_index` ) , hence a run of lookups costs no more
+            than rebuilding first , while a few lookups skip the rebuild .
+
+        Raises:
+            KeyError: If `index` is out of range.
+
+        Complexity:
+            O(min(index, N-index))
+        """
+        size = self._tail._data + 1
+        if 0 <= index < size:
+            self._stale_steps += min(index, size - 1 - index)
+            if self._stale_steps >= size:
+                self._sync_index()
+                return self._index_store[index]
+        return _walk(self._head._right, self._tail._left, size, index)
+
     def __setitem__(self):
         raise NotImplementedError('...')
     
@@ -668,7 +2432,7 @@ class LinkedList:
         Returns:
             Iterator: The iterator for the linked list.
         """
-        if inspect.isclass(self.root_iterator_cls):
+        if not isinstance(self.root_iterator_cls, str):
             return self.root_iterator_cls(self)
         else:
             # memory efficient approach
@@ -687,58 +2451,80 @@ class LinkedList:
         """
         return self._tail.data - self._head.data + 1
     
-    def __sizeof__(self):
-        # Calculate the size of all nodes
-        all_nodes_size = sys.getsizeof(self._head) + sys.getsizeof(self._tail)
-        for node in iter(self):
+    def _size_breakdown(self) -> Dict[str, int]:
+        """
+        Splits the memory footprint of the list into it's components .
+
+        Returns:
+            Dict[str, int]: size in bytes per component .
+        """
+        # Calculate the size of all nodes ( head & tail markers included )
+        nodes = [self._head, self._tail]
+        _pointer = self._head._right
+        while _pointer is not None and _pointer is not self._tail:
+            nodes.append(_pointer)
+            _pointer = _pointer._right
+        all_nodes_size = 0
+        metadata_size = 0
+        shared_metadata = set()
+        for node in nodes:
             all_nodes_size += sys.getsizeof(node)
+            # slotted nodes don't have it , subclasses without `__slots__` do
+            if hasattr(node, '__dict__'):
+                all_nodes_size += sys.getsizeof(node.__dict__)
+            # metadata is immutable & may be shared , count every object once
+            if id(node._metadata) not in shared_metadata:
+                shared_metadata.add(id(node._metadata))
+                metadata_size += sys.getsizeof(node._metadata)
 
         # Calculate the size of the idex store
         index_store_size = sys.getsizeof(self._index_store)
+        index_store_size += sum(sys.getsizeof(store) for store in self._pending_stores)
 
         # Calculate the size of the iterator class reference
         iterator_class_ref_size = sys.getsizeof(self.root_iterator_cls)
         
         # Add the size of the object itself (base object size)
         # This is typically the size of an empty instance of the class
-        base_object_size = super().__sizeof__() 
+        base_object_size = super().__sizeof__()
 
-        return base_object_size + iterator_class_ref_size + index_store_size + all_nodes_size
+        return {
+            'base_object_size': base_object_size,
+            'iterator_class_ref_size': iterator_class_ref_size,
+            'index_store_size': index_store_size,
+            'all_nodes_size': all_nodes_size,
+            'metadata_size': metadata_size,
+        }
+
+    def __sizeof__(self):
+        return sum(self._size_breakdown().values())
     
     def print_detailed_size_information(self):
-        # Calculate the size of all nodes
-        all_nodes_size = sys.getsizeof(self._head) + sys.getsizeof(self._tail)
-        for node in iter(self):
-            all_nodes_size += sys.getsizeof(node)
-
-        # Calculate the size of the idex store
-        index_store_size = sys.getsizeof(self._index_store)
-
-        # Calculate the size of the iterator class reference
-        iterator_class_ref_size = sys.getsizeof(self.root_iterator_cls)
-        
-        # Add the size of the object itself (base object size)
-        # This is typically the size of an empty instance of the class
-        base_object_size = super().__sizeof__()
-        
-        total = base_object_size + iterator_class_ref_size + index_store_size + all_nodes_size
-        percent = lambda field: field/total*100 
-        cols = ['base_object_size', 'iterator_class_ref_size', 'index_store_size', 'all_nodes_size']
+        sizes = self._size_breakdown()
+        total = sum(sizes.values())
+        percent = lambda field: field/total*100
+        cols = list(sizes) + ['unit']
         data = [
             cols,
-            [locals()[v_name] for v_name in cols] + ['bytes'],
-            [percent(locals()[v_name]) for v_name in cols] + ['%']
+            [sizes[v_name] for v_name in sizes] + ['bytes'],
+            [percent(sizes[v_name]) for v_name in sizes] + ['%']
         ]
 
         # Using f-strings (Python 3.6+)
-        header = f"| {data[0][0]:<10} | {data[0][1]:^5} | {data[0][2]:>10} | {data[0][3]:>10} |"
+        widths = [max(len(col), 6) for col in cols]
+        header = "| " + " | ".join(f"{col:^{width}}" for col, width in zip(cols, widths)) + " |"
         print("-" * len(header))
         print(header)
         print("-" * len(header))
         for row in data[1:]:
-            print(f"| {row[0]:^16.2f} | {row[1]:^23.2f} | {row[2]:^16.2f} | {row[3]:^14.2f} | {row[4]:^16} | ")
+            cells = [f"{value:^{width}.2f}" for value, width in zip(row[:-1], widths)]
+            print("| " + " | ".join(cells + [f"{row[-1]:^{widths[-1]}}"]) + " |")
         print("-" * len(header))
         print(f"* Total Size : {total}")
+        # markers are not elements , an empty list still has them
+        elements = len(self._index_store) + sum(len(store) for store in self._pending_stores)
+        if elements:
+            print(f"* Bytes per Element : {(sizes['all_nodes_size'] + sizes['index_store_size'])/elements:.2f}")
         print("\n")
     
     def __reversed__(self):
@@ -764,6 +2550,158 @@ class LinkedList:
         """
         return f"[{', '.join([str(node.data) for node in iter(self)]).strip(',')}]"
 
+
+def _rebuild(cls: Type[LinkedList], config: Tuple[Any, ...], values: List[Any]) -> LinkedList:
+    """Unpickles a list : `cls(*config)` , then it's data in one bulk pass."""
+    _ll = cls(*config)
+    _ll._extend_values(values)
+    return _ll
+
+
+# marks the end of the shorter side , when comparing
+_EXHAUSTED = object()
+
+
+class LinkedListView:
+    """
+    Read only window over the positions `indices` of a linked list.
+
+    * returned by `ll[a:b:c]` when `slice_views` is set , in place of a copy .
+    * nothing is allocated per element , the nodes are read from the list
+        on demand : iteration costs O(K) for K positions .
+    * positions are resolved at access time , hence edits of the list
+        show through ( and positions that went away raise `KeyError` ) .
+    * `copy()` materializes it into a `LinkedList` .
+
+    >>> ll = LinkedList(slice_views=True)
+    >>> ll.extend(range(10))
+    >>> view = ll[2:8:2]
+    >>> print(view, len(view), view[1].data)
+    [2, 4, 6] 3 4
+    >>> print(view.copy())
+    [2, 4, 6]
+    """
+    __slots__ = ('_ll', '_indices')
+
+    def __init__(self, ll: LinkedList, indices: range):
+        """
+        Initializes a LinkedListView instance.
+
+        Args:
+            ll (LinkedList): The list viewed.
+            indices (range): The positions viewed , in order.
+        """
+        self._ll = ll
+        self._indices = indices
+
+    def copy(self) -> LinkedList:
+        """
+        Materializes the view into a new list.
+
+        Complexity:
+            O(K)
+        """
+        _ll = self._ll._new_like()
+        _ll._extend_values(node._data for node in self)
+        return _ll
+
+    def _values(self) -> Generator[Any, None, None]:
+        """Generates the data of the viewed elements."""
+        for node in self:
+            yield node._data
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[LinkedListNode, 'LinkedListView']:
+        if isinstance(key, int):
+            try:
+                return self._ll[self._indices[key]]
+            except IndexError:
+                raise KeyError(key) from None
+        elif isinstance(key, slice):
+            return LinkedListView(self._ll, self._indices[key])
+        else:
+            raise TypeError("Invalid key type")
+
+    def __iter__(self) -> Generator[LinkedListNode, None, None]:
+        indices = self._indices
+        if not indices:
+            return
+        if indices.step in (1, -1):
+            # one positional lookup , then walk the links
+            _pointer = self._ll[indices[0]]
+            for _ in indices:
+                yield _pointer
+                _pointer = _pointer._right if indices.step == 1 else _pointer._left
+            return
+        for index in indices:
+            yield self._ll[index]
+
+    def __reversed__(self) -> Generator[LinkedListNode, None, None]:
+        return iter(self[::-1])
+
+    def __contains__(self, value: Union[Any, LinkedListNode]) -> bool:
+        if isinstance(value, LinkedListNode):
+            value = value.data
+        return any(data == value for data in self._values())
+
+    @staticmethod
+    def _values_of(other: Any) -> Optional[Iterator[Any]]:
+        """Data of a view or list to compare with , `None` for anything else."""
+        if isinstance(other, (LinkedListView, LinkedList)):
+            return other._values()
+        return None
+
+    def _compare(self, other: Any) -> Any:
+        """Lexicographic comparison : -1 , 0 or 1 ( shorter is smaller )."""
+        values = self._values_of(other)
+        if values is None:
+            return NotImplemented
+        for left, right in itertools.zip_longest(self._values(), values, fillvalue=_EXHAUSTED):
+            if left is _EXHAUSTED:
+                return -1
+            if right is _EXHAUSTED:
+                return 1
+            if left != right:
+                return -1 if left < right else 1
+        return 0
+
+    def __eq__(self, other: Any) -> bool:
+        values = self._values_of(other)
+        if values is None:
+            return NotImplemented
+        return all(left == right for left, right in itertools.zip_longest(self._values(), values, fillvalue=_EXHAUSTED))
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __lt__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result < 0
+
+    def __le__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result <= 0
+
+    def __gt__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result > 0
+
+    def __ge__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result >= 0
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return f"[{', '.join(str(data) for data in self._values())}]"
+
+    def __repr__(self) -> str:
+        return f"LinkedListView({self}, indices={self._indices!r})"
+
+
 class Operations:
     """
     Utility class for performing operations on linked lists.
@@ -837,8 +2775,7 @@ class Operations:
             LinkedList: The resulting linked list.
         """
         _ll = LinkedList()
-        for value in obj:
-            _ll.append(value)
+        _ll._extend_values(obj)
         return _ll
 
 if __name__ == '__main__':
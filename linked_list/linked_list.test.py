@@ -5,7 +5,10 @@ This module contains comprehensive test cases for the LinkedList implementation,
 including tests for MemoryBlock, LinkedListNode, LinkedList, Iterators, and Operations.
 """
 
+import gc
 import unittest
+import pickle
+import random
 import sys
 from linked_list import (
     MemoryBlock,
@@ -14,6 +17,15 @@ from linked_list import (
     LinkedList,
     LRIterator,
     RLIterator,
+    IndexStore,
+    SkipListIndexStore,
+    LazyIndexStore,
+    EndsIndexStore,
+    INDEX_STORES,
+    NodePool,
+    SHARED_NODE_POOL,
+    WeakBackLinkNode,
+    LinkedListView,
     Operations
 )
 
@@ -93,6 +105,20 @@ class TestLinkedListNode(unittest.TestCase):
         node = LinkedListNode(10)
         self.assertIsInstance(node, MemoryBlock)
 
+    def test_slotted_layout(self):
+        """Test that nodes don't carry a per-instance __dict__"""
+        node = LinkedListNode(10)
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
+    def test_default_metadata_is_shared(self):
+        """Test that nodes created by the list share the default metadata"""
+        ll = LinkedList()
+        ll.append(1)
+        ll.prepend(0)
+        self.assertIs(ll[0].metadata, ll[1].metadata)
+
 
 class TestLinkedList(unittest.TestCase):
     """Test cases for LinkedList class"""
@@ -436,6 +462,52 @@ class TestLinkedList(unittest.TestCase):
         values = [node.data for node in ll1]
         self.assertEqual(values, [1, 2, 3, 4])
 
+    def test_iadd_moves_nodes(self):
+        """Test += relinks the nodes and empties the other list"""
+        ll1 = Operations.ll_from([1, 2])
+        ll2 = Operations.ll_from([3, 4, 5])
+        moved = ll2[0]
+        ll1 += ll2
+        self.assertIs(ll1[2], moved)
+        self.assertEqual(len(ll1), 5)
+        self.assertEqual([ll1[i].data for i in range(5)], [1, 2, 3, 4, 5])
+        self.assertEqual([node.data for node in reversed(ll1)], [5, 4, 3, 2, 1])
+        self.assertEqual(str(ll2), str(LinkedList()))
+        self.assertEqual(len(ll2), len(LinkedList()))
+        ll2.append(6)
+        self.assertEqual(str(ll2), "[6]")
+        self.assertEqual(str(ll1), "[1, 2, 3, 4, 5]")
+
+    def test_splice_merges_index_lazily(self):
+        """Test spliced indexes are merged on the next positional access"""
+        ll = LinkedList()
+        others = [Operations.ll_from(range(i * 3, i * 3 + 3)) for i in range(4)]
+        for other in others:
+            ll.splice(other)
+        self.assertEqual(len(ll._pending_stores), 4)
+        self.assertEqual(len(ll), 12)
+        self.assertEqual([node.data for node in ll], list(range(12)))
+        ll.prepend(-1)
+        self.assertEqual(ll._pending_stores, [])
+        self.assertEqual([ll[i].data for i in range(13)], list(range(-1, 12)))
+
+    def test_splice_edge_cases(self):
+        """Test splicing empty lists , into empty lists and with itself"""
+        ll = LinkedList()
+        ll.splice(LinkedList())
+        self.assertEqual(str(ll), str(LinkedList()))
+        ll.splice(Operations.ll_from([1, 2]))
+        self.assertEqual(str(ll), "[1, 2]")
+        self.assertIsNone(ll[0].left)
+        ll.splice(ll)
+        self.assertEqual(str(ll), "[1, 2, 1, 2]")
+        skip = LinkedList(index_store_cls=SkipListIndexStore)
+        skip.append(0)
+        skip.splice(ll)
+        del skip[1]
+        self.assertEqual([skip[i].data for i in range(4)], [0, 2, 1, 2])
+        self.assertIsInstance(skip.index_store, SkipListIndexStore)
+
     def test_mul_operator(self):
         """Test multiplication operator"""
         ll1 = LinkedList()
@@ -474,6 +546,575 @@ class TestLinkedList(unittest.TestCase):
         values = [node.data for node in reversed(self.ll)]
         self.assertEqual(values, [3, 2, 1])
 
+    def test_insert(self):
+        """Test inserting in the middle and at both ends"""
+        for i in [1, 2, 4]:
+            self.ll.append(i)
+        self.ll.insert(2, 3)
+        self.ll.insert(0, 0)
+        self.ll.insert(100, 5)
+        self.ll.insert(-1, 4.5)
+        values = [node.data for node in self.ll]
+        self.assertEqual(values, [0, 1, 2, 3, 4, 4.5, 5])
+        self.assertEqual([self.ll[i].data for i in range(len(self.ll))], values)
+        self.assertEqual([node.data for node in reversed(self.ll)], values[::-1])
+
+    def test_insert_into_empty_list(self):
+        """Test inserting into an empty list"""
+        self.ll.insert(3, 'a')
+        self.assertEqual(str(self.ll), "[a]")
+        self.assertEqual(len(self.ll), 1)
+
+    def test_extend(self):
+        """Test extending with iterables and linked lists"""
+        self.ll.extend([])
+        self.assertEqual(len(self.ll.index_store), 0)
+        self.ll.extend(range(3))
+        self.ll.prepend(-1)
+        self.ll.extend(Operations.ll_from([3, 4]))
+        self.ll.extend(LinkedList())
+        self.ll.extend(x for x in [5])
+        values = [node.data for node in self.ll]
+        self.assertEqual(values, [-1, 0, 1, 2, 3, 4, 5])
+        self.assertEqual(len(self.ll), 7)
+        self.assertEqual([self.ll[i].data for i in range(7)], values)
+        self.assertEqual([node.data for node in reversed(self.ll)], values[::-1])
+        self.ll.append(6)
+        self.assertEqual(self.ll[7].data, 6)
+
+    def test_extend_with_itself(self):
+        """Test extending a list with itself"""
+        self.ll.extend([1, 2])
+        self.ll.extend(self.ll)
+        self.assertEqual(str(self.ll), "[1, 2, 1, 2]")
+
+    def test_arithmetic_with_empty_lists(self):
+        """Test +, * and *= don't pick up the markers of empty lists"""
+        empty = LinkedList()
+        ll = Operations.ll_from([1])
+        self.assertEqual(str(empty + ll), "[1]")
+        self.assertEqual(str(ll + empty), "[1]")
+        self.assertEqual(len((empty * 3).index_store), 0)
+        ll *= 2
+        self.assertEqual([node.data for node in ll], [1, 1, 1])
+
+    def test_slice_views(self):
+        """Test slicing gives zero copy views with slice_views set"""
+        ll = LinkedList(slice_views=True)
+        ll.extend(range(10))
+        view = ll[2:8]
+        self.assertIsInstance(view, LinkedListView)
+        self.assertEqual(len(view), 6)
+        self.assertIs(view[1], ll[3])
+        self.assertEqual([node.data for node in view], [2, 3, 4, 5, 6, 7])
+        self.assertEqual([node.data for node in reversed(view)], [7, 6, 5, 4, 3, 2])
+        self.assertEqual(str(view[::2]), "[2, 4, 6]")
+        self.assertEqual(str(view[::-3]), "[7, 4]")
+        self.assertIn(4, view)
+        self.assertNotIn(9, view)
+        with self.assertRaises(KeyError):
+            view[6]
+        ll[3].data = 30
+        self.assertEqual(view[1].data, 30)
+
+    def test_slice_view_copy_and_comparisons(self):
+        """Test views materialize on copy and compare like lists"""
+        ll = LinkedList(slice_views=True)
+        ll.extend([1, 5, 10, 1, 5])
+        copied = ll[0:2].copy()
+        self.assertIsInstance(copied, LinkedList)
+        self.assertIsInstance(copied[0:1], LinkedListView)
+        self.assertEqual(str(copied), "[1, 5]")
+        self.assertTrue(ll[0:2] == ll[3:5])
+        self.assertTrue(ll[0:2] == copied)
+        self.assertTrue(copied == ll[3:5])
+        self.assertTrue(ll[0:2] < ll[0:3])
+        self.assertTrue(ll[1:2] > copied)
+        self.assertTrue(copied <= ll[0:2])
+        self.assertTrue(ll[0:3] != ll[0:2])
+        self.assertFalse(ll[0:2] == [1, 5])
+        self.assertFalse(ll == 5)
+        self.assertTrue(ll != 5)
+        with self.assertRaises(TypeError):
+            ll < 5
+
+    def test_copy(self):
+        """Test copy gives an independent list with the same data"""
+        self.assertEqual(str(self.ll.copy()), str(LinkedList()))
+        ll = LinkedList(index_store_cls='SkipListIndexStore')
+        ll.extend([1, 2, 3])
+        copied = ll.copy()
+        self.assertEqual(copied, ll)
+        self.assertIsNot(copied[0], ll[0])
+        self.assertIsInstance(copied.index_store, SkipListIndexStore)
+        copied.append(4)
+        self.assertEqual(len(ll), 3)
+
+    def test_pickle(self):
+        """Test pickling keeps the data & config , without recursing along the links"""
+        self.assertEqual(str(pickle.loads(pickle.dumps(self.ll))), str(LinkedList()))
+        ll = LinkedList('RLIterator', 'SkipListIndexStore', slice_views=True, value_index=True)
+        ll.extend([3, 'a', 3, None])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(ll, protocol))
+            self.assertEqual(loaded, ll)
+            self.assertEqual(loaded.root_iterator_cls, 'RLIterator')
+            self.assertIsInstance(loaded.index_store, SkipListIndexStore)
+            self.assertIsInstance(loaded[0:2], LinkedListView)
+            self.assertEqual(loaded.count(3), 2)
+        long_ll = Operations.ll_from(range(sys.getrecursionlimit() * 100))
+        loaded = pickle.loads(pickle.dumps(long_ll))
+        self.assertEqual(loaded, long_ll)
+        self.assertEqual(loaded[len(long_ll) - 1].data, len(long_ll) - 1)
+
+    def test_to_bytes_from_bytes(self):
+        """Test the array backed binary round trip"""
+        self.assertEqual(self.ll.to_bytes(), b'')
+        self.ll.extend([1, -2, 2 ** 40])
+        loaded = LinkedList.from_bytes(self.ll.to_bytes())
+        self.assertEqual(loaded, self.ll)
+        floats = Operations.ll_from([0.5, -1.25])
+        loaded = LinkedList.from_bytes(floats.to_bytes('d'), 'd', index_store_cls='LazyIndexStore')
+        self.assertEqual(str(loaded), "[0.5, -1.25]")
+        self.assertIsInstance(loaded.index_store, LazyIndexStore)
+        with self.assertRaises(OverflowError):
+            self.ll.to_bytes('b')
+        with self.assertRaises(TypeError):
+            Operations.ll_from(['a']).to_bytes()
+        with self.assertRaises(ValueError):
+            LinkedList.from_bytes(b'123')
+
+    def test_popleft(self):
+        """Test popleft removes the first element and returns its data"""
+        with self.assertRaises(IndexError):
+            self.ll.popleft()
+        self.ll.extend([1, 2, 3])
+        self.assertEqual(self.ll.popleft(), 1)
+        self.assertEqual(self.ll[0].data, 2)
+        self.assertIsNone(self.ll[0].left)
+        self.assertEqual([self.ll.popleft(), self.ll.popleft()], [2, 3])
+        self.assertEqual(str(self.ll), str(LinkedList()))
+        self.ll.append(4)
+        self.assertEqual(str(self.ll), "[4]")
+
+    def test_popleft_as_a_queue_trims_the_index(self):
+        """Test append + popleft keep the index store bounded"""
+        for value in range(10000):
+            self.ll.append(value)
+            if value % 2:
+                self.assertEqual(self.ll.popleft(), value // 2)
+        self.assertEqual(len(self.ll), 5000)
+        self.assertLess(len(self.ll.index_store._slots), 2 * 5000 + 64)
+        self.assertEqual([self.ll[i].data for i in (0, 2500, 4999)], [5000, 7500, 9999])
+        for lazy in (LinkedList(index_store_cls='LazyIndexStore'), LinkedList(index_store_cls='SkipListIndexStore')):
+            lazy.extend(range(100))
+            self.assertEqual([lazy.popleft() for _ in range(60)], list(range(60)))
+            self.assertEqual([lazy[i].data for i in range(40)], list(range(60, 100)))
+
+    def test_count_index_remove(self):
+        """Test count , index & remove behave like list's , with & without a value index"""
+        for ll in (LinkedList(), LinkedList(value_index=True), LinkedList(index_store_cls='SkipListIndexStore', value_index=True)):
+            expected = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+            ll.extend(expected)
+            self.assertEqual([ll.count(v) for v in range(10)], [expected.count(v) for v in range(10)])
+            self.assertEqual([ll.index(v) for v in (3, 1, 5, 6)], [expected.index(v) for v in (3, 1, 5, 6)])
+            self.assertEqual(ll.index(5, 5), expected.index(5, 5))
+            self.assertEqual(ll.index(5, -3, -1), expected.index(5, -3, -1))
+            with self.assertRaises(ValueError):
+                ll.index(9, 0, 5)
+            with self.assertRaises(ValueError):
+                ll.index(7)
+            ll.remove(5)
+            expected.remove(5)
+            ll.remove(3)
+            expected.remove(3)
+            self.assertEqual([node.data for node in ll], expected)
+            self.assertEqual([ll[i].data for i in range(len(expected))], expected)
+            with self.assertRaises(ValueError):
+                ll.remove(7)
+            self.assertTrue(5 in ll and 7 not in ll and [] not in ll)
+
+    def test_value_index_follows_edits(self):
+        """Test the value index stays in line with the nodes of the list"""
+        ll = LinkedList(value_index=True)
+        ll.append('a')
+        ll.prepend('b')
+        ll.insert(1, 'a')
+        ll.extend(['c', 'a'])
+        self.assertEqual(ll.count('a'), 3)
+        self.assertEqual(ll.popleft(), 'b')
+        del ll[0]
+        self.assertEqual((ll.count('a'), ll.count('b'), 'b' in ll), (2, 0, False))
+        other = LinkedList()
+        other.extend(['a', 'd'])
+        ll += other
+        self.assertEqual((ll.count('a'), ll.count('d'), str(other)), (3, 1, str(LinkedList())))
+        indexed = LinkedList(value_index=True)
+        indexed.extend(['d', 'e'])
+        ll.splice(indexed)
+        self.assertEqual((ll.count('d'), ll.count('e'), indexed.count('d')), (2, 1, 0))
+        copied = ll.copy() * 2
+        self.assertEqual(copied.count('a'), 6)
+        self.assertIsNone(LinkedList().value_index)
+        # unhashable data is refused , the list is left untouched
+        with self.assertRaises(TypeError):
+            ll.append([1])
+        with self.assertRaises(TypeError):
+            ll.extend(['f', [1]])
+        self.assertEqual((len(ll), ll.count('f')), (7, 0))
+        self.assertEqual(str(ll), "[a, c, a, a, d, d, e]")
+
+    def test_delete_node_handles(self):
+        """Test delete unlinks the handles given by append & prepend"""
+        for index_store_cls in INDEX_STORES:
+            ll = LinkedList(index_store_cls=index_store_cls, value_index=True)
+            self.assertIsNone(ll.append('x'))
+            nodes = {value: ll.append(value, return_node=True) for value in 'bcd'}
+            nodes['a'] = ll.prepend('a', return_node=True)
+            ll.delete(nodes['c'])
+            ll.delete(nodes['a'])
+            ll.delete(nodes['d'])
+            self.assertEqual(str(ll), "[x, b]")
+            self.assertEqual((len(ll), ll.count('c')), (2, 0))
+            self.assertEqual([ll[i].data for i in range(2)], ['x', 'b'])
+            self.assertIsNone(ll[0].left)
+            self.assertEqual([node.data for node in reversed(ll)], ['b', 'x'])
+            with self.assertRaises(ValueError):
+                ll.delete(nodes['c'])
+            with self.assertRaises(ValueError):
+                ll.delete(ll.head)
+            with self.assertRaises(ValueError):
+                ll.delete(LinkedListNode('y'))
+            ll.delete(ll[1])
+            ll.delete(ll[0])
+            self.assertEqual(str(ll), str(LinkedList()))
+            ll.append('z')
+            self.assertEqual((str(ll), ll[0].data), ("[z]", 'z'))
+
+    def test_delete_foreign_nodes(self):
+        """Test delete rejects the nodes of another list it can tell apart"""
+        for index_store_cls in INDEX_STORES:
+            ll, other = LinkedList(index_store_cls=index_store_cls), LinkedList(index_store_cls=index_store_cls)
+            ll.extend('abc')
+            other.extend('xyz')
+            for node in (other[0], other[2], other.head, LinkedListNode('y')):
+                with self.assertRaises(ValueError):
+                    ll.delete(node)
+            self.assertEqual((str(ll), len(ll), str(other), len(other)), ("[a, b, c]", 3, "[x, y, z]", 3))
+            # middle nodes are told apart through the value index
+            ll, other = LinkedList(index_store_cls=index_store_cls, value_index=True), LinkedList()
+            ll.extend('abc')
+            other.extend('abc')
+            with self.assertRaises(ValueError):
+                ll.delete(other[1])
+            self.assertEqual((str(ll), len(ll), str(other), len(other)), ("[a, b, c]", 3, "[a, b, c]", 3))
+            ll.delete(ll[1])
+            self.assertEqual((str(ll), len(ll)), ("[a, c]", 2))
+
+    def test_negative_indices(self):
+        """Test -ve indices count from the end , with every index store"""
+        for index_store_cls in [*INDEX_STORES, None]:
+            ll = LinkedList(index_store_cls=index_store_cls)
+            ll.extend(range(5))
+            self.assertEqual([ll[i].data for i in range(-1, -6, -1)], [4, 3, 2, 1, 0])
+            with self.assertRaises(KeyError):
+                ll[-6]
+            with self.assertRaises(KeyError):
+                ll[5]
+            with self.assertRaises(KeyError):
+                LinkedList(index_store_cls=index_store_cls)[-1]
+
+    def test_stale_lookups_walk_from_closer_end(self):
+        """Test lookups after delete walk the links , then rebuild the index once"""
+        ll = LinkedList()
+        nodes = [ll.append(value, return_node=True) for value in range(100)]
+        ll.delete(nodes[10])
+        ll.delete(nodes[90])
+        self.assertEqual([ll[0].data, ll[-1].data, ll[50].data, ll[96].data], [0, 99, 51, 98])
+        self.assertTrue(ll._deleted_nodes)
+        self.assertEqual(ll._stale_steps, 0 + 0 + 47 + 1)
+        self.assertEqual(ll[45].data, 46)
+        self.assertEqual(ll._stale_steps, 48 + 45)
+        self.assertEqual(ll[20].data, 21)
+        self.assertFalse(ll._deleted_nodes)
+        self.assertEqual(ll._stale_steps, 0)
+        self.assertEqual([ll[i].data for i in range(98)], [v for v in range(100) if v not in (10, 90)])
+
+    def test_ends_index_store(self):
+        """Test the list without a positional index ( `index_store_cls=None` )"""
+        ll = LinkedList(index_store_cls=None)
+        self.assertIsInstance(ll.index_store, EndsIndexStore)
+        expected = []
+        rng = random.Random(21)
+        for step in range(1500):
+            op = rng.random()
+            if op < 0.3:
+                ll.append(step)
+                expected.append(step)
+            elif op < 0.5:
+                ll.prepend(step)
+                expected.insert(0, step)
+            elif op < 0.65:
+                index = rng.randrange(len(expected) + 1)
+                ll.insert(index, step)
+                expected.insert(index, step)
+            elif op < 0.9 and expected:
+                index = rng.randrange(len(expected))
+                if op < 0.75:
+                    del ll[index]
+                elif op < 0.85:
+                    ll.delete(ll[index])
+                else:
+                    self.assertEqual(ll.popleft(), expected[0])
+                    index = 0
+                del expected[index]
+            elif op < 0.95:
+                ll.reverse()
+                expected.reverse()
+            else:
+                other = Operations.ll_from([step, -step])
+                other.delete(other[0])
+                ll += other
+                expected.append(-step)
+        self.assertFalse(ll._deleted_nodes)
+        self.assertEqual(str(ll), str(Operations.ll_from(expected)))
+        self.assertEqual([ll[i].data for i in range(len(expected))], expected)
+        self.assertEqual([node.data for node in ll.index_store.values()], expected)
+        self.assertEqual(pickle.loads(pickle.dumps(ll)).index_store.__class__, EndsIndexStore)
+
+    def test_node_pool(self):
+        """Test the nodes dropped by del & popleft are recycled , up to max_size"""
+        pool = NodePool(max_size=2)
+        ll = LinkedList(node_pool=pool)
+        self.assertIs(ll.node_pool, pool)
+        ll.extend(range(5))
+        self.assertEqual((pool.allocations, pool.reuses), (5, 0))
+        dropped = ll[1]
+        del ll[1]
+        self.assertEqual(ll.popleft(), 0)
+        del ll[0]
+        self.assertEqual(pool.stats(), {'allocations': 5, 'reuses': 0, 'releases': 2, 'overflows': 1, 'free': 2})
+        self.assertIsNone(dropped.data)
+        self.assertIsNone(dropped.left)
+        # # `delete` keeps the caller's node
+        node = ll[0]
+        ll.delete(node)
+        self.assertEqual((node.data, len(pool)), (3, 2))
+        ll.append(7)
+        ll.prepend(8)
+        ll.insert(1, 9)
+        self.assertEqual((pool.allocations, pool.reuses), (6, 2))
+        self.assertEqual(list(ll.values()), [8, 9, 4, 7])
+        self.assertEqual([ll[i].data for i in range(4)], [8, 9, 4, 7])
+        self.assertIs(ll.copy().node_pool, pool)
+        self.assertIsNone(pickle.loads(pickle.dumps(ll)).node_pool)
+        self.assertIsNone(LinkedList().node_pool)
+        self.assertRaises(ValueError, NodePool, -1)
+
+    def test_clear(self):
+        """Test clear empties the list & breaks the links of it's nodes"""
+        for index_store_cls in INDEX_STORES:
+            ll = LinkedList(index_store_cls=index_store_cls, value_index=True)
+            ll.extend(range(10))
+            ll.delete(ll[4])
+            other = Operations.ll_from([10, 11])
+            ll += other
+            node = ll[2]
+            ll.clear()
+            self.assertEqual((str(ll), len(ll), list(ll.values())), ('[-1]', 1, []))
+            self.assertEqual((len(ll.index_store), ll.count(1), 1 in ll), (0, 0, False))
+            self.assertIsNone(node.left)
+            self.assertIsNone(node.right)
+            self.assertRaises(KeyError, ll.__getitem__, 0)
+            ll.clear()
+            ll.extend([1, 2])
+            ll.prepend(0)
+            self.assertEqual([ll[i].data for i in range(3)], [0, 1, 2])
+        # # no cycle is left for the cyclic GC
+        ll = Operations.ll_from(range(1000))
+        gc.collect()
+        ll.clear()
+        self.assertEqual(gc.collect(), 0)
+        pool = NodePool(max_size=4)
+        ll = LinkedList(node_pool=pool)
+        ll.extend(range(10))
+        ll.clear()
+        self.assertEqual(pool.stats()['free'], 4)
+
+    def test_weak_back_links(self):
+        """Test the nodes of a list with weak back-links make no reference cycle"""
+        ll = LinkedList(weak_back_links=True)
+        self.assertTrue(ll.weak_back_links)
+        ll.extend(range(5))
+        ll.append(5)
+        ll.prepend(-1)
+        ll.insert(3, 9)
+        del ll[1]
+        self.assertIsInstance(ll[0], WeakBackLinkNode)
+        self.assertEqual(list(ll.values()), [-1, 1, 9, 2, 3, 4, 5])
+        self.assertEqual([node.data for node in reversed(ll)], [5, 4, 3, 2, 9, 1, -1])
+        self.assertIs(ll[2].left, ll[1])
+        ll.reverse()
+        self.assertEqual(list(ll.values_reversed()), [-1, 1, 9, 2, 3, 4, 5])
+        self.assertTrue(pickle.loads(pickle.dumps(ll)).weak_back_links)
+        self.assertTrue(ll.copy().weak_back_links)
+        self.assertFalse(LinkedList().weak_back_links)
+        # # a dropped list is freed by reference counting
+        gc.collect()
+        kept = ll[6]
+        del ll
+        self.assertEqual(gc.collect(), 0)
+        self.assertIsNone(kept.left)
+        self.assertRaises(NotImplementedError, LinkedList, node_pool=NodePool(), weak_back_links=True)
+
+    def test_weak_back_links_without_index(self):
+        """Test weak back-links when no index store holds the nodes"""
+        ll = LinkedList(index_store_cls=None, weak_back_links=True)
+        ll.extend([1, 2, 3])
+        ll.reverse()
+        self.assertEqual((list(ll.values()), list(ll.values_reversed())), ([3, 2, 1], [1, 2, 3]))
+        ll.sort()
+        ll.prepend(0)
+        ll.insert(2, 9)
+        del ll[3]
+        self.assertEqual((list(ll.values()), list(ll.values_reversed())), ([0, 1, 9, 3], [3, 9, 1, 0]))
+        self.assertEqual([ll[i].data for i in (-1, 1)], [3, 1])
+
+    def test_reverse_empty(self):
+        """Test reversing an emptied list keeps the markers apart"""
+        for ll in (LinkedList(), LinkedList(index_store_cls=None, weak_back_links=True)):
+            ll.reverse()
+            ll.extend([1, 2])
+            ll.popleft()
+            ll.popleft()
+            ll.reverse()
+            self.assertEqual((str(ll), list(ll.values_reversed())), ('[-1]', []))
+            ll.extend([1, 2])
+            ll.clear()
+            ll.reverse()
+            ll.append(5)
+            self.assertEqual((list(ll.values()), list(ll.values_reversed()), len(ll)), ([5], [5], 1))
+
+    def test_node_pool_churn(self):
+        """Test a churn of inserts & deletes , on a pool shared by lists"""
+        first, second = LinkedList(node_pool=SHARED_NODE_POOL), LinkedList(node_pool=SHARED_NODE_POOL, value_index=True)
+        before = SHARED_NODE_POOL.stats()
+        expected = {id(first): [], id(second): []}
+        rng = random.Random(24)
+        for step in range(2000):
+            ll = rng.choice((first, second))
+            values = expected[id(ll)]
+            if values and rng.random() < 0.5:
+                index = rng.randrange(len(values))
+                if index:
+                    del ll[index]
+                    del values[index]
+                else:
+                    self.assertEqual(ll.popleft(), values.pop(0))
+            else:
+                ll.append(step)
+                values.append(step)
+        for ll in (first, second):
+            self.assertEqual(list(ll.values()), expected[id(ll)])
+            self.assertEqual([ll[i].data for i in range(len(ll.index_store))], expected[id(ll)])
+        self.assertEqual(sum(second.count(value) for value in expected[id(second)]), len(expected[id(second)]))
+        after = SHARED_NODE_POOL.stats()
+        created = sum(after[name] - before[name] for name in ('allocations', 'reuses'))
+        kept = len(expected[id(first)]) + len(expected[id(second)])
+        self.assertEqual(created, kept + after['releases'] - before['releases'] + after['overflows'] - before['overflows'])
+        self.assertGreater(after['reuses'] - before['reuses'], after['allocations'] - before['allocations'])
+
+    def test_delete_then_popleft_and_splice(self):
+        """Test the entries left by delete are skipped by popleft & carried by splice"""
+        ll = LinkedList()
+        nodes = [ll.append(value, return_node=True) for value in range(6)]
+        ll.delete(nodes[0])
+        ll.delete(nodes[2])
+        self.assertEqual([ll.popleft(), ll.popleft()], [1, 3])
+        other = LinkedList()
+        other_nodes = [other.append(value, return_node=True) for value in range(10, 13)]
+        other.delete(other_nodes[1])
+        ll += other
+        self.assertEqual([ll[i].data for i in range(len(ll))], [4, 5, 10, 12])
+
+    def test_delete_as_lru_keeps_index_bounded(self):
+        """Test moving entries to the end with delete + append stays O(1) amortized"""
+        ll = LinkedList()
+        nodes = [ll.append(value, return_node=True) for value in range(100)]
+        rng = random.Random(3)
+        for _ in range(5000):
+            key = rng.randrange(100)
+            ll.delete(nodes[key])
+            nodes[key] = ll.append(key, return_node=True)
+            self.assertLessEqual(len(ll._deleted_nodes), 100)
+        self.assertLess(len(ll._index_store) + sum(len(store) for store in ll._pending_stores), 300)
+        self.assertEqual(sorted(node.data for node in ll), list(range(100)))
+        self.assertEqual([ll[i] for i in range(100)], [node for node in ll])
+
+    def test_values_and_chunks(self):
+        """Test the fast value iterators against the node iteration"""
+        self.assertEqual((list(self.ll.values()), list(self.ll.values_reversed()), list(self.ll.iter_chunks(2))), ([], [], []))
+        self.ll.extend(range(7))
+        self.assertEqual(list(self.ll.values()), [node.data for node in self.ll])
+        self.assertEqual(list(self.ll.values_reversed()), [node.data for node in reversed(self.ll)])
+        self.assertEqual(list(self.ll.iter_chunks(3)), [[0, 1, 2], [3, 4, 5], [6]])
+        chunks = list(self.ll.iter_chunks(4, typecode='q'))
+        self.assertEqual([chunk.typecode for chunk in chunks], ['q', 'q'])
+        self.assertEqual([chunk.tolist() for chunk in chunks], [[0, 1, 2, 3], [4, 5, 6]])
+        with self.assertRaises(ValueError):
+            self.ll.iter_chunks(0)
+
+    def test_iter_from(self):
+        """Test iter_from walks either way from a position"""
+        self.ll.extend('abcde')
+        self.assertEqual(list(self.ll.iter_from(2)), ['c', 'd', 'e'])
+        self.assertEqual(list(self.ll.iter_from(2, 'left')), ['c', 'b', 'a'])
+        self.assertEqual(list(self.ll.iter_from(4)), ['e'])
+        with self.assertRaises(KeyError):
+            self.ll.iter_from(5)
+        with self.assertRaises(ValueError):
+            self.ll.iter_from(0, 'up')
+
+    def test_sort(self):
+        """Test sort relinks the nodes and re-indexes them"""
+        self.ll.sort()
+        self.assertEqual(str(self.ll), str(LinkedList()))
+        for value in [5, 1, 4, 2, 3]:
+            self.ll.prepend(value)
+        nodes = {node.data: node for node in self.ll}
+        self.ll.sort()
+        self.assertEqual(str(self.ll), "[1, 2, 3, 4, 5]")
+        self.assertEqual([self.ll[i].data for i in range(5)], [1, 2, 3, 4, 5])
+        self.assertEqual([node.data for node in reversed(self.ll)], [5, 4, 3, 2, 1])
+        self.assertTrue(all(nodes[node.data] is node for node in self.ll))
+        self.assertIsNone(self.ll[0].left)
+        self.assertIsNone(self.ll[4].right)
+        self.ll.append(0)
+        self.assertEqual(len(self.ll), 6)
+
+    def test_sort_key_reverse_is_stable(self):
+        """Test sort with key= and reverse= keeps equal elements in order"""
+        pairs = [(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd'), (2, 'e')]
+        ll = Operations.ll_from(pairs)
+        ll.sort(key=lambda pair: pair[0])
+        self.assertEqual([node.data for node in ll], sorted(pairs, key=lambda pair: pair[0]))
+        ll = Operations.ll_from(pairs)
+        ll.sort(key=lambda pair: pair[0], reverse=True)
+        self.assertEqual([node.data for node in ll], sorted(pairs, key=lambda pair: pair[0], reverse=True))
+
+    def test_sort_with_every_index_store(self):
+        """Test sort with the index stores & pending splices"""
+        rng = random.Random(11)
+        values = [rng.randrange(100) for _ in range(300)]
+        for index_store_cls in ['IndexStore', 'SkipListIndexStore', 'LazyIndexStore']:
+            ll = LinkedList(index_store_cls=index_store_cls)
+            ll.extend(values[:100])
+            del ll[50]
+            ll += Operations.ll_from(values[100:])
+            ll.sort()
+            expected = sorted(values[:50] + values[51:])
+            self.assertEqual([ll[i].data for i in range(len(ll))], expected)
+
     def test_sizeof(self):
         """Test __sizeof__ method"""
         self.ll.append(1)
@@ -484,6 +1125,206 @@ class TestLinkedList(unittest.TestCase):
         self.assertIsInstance(size, int)
 
 
+class TestIndexStore(unittest.TestCase):
+    """Test cases for the offset based IndexStore"""
+
+    def test_prepend_keeps_positions(self):
+        """Test that prepend shifts positions without touching existing entries"""
+        ll = LinkedList()
+        for i in range(100):
+            ll.prepend(i)
+        self.assertEqual(len(ll), 100)
+        self.assertEqual([ll[i].data for i in range(100)], list(range(99, -1, -1)))
+
+    def test_mixed_append_prepend_positions(self):
+        """Test positional lookups after interleaved append and prepend"""
+        ll = LinkedList()
+        expected = []
+        for i in range(50):
+            if i % 3:
+                ll.append(i)
+                expected.append(i)
+            else:
+                ll.prepend(i)
+                expected.insert(0, i)
+        self.assertEqual([ll[i].data for i in range(len(expected))], expected)
+        self.assertEqual([node.data for node in ll.index_store.values()], expected)
+
+    def test_delete_from_both_halves(self):
+        """Test deletes on either side of the middle keep the index consistent"""
+        ll = Operations.ll_from(range(10))
+        del ll[1]
+        del ll[7]
+        expected = [0, 2, 3, 4, 5, 6, 7, 9]
+        self.assertEqual([ll[i].data for i in range(len(ll))], expected)
+        ll.prepend(-1)
+        self.assertEqual(ll[0].data, -1)
+        self.assertEqual(ll[1].data, 0)
+
+    def test_delete_all_then_append(self):
+        """Test the list is usable after all elements are deleted"""
+        ll = Operations.ll_from([1, 2])
+        del ll[0]
+        del ll[0]
+        self.assertEqual(len(ll.index_store), 0)
+        ll.append(3)
+        self.assertEqual(str(ll), "[3]")
+        self.assertEqual(ll[0].data, 3)
+
+    def test_reverse_reverses_index(self):
+        """Test reverse keeps positional lookups in sync"""
+        ll = Operations.ll_from([1, 2, 3])
+        ll.prepend(0)
+        ll.reverse()
+        self.assertEqual([ll[i].data for i in range(4)], [3, 2, 1, 0])
+
+    def test_missing_index(self):
+        """Test lookups outside the stored range"""
+        ll = Operations.ll_from([1, 2])
+        self.assertIsInstance(ll.index_store, IndexStore)
+        with self.assertRaises(KeyError):
+            ll[2]
+        self.assertNotIn(-1, ll.index_store)
+        self.assertIsNone(ll.index_store.get(5))
+
+    def test_smaller_than_dict(self):
+        """Test the store takes less memory than a dict of int -> node"""
+        ll = Operations.ll_from(range(1000))
+        as_dict = dict(ll.index_store.items())
+        self.assertLess(sys.getsizeof(ll.index_store), sys.getsizeof(as_dict))
+
+    def test_repr_reads_like_dict(self):
+        """Test the store repr matches the dict it replaces"""
+        ll = Operations.ll_from([1, 2])
+        self.assertEqual(repr(ll.index_store), repr(dict(ll.index_store.items())))
+
+
+class TestSkipListIndexStore(unittest.TestCase):
+    """Test cases for the order-statistic SkipListIndexStore"""
+
+    def test_matches_list_under_random_edits(self):
+        """Test positional insert / delete / lookup against a python list"""
+        rng = random.Random(3)
+        store, expected = SkipListIndexStore(), []
+        for step in range(2000):
+            if expected and rng.random() < 0.35:
+                index = rng.randrange(len(expected))
+                del store[index]
+                del expected[index]
+            else:
+                index = rng.randrange(len(expected) + 1)
+                store.insert(index, step)
+                expected.insert(index, step)
+        self.assertEqual(len(store), len(expected))
+        self.assertEqual(list(store.values()), expected)
+        self.assertEqual([store[i] for i in range(len(expected))], expected)
+
+    def test_extend_then_edit(self):
+        """Test bulk extend keeps the link widths consistent"""
+        store = SkipListIndexStore(range(100))
+        store.extend(range(100, 200))
+        store.insert(150, 'x')
+        del store[0]
+        self.assertEqual(store[149], 'x')
+        self.assertEqual(store[199], 199)
+        self.assertEqual(len(store), 200)
+
+    def test_missing_index(self):
+        """Test lookups outside the stored range"""
+        store = SkipListIndexStore([1])
+        with self.assertRaises(KeyError):
+            store[1]
+        with self.assertRaises(KeyError):
+            del store[-1]
+
+    def test_linked_list_with_skip_list(self):
+        """Test LinkedList operations backed by SkipListIndexStore"""
+        ll = LinkedList(index_store_cls='SkipListIndexStore')
+        for i in range(10):
+            ll.append(i)
+        ll.prepend(-1)
+        ll.insert(5, 'mid')
+        del ll[0]
+        expected = [0, 1, 2, 3, 'mid', 4, 5, 6, 7, 8, 9]
+        self.assertEqual([ll[i].data for i in range(len(ll))], expected)
+        self.assertEqual([node.data for node in ll[2:6]], expected[2:6])
+        self.assertIsInstance(ll[2:6].index_store, SkipListIndexStore)
+        ll.reverse()
+        self.assertEqual(ll[0].data, 9)
+
+    def test_unknown_index_store(self):
+        """Test unsupported index store names are rejected"""
+        with self.assertRaises(NotImplementedError):
+            LinkedList(index_store_cls='BTreeIndexStore')
+
+
+class TestLazyIndexStore(unittest.TestCase):
+    """Test cases for the hole based LazyIndexStore"""
+
+    def test_matches_list_under_random_edits(self):
+        """Test positional edits & lookups against a python list"""
+        rng = random.Random(5)
+        store, expected = LazyIndexStore(), []
+        for step in range(3000):
+            op = rng.random()
+            if expected and op < 0.4:
+                index = rng.randrange(len(expected))
+                del store[index]
+                del expected[index]
+            elif expected and op < 0.6:
+                index = rng.randrange(len(expected))
+                self.assertEqual(store[index], expected[index])
+            elif op < 0.7:
+                store.prepend(step)
+                expected.insert(0, step)
+            elif op < 0.75:
+                index = rng.randrange(len(expected) + 1)
+                store.insert(index, step)
+                expected.insert(index, step)
+            else:
+                store.append(step)
+                expected.append(step)
+            self.assertEqual(len(store), len(expected))
+        self.assertEqual(list(store.values()), expected)
+        self.assertEqual([store[i] for i in range(len(expected))], expected)
+
+    def test_deletes_leave_holes(self):
+        """Test deletes don't shift entries until a lookup needs them"""
+        store = LazyIndexStore(range(100))
+        for _ in range(25):
+            del store[30]
+        self.assertEqual(len(store._holes), 25)
+        self.assertEqual(store[5], 5)
+        self.assertEqual(len(store._holes), 25)
+        self.assertEqual(store[40], 65)
+        self.assertEqual(store[74], 99)
+        self.assertEqual(store._holes, [])
+
+    def test_deletes_at_the_ends(self):
+        """Test deletes at either end don't leave holes"""
+        store = LazyIndexStore(range(10))
+        del store[5]
+        del store[0]
+        del store[7]
+        del store[6]
+        self.assertEqual(store._holes, [5])
+        self.assertEqual(len(store._slots), 8)
+        self.assertEqual(list(store.values()), [1, 2, 3, 4, 6, 7])
+
+    def test_linked_list_deletes(self):
+        """Test a linked list backed by the store"""
+        ll = LinkedList(index_store_cls='LazyIndexStore')
+        ll.extend(range(1000))
+        for index in range(0, 1000, 7):
+            del ll[500 - index // 2]
+        expected = [node.data for node in ll]
+        self.assertEqual(len(ll), len(expected))
+        self.assertEqual([ll[i].data for i in range(len(ll))], expected)
+        ll.reverse()
+        ll.insert(3, 'x')
+        self.assertEqual(str(ll[0:4]), str(Operations.ll_from(expected[:-4:-1] + ['x'])))
+
+
 class TestIterators(unittest.TestCase):
     """Test cases for LRIterator and RLIterator classes"""
 
@@ -706,10 +1547,12 @@ class TestEdgeCases(unittest.TestCase):
         values = [node.data for node in sliced]
         self.assertEqual(values, [5, 6, 7, 8, 9])
         
-        # Slice with negative start (should default to 0)
-        sliced2 = ll[-5:5]
-        values2 = [node.data for node in sliced2]
-        self.assertEqual(values2, [0, 1, 2, 3, 4])
+        # Negative bounds count from the end
+        self.assertEqual(list(ll[-5:5].values()), [])
+        self.assertEqual(list(ll[-5:].values()), [5, 6, 7, 8, 9])
+        self.assertEqual(list(ll[-3:-8:-2].values()), [7, 5, 3])
+        self.assertEqual(list(ll[::-1].values()), list(range(9, -1, -1)))
+        self.assertEqual(list(ll[:0].values()), [])
 
     def test_multiple_deletions(self):
         """Test multiple consecutive deletions"""
@@ -745,57 +1588,11 @@ class TestNotImplementedMethods(unittest.TestCase):
         """Set up test fixtures"""
         self.ll = LinkedList()
 
-    def test_sort_not_implemented(self):
-        """Test that sort raises NotImplementedError"""
-        with self.assertRaises(NotImplementedError):
-            self.ll.sort()
-
     def test_pop_not_implemented(self):
         """Test that pop raises NotImplementedError"""
         with self.assertRaises(NotImplementedError):
             self.ll.pop()
 
-    def test_insert_not_implemented(self):
-        """Test that insert raises NotImplementedError"""
-        with self.assertRaises(NotImplementedError):
-            self.ll.insert()
-
-    def test_index_not_implemented(self):
-        """Test that index raises NotImplementedError"""
-        with self.assertRaises(NotImplementedError):
-            self.ll.index()
-
-    def test_extend_not_implemented(self):
-        """Test that extend raises NotImplementedError"""
-        with self.assertRaises(NotImplementedError):
-            self.ll.extend()
-
-    def test_count_not_implemented(self):
-        """Test that count raises NotImplementedError"""
-        with self.assertRaises(NotImplementedError):
-            self.ll.count()
-
-    def test_copy_not_implemented(self):
-        """Test that copy raises NotImplementedError"""
-        with self.assertRaises(NotImplementedError):
-            self.ll.copy()
-
-    def test_clear_not_implemented(self):
-        """Test that clear raises NotImplementedError"""
-        with self.assertRaises(NotImplementedError):
-            self.ll.clear()
-
-    def test_remove_not_implemented(self):
-        """Test that remove raises NotImplementedError"""
-        with self.assertRaises(NotImplementedError):
-            self.ll.remove()
-
-    def test_delete_not_implemented(self):
-        """Test that delete raises NotImplementedError"""
-        node = LinkedListNode(1)
-        with self.assertRaises(NotImplementedError):
-            self.ll.delete(node)
-
     def test_setitem_not_implemented(self):
         """Test that __setitem__ raises NotImplementedError"""
         self.ll.append(1)
@@ -0,0 +1,1115 @@
+"""
+Linked List ( Array Backed )
+============================
+
+* It is an alternative engine for linked list V1 ,
+    exposing the same public api .
+
+Layout :
+--------
+                 head  tail  [1st]  [2nd]  [3rd]
+    slot     :     0     1     2      3      4
+    _data    :     -     -     a      b      c
+    _prev    :    -1     4    -1      2      3
+    _next    :     2    -1     3      4     -1
+
+* Every element is a slot , i.e a position in three parallel columns :
+    `_data` ( python list ) , `_prev` & `_next` ( `array('q')` of slots ) .
+* Links are slot numbers , `-1` ( `NIL` ) stands for no link .
+* Slots released by deletion are chained into a free-list and reused .
+* Slot `0` & `1` are the head & tail markers , linked the same way as in
+    linked list V1 ( first element has no left link , last has no right link ) .
+
+Notes :
+-------
+* No python object is allocated per element , hence no reference cycles
+    for the garbage collector to chase .
+* `ll[i]` & iteration hand out `ArrayNode` handles , created on demand .
+* `TypedLinkedList(typecode)` keeps the data column in an `array` too : no
+    boxed number per element , reductions run over the column , & the
+    column is exported zero-copy ( `memoryview` , `numpy.asarray` ) .
+"""
+import sys
+import inspect
+import itertools
+from array import array
+from typing import Any, Callable, Optional, Dict, Union, Iterable, Generator, Tuple, Type
+from collections.abc import Iterator
+
+try:
+    import numpy
+except ImportError:     # optional : vectorized reductions , `numpy.asarray`
+    numpy = None
+
+import linked_list
+from linked_list import (
+    IndexStore,
+    LinkedListNode,
+    Metadata,
+    LRIterator,
+    RLIterator,
+)
+
+# no link
+NIL = -1
+# marker slots
+HEAD = 0
+TAIL = 1
+
+# slots carry no metadata , handles report the default one
+_DEFAULT_METADATA = Metadata()
+
+
+class SlotIndexStore(IndexStore):
+    """
+    `IndexStore` of slot numbers , backed by an `array('q')` .
+
+    * costs 8 bytes per entry , no int object is kept per entry .
+    """
+    __slots__ = ()
+
+    _vacant = NIL
+
+    @staticmethod
+    def _allocate(entries: Iterable[int]) -> array:
+        """Creates the backing array out of `entries` ."""
+        return array('q', entries)
+
+
+class ArrayNode:
+    """
+    Handle to a slot of an array backed linked list.
+
+    * It reads like `linked_list.LinkedListNode` : `data` , `left` , `right` .
+    * Handles are created on demand & are not stored anywhere ,
+        two handles to the same slot compare equal .
+
+    Attributes:
+        ll (LinkedList): The list owning the slot.
+        slot (int): The slot in the list columns.
+    """
+    __slots__ = ('_ll', '_slot')
+
+    def __init__(self, ll: 'LinkedList', slot: int):
+        """
+        Initializes an ArrayNode instance.
+
+        Args:
+            ll (LinkedList): The list owning the slot.
+            slot (int): The slot in the list columns.
+        """
+        self._ll = ll
+        self._slot = slot
+
+    @property
+    def slot(self) -> int:
+        """Gets the slot of the node."""
+        return self._slot
+
+    @property
+    def data(self) -> Any:
+        """Gets the data stored in the node."""
+        return self._ll._value(self._slot)
+
+    @data.setter
+    def data(self, value: Any) -> Any:
+        """Sets the data in the node."""
+        self._ll._data[self._slot] = value
+        return value
+
+    @property
+    def left(self) -> Optional['ArrayNode']:
+        """Gets the left node."""
+        return self._ll._node(self._ll._prev[self._slot])
+
+    @property
+    def right(self) -> Optional['ArrayNode']:
+        """Gets the right node."""
+        return self._ll._node(self._ll._next[self._slot])
+
+    @property
+    def metadata(self) -> Metadata:
+        """Gets the metadata associated with the node ( always the default one )."""
+        return _DEFAULT_METADATA
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ArrayNode):
+            return self._ll is other._ll and self._slot == other._slot
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._ll), self._slot))
+
+    def __str__(self) -> str:
+        """Returns a string representation of the node."""
+        return f"{self.data}"
+
+    def __repr__(self):
+        """Returns a detailed string representation of the node."""
+        return f"ArrayNode({self.data}, left={self.left}, right={self.right})"
+
+
+class LinkedList:
+    """
+    Doubly Linked List Implementation ( struct-of-arrays )
+
+    -----
+    Usage
+    -----
+
+    # Prepare
+    >>> ll = LinkedList()
+    >>> ll.append(3)
+    >>> ll.prepend(4)
+    >>> ll.append(8)
+    >>> print(ll)
+    [4, 3, 8]
+
+    # Fetch Node data
+    >>> value=ll[1]
+    >>> value.data
+    3
+
+    # Index Map ( position -> slot )
+    >>> ll.index_store
+    {0: 3, 1: 2, 2: 4}
+
+    # Length
+    >>> len(ll)
+    3
+
+    # Reverse Iteration
+    >>> print([v.data for v in reversed(ll)])
+    [8, 3, 4]
+
+    ---
+
+    NOTES
+        - -ve indices count from the end , as for `list` .
+        - `index_store` maps positions to slots , `ll[i]` gives the node
+
+    """
+
+    # data left in a released slot
+    _released = None
+
+    def __init__(self, root_iterator_cls: Union[str, Type[Iterator]] = 'LRIterator'):
+        """
+        Initializes a LinkedList instance.
+
+        Args:
+            root_iterator_cls (Iterator): The iterator class used for traversal.
+        """
+        self._init_columns()
+        # Config
+        # # Root Iterator
+        self.root_iterator_cls: Iterator = root_iterator_cls
+
+    def _init_columns(self) -> None:
+        """Sets the columns , free-list & index map of an empty list."""
+        # Columns ( Positioning Markers in slot 0 & 1 )
+        self._data: list = [None, None]
+        self._prev: array = array('q', [NIL, HEAD])
+        self._next: array = array('q', [TAIL, NIL])
+        # Free-list of released slots
+        self._free: int = NIL
+        self._length: int = 0
+        # Index Map
+        self._index_store: SlotIndexStore = SlotIndexStore()
+
+    def _new_like(self) -> 'LinkedList':
+        """Creates an empty list of the same kind."""
+        return LinkedList()
+
+    @property
+    def head(self) -> ArrayNode:
+        """Gets the head node of the list."""
+        return ArrayNode(self, HEAD)
+
+    @property
+    def tail(self) -> ArrayNode:
+        """Gets the tail node of the list."""
+        return ArrayNode(self, TAIL)
+
+    @property
+    def index_store(self) -> SlotIndexStore:
+        """Gets the index store of the list."""
+        return self._index_store
+
+    def _value(self, slot: int) -> Any:
+        """
+        Reads the data of a slot.
+
+        * markers read as the index counters of linked list V1 :
+            head is `0` ( `-1` when empty ) , tail is the last index .
+        """
+        if slot > TAIL:
+            return self._data[slot]
+        if slot == HEAD:
+            return 0 if self._length else -1
+        return self._length - 1
+
+    def _node(self, slot: int) -> Optional[ArrayNode]:
+        """Creates a handle for `slot` , `None` for `NIL` ."""
+        return None if slot == NIL else ArrayNode(self, slot)
+
+    def _allocate(self, data: Any) -> int:
+        """
+        Takes a slot for `data` , out of the free-list when possible.
+
+        Complexity:
+            O(1) amortized
+        """
+        slot = self._free
+        if slot == NIL:
+            slot = len(self._data)
+            self._data.append(data)
+            self._prev.append(NIL)
+            self._next.append(NIL)
+        else:
+            self._free = self._next[slot]
+            self._data[slot] = data
+            self._prev[slot] = NIL
+            self._next[slot] = NIL
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """
+        Gives `slot` back to the free-list.
+
+        * the free-list link is written in both columns ,
+            so that `reverse` ( which swaps the columns ) keeps it intact .
+        """
+        self._data[slot] = self._released
+        self._prev[slot] = self._next[slot] = self._free
+        self._free = slot
+
+    def _extend_values(self, values: Iterable[Any]) -> None:
+        """
+        Appends all `values` in one pass.
+
+        * the new slots are contiguous , so the columns are extended with
+            ranges instead of being linked one slot at a time .
+
+        Complexity:
+            O(K)
+        """
+        start = len(self._data)
+        self._data.extend(values)
+        end = len(self._data)
+        if start == end:
+            return
+        last_slot = self._prev[TAIL]
+        self._prev.extend(range(start - 1, end - 1))
+        self._next.extend(range(start + 1, end + 1))
+        self._next[end - 1] = NIL
+        if last_slot == HEAD:
+            self._next[HEAD] = start
+            self._prev[start] = NIL
+        else:
+            self._next[last_slot] = start
+            self._prev[start] = last_slot
+        self._prev[TAIL] = end - 1
+        self._index_store.extend(range(start, end))
+        self._length += end - start
+
+    def append(self, data: Any):
+        """
+        Adds a new element at the end of the list.
+
+        Args:
+            data (Any): The data to append.
+
+        Complexity:
+            O(1)
+        """
+        slot = self._allocate(data)
+        last_slot = self._prev[TAIL]
+        self._prev[TAIL] = slot
+        if last_slot == HEAD:
+            # last slot is head
+            self._next[HEAD] = slot
+        else:
+            self._next[last_slot] = slot
+            self._prev[slot] = last_slot
+        self._index_store.append(slot)
+        self._length += 1
+
+    def prepend(self, data: Any):
+        """
+        Adds a new element at the beginning of the list.
+
+        Args:
+            data (Any): The data to prepend.
+
+        Complexity:
+            O(1) amortized
+        """
+        slot = self._allocate(data)
+        first_slot = self._next[HEAD]
+        self._next[HEAD] = slot
+        if first_slot == TAIL:
+            # first slot is tail
+            self._prev[TAIL] = slot
+        else:
+            self._prev[first_slot] = slot
+            self._next[slot] = first_slot
+        self._index_store.prepend(slot)
+        self._length += 1
+
+    def sort(self, *, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False):
+        """
+        Sorts the list in place , like `list.sort` .
+
+        * the data is sorted by timsort ( stable ) & laid out again in
+            contiguous slots , the existing handles are invalidated .
+
+        Args:
+            key (Callable): computes the sort key out of an element's data.
+            reverse (bool): sorts in descending order , keeping it stable.
+
+        Complexity:
+            O(N log N)
+        """
+        values = list(self.values())
+        values.sort(key=key, reverse=reverse)
+        self._init_columns()
+        self._extend_values(values)
+
+    def reverse(self):
+        """
+        Reverses a linked list
+
+        * swapping the `_prev` & `_next` columns reverses every link at once .
+
+        Complexity:
+            O(N) ( index store ) , O(1) for the links
+        """
+        if not self._length:
+            return
+        first_slot, last_slot = self._next[HEAD], self._prev[TAIL]
+        self._prev, self._next = self._next, self._prev
+        self._next[HEAD], self._prev[HEAD] = last_slot, NIL
+        self._prev[TAIL], self._next[TAIL] = first_slot, NIL
+        self._index_store.reverse()
+
+    def pop(self):
+        raise NotImplementedError('...')
+
+    def insert(self, index: int, data: Any):
+        """
+        Adds a new element before position `index` , like `list.insert` .
+
+        Args:
+            index (int): position of the new element , clamped to the list bounds.
+            data (Any): The data to insert.
+
+        Complexity:
+            O(N-index) ( index store )
+        """
+        if index < 0:
+            index = max(index + self._length, 0)
+        if index >= self._length:
+            return self.append(data)
+        if index == 0:
+            return self.prepend(data)
+        right_slot = self._index_store[index]
+        left_slot = self._prev[right_slot]
+        slot = self._allocate(data)
+        self._next[left_slot], self._prev[slot] = slot, left_slot
+        self._next[slot], self._prev[right_slot] = right_slot, slot
+        self._index_store.insert(index, slot)
+        self._length += 1
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        """
+        Position of the first element holding `value` , like `list.index` .
+
+        Raises:
+            ValueError: If no element in `start:stop` holds `value` .
+
+        Complexity:
+            O(index)
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start < stop:
+            data, links = self._data, self._next
+            slot = self._index_store[start]
+            for index in range(start, stop):
+                if data[slot] == value:
+                    return index
+                slot = links[slot]
+        raise ValueError(f'{value!r} is not in list')
+
+    def extend(self, values: Iterable[Any]):
+        """
+        Adds all the `values` at the end of the list , in one pass.
+
+        Args:
+            values (Iterable): The values to add , a linked list ( of any
+                engine ) adds it's data.
+
+        Complexity:
+            O(K)
+        """
+        if isinstance(values, LinkedList):
+            # read upfront , the list may be extended with itself
+            values = list(values.values())
+        elif isinstance(values, linked_list.LinkedList):
+            values = values.values()
+        self._extend_values(values)
+
+    def count(self, value: Any) -> int:
+        """
+        Number of elements holding `value` , like `list.count` .
+
+        Complexity:
+            O(N)
+        """
+        return sum(1 for data in self.values() if data == value)
+
+    def copy(self) -> 'LinkedList':
+        """
+        Returns a shallow copy of the list , built in one pass.
+
+        Complexity:
+            O(N)
+        """
+        _ll = self._new_like()
+        _ll.root_iterator_cls = self.root_iterator_cls
+        _ll._extend_values(self.values())
+        return _ll
+
+    def clear(self):
+        """
+        Removes all the elements , like `list.clear` .
+
+        * the columns are replaced , no link to break ( slots aren't objects ).
+
+        Complexity:
+            O(1)
+        """
+        self._init_columns()
+
+    def remove(self, value: Any) -> None:
+        """
+        Deletes the first element holding `value` , like `list.remove` .
+
+        Raises:
+            ValueError: If no element holds `value` .
+
+        Complexity:
+            O(index) to find it , plus the cost of `del ll[index]`
+        """
+        del self[self.index(value)]
+
+    def delete(self, node: ArrayNode):
+        """
+        Deletes the element of `node` .
+
+        * the slot carries no position , it's found by walking the links ,
+            which also checks that the node is an element of this list .
+
+        Args:
+            node (ArrayNode): The node to delete.
+
+        Raises:
+            ValueError: If the node is a marker or not an element of this list.
+
+        Complexity:
+            O(index) to find it , plus the cost of `del ll[index]`
+        """
+        if node._ll is self and node._slot > TAIL:
+            links, slot = self._next, self._next[HEAD]
+            for index in range(self._length):
+                if slot == node._slot:
+                    del self[index]
+                    return
+                slot = links[slot]
+        raise ValueError('node is not in list')
+
+    def values(self) -> Iterator[Any]:
+        """
+        Generates the data of the elements , left to right ( markers excluded ).
+
+        Complexity:
+            O(N)
+        """
+        return self._values() if self._length else iter(())
+
+    def values_reversed(self) -> Iterator[Any]:
+        """Generates the data of the elements , right to left ( markers excluded )."""
+        return self._values(reverse=True) if self._length else iter(())
+
+    def _values(self, reverse: bool = False) -> Generator[Any, None, None]:
+        """
+        Generates the data of the list , reading the columns directly.
+
+        * it walks the links like the iterators do ,
+            an empty list yields the marker it lands on .
+        """
+        links, slot = (self._prev, self._prev[TAIL]) if reverse else (self._next, self._next[HEAD])
+        data = self._data
+        while slot != NIL:
+            yield data[slot] if slot > TAIL else self._value(slot)
+            slot = links[slot]
+
+    def _walk(self, reverse: bool = False) -> Generator[ArrayNode, None, None]:
+        """Generates node handles , from either end of the list."""
+        links, slot = (self._prev, self._prev[TAIL]) if reverse else (self._next, self._next[HEAD])
+        while slot != NIL:
+            yield ArrayNode(self, slot)
+            slot = links[slot]
+
+    def _compare(self, other: Any) -> int:
+        """
+        Compares two linked lists element by element.
+
+        Returns:
+            int: -1 , 0 or 1 as `self` is lower , equal or greater than `other` .
+        """
+        for self_value, other_value in itertools.zip_longest(self._values(), _values_of(other, markers=True), fillvalue=_EXHAUSTED):
+            if self_value is _EXHAUSTED:
+                # LHS shorter
+                return -1
+            if other_value is _EXHAUSTED:
+                # RHS shorter
+                return 1
+            if self_value < other_value:
+                return -1
+            if self_value > other_value:
+                return 1
+        return 0
+
+    def __rmul__(self):
+        raise NotImplementedError('...')
+
+    def __mul__(self, value: int) -> 'LinkedList':
+        _ll = self._new_like()
+        _ll._extend_values(itertools.chain.from_iterable(itertools.repeat(list(self.values()), value)))
+        return _ll
+
+    def __imul__(self, value: int) -> 'LinkedList':
+        # same as linked list V1 : `value` more copies are appended
+        self._extend_values(list(self.values()) * value)
+        return self
+
+    def __add__(self, other: 'LinkedList') -> 'LinkedList':
+        new_ll = self._new_like()
+        new_ll._extend_values(self.values())
+        new_ll._extend_values(_values_of(other))
+        return new_ll
+
+    def __iadd__(self, other: 'LinkedList') -> 'LinkedList':
+        # columns can't be shared between lists , values are copied
+        self._extend_values(list(_values_of(other)))
+        return self
+
+    def __lt__(self, other: 'LinkedList') -> bool:
+        return self._compare(other) < 0
+
+    def __ge__(self, other: 'LinkedList') -> bool:
+        return self._compare(other) >= 0
+
+    def __gt__(self, other: 'LinkedList') -> bool:
+        return self._compare(other) > 0
+
+    def __le__(self, other: 'LinkedList') -> bool:
+        return self._compare(other) <= 0
+
+    def __eq__(self, other: 'LinkedList') -> bool:
+        """
+        Comapring two linked lists for equlity
+        """
+        for self_value, other_value in itertools.zip_longest(self._values(), _values_of(other, markers=True), fillvalue=_EXHAUSTED):
+            if self_value is _EXHAUSTED or other_value is _EXHAUSTED or self_value != other_value:
+                return False
+        return True
+
+    def __ne__(self, other: 'LinkedList') -> bool:
+        return not self.__eq__(other)
+
+    def __delitem__(self, index: int):
+        """
+        Deletes the element at `index` , out of range indices are ignored.
+
+        Complexity:
+            O(min(index, N-index)) ( index store repair )
+        """
+        if index not in self._index_store:
+            return
+        slot = self._index_store[index]
+        prev_slot = self._prev[slot]
+        next_slot = self._next[slot]
+        if prev_slot == NIL and next_slot == NIL:
+            # last remaining element : back to the initial markers state
+            self._next[HEAD] = TAIL
+            self._prev[TAIL] = HEAD
+        else:
+            # link prev --> next
+            if prev_slot != NIL:
+                self._next[prev_slot] = next_slot
+            else:   # this means current slot is first slot
+                self._next[HEAD] = next_slot
+            # link next <-- prev
+            if next_slot != NIL:
+                self._prev[next_slot] = prev_slot
+            else:   # this means current slot is last slot
+                self._prev[TAIL] = prev_slot
+        self._release(slot)
+        del self._index_store[index]
+        self._length -= 1
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, (ArrayNode, LinkedListNode)):
+            value = value.data
+        for data in self._values():
+            if data == value:
+                return True
+        return False
+
+    def __getitem__(self, key):
+        """
+        Gets an item from the linked list by index or slice.
+
+        Args:
+            key (int or slice): The index or slice to retrieve.
+
+        Returns:
+            ArrayNode or LinkedList: The node or sublist corresponding to the key.
+
+        Raises:
+            TypeError: If the key is not an integer or slice.
+            KeyError: If the index is out of range.
+        """
+        if isinstance(key, int):
+            # Handle integer indexing
+            if key < 0:
+                key += self._length
+            return ArrayNode(self, self._index_store[key])
+        elif isinstance(key, slice):
+            # Handle slicing ( -ve bounds count from the end , as for `list` )
+            _ll = self._new_like()
+            store, data = self._index_store, self._data
+            _ll._extend_values([data[store[idx]] for idx in range(*key.indices(self._length))])
+            return _ll
+        else:
+            raise TypeError("Invalid key type")
+
+    def __setitem__(self):
+        raise NotImplementedError('...')
+
+    def __iter__(self):
+        """
+        Returns an iterator for the linked list.
+
+        Returns:
+            Iterator: The iterator for the linked list.
+        """
+        if self.root_iterator_cls in (LRIterator, 'LRIterator'):
+            return self._walk()
+        if self.root_iterator_cls in (RLIterator, 'RLIterator'):
+            return self._walk(reverse=True)
+        if inspect.isclass(self.root_iterator_cls):
+            return self.root_iterator_cls(self)
+        raise NotImplementedError('root_iterator_cls specified isn`t supported yet')
+
+    def __len__(self):
+        """
+        Returns the length of the linked list.
+
+        Returns:
+            int: The length of the linked list.
+        """
+        return self._value(TAIL) - self._value(HEAD) + 1
+
+    def _size_breakdown(self) -> Dict[str, int]:
+        """
+        Splits the memory footprint of the list into it's components .
+
+        Returns:
+            Dict[str, int]: size in bytes per component .
+        """
+        return {
+            'base_object_size': super().__sizeof__(),
+            'iterator_class_ref_size': sys.getsizeof(self.root_iterator_cls),
+            'index_store_size': sys.getsizeof(self._index_store),
+            'data_column_size': sys.getsizeof(self._data),
+            'link_columns_size': sys.getsizeof(self._prev) + sys.getsizeof(self._next),
+        }
+
+    def __sizeof__(self):
+        return sum(self._size_breakdown().values())
+
+    def print_detailed_size_information(self):
+        sizes = self._size_breakdown()
+        total = sum(sizes.values())
+        print("-" * 40)
+        for name, size in sizes.items():
+            print(f"| {name:<24} | {size:>9} |")
+        print("-" * 40)
+        print(f"* Total Size : {total}")
+        if self._length:
+            print(f"* Bytes per Element : {(total - sizes['base_object_size'])/self._length:.2f}")
+        print("\n")
+
+    def __reversed__(self):
+        """
+        Returns a reversed iterator for the linked list.
+
+        Returns:
+            Iterator: The reversed iterator for the linked list.
+        """
+        return self._walk(reverse=self.root_iterator_cls not in (RLIterator, 'RLIterator'))
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the linked list.
+
+        Returns:
+            str: The string representation of the linked list.
+        """
+        return f"[{', '.join([str(data) for data in self._values(reverse=self.root_iterator_cls in (RLIterator, 'RLIterator'))])}]"
+
+
+# marks the exhausted side , while comparing lists of different lengths
+_EXHAUSTED = object()
+
+
+def _values_of(ll: Any, markers: bool = False) -> Iterable[Any]:
+    """
+    Generates the data of any linked list ( array backed or node based ) , left to right.
+
+    Args:
+        markers (bool): an empty list yields the marker it's iterator lands on
+            ( comparisons , as in linked list V1 ).
+    """
+    if not markers and ll.head.data < 0:
+        # empty ( head reads `-1` )
+        return ()
+    if isinstance(ll, LinkedList):
+        return ll._values()
+    return (node.data for node in _nodes_of(ll))
+
+
+def _nodes_of(ll: Any) -> Generator[Any, None, None]:
+    """Walks the nodes of a node based linked list , left to right."""
+    pointer = ll.head.right
+    while pointer:
+        yield pointer
+        pointer = pointer.right
+
+
+# numeric `array` typecodes , by kind ( signed , unsigned , float )
+_TYPECODE_KINDS = {
+    **dict.fromkeys('bhilq', 'i'),
+    **dict.fromkeys('BHILQ', 'u'),
+    **dict.fromkeys('fd', 'f'),
+}
+
+
+class TypedLinkedList(LinkedList):
+    """
+    Array backed linked list of numbers , the data column is an `array` too.
+
+    Layout :
+    --------
+        slot     :   0   1   2   3   4
+        _data    :   0   0   a   b   c     <- array(typecode) , 0 in the markers
+        _prev    :  -1   4  -1   2   3
+        _next    :   2  -1   3   4  -1
+
+    * the column is "compact" when slots `2..` hold the elements in list
+        order , without released slots : `append` & `extend` keep it so ,
+        `prepend` , `del` & `reverse` don't , the next export compacts it .
+    * exports ( `as_memoryview()` , `memoryview(ll)` on 3.12+ , `numpy.asarray`
+        ) share the column : an edit that grows it raises `BufferError`
+        until they are released .
+
+    >>> ll = TypedLinkedList('d')
+    >>> ll.extend([1.5, 2.5, 3.5])
+    >>> ll.prepend(0.5)
+    >>> ll.sum(), ll.min(), ll.max(), ll.mean()
+    (8.0, 0.5, 3.5, 2.0)
+    >>> with ll.as_memoryview() as view:
+    ...     view.tolist()
+    [0.5, 1.5, 2.5, 3.5]
+    """
+
+    _released = 0
+
+    def __init__(self, typecode: str = 'q', root_iterator_cls: Union[str, Type[Iterator]] = 'LRIterator'):
+        """
+        Initializes a TypedLinkedList instance.
+
+        Args:
+            typecode (str): numeric `array` typecode of the data , e.g. `'q'` , `'d'` .
+            root_iterator_cls (Iterator): The iterator class used for traversal.
+
+        Raises:
+            ValueError: If the typecode isn't a numeric `array` typecode.
+        """
+        if typecode not in _TYPECODE_KINDS:
+            raise ValueError(f'expected a numeric array typecode ( one of {"".join(_TYPECODE_KINDS)} ) , got {typecode!r}')
+        self._typecode = typecode
+        super().__init__(root_iterator_cls)
+
+    def _init_columns(self) -> None:
+        super()._init_columns()
+        self._data: array = array(self._typecode, [0, 0])
+        self._compact: bool = True
+
+    def _new_like(self) -> 'TypedLinkedList':
+        return TypedLinkedList(self._typecode)
+
+    @property
+    def typecode(self) -> str:
+        """Gets the `array` typecode of the data."""
+        return self._typecode
+
+    def _column_of(self, values: Iterable[Any]) -> array:
+        """
+        Converts `values` to an `array` of the list's typecode.
+
+        * a 1-d contiguous buffer of the same kind & item size ( `array` ,
+            `numpy.ndarray` , ... ) is copied in bulk , other values one by one .
+        """
+        if isinstance(values, array) and values.typecode == self._typecode:
+            return values
+        try:
+            view = memoryview(values)
+        except TypeError:
+            return array(self._typecode, values)
+        column = array(self._typecode)
+        if view.ndim == 1 and view.c_contiguous and view.itemsize == column.itemsize \
+                and _TYPECODE_KINDS.get(view.format.lstrip('@')) == _TYPECODE_KINDS[self._typecode]:
+            column.frombytes(view.cast('B'))
+        else:
+            column.fromlist(view.tolist())
+        return column
+
+    def _extend_values(self, values: Iterable[Any]) -> None:
+        # converted first : a `TypeError` leaves the list untouched
+        super()._extend_values(self._column_of(values))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """
+        Adds all the `values` at the end of the list , in one pass.
+
+        Args:
+            values (Iterable): numbers , a buffer ( `numpy.ndarray` , `array`
+                , ... ) , or a linked list ( it's data is added ).
+
+        Raises:
+            TypeError: If some value isn't a number of the list's kind.
+            OverflowError: If some number doesn't fit the typecode.
+
+        Complexity:
+            O(K) , a bulk copy for a buffer of the same kind
+        """
+        if isinstance(values, LinkedList):
+            values = values._values() if values._length else ()
+        elif isinstance(values, linked_list.LinkedList):
+            values = values.values()
+        self._extend_values(values)
+
+    def prepend(self, data: Any):
+        if self._length:
+            self._compact = False
+        super().prepend(data)
+
+    def insert(self, index: int, data: Any):
+        if self._length and index < self._length:
+            self._compact = False
+        super().insert(index, data)
+
+    def reverse(self):
+        if self._length > 1:
+            self._compact = False
+        super().reverse()
+
+    def __delitem__(self, index: int):
+        length = self._length
+        super().__delitem__(index)
+        if self._length != length:
+            self._compact = False
+
+    def _column(self) -> memoryview:
+        """
+        Exports the data , in list order , compacting the column first if needed.
+
+        Complexity:
+            O(1) , O(N) when the column isn't compact
+        """
+        if not self._compact:
+            values = array(self._typecode, self._values()) if self._length else ()
+            self._init_columns()
+            self._extend_values(values)
+        return memoryview(self._data)[2:]
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Zero-copy view of the data , in list order.
+
+        * writes through the view edit the list , release it ( or use it in a
+            `with` block ) before growing the list .
+        """
+        return self._column()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # buffer protocol ( python 3.12+ ) : `memoryview(ll)` , `bytes(ll)` , ...
+        return self._column()
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> Any:
+        """`numpy.asarray(ll)` : shares the column , unless `copy` is asked for."""
+        values = numpy.asarray(self._column())
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+        return values.copy() if copy else values
+
+    def _check_not_empty(self, reduction: str) -> None:
+        """Raises a `ValueError` for a reduction over an empty list , like `min([])` ."""
+        if not self._length:
+            raise ValueError(f'{reduction}() of an empty list')
+
+    def sum(self) -> Union[int, float]:
+        """
+        Sum of the data , `0` for an empty list.
+
+        * integers are summed exactly , numpy is used when it can't overflow .
+
+        Complexity:
+            O(N) , vectorized with numpy
+        """
+        column = self._column()
+        if numpy is None or not self._length:
+            return sum(column)
+        values = numpy.asarray(column)
+        if _TYPECODE_KINDS[self._typecode] != 'f':
+            bound = max(abs(int(values.min())), abs(int(values.max()))) * self._length
+            if bound > numpy.iinfo(values.dtype).max:
+                return sum(column)
+            return values.sum().item()
+        # accumulated in double precision , like `sum` does
+        return values.sum(dtype=numpy.float64).item()
+
+    def min(self) -> Union[int, float]:
+        """
+        Smallest data.
+
+        Raises:
+            ValueError: If the list is empty.
+
+        Complexity:
+            O(N) , vectorized with numpy
+        """
+        self._check_not_empty('min')
+        if numpy is None:
+            return min(self._column())
+        return numpy.asarray(self._column()).min().item()
+
+    def max(self) -> Union[int, float]:
+        """
+        Largest data.
+
+        Raises:
+            ValueError: If the list is empty.
+
+        Complexity:
+            O(N) , vectorized with numpy
+        """
+        self._check_not_empty('max')
+        if numpy is None:
+            return max(self._column())
+        return numpy.asarray(self._column()).max().item()
+
+    def mean(self) -> float:
+        """
+        Arithmetic mean of the data.
+
+        Raises:
+            ValueError: If the list is empty.
+
+        Complexity:
+            O(N) , vectorized with numpy
+        """
+        self._check_not_empty('mean')
+        return self.sum() / self._length
+
+
+class Operations:
+    """
+    Utility class for performing operations on array backed linked lists.
+    """
+
+    @staticmethod
+    def reversed(ll: LinkedList, method=1) -> Generator[ArrayNode, None, None]:
+        """
+        Generates linked list nodes in reverse order.
+
+        Args:
+            ll (LinkedList): The linked list to reverse.
+            method (int): kept for parity with linked list V1 , both methods walk the `_prev` column.
+
+        Returns:
+            Generator[ArrayNode, None, None]: A generator for the reversed nodes.
+
+        Complexity:
+            O(N)
+        """
+        if not issubclass(ll.root_iterator_cls, Iterator):
+            raise Exception('must implement typing.Iterator class')
+        if ll.root_iterator_cls == LRIterator:
+            yield from ll._walk(reverse=True)
+        elif ll.root_iterator_cls == RLIterator:
+            yield from ll._walk()
+        else:
+            raise NotImplementedError('`root_iterator_cls` not specified')
+
+    @staticmethod
+    def enumerate(ll: Union[LinkedList, Generator[ArrayNode, None, None]]) -> Generator[Tuple[int, ArrayNode], None, None]:
+        """
+        Enumerates the nodes in the linked list.
+
+        Args:
+            ll (LinkedList or Generator): The linked list or generator to enumerate.
+
+        Returns:
+            Generator[Tuple[int, ArrayNode], None, None]: A generator for the enumerated nodes.
+        """
+        return zip(itertools.count(), iter(ll))
+
+    @staticmethod
+    def ll_from(obj: Iterable) -> LinkedList:
+        """
+        Converts an iterable to a linked list.
+
+        Args:
+            obj (Iterable): The iterable to convert.
+
+        Returns:
+            LinkedList: The resulting linked list.
+        """
+        _ll = LinkedList()
+        _ll._extend_values(obj)
+        return _ll
+
+
+if __name__ == '__main__':
+    ll = LinkedList()
+    ll.append(2)
+    ll.append(3)
+    ll.prepend(4)
+    ll.append(8)
+    print(ll)
+    print(ll.index_store)
+    ll.root_iterator_cls = RLIterator
+    print([v.data for v in ll])
+    ll.root_iterator_cls = LRIterator
+
+    del ll[1]
+    print(ll, len(ll))
+    ll.append(9)    # reuses the released slot
+    print(ll, ll.index_store)
+
+    ll.print_detailed_size_information()
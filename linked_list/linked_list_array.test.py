@@ -0,0 +1,372 @@
+"""
+Unit Tests for linked_list_array.py
+
+This module checks that the array backed LinkedList behaves like the
+node based LinkedList of linked_list.py .
+"""
+
+import gc
+import random
+import unittest
+import unittest.mock
+from array import array
+import linked_list
+import linked_list_array
+from linked_list_array import (
+    NIL,
+    ArrayNode,
+    LinkedList,
+    TypedLinkedList,
+    Operations,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestArrayLinkedList(unittest.TestCase):
+    """Test cases for the array backed LinkedList"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ll = LinkedList()
+
+    def test_empty_list_matches_v1(self):
+        """Test the marker semantics of an empty list"""
+        v1 = linked_list.LinkedList()
+        self.assertEqual(len(self.ll), len(v1))
+        self.assertEqual(str(self.ll), str(v1))
+        self.assertEqual([n.data for n in self.ll], [n.data for n in v1])
+        self.assertEqual(self.ll, v1)
+
+    def test_append_prepend(self):
+        """Test append and prepend with positional lookups"""
+        self.ll.append(3)
+        self.ll.prepend(4)
+        self.ll.append(8)
+        self.ll.prepend(6)
+        self.assertEqual(str(self.ll), "[6, 4, 3, 8]")
+        self.assertEqual([self.ll[i].data for i in range(4)], [6, 4, 3, 8])
+        self.assertEqual(len(self.ll), 4)
+
+    def test_node_handles(self):
+        """Test node handles read like LinkedListNode"""
+        ll = Operations.ll_from([1, 2, 3])
+        node = ll[1]
+        self.assertIsInstance(node, ArrayNode)
+        self.assertEqual(node.left.data, 1)
+        self.assertEqual(node.right.data, 3)
+        self.assertIsNone(ll[0].left)
+        self.assertIsNone(ll[2].right)
+        self.assertEqual(node, ll[1])
+        node.data = 20
+        self.assertEqual(str(ll), "[1, 20, 3]")
+
+    def test_delete_reuses_slots(self):
+        """Test released slots are taken back from the free-list"""
+        ll = Operations.ll_from(range(5))
+        slot = ll.index_store[2]
+        del ll[2]
+        self.assertEqual(ll._free, slot)
+        ll.append(5)
+        self.assertEqual(ll.index_store[4], slot)
+        self.assertEqual(ll._free, NIL)
+        self.assertEqual(str(ll), "[0, 1, 3, 4, 5]")
+
+    def test_delete_all_then_append(self):
+        """Test the list is usable after all elements are deleted"""
+        ll = Operations.ll_from([1, 2])
+        del ll[1]
+        del ll[0]
+        del ll[0]
+        self.assertEqual(len(ll), len(linked_list.LinkedList()))
+        ll.prepend(7)
+        self.assertEqual(str(ll), "[7]")
+
+    def test_reverse(self):
+        """Test reverse keeps links , index and free-list in sync"""
+        ll = Operations.ll_from(range(6))
+        del ll[0]
+        ll.reverse()
+        self.assertEqual(str(ll), "[5, 4, 3, 2, 1]")
+        self.assertEqual([ll[i].data for i in range(5)], [5, 4, 3, 2, 1])
+        self.assertEqual([n.data for n in reversed(ll)], [1, 2, 3, 4, 5])
+        ll.append(9)
+        ll.prepend(-1)
+        self.assertEqual(str(ll), "[-1, 5, 4, 3, 2, 1, 9]")
+
+    def test_iterators(self):
+        """Test iteration with the iterators of linked_list.py"""
+        ll = Operations.ll_from([1, 2, 3])
+        ll.root_iterator_cls = linked_list.RLIterator
+        self.assertEqual([n.data for n in ll], [3, 2, 1])
+        self.assertEqual([n.data for n in reversed(ll)], [1, 2, 3])
+        self.assertEqual([n.data for n in Operations.reversed(ll)], [1, 2, 3])
+        ll.root_iterator_cls = linked_list.LRIterator
+        self.assertEqual([n.data for n in Operations.reversed(ll, method=2)], [3, 2, 1])
+        self.assertEqual([(i, n.data) for i, n in Operations.enumerate(ll)], [(0, 1), (1, 2), (2, 3)])
+
+    def test_comparisons(self):
+        """Test comparisons against both engines"""
+        a = Operations.ll_from([1, 5, 10])
+        b = linked_list.Operations.ll_from([1, 2, 20])
+        c = Operations.ll_from([1, 5])
+        self.assertTrue(a > b)
+        self.assertTrue(c < a)
+        self.assertTrue(c <= a)
+        self.assertFalse(a <= c)
+        self.assertTrue(a >= c)
+        self.assertEqual(a, Operations.ll_from([1, 5, 10]))
+        self.assertNotEqual(a, c)
+
+    def test_arithmetic(self):
+        """Test +, +=, * and *= keep linked list V1 semantics"""
+        a = Operations.ll_from([1, 2])
+        b = Operations.ll_from([3])
+        self.assertEqual(str(a + b), "[1, 2, 3]")
+        self.assertEqual(str(a * 2), "[1, 2, 1, 2]")
+        a += b
+        self.assertEqual(str(a), "[1, 2, 3]")
+        a *= 1
+        self.assertEqual(len(a), 6)
+
+    def test_slice_and_contains(self):
+        """Test slicing and membership"""
+        ll = Operations.ll_from(range(10))
+        self.assertEqual(str(ll[0:10:3]), "[0, 3, 6, 9]")
+        self.assertEqual(str(ll[-7:5]), "[3, 4]")
+        self.assertIn(4, ll)
+        self.assertIn(linked_list.LinkedListNode(4), ll)
+        self.assertNotIn(40, ll)
+
+    def test_negative_indices_and_slices_match_v1(self):
+        """Test -ve indices & slices behave as in V1 ( & `list` )"""
+        for values in ([], [7], list(range(10))):
+            typed = TypedLinkedList()
+            typed.extend(values)
+            v1 = linked_list.Operations.ll_from(values)
+            for engine in (Operations.ll_from(values), typed):
+                for index in (-1, -len(values), -len(values) - 1, len(values)):
+                    if -len(values) <= index < len(values):
+                        self.assertEqual(engine[index].data, v1[index].data)
+                        self.assertEqual(engine[index].data, values[index])
+                    else:
+                        self.assertRaises(KeyError, engine.__getitem__, index)
+                        self.assertRaises(KeyError, v1.__getitem__, index)
+                for key in (slice(-3, None), slice(None, 0), slice(None, None, -1), slice(-5, 5), slice(-3, -8, -2), slice(1, 100, 3)):
+                    part = engine[key]
+                    self.assertIsInstance(part, type(engine))
+                    self.assertEqual(str(part), str(v1[key]))
+                    self.assertEqual(list(v1[key].values()), values[key])
+
+    def test_arithmetic_with_empty_operands(self):
+        """Test `*` , `*=` , `+` & `+=` add no marker for an empty operand , as in V1"""
+        empty_v1 = str(linked_list.LinkedList())
+        for new in (LinkedList, TypedLinkedList):
+            one = new()
+            one.append(1)
+            self.assertEqual((str(new() * 3), len(new() * 3)), (empty_v1, len(linked_list.LinkedList())))
+            empty = new()
+            empty *= 3
+            self.assertEqual((str(empty), list(empty.values())), (empty_v1, []))
+            for other in (new(), linked_list.LinkedList()):
+                self.assertEqual(list((new() + other).values()), [])
+                self.assertEqual(list((one + other).values()), [1])
+                self.assertEqual(list((new() + one).values()), [1])
+                total = one.copy()
+                total += other
+                self.assertEqual((str(total), len(total)), ("[1]", 1))
+            self.assertEqual(new(), linked_list.LinkedList())
+
+    def test_v1_methods(self):
+        """Test the list methods give the same result as in V1"""
+        values = [5, 3, 8, 3, 1, 9, 3]
+        for new in (LinkedList, TypedLinkedList):
+            engine, v1 = new(), linked_list.LinkedList()
+            self.assertEqual(list(engine.values()), [])
+            engine.extend(values)
+            v1.extend(values)
+            self.assertEqual(list(engine.values()), values)
+            self.assertEqual(list(engine.values_reversed()), values[::-1])
+            self.assertEqual(engine.count(3), v1.count(3))
+            self.assertEqual(engine.count(4), 0)
+            self.assertEqual(engine.index(3), v1.index(3))
+            self.assertEqual(engine.index(3, 2), v1.index(3, 2))
+            self.assertEqual(engine.index(3, -2), v1.index(3, -2))
+            self.assertRaises(ValueError, engine.index, 3, 4, 6)
+            self.assertRaises(ValueError, engine.index, 3, 1, 1)
+            for index, data in ((0, 10), (3, 11), (-2, 12), (-50, 13), (50, 14)):
+                engine.insert(index, data)
+                v1.insert(index, data)
+                self.assertEqual(str(engine), str(v1))
+            self.assertEqual([engine[i].data for i in range(len(engine))], list(v1.values()))
+            engine.remove(3)
+            v1.remove(3)
+            self.assertEqual(str(engine), str(v1))
+            self.assertRaises(ValueError, engine.remove, 42)
+            node = engine[4]
+            engine.delete(node)
+            v1.delete(v1[4])
+            self.assertEqual(str(engine), str(v1))
+            self.assertRaises(ValueError, engine.delete, node)
+            other = new()
+            other.extend(values)
+            self.assertRaises(ValueError, engine.delete, other[1])
+            self.assertEqual(list(other.values()), values)
+            engine.sort()
+            v1.sort()
+            self.assertEqual(str(engine), str(v1))
+            engine.sort(key=lambda data: data % 4, reverse=True)
+            v1.sort(key=lambda data: data % 4, reverse=True)
+            self.assertEqual(str(engine), str(v1))
+            copy = engine.copy()
+            self.assertIsInstance(copy, new)
+            engine.extend(engine)
+            self.assertEqual(list(engine.values()), list(copy.values()) * 2)
+            engine.clear()
+            self.assertEqual(str(engine), str(linked_list.LinkedList()))
+            self.assertEqual(len(engine), len(linked_list.LinkedList()))
+            engine.append(1)
+            self.assertEqual(list(engine.values()), [1])
+        typed = TypedLinkedList()
+        typed.extend(range(4))
+        typed.insert(2, 9)
+        self.assertEqual(list(typed.as_memoryview()), [0, 1, 9, 2, 3])
+
+    def test_matches_v1_under_random_operations(self):
+        """Test both engines agree over a random workload"""
+        rng = random.Random(7)
+        v1, array_ll = linked_list.LinkedList(), LinkedList()
+        for step in range(500):
+            op = rng.random()
+            if op < 0.4:
+                v1.append(step)
+                array_ll.append(step)
+            elif op < 0.7:
+                v1.prepend(step)
+                array_ll.prepend(step)
+            elif op < 0.95:
+                index = rng.randrange(len(v1) + 1)
+                del v1[index]
+                del array_ll[index]
+            else:
+                v1.reverse()
+                array_ll.reverse()
+        self.assertEqual(str(v1), str(array_ll))
+        self.assertEqual(len(v1), len(array_ll))
+        self.assertEqual([v1[i].data for i in range(len(v1))], [array_ll[i].data for i in range(len(array_ll))])
+
+    def test_no_gc_tracked_objects_per_element(self):
+        """Test elements don't allocate gc tracked objects"""
+        gc.collect()
+        before = len(gc.get_objects())
+        ll = Operations.ll_from(range(10_000))
+        after = len(gc.get_objects())
+        self.assertLess(after - before, 100)
+        self.assertEqual(len(ll), 10_000)
+
+
+
+class TestTypedLinkedList(unittest.TestCase):
+    """Test cases for the typed ( numeric column ) LinkedList"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ll = TypedLinkedList('q')
+
+    def test_matches_array_engine(self):
+        """Test the same edits as the array engine , and the empty markers"""
+        untyped = LinkedList()
+        self.assertEqual(str(self.ll), str(untyped))
+        self.assertEqual(len(self.ll), len(untyped))
+        for ll in (self.ll, untyped):
+            ll.append(3)
+            ll.prepend(4)
+            ll.append(8)
+            del ll[1]
+            ll.reverse()
+        self.assertEqual(str(self.ll), str(untyped))
+        self.assertEqual(self.ll, untyped)
+        self.assertIsInstance(self.ll[0:1], TypedLinkedList)
+        self.assertIsInstance(self.ll * 2, TypedLinkedList)
+
+    def test_typecode(self):
+        """Test the column keeps the typecode , bad values & typecodes are refused"""
+        with self.assertRaises(ValueError):
+            TypedLinkedList('u')
+        self.assertEqual(self.ll.typecode, 'q')
+        self.ll.extend([1, 2])
+        with self.assertRaises(TypeError):
+            self.ll.extend([3, 'a'])
+        with self.assertRaises(OverflowError):
+            self.ll.append(2 ** 64)
+        self.assertEqual(str(self.ll), "[1, 2]")
+        self.assertEqual(self.ll._data.typecode, 'q')
+
+    def test_reductions(self):
+        """Test sum , min , max & mean , with and without numpy"""
+        self.assertEqual(self.ll.sum(), 0)
+        for reduction in (self.ll.min, self.ll.max, self.ll.mean):
+            with self.assertRaises(ValueError):
+                reduction()
+        self.ll.extend([5, -3, 2 ** 62, 2 ** 62])
+        self.ll.prepend(7)
+        del self.ll[1]
+        expected = [7, -3, 2 ** 62, 2 ** 62]
+        with unittest.mock.patch.object(linked_list_array, 'numpy', None):
+            self.assertEqual((self.ll.sum(), self.ll.min(), self.ll.max()), (sum(expected), -3, 2 ** 62))
+        self.assertEqual((self.ll.sum(), self.ll.min(), self.ll.max()), (sum(expected), -3, 2 ** 62))
+        self.assertEqual(self.ll.mean(), sum(expected) / 4)
+        floats = TypedLinkedList('f')
+        floats.extend([0.5, 1.5])
+        self.assertEqual((floats.sum(), floats.mean()), (2.0, 1.0))
+
+    def test_memoryview_export(self):
+        """Test the export is in list order , shares the column & pins it"""
+        self.ll.extend(range(5))
+        self.ll.prepend(-1)
+        del self.ll[3]
+        with self.ll.as_memoryview() as view:
+            self.assertEqual(view.tolist(), [-1, 0, 1, 3, 4])
+            view[0] = 10
+            with self.assertRaises(BufferError):
+                self.ll.append(5)
+        self.assertEqual(self.ll[0].data, 10)
+        self.ll.append(5)
+        self.assertEqual(self.ll.as_memoryview().tolist(), [10, 0, 1, 3, 4, 5])
+        self.assertEqual([node.data for node in reversed(self.ll)], [5, 4, 3, 1, 0, 10])
+
+    def test_ingest_buffers_in_bulk(self):
+        """Test buffers & linked lists are taken in , whatever their kind"""
+        self.ll.extend(array('q', [1, 2]))
+        self.ll.extend(array('i', [3]))
+        self.ll.extend(memoryview(array('q', [4])))
+        self.ll.extend(linked_list.Operations.ll_from([5]))
+        self.ll.extend(self.ll)
+        self.assertEqual(str(self.ll), "[1, 2, 3, 4, 5, 1, 2, 3, 4, 5]")
+        with self.assertRaises(TypeError):
+            self.ll.extend(array('d', [0.5]))
+
+    @unittest.skipUnless(numpy, 'numpy is not installed')
+    def test_numpy(self):
+        """Test numpy ingest & zero-copy `numpy.asarray`"""
+        self.ll.extend(numpy.arange(4))
+        self.ll.extend(numpy.arange(2, dtype=numpy.int8))
+        self.ll.prepend(9)
+        values = numpy.asarray(self.ll)
+        self.assertEqual(values.tolist(), [9, 0, 1, 2, 3, 0, 1])
+        values[1] = 20
+        self.assertEqual(self.ll[1].data, 20)
+        with self.assertRaises(BufferError):
+            self.ll.append(1)
+        del values
+        copied = numpy.array(self.ll, dtype=numpy.float64)
+        self.assertEqual(copied.dtype, numpy.float64)
+        self.ll.append(1)
+        self.assertEqual(len(copied), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
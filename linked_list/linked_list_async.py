@@ -0,0 +1,237 @@
+"""
+Linked List ( Async Queue )
+===========================
+
+* An asyncio FIFO queue on top of the singly linked list : items are
+    appended after the last element & taken with `popleft` at the head
+    marker , both O(1) .
+
+        get <- head -> [1st item] -> ..... -> [nth item] <- _last <- put
+
+Notes :
+-------
+* `get_many(n)` takes up to `n` items in one call , waking the producers
+    once for the whole batch : the per item cost of a coroutine call &
+    future wake up is paid once per batch .
+* `maxsize` bounds the queue : `put` waits for room ( backpressure ) .
+* `close()` ends the queue : `put` raises `QueueClosed` , consumers drain
+    what's left , then `get` raises `QueueClosed` & `async for` stops .
+* waiters are woken in FIFO order , like `asyncio.Queue` .
+* no waiter future is created while an item ( or room ) is available , the
+    time goes into the storage : linked list V1 keeps an index store up to
+    date on every `append` & `popleft` ( ~ 2.3 us per item ) , a queue never
+    indexes , the singly linked list doesn't ( ~ 0.7 us per item ) .
+* a `deque` is still cheaper per item than a node , one item per `get` runs
+    at ~ 2/3 of `asyncio.Queue` , `get_many` & bounded queues get close to it
+    ( `python3 -m benchmarks.async_queue` ) .
+"""
+import asyncio
+import collections
+from typing import Any, Callable, Deque, List
+
+from linked_list_singly import SinglyLinkedList
+
+
+class QueueClosed(Exception):
+    """Raised by `put` on a closed queue , and by `get` once it's also drained."""
+
+
+class AsyncLinkedQueue:
+    """
+    Unbounded ( or `maxsize` bounded ) asyncio FIFO queue.
+
+    >>> async def main():
+    ...     queue = AsyncLinkedQueue(maxsize=2)
+    ...     async def produce():
+    ...         for i in range(5):
+    ...             await queue.put(i)
+    ...         queue.close()
+    ...     producer = asyncio.ensure_future(produce())
+    ...     items = [item async for item in queue]
+    ...     await producer
+    ...     return items
+    >>> asyncio.run(main())
+    [0, 1, 2, 3, 4]
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initializes an AsyncLinkedQueue instance.
+
+        Args:
+            maxsize (int): The most items held at a time , `0` for no bound.
+        """
+        self._items = SinglyLinkedList()
+        self._size: int = 0
+        self._maxsize = maxsize
+        self._closed = False
+        self._getters: Deque[asyncio.Future] = collections.deque()
+        self._putters: Deque[asyncio.Future] = collections.deque()
+
+    @property
+    def maxsize(self) -> int:
+        """Gets the bound of the queue , `0` for none."""
+        return self._maxsize
+
+    @property
+    def closed(self) -> bool:
+        """Tells whether `close()` was called."""
+        return self._closed
+
+    def qsize(self) -> int:
+        """Number of items in the queue."""
+        return self._size
+
+    def empty(self) -> bool:
+        return not self._size
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= self._size
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future], count: int = 1) -> None:
+        """Wakes up to `count` waiters , skipping the cancelled ones."""
+        while waiters and count:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    async def _wait(self, waiters: Deque[asyncio.Future], ready: Callable[[], bool]) -> None:
+        """Parks the caller in `waiters` until it's woken up."""
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            # the wake up was meant for this caller : hand it over
+            if ready() and not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Adds an item at the end of the queue , without waiting.
+
+        Raises:
+            QueueClosed: If the queue is closed.
+            asyncio.QueueFull: If the queue is full.
+
+        Complexity:
+            O(1)
+        """
+        if self._closed:
+            raise QueueClosed('put on a closed queue')
+        if 0 < self._maxsize <= self._size:
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._size += 1
+        if self._getters:
+            self._wakeup_next(self._getters)
+
+    async def put(self, item: Any) -> None:
+        """
+        Adds an item at the end of the queue , waiting for room if it's full.
+
+        Raises:
+            QueueClosed: If the queue is closed.
+        """
+        while 0 < self._maxsize <= self._size and not self._closed:
+            await self._wait(self._putters, lambda: not self.full())
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        """
+        Removes & returns the first item , without waiting.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty ( `QueueClosed` once it's closed ).
+
+        Complexity:
+            O(1)
+        """
+        if not self._size:
+            if self._closed:
+                raise QueueClosed('get on a closed & drained queue')
+            raise asyncio.QueueEmpty
+        self._size -= 1
+        item = self._items.popleft()
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return item
+
+    async def get(self) -> Any:
+        """
+        Removes & returns the first item , waiting for one if it's empty.
+
+        Raises:
+            QueueClosed: If the queue is closed & drained.
+        """
+        while not self._size and not self._closed:
+            await self._wait(self._getters, lambda: bool(self._size))
+        return self.get_nowait()
+
+    async def get_many(self, count: int) -> List[Any]:
+        """
+        Removes & returns up to `count` items , waiting for at least one.
+
+        Raises:
+            ValueError: If `count` is less than 1.
+            QueueClosed: If the queue is closed & drained.
+
+        Complexity:
+            O(K) for K items returned
+        """
+        if count < 1:
+            raise ValueError(f'count must be at least 1 , not {count}')
+        while not self._size and not self._closed:
+            await self._wait(self._getters, lambda: bool(self._size))
+        if not self._size:
+            raise QueueClosed('get on a closed & drained queue')
+        count = min(count, self._size)
+        popleft = self._items.popleft
+        items = [popleft() for _ in range(count)]
+        self._size -= count
+        if self._putters:
+            self._wakeup_next(self._putters, count)
+        return items
+
+    def close(self) -> None:
+        """
+        Closes the queue : no more puts , consumers drain the rest.
+        """
+        self._closed = True
+        # nobody will put anymore : waiters must see the queue closed
+        self._wakeup_next(self._getters, len(self._getters))
+        self._wakeup_next(self._putters, len(self._putters))
+
+    def __aiter__(self) -> 'AsyncLinkedQueue':
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return await self.get()
+        except QueueClosed:
+            raise StopAsyncIteration from None
+
+    def __repr__(self) -> str:
+        return f"<AsyncLinkedQueue maxsize={self._maxsize} qsize={self._size}{' closed' if self._closed else ''}>"
+
+
+if __name__ == '__main__':
+    async def main():
+        queue = AsyncLinkedQueue()
+        for i in range(10):
+            queue.put_nowait(i)
+        queue.close()
+        print(await queue.get_many(4), [item async for item in queue])
+
+    asyncio.run(main())
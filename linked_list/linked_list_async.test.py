@@ -0,0 +1,128 @@
+"""
+Unit Tests for linked_list_async.py
+
+This module checks the asyncio queue ordering , backpressure , closing &
+cancellation .
+"""
+
+import asyncio
+import unittest
+import unittest.mock
+from linked_list_async import (
+    AsyncLinkedQueue,
+    QueueClosed,
+)
+
+
+class TestAsyncLinkedQueue(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the AsyncLinkedQueue"""
+
+    async def test_put_get_in_order(self):
+        """Test items come out in the order they went in"""
+        queue = AsyncLinkedQueue()
+        for i in range(100):
+            await queue.put(i)
+        self.assertEqual(queue.qsize(), 100)
+        self.assertEqual([await queue.get() for _ in range(100)], list(range(100)))
+        self.assertTrue(queue.empty())
+
+    async def test_no_waiter_while_ready(self):
+        """Test no waiter future is created while an item or room is available"""
+        queue = AsyncLinkedQueue(maxsize=3)
+        with unittest.mock.patch.object(queue, '_wait', side_effect=AssertionError):
+            for i in range(3):
+                await queue.put(i)
+            self.assertEqual([await queue.get(), await queue.get()], [0, 1])
+            await queue.put(3)
+            self.assertEqual(await queue.get_many(5), [2, 3])
+
+    async def test_get_waits_for_put(self):
+        """Test a waiting consumer is woken by a producer"""
+        queue = AsyncLinkedQueue()
+        consumer = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        self.assertFalse(consumer.done())
+        queue.put_nowait('item')
+        self.assertEqual(await consumer, 'item')
+
+    async def test_get_many(self):
+        """Test a batch takes up to count items , at least one"""
+        queue = AsyncLinkedQueue()
+        for i in range(10):
+            queue.put_nowait(i)
+        self.assertEqual(await queue.get_many(4), [0, 1, 2, 3])
+        self.assertEqual(await queue.get_many(100), [4, 5, 6, 7, 8, 9])
+        batch = asyncio.ensure_future(queue.get_many(5))
+        await asyncio.sleep(0)
+        queue.put_nowait(10)
+        self.assertEqual(await batch, [10])
+
+    async def test_get_many_rejects_counts_below_one(self):
+        """Test a batch of less than one item is refused , the queue untouched"""
+        queue = AsyncLinkedQueue()
+        for i in range(3):
+            queue.put_nowait(i)
+        for count in (0, -2):
+            with self.assertRaises(ValueError):
+                await queue.get_many(count)
+        self.assertEqual(queue.qsize(), 3)
+        self.assertEqual(await queue.get_many(10), [0, 1, 2])
+        with self.assertRaises(ValueError):
+            # refused before waiting on an empty queue
+            await asyncio.wait_for(queue.get_many(0), 1)
+
+
+        """Test put waits for room when the queue is full"""
+        queue = AsyncLinkedQueue(maxsize=2)
+        await queue.put(1)
+        await queue.put(2)
+        self.assertTrue(queue.full())
+        with self.assertRaises(asyncio.QueueFull):
+            queue.put_nowait(3)
+        producer = asyncio.ensure_future(queue.put(3))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual(await queue.get_many(2), [1, 2])
+        await producer
+        self.assertEqual(queue.get_nowait(), 3)
+
+    async def test_close_drains_then_stops(self):
+        """Test close refuses puts , then consumers drain & stop"""
+        queue = AsyncLinkedQueue()
+        waiting = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        queue.close()
+        with self.assertRaises(QueueClosed):
+            await waiting
+        queue = AsyncLinkedQueue()
+        for i in range(3):
+            queue.put_nowait(i)
+        queue.close()
+        self.assertTrue(queue.closed)
+        with self.assertRaises(QueueClosed):
+            queue.put_nowait(3)
+        self.assertEqual([item async for item in queue], [0, 1, 2])
+        with self.assertRaises(QueueClosed):
+            await queue.get_many(1)
+
+    async def test_nowait_on_empty(self):
+        """Test get_nowait raises QueueEmpty on an open & empty queue"""
+        queue = AsyncLinkedQueue()
+        with self.assertRaises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    async def test_cancelled_getter_passes_the_item_on(self):
+        """Test a cancelled consumer doesn't swallow a wake up"""
+        queue = AsyncLinkedQueue()
+        first = asyncio.ensure_future(queue.get())
+        second = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait('item')
+        first.cancel()
+        self.assertEqual(await second, 'item')
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,447 @@
+"""
+Linked List ( Concurrent )
+==========================
+
+* A thread safe variant of linked list V1 , exposing the same public api .
+
+Locking :
+---------
+        head_lock                                     tail_lock
+            \\                                             /
+    head -> [1st elem] <=> [2nd elem] ..... <=> [nth elem] <- tail
+
+    index_lock : index store , value index & length counters ( held for O(1) bookkeeping only )
+    rw_lock    : readers  -> reads that walk the list ( slices , `in` , `str` , comparisons , `+` , `*` , pickling , `to_bytes` )
+                 writers  -> edits in the middle ( `del` , `insert` , `reverse` , `sort` , ... )
+
+* `append` holds the tail lock , `prepend` & `popleft` the head lock , so
+    both ends move at the same time , unless the list has less than two
+    elements ( the ends share nodes then , both locks are taken , head first ) .
+* the elements are counted for that , not the links : the count covers the
+    linked elements only & drops under the head lock alone , so two elements
+    counted by an end stay two distinct nodes until it's edit is done , while
+    a half linked node could be seen through the links .
+* edits in the middle take the `rw_lock` for writing , then both end locks ,
+    hence they wait for the walking reads & the edits at the ends .
+* edits at the ends never move a node in the middle , so walking reads
+    don't wait for them .
+* locks are always taken in the order : rw_lock , head , tail , index .
+
+Notes :
+-------
+* iteration is not guarded ( `iter` , `reversed` , `values()` ,
+    `values_reversed()` , `iter_chunks` , `iter_from` ) , iterate over a
+    `copy()` to get a consistent picture while other threads edit the list .
+* `splice` / `+=` , `+` & comparisons lock this list only , the other list
+    must not be edited meanwhile ( locking both could deadlock ) .
+* `delete(node)` is an edit in the middle , the index entries it leaves are
+    dropped under all the locks too , before the next positional read .
+"""
+import sys
+import threading
+import contextlib
+from typing import Any, Callable, Iterable, Optional, Tuple, Type, Union
+from collections.abc import Iterator
+
+from linked_list import (
+    BaseIndexStore,
+    LinkedList,
+    LinkedListNode,
+    NodePool,
+)
+
+
+class ReadWriteLock:
+    """
+    Many readers or a single writer , waiting writers go first.
+
+    * re-entrant : a reader may read again , the writer may read & write again .
+    * a reader can't upgrade to a writer ( `RuntimeError` ) .
+
+    >>> lock = ReadWriteLock()
+    >>> with lock.write_locked():
+    ...     with lock.read_locked():
+    ...         'nested'
+    'nested'
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._waiting_writers: int = 0
+        self._writer: Optional[int] = None
+        self._writes: int = 0
+        self._local = threading.local()
+
+    def _reads(self) -> int:
+        """Read locks held by the current thread."""
+        return getattr(self._local, 'reads', 0)
+
+    def acquire_read(self) -> None:
+        reads = self._reads()
+        if reads or self._writer == threading.get_ident():
+            self._local.reads = reads + 1
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        self._local.reads = 1
+
+    def release_read(self) -> None:
+        reads = self._reads() - 1
+        self._local.reads = reads
+        if reads or self._writer == threading.get_ident():
+            return
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        ident = threading.get_ident()
+        if self._writer == ident:
+            self._writes += 1
+            return
+        if self._reads():
+            raise RuntimeError('a read lock can`t be upgraded to a write lock')
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = ident
+            self._writes = 1
+
+    def release_write(self) -> None:
+        self._writes -= 1
+        if self._writes:
+            return
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextlib.contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentLinkedList(LinkedList):
+    """
+    Thread safe Doubly Linked List Implementation
+
+    >>> import threading
+    >>> ll = ConcurrentLinkedList()
+    >>> workers = [threading.Thread(target=lambda: [ll.append(i) for i in range(1000)]) for _ in range(4)]
+    >>> workers += [threading.Thread(target=lambda: [ll.prepend(i) for i in range(1000)]) for _ in range(4)]
+    >>> for worker in workers: worker.start()
+    >>> for worker in workers: worker.join()
+    >>> len(ll), len(ll.index_store), len([node for node in ll])
+    (8000, 8000, 8000)
+    """
+
+    def __init__(self, root_iterator_cls: Union[str, Type[Iterator]] = 'LRIterator', index_store_cls: Union[str, Type[BaseIndexStore]] = 'IndexStore', slice_views: bool = False, value_index: bool = False, node_pool: Optional[NodePool] = None, weak_back_links: bool = False):
+        """
+        Initializes a ConcurrentLinkedList instance.
+
+        Args:
+            root_iterator_cls (Iterator): The iterator class used for traversal.
+            index_store_cls (BaseIndexStore): The positional index implementation.
+            slice_views (bool): `ll[a:b:c]` gives a `LinkedListView` instead of a copy.
+            value_index (bool): keeps a `ValueIndex` of the elements ( guarded by the index lock ).
+            node_pool (NodePool): recycles the dropped nodes ( see `LinkedList` ).
+            weak_back_links (bool): builds `WeakBackLinkNode` s ( see `LinkedList` ).
+        """
+        # re-entrant : edits in the middle call `append` / `prepend`
+        self._head_lock = threading.RLock()
+        self._tail_lock = threading.RLock()
+        self._index_lock = threading.RLock()
+        self._rw_lock = ReadWriteLock()
+        super().__init__(root_iterator_cls, index_store_cls, slice_views, value_index, node_pool=node_pool, weak_back_links=weak_back_links)
+
+    def _new_like(self) -> 'ConcurrentLinkedList':
+        """Creates an empty list with the same index implementation."""
+        return ConcurrentLinkedList(index_store_cls=type(self._index_store), slice_views=self.slice_views, value_index=self._value_index is not None, node_pool=self._node_pool, weak_back_links=self.weak_back_links)
+
+    def _shares_ends(self, from_tail: bool) -> bool:
+        """
+        Tells , from one end , whether the list has less than two elements.
+
+        * read from the count , updated once the links are done ( see the
+            module notes ) , the same for both ends .
+        """
+        return self._tail._data < 1
+
+    def _lock_end(self, from_tail: bool) -> Tuple[threading.RLock, ...]:
+        """
+        Locks one end of the list for an edit there.
+
+        * both ends are locked ( head first ) when the list has less than two
+            elements , since the ends share nodes then .
+
+        Returns:
+            Tuple[RLock]: the locks taken , to give to `_unlock` .
+        """
+        lock = self._tail_lock if from_tail else self._head_lock
+        lock.acquire()
+        if not self._shares_ends(from_tail):
+            return (lock,)
+        lock.release()
+        self._head_lock.acquire()
+        self._tail_lock.acquire()
+        return (self._tail_lock, self._head_lock)
+
+    @staticmethod
+    def _unlock(locks: Tuple[threading.RLock, ...]) -> None:
+        for lock in locks:
+            lock.release()
+
+    @contextlib.contextmanager
+    def _all_locked(self):
+        """Locks the whole list , for edits in the middle."""
+        with self._rw_lock.write_locked(), self._head_lock, self._tail_lock, self._index_lock:
+            yield
+
+    @contextlib.contextmanager
+    def _repaired(self, acquire: Callable[[], Any], release: Callable[[], Any]):
+        """
+        Takes a lock that `delete` takes too , once the index is repaired.
+
+        * the repair walks the links , hence runs under all the locks ,
+            the lock is then taken again if a `delete` slipped in between .
+        """
+        while True:
+            if self._deleted_nodes:
+                with self._all_locked():
+                    self._sync_index()
+            acquire()
+            if not self._deleted_nodes:
+                break
+            release()
+        try:
+            yield
+        finally:
+            release()
+
+    def _value_index_locked(self):
+        """Locks the value index , if there's one ( walks without it don't stall the ends )."""
+        return self._index_lock if self._value_index is not None else contextlib.nullcontext()
+
+    def append(self, data: Any, return_node: bool = False) -> Optional[LinkedListNode]:
+        """
+        Adds a new element at the end of the list.
+
+        Complexity:
+            O(1)
+        """
+        new_node: LinkedListNode = self._node_cls(data) if self._node_pool is None else self._node_pool.acquire(data)
+        locks = self._lock_end(from_tail=True)
+        try:
+            if self._value_index is not None:
+                with self._index_lock:
+                    self._value_index.add(new_node)
+            last_element: LinkedListNode = self._tail._left
+            self._tail._left = new_node
+            if last_element is self._head:
+                # last_element is head
+                last_element._right = new_node
+            else:
+                self._joint(last_element, new_node)
+            with self._index_lock:
+                if last_element is self._head:
+                    self._head._data += 1
+                self._merge_pending_stores()
+                self._index_store.append(new_node)
+                self._tail._data += 1
+        finally:
+            self._unlock(locks)
+        if return_node:
+            return new_node
+
+    def prepend(self, data: Any, return_node: bool = False) -> Optional[LinkedListNode]:
+        """
+        Adds a new element at the beginning of the list.
+
+        Complexity:
+            O(1) amortized
+        """
+        new_node: LinkedListNode = self._node_cls(data) if self._node_pool is None else self._node_pool.acquire(data)
+        locks = self._lock_end(from_tail=False)
+        try:
+            if self._value_index is not None:
+                with self._index_lock:
+                    self._value_index.add(new_node)
+            first_element: LinkedListNode = self._head._right
+            self._head._right = new_node
+            if first_element is self._tail:
+                # first_element is tail
+                self._tail._left = new_node
+            else:
+                self._joint(new_node, first_element)
+            with self._index_lock:
+                if first_element is self._tail:
+                    self._head._data += 1
+                self._merge_pending_stores()
+                self._index_store.prepend(new_node)
+                self._tail._data += 1
+        finally:
+            self._unlock(locks)
+        if return_node:
+            return new_node
+
+    def popleft(self) -> Any:
+        """
+        Removes the first element & returns it's data.
+
+        Raises:
+            IndexError: If the list is empty.
+
+        Complexity:
+            O(1) with `IndexStore`
+        """
+        locks = self._lock_end(from_tail=False)
+        try:
+            with self._index_lock:
+                return LinkedList.popleft(self)
+        finally:
+            self._unlock(locks)
+
+    def insert(self, index: int, data: Any):
+        with self._all_locked():
+            return super().insert(index, data)
+
+    def extend(self, values: Iterable[Any]):
+        if isinstance(values, LinkedList) and values is not self:
+            # read the other list before locking this one
+            values = values.copy()._values()
+        with self._all_locked():
+            return super().extend(values)
+
+    def splice(self, other: 'LinkedList') -> None:
+        with self._all_locked():
+            return super().splice(other)
+
+    def remove(self, value: Any) -> None:
+        with self._all_locked():
+            return super().remove(value)
+
+    def clear(self):
+        with self._all_locked():
+            return super().clear()
+
+    def reverse(self):
+        with self._all_locked():
+            return super().reverse()
+
+    def sort(self, *, key=None, reverse: bool = False):
+        with self._all_locked():
+            return super().sort(key=key, reverse=reverse)
+
+    def copy(self) -> 'ConcurrentLinkedList':
+        # a consistent copy : the ends wait meanwhile
+        with self._all_locked():
+            return super().copy()
+
+    def __imul__(self, value: int) -> 'ConcurrentLinkedList':
+        with self._all_locked():
+            return super().__imul__(value)
+
+    def __delitem__(self, index: int):
+        with self._all_locked():
+            return super().__delitem__(index)
+
+    def delete(self, node: LinkedListNode):
+        with self._all_locked():
+            return super().delete(node)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            with self._repaired(self._index_lock.acquire, self._index_lock.release):
+                return super().__getitem__(key)
+        with self._repaired(self._rw_lock.acquire_read, self._rw_lock.release_read):
+            return super().__getitem__(key)
+
+    @property
+    def index_store(self) -> BaseIndexStore:
+        """Gets the index store of the list."""
+        with self._repaired(self._index_lock.acquire, self._index_lock.release):
+            self._merge_pending_stores()
+            return self._index_store
+
+    def __len__(self):
+        with self._index_lock:
+            return super().__len__()
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        with self._repaired(self._rw_lock.acquire_read, self._rw_lock.release_read), self._value_index_locked():
+            return super().index(value, start, stop)
+
+    def count(self, value: Any) -> int:
+        with self._rw_lock.read_locked(), self._value_index_locked():
+            return super().count(value)
+
+    def __contains__(self, value: Union[Any, LinkedListNode]) -> bool:
+        with self._rw_lock.read_locked(), self._value_index_locked():
+            return super().__contains__(value)
+
+    def __str__(self) -> str:
+        with self._rw_lock.read_locked():
+            return super().__str__()
+
+    def __eq__(self, other: 'LinkedList'):
+        with self._rw_lock.read_locked():
+            return super().__eq__(other)
+
+    def __lt__(self, other: 'LinkedList'):
+        with self._rw_lock.read_locked():
+            return super().__lt__(other)
+
+    def __le__(self, other: 'LinkedList'):
+        with self._rw_lock.read_locked():
+            return super().__le__(other)
+
+    def __gt__(self, other: 'LinkedList'):
+        with self._rw_lock.read_locked():
+            return super().__gt__(other)
+
+    def __ge__(self, other: 'LinkedList'):
+        with self._rw_lock.read_locked():
+            return super().__ge__(other)
+
+    def __add__(self, other: 'LinkedList') -> 'ConcurrentLinkedList':
+        with self._rw_lock.read_locked():
+            return super().__add__(other)
+
+    def __mul__(self, value: int) -> 'ConcurrentLinkedList':
+        with self._rw_lock.read_locked():
+            return super().__mul__(value)
+
+    def to_bytes(self, typecode: str = 'q') -> bytes:
+        with self._rw_lock.read_locked():
+            return super().to_bytes(typecode)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        with self._rw_lock.read_locked():
+            return super().__reduce__()
+
+
+if __name__ == '__main__':
+    ll = ConcurrentLinkedList()
+    producers = [threading.Thread(target=lambda: [ll.append(i) for i in range(10_000)]) for _ in range(4)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    print(len(ll))
@@ -0,0 +1,245 @@
+"""
+Unit Tests for linked_list_concurrent.py
+
+This module checks that the concurrent LinkedList stays consistent while
+many threads edit it .
+"""
+
+import pickle
+import threading
+import unittest
+import linked_list
+from linked_list_concurrent import (
+    ConcurrentLinkedList,
+    ReadWriteLock,
+)
+
+
+def run_threads(*targets):
+    """Runs every target in it's own thread & waits for all of them."""
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def assert_consistent(test: unittest.TestCase, ll: ConcurrentLinkedList):
+    """Checks links , index & length agree."""
+    values = [node.data for node in ll]
+    test.assertEqual(len(ll), len(values))
+    test.assertEqual([ll[i].data for i in range(len(values))], values)
+    test.assertEqual([node.data for node in reversed(ll)], values[::-1])
+    return values
+
+
+class TestConcurrentLinkedList(unittest.TestCase):
+    """Test cases for the concurrent LinkedList"""
+
+    def test_appends_and_prepends(self):
+        """Test both ends edited from many threads"""
+        ll = ConcurrentLinkedList()
+        appenders = [lambda k=k: [ll.append((k, i)) for i in range(2000)] for k in range(4)]
+        prependers = [lambda k=k: [ll.prepend((k, i)) for i in range(2000)] for k in range(4, 8)]
+        run_threads(*appenders, *prependers)
+        values = assert_consistent(self, ll)
+        self.assertEqual(len(values), 16000)
+        for k in range(4):
+            self.assertEqual([i for key, i in values if key == k], list(range(2000)))
+        for k in range(4, 8):
+            self.assertEqual([i for key, i in values if key == k], list(range(1999, -1, -1)))
+
+    def test_producers_and_consumers(self):
+        """Test every produced item is consumed exactly once"""
+        ll = ConcurrentLinkedList()
+        consumed = []
+
+        def consume():
+            taken = []
+            while len(taken) < 3000:
+                try:
+                    taken.append(ll.popleft())
+                except IndexError:
+                    pass
+            consumed.extend(taken)
+
+        producers = [lambda k=k: [ll.append(k * 3000 + i) for i in range(3000)] for k in range(3)]
+        run_threads(*producers, consume, consume, consume)
+        self.assertEqual(sorted(consumed), list(range(9000)))
+        self.assertEqual(str(ll), str(ConcurrentLinkedList()))
+        ll.append(1)
+        self.assertEqual(ll[0].data, 1)
+
+    def test_middle_edits_during_appends(self):
+        """Test deletes & inserts in the middle while the ends move"""
+        ll = ConcurrentLinkedList()
+        ll.extend(range(1000))
+
+        def edit_middle():
+            for i in range(300):
+                del ll[len(ll) // 2]
+                ll.insert(10, -i)
+
+        run_threads(edit_middle, lambda: [ll.append(i) for i in range(1000)], lambda: [ll.prepend(i) for i in range(1000)])
+        values = assert_consistent(self, ll)
+        self.assertEqual(len(values), 3000)
+
+    def test_slices_and_copies(self):
+        """Test reads that walk the list"""
+        ll = ConcurrentLinkedList()
+        ll.extend(range(10))
+        self.assertIsInstance(ll[2:5], ConcurrentLinkedList)
+        self.assertEqual(str(ll[2:5]), "[2, 3, 4]")
+        self.assertEqual(str(ll.copy()), str(ll))
+        self.assertIn(5, ll)
+        ll += ll.copy()
+        self.assertEqual(len(ll), 20)
+
+    def test_whole_list_reads_during_reverses(self):
+        """Test comparisons , `+` , `*` , pickling & `to_bytes` see the list before or after a reverse"""
+        ll = ConcurrentLinkedList()
+        ll.extend(range(2000))
+        ascending, descending = list(range(2000)), list(range(1999, -1, -1))
+        ref, reversed_ref = linked_list.Operations.ll_from(ascending), linked_list.Operations.ll_from(descending)
+        done = threading.Event()
+        torn = []
+
+        def reverse():
+            while not done.is_set():
+                ll.reverse()
+
+        def read():
+            try:
+                for _ in range(20):
+                    if not (ll == ref or ll == reversed_ref):
+                        torn.append('==')
+                    if not (ll >= ref and ll <= ref) and not (ll > ref and ll >= reversed_ref):
+                        torn.append('<=')
+                    for values in (list((ll + linked_list.LinkedList()).values()), list((ll * 1).values()), list(pickle.loads(pickle.dumps(ll)).values())):
+                        if values not in (ascending, descending):
+                            torn.append('copy')
+                    if list(memoryview(ll.to_bytes()).cast('q')) not in (ascending, descending):
+                        torn.append('to_bytes')
+            finally:
+                done.set()
+
+        run_threads(reverse, read)
+        self.assertEqual(torn, [])
+        assert_consistent(self, ll)
+
+    def test_value_index_under_threads(self):
+        """Test the value index counts what many threads added & removed"""
+        ll = ConcurrentLinkedList(value_index=True)
+        run_threads(
+            *[lambda: [ll.append(i % 10) for i in range(1000)] for _ in range(3)],
+            *[lambda: [ll.prepend(i % 10) for i in range(1000)] for _ in range(3)],
+        )
+        run_threads(*[lambda: [ll.popleft() for _ in range(500)] for _ in range(2)], lambda: [ll.remove(3) for _ in range(100)])
+        values = assert_consistent(self, ll)
+        self.assertEqual([ll.count(v) for v in range(10)], [values.count(v) for v in range(10)])
+        self.assertEqual(ll.index(values[-1]), values.index(values[-1]))
+
+    def test_delete_handles_under_threads(self):
+        """Test deletes by handle racing with positional reads & the ends"""
+        ll = ConcurrentLinkedList()
+        nodes = [ll.append(i, return_node=True) for i in range(2000)]
+        reads = []
+        run_threads(
+            lambda: [ll.delete(node) for node in nodes[::2]],
+            lambda: [ll.delete(node) for node in nodes[1::4]],
+            lambda: [ll.append(i) for i in range(2000, 3000)],
+            lambda: reads.extend(ll[0].data for _ in range(500)),
+        )
+        values = assert_consistent(self, ll)
+        self.assertEqual(values, list(range(3, 2000, 4)) + list(range(2000, 3000)))
+        self.assertEqual(len(reads), 500)
+
+
+    def test_append_racing_poplefts(self):
+        """Test poplefts reaching a half linked append wait for it"""
+        ll = ConcurrentLinkedList()
+        ll.extend(['A', 'B'])
+        linking, resume = threading.Event(), threading.Event()
+
+        def paused_joint(left_node, right_node):
+            # the append stops half way : `B -> C` is linked , `B <- C` isn't yet
+            left_node._right = right_node
+            linking.set()
+            resume.wait(5)
+            right_node._left = left_node
+
+        ll._joint = paused_joint
+        appender = threading.Thread(target=ll.append, args=('C',))
+        appender.start()
+        self.assertTrue(linking.wait(5))
+        popped = []
+        first = threading.Thread(target=lambda: popped.append(ll.popleft()))
+        first.start()
+        first.join(5)
+        self.assertEqual(popped, ['A'])
+        # # a single element left : the end is shared , it waits for the append
+        second = threading.Thread(target=lambda: popped.append(ll.popleft()))
+        second.start()
+        second.join(0.2)
+        self.assertTrue(second.is_alive())
+        resume.set()
+        appender.join(5)
+        second.join(5)
+        self.assertEqual(popped, ['A', 'B'])
+        self.assertEqual(assert_consistent(self, ll), ['C'])
+        self.assertIsNone(ll[0].left)
+
+    def test_v1_options(self):
+        """Test the node pool & weak back-links options reach the nodes"""
+        from linked_list import NodePool, WeakBackLinkNode
+        pool = NodePool()
+        ll = ConcurrentLinkedList(node_pool=pool)
+        run_threads(*[lambda: [ll.append(i) for i in range(500)] for _ in range(2)], lambda: [ll.prepend(i) for i in range(500)])
+        run_threads(*[lambda: [ll.popleft() for _ in range(250)] for _ in range(2)])
+        ll.append(0)
+        ll.prepend(0)
+        self.assertEqual((pool.allocations, pool.reuses), (1500, 2))
+        self.assertIs(ll.copy().node_pool, pool)
+        ll = ConcurrentLinkedList(weak_back_links=True)
+        run_threads(*[lambda: [ll.append(i) for i in range(500)] for _ in range(2)], lambda: [ll.prepend(i) for i in range(500)])
+        self.assertIsInstance(ll[0], WeakBackLinkNode)
+        self.assertEqual(len(assert_consistent(self, ll)), 1500)
+        self.assertTrue(ll.copy().weak_back_links)
+
+
+class TestReadWriteLock(unittest.TestCase):
+    """Test cases for the ReadWriteLock"""
+
+    def test_reentrant(self):
+        """Test nested reads , and reads & writes inside a write"""
+        lock = ReadWriteLock()
+        with lock.read_locked(), lock.read_locked():
+            pass
+        with lock.write_locked(), lock.read_locked(), lock.write_locked():
+            pass
+        with lock.write_locked():
+            pass
+
+    def test_no_upgrade(self):
+        """Test a reader can't take the write lock"""
+        lock = ReadWriteLock()
+        with lock.read_locked():
+            with self.assertRaises(RuntimeError):
+                lock.acquire_write()
+
+    def test_writer_excludes_readers(self):
+        """Test readers wait for the writer"""
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_write()
+        reader = threading.Thread(target=lambda: lock.read_locked().__enter__() or events.append('read'))
+        reader.start()
+        reader.join(0.05)
+        events.append('write done')
+        lock.release_write()
+        reader.join()
+        self.assertEqual(events, ['write done', 'read'])
+
+
+if __name__ == '__main__':
+    unittest.main()
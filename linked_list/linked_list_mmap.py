@@ -0,0 +1,1141 @@
+"""
+Linked List ( Memory Mapped )
+=============================
+
+* It is an alternative engine for linked list V1 , kept in a file on disk
+    & mapped in memory , for lists larger than the memory budget .
+* It follows the slot layout of the array backed engine ( `linked_list_array` ) ,
+    the columns being packed into fixed size records .
+
+Layout :
+--------
+    <path>       : [ header | head | tail | record | record | ... ]
+    record       : [ prev ( int64 ) | next ( int64 ) | payload ( `payload_format` ) ]
+
+    <path>.index : [ header | front room ... | slot of 1st | slot of 2nd | ... ]
+
+* Slot `0` & `1` are the head & tail markers , links are slot numbers ,
+    `-1` ( `NIL` ) stands for no link .
+* Slots released by deletion are chained into a free-list ( through their
+    `next` field ) and reused .
+* the payload is packed with `struct` , hence has a fixed size : `'q'` ( int64 ) ,
+    `'d'` ( float64 ) , `'32s'` ( bytes , NUL padded ) , or a record like `'qd'` .
+    Variable size data is kept elsewhere , the payload holding it's offset .
+* `<path>.index` is the positional index , laid out like `IndexStore` :
+    front room , then the slots in positional order .
+* both files grow by doubling & keep their counters in the header , hence
+    opening an existing list reads two headers , nothing else .
+
+Notes :
+-------
+* only the pages touched are loaded , the OS pages them out under pressure .
+* edits land in the mapping at once ( shared with the file ) , so they outlive
+    the process , `flush()` forces them to the disk against a machine crash .
+    An edit interrupted halfway isn't recovered .
+* `ll[i]` & iteration hand out `MappedNode` handles , created on demand .
+* not supported : `pop` ( as in linked list V1 ) , `ll[i] = x` & `n * ll` ,
+    set the data through the handle instead ( `ll[i].data = x` ) .
+* `sort` & `copy()` read the data in memory , `copy(path)` copies it into
+    another file .
+"""
+import os
+import sys
+import mmap
+import struct
+import inspect
+import itertools
+from typing import Any, Callable, Dict, Generator, Iterable, Optional, Tuple, Type, Union
+from collections.abc import Iterator
+
+import linked_list
+from linked_list import (
+    BaseIndexStore,
+    LinkedListNode,
+    Metadata,
+    LRIterator,
+    RLIterator,
+)
+from linked_list_array import (
+    HEAD,
+    NIL,
+    TAIL,
+    _values_of,
+)
+
+# headers : magic , then the counters
+_DATA_HEADER = struct.Struct('<8sqqqq16s')
+_INDEX_HEADER = struct.Struct('<8sqq')
+_DATA_MAGIC = b'LLMMAP\x00\x01'
+_INDEX_MAGIC = b'LLMIDX\x00\x01'
+# bytes reserved for the headers
+_DATA_HEADER_SIZE = 64
+_INDEX_HEADER_SIZE = 32
+# record fields & index entries
+_LINKS = struct.Struct('<qq')
+_SLOT = struct.Struct('<q')
+# entries moved per step by the bulk operations
+_CHUNK = 1 << 12
+
+# slots carry no metadata , handles report the default one
+_DEFAULT_METADATA = Metadata()
+
+
+def _payload_struct(payload_format: str) -> struct.Struct:
+    """
+    Compiles a `payload_format` ( little endian ).
+
+    Raises:
+        ValueError: If it's not a `struct` format , or longer than the
+            16 characters the header keeps.
+    """
+    if not payload_format.isascii() or len(payload_format) > 16:
+        raise ValueError('payload_format is limited to 16 ascii characters')
+    try:
+        return struct.Struct('<' + payload_format)
+    except struct.error as error:
+        raise ValueError(f'invalid payload_format {payload_format!r} : {error}') from None
+
+
+class _MappedFile:
+    """
+    A file mapped in memory , grown by doubling.
+
+    * `map` changes when the file grows , it's read again after `reserve` .
+    """
+    __slots__ = ('_file', 'map')
+
+    def __init__(self, path: str, min_size: int):
+        """
+        Opens ( or creates ) the file at `path` and maps it.
+
+        Args:
+            path (str): The file to map.
+            min_size (int): size the file is grown to , if it's smaller.
+        """
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        if os.fstat(self._file.fileno()).st_size < min_size:
+            self._file.truncate(min_size)
+        self.map = mmap.mmap(self._file.fileno(), 0)
+
+    def reserve(self, size: int) -> None:
+        """
+        Grows the file to hold at least `size` bytes.
+
+        Complexity:
+            O(1) amortized ( the file is at least doubled , sparse until written )
+        """
+        if size <= len(self.map):
+            return
+        size = max(size, 2 * len(self.map))
+        self.map.close()
+        self._file.truncate(size)
+        self.map = mmap.mmap(self._file.fileno(), 0)
+
+    def flush(self) -> None:
+        self.map.flush()
+
+    def close(self) -> None:
+        if not self.map.closed:
+            self.map.flush()
+            self.map.close()
+            self._file.close()
+
+
+class MappedIndexStore(BaseIndexStore):
+    """
+    `IndexStore` of slot numbers , kept in a memory mapped file.
+
+    * same layout as `IndexStore` : front room , then an int64 slot per entry ,
+        entries are moved with `mmap.move` ( a `memmove` ) , never one by one .
+    * `_offset` & `_length` live in the header , so they survive a restart .
+    """
+    __slots__ = ('_mapped', '_offset', '_length')
+
+    def __init__(self, path: str):
+        """
+        Opens ( or creates ) the index kept at `path` .
+
+        Raises:
+            ValueError: If the file is not a linked list index.
+        """
+        self._mapped = _MappedFile(path, _INDEX_HEADER_SIZE)
+        magic, self._offset, self._length = _INDEX_HEADER.unpack_from(self._mapped.map, 0)
+        if magic == bytes(8):
+            # new index
+            self._offset = self._length = 0
+            self._save()
+        elif magic != _INDEX_MAGIC:
+            self._mapped.close()
+            raise ValueError(f'{path} is not a linked list index')
+
+    def _save(self) -> None:
+        """Writes the counters to the header."""
+        _INDEX_HEADER.pack_into(self._mapped.map, 0, _INDEX_MAGIC, self._offset, self._length)
+
+    def _position(self, index: int) -> int:
+        """Byte position of the entry at `index` ."""
+        return _INDEX_HEADER_SIZE + 8 * (self._offset + index)
+
+    def append(self, slot: int) -> None:
+        """
+        Indexes a slot after the last entry.
+
+        Complexity:
+            O(1) amortized
+        """
+        self._mapped.reserve(self._position(self._length + 1))
+        _SLOT.pack_into(self._mapped.map, self._position(self._length), slot)
+        self._length += 1
+        self._save()
+
+    def prepend(self, slot: int) -> None:
+        """
+        Indexes a slot before the first entry , out of the front room.
+
+        Complexity:
+            O(1) amortized
+        """
+        if not self._offset:
+            self._grow_front()
+        self._offset -= 1
+        _SLOT.pack_into(self._mapped.map, self._position(0), slot)
+        self._length += 1
+        self._save()
+
+    def _grow_front(self) -> None:
+        """Doubles the front room , the entries are moved once."""
+        room = max(self._length, 8)
+        self._mapped.reserve(self._position(self._length) + 8 * room)
+        self._mapped.map.move(self._position(0) + 8 * room, self._position(0), 8 * self._length)
+        self._offset += room
+
+    def _trim(self) -> None:
+        """Gives back the front room once it outgrows the entries ( see `IndexStore._trim` )."""
+        if self._offset > 64 and self._offset > self._length:
+            self._mapped.map.move(_INDEX_HEADER_SIZE, self._position(0), 8 * self._length)
+            self._offset = 0
+
+    def extend(self, slots: Iterable[int]) -> None:
+        """
+        Indexes all the slots after the last entry , `_CHUNK` at a time.
+
+        Complexity:
+            O(K)
+        """
+        slots = iter(slots)
+        while True:
+            chunk = list(itertools.islice(slots, _CHUNK))
+            if not chunk:
+                break
+            self._mapped.reserve(self._position(self._length + len(chunk)))
+            struct.pack_into(f'<{len(chunk)}q', self._mapped.map, self._position(self._length), *chunk)
+            self._length += len(chunk)
+        self._save()
+
+    def insert(self, index: int, slot: int) -> None:
+        """
+        Indexes a slot at `index` , the entries after it move right.
+
+        Complexity:
+            O(N-index) ( a single `memmove` )
+        """
+        self._mapped.reserve(self._position(self._length + 1))
+        self._mapped.map.move(self._position(index + 1), self._position(index), 8 * (self._length - index))
+        _SLOT.pack_into(self._mapped.map, self._position(index), slot)
+        self._length += 1
+        self._save()
+
+    def reverse(self) -> None:
+        """
+        Reverses the entries in place , swapping chunks from both ends.
+
+        Complexity:
+            O(N)
+        """
+        low, high = 0, self._length
+        while high - low > 1:
+            size = min(_CHUNK, (high - low) // 2)
+            fmt = f'<{size}q'
+            left = struct.unpack_from(fmt, self._mapped.map, self._position(low))
+            right = struct.unpack_from(fmt, self._mapped.map, self._position(high - size))
+            struct.pack_into(fmt, self._mapped.map, self._position(low), *reversed(right))
+            struct.pack_into(fmt, self._mapped.map, self._position(high - size), *reversed(left))
+            low, high = low + size, high - size
+
+    def clear(self) -> None:
+        self._offset = self._length = 0
+        self._save()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> int:
+        if 0 <= index < self._length:
+            return _SLOT.unpack_from(self._mapped.map, self._position(index))[0]
+        raise KeyError(index)
+
+    def __setitem__(self, index: int, slot: int) -> None:
+        if not 0 <= index < self._length:
+            raise KeyError(index)
+        _SLOT.pack_into(self._mapped.map, self._position(index), slot)
+
+    def __delitem__(self, index: int) -> None:
+        """
+        Removes the entry at `index` , shifting the shorter side.
+
+        Complexity:
+            O(min(index, N-index)) ( a single `memmove` )
+        """
+        if not 0 <= index < self._length:
+            raise KeyError(index)
+        if index < self._length // 2:
+            # the entries before `index` move one slot to the right
+            self._mapped.map.move(self._position(1), self._position(0), 8 * index)
+            self._offset += 1
+        else:
+            self._mapped.map.move(self._position(index), self._position(index + 1), 8 * (self._length - index - 1))
+        self._length -= 1
+        self._trim()
+        self._save()
+
+    def popleft(self) -> int:
+        """
+        Removes the first entry & returns it's slot.
+
+        Complexity:
+            O(1) amortized
+        """
+        slot = self[0]
+        self._offset += 1
+        self._length -= 1
+        self._trim()
+        self._save()
+        return slot
+
+    def values(self) -> Generator[int, None, None]:
+        """Generates the slots in positional order , read `_CHUNK` at a time."""
+        for start in range(0, self._length, _CHUNK):
+            size = min(_CHUNK, self._length - start)
+            yield from struct.unpack_from(f'<{size}q', self._mapped.map, self._position(start))
+
+    def flush(self) -> None:
+        self._mapped.flush()
+
+    def close(self) -> None:
+        self._mapped.close()
+
+
+class MappedNode:
+    """
+    Handle to a slot of a memory mapped linked list.
+
+    * It reads like `linked_list.LinkedListNode` : `data` , `left` , `right` .
+    * Handles are created on demand & are not stored anywhere ,
+        two handles to the same slot compare equal .
+
+    Attributes:
+        ll (LinkedList): The list owning the slot.
+        slot (int): The slot in the data file.
+    """
+    __slots__ = ('_ll', '_slot')
+
+    def __init__(self, ll: 'LinkedList', slot: int):
+        """
+        Initializes a MappedNode instance.
+
+        Args:
+            ll (LinkedList): The list owning the slot.
+            slot (int): The slot in the data file.
+        """
+        self._ll = ll
+        self._slot = slot
+
+    @property
+    def slot(self) -> int:
+        """Gets the slot of the node."""
+        return self._slot
+
+    @property
+    def data(self) -> Any:
+        """Gets the data stored in the node."""
+        return self._ll._value(self._slot)
+
+    @data.setter
+    def data(self, value: Any) -> Any:
+        """Sets the data in the node ( packed with the list's `payload_format` )."""
+        self._ll._write(self._slot, self._ll._pack(value))
+        return value
+
+    @property
+    def left(self) -> Optional['MappedNode']:
+        """Gets the left node."""
+        return self._ll._node(self._ll._prev(self._slot))
+
+    @property
+    def right(self) -> Optional['MappedNode']:
+        """Gets the right node."""
+        return self._ll._node(self._ll._next(self._slot))
+
+    @property
+    def metadata(self) -> Metadata:
+        """Gets the metadata associated with the node ( always the default one )."""
+        return _DEFAULT_METADATA
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MappedNode):
+            return self._ll is other._ll and self._slot == other._slot
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._ll), self._slot))
+
+    def __str__(self) -> str:
+        """Returns a string representation of the node."""
+        return f"{self.data}"
+
+    def __repr__(self):
+        """Returns a detailed string representation of the node."""
+        return f"MappedNode({self.data}, left={self.left}, right={self.right})"
+
+
+class LinkedList:
+    """
+    Doubly Linked List Implementation ( memory mapped file )
+
+    -----
+    Usage
+    -----
+
+    # Prepare
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'numbers.ll')
+    >>> ll = LinkedList(path)
+    >>> ll.append(3)
+    >>> ll.prepend(4)
+    >>> ll.append(8)
+    >>> print(ll)
+    [4, 3, 8]
+
+    # Fetch Node data
+    >>> ll[1].data
+    3
+
+    # Reopen ( two headers are read , nothing else )
+    >>> ll.close()
+    >>> ll = LinkedList(path)
+    >>> print(ll, len(ll))
+    [4, 3, 8] 3
+
+    # Reverse Iteration
+    >>> print([v.data for v in reversed(ll)])
+    [8, 3, 4]
+    >>> ll.close()
+
+    ---
+
+    NOTES
+        - -ve indices count from the end , as for `list` .
+        - data must fit `payload_format` ( `struct` format , `'q'` by default )
+        - slices are copied into a `linked_list.LinkedList` , in memory
+
+    """
+
+    def __init__(self, path: str, payload_format: Optional[str] = None, root_iterator_cls: Union[str, Type[Iterator]] = 'LRIterator'):
+        """
+        Opens the list kept at `path` , creating it if needed.
+
+        Args:
+            path (str): The data file , the index is kept next to it ( `<path>.index` ).
+            payload_format (str): `struct` format of the data , without a byte
+                order character ; `'q'` for a new list , the stored one when reopening.
+            root_iterator_cls (Iterator): The iterator class used for traversal.
+
+        Raises:
+            ValueError: If the file is not a linked list , was created with
+                another `payload_format` , if `payload_format` isn't a valid
+                `struct` format , or if the index doesn't match the list.
+        """
+        if payload_format is not None:
+            # checked before any file is touched
+            _payload_struct(payload_format)
+        self._mapped = _MappedFile(path, _DATA_HEADER_SIZE)
+        self._index_store: Optional[MappedIndexStore] = None
+        try:
+            self._open(path, payload_format)
+        except BaseException:
+            self.close()
+            raise
+        # Config
+        # # Root Iterator
+        self.root_iterator_cls: Iterator = root_iterator_cls
+
+    def _open(self, path: str, payload_format: Optional[str]) -> None:
+        """Reads ( or writes , for a new list ) the headers of both files."""
+        magic, record_size, self._slots, self._free, self._length, stored_format = _DATA_HEADER.unpack_from(self._mapped.map, 0)
+        new = magic == bytes(8)
+        if new:
+            # new list : the markers take slot 0 & 1
+            stored_format = payload_format or 'q'
+        elif magic != _DATA_MAGIC:
+            raise ValueError(f'{path} is not a linked list file')
+        else:
+            stored_format = stored_format.rstrip(b'\x00').decode('ascii')
+            if payload_format is not None and payload_format != stored_format:
+                raise ValueError(f'{path} holds {stored_format!r} payloads , not {payload_format!r}')
+        self._payload_format: str = stored_format
+        self._payload = _payload_struct(stored_format)
+        self._record_size: int = _LINKS.size + self._payload.size
+        # a single field reads as a scalar , a record as a tuple
+        self._scalar: bool = len(self._payload.unpack(bytes(self._payload.size))) == 1
+        if new:
+            self._slots, self._free, self._length = 2, NIL, 0
+            self._mapped.reserve(self._record(2))
+            _LINKS.pack_into(self._mapped.map, self._record(HEAD), NIL, TAIL)
+            _LINKS.pack_into(self._mapped.map, self._record(TAIL), HEAD, NIL)
+            self._save()
+        # Index Map
+        self._index_store = MappedIndexStore(path + '.index')
+        if new:
+            # an index left over from a deleted list indexes nothing here
+            self._index_store.clear()
+        elif len(self._index_store) != self._length:
+            raise ValueError(f'{path}.index holds {len(self._index_store)} entries , the list {self._length}')
+
+    @property
+    def payload_format(self) -> str:
+        """Gets the `struct` format of the data."""
+        return self._payload_format
+
+    @property
+    def head(self) -> MappedNode:
+        """Gets the head node of the list."""
+        return MappedNode(self, HEAD)
+
+    @property
+    def tail(self) -> MappedNode:
+        """Gets the tail node of the list."""
+        return MappedNode(self, TAIL)
+
+    @property
+    def index_store(self) -> MappedIndexStore:
+        """Gets the index store of the list."""
+        return self._index_store
+
+    def _save(self) -> None:
+        """Writes the counters to the header."""
+        _DATA_HEADER.pack_into(
+            self._mapped.map, 0, _DATA_MAGIC, self._record_size, self._slots, self._free, self._length,
+            self._payload_format.encode('ascii'),
+        )
+
+    def _record(self, slot: int) -> int:
+        """Byte position of the record of `slot` ."""
+        return _DATA_HEADER_SIZE + slot * self._record_size
+
+    def _prev(self, slot: int) -> int:
+        return _SLOT.unpack_from(self._mapped.map, self._record(slot))[0]
+
+    def _next(self, slot: int) -> int:
+        return _SLOT.unpack_from(self._mapped.map, self._record(slot) + 8)[0]
+
+    def _set_prev(self, slot: int, value: int) -> None:
+        _SLOT.pack_into(self._mapped.map, self._record(slot), value)
+
+    def _set_next(self, slot: int, value: int) -> None:
+        _SLOT.pack_into(self._mapped.map, self._record(slot) + 8, value)
+
+    def _pack(self, data: Any) -> bytes:
+        """
+        Packs `data` into a payload.
+
+        Raises:
+            struct.error: If `data` doesn't fit the `payload_format` .
+        """
+        return self._payload.pack(data) if self._scalar else self._payload.pack(*data)
+
+    def _write(self, slot: int, payload: bytes) -> None:
+        position = self._record(slot) + _LINKS.size
+        self._mapped.map[position:position + len(payload)] = payload
+
+    def _read(self, slot: int) -> Any:
+        values = self._payload.unpack_from(self._mapped.map, self._record(slot) + _LINKS.size)
+        return values[0] if self._scalar else values
+
+    def _value(self, slot: int) -> Any:
+        """
+        Reads the data of a slot.
+
+        * markers read as the index counters of linked list V1 :
+            head is `0` ( `-1` when empty ) , tail is the last index .
+        """
+        if slot > TAIL:
+            return self._read(slot)
+        if slot == HEAD:
+            return 0 if self._length else -1
+        return self._length - 1
+
+    def _node(self, slot: int) -> Optional[MappedNode]:
+        """Creates a handle for `slot` , `None` for `NIL` ."""
+        return None if slot == NIL else MappedNode(self, slot)
+
+    def _allocate(self, payload: bytes) -> int:
+        """
+        Takes a slot for `payload` , out of the free-list when possible.
+
+        Complexity:
+            O(1) amortized
+        """
+        slot = self._free
+        if slot == NIL:
+            slot = self._slots
+            self._slots += 1
+            self._mapped.reserve(self._record(self._slots))
+        else:
+            self._free = self._next(slot)
+        _LINKS.pack_into(self._mapped.map, self._record(slot), NIL, NIL)
+        self._write(slot, payload)
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """Gives `slot` back to the free-list ( chained through it's `next` field )."""
+        _LINKS.pack_into(self._mapped.map, self._record(slot), NIL, self._free)
+        self._free = slot
+
+    def append(self, data: Any):
+        """
+        Adds a new element at the end of the list.
+
+        Args:
+            data (Any): The data to append.
+
+        Complexity:
+            O(1) amortized
+        """
+        slot = self._allocate(self._pack(data))
+        last_slot = self._prev(TAIL)
+        self._set_prev(TAIL, slot)
+        if last_slot == HEAD:
+            # last slot is head
+            self._set_next(HEAD, slot)
+        else:
+            self._set_next(last_slot, slot)
+            self._set_prev(slot, last_slot)
+        self._index_store.append(slot)
+        self._length += 1
+        self._save()
+
+    def prepend(self, data: Any):
+        """
+        Adds a new element at the beginning of the list.
+
+        Args:
+            data (Any): The data to prepend.
+
+        Complexity:
+            O(1) amortized
+        """
+        slot = self._allocate(self._pack(data))
+        first_slot = self._next(HEAD)
+        self._set_next(HEAD, slot)
+        if first_slot == TAIL:
+            # first slot is tail
+            self._set_prev(TAIL, slot)
+        else:
+            self._set_prev(first_slot, slot)
+            self._set_next(slot, first_slot)
+        self._index_store.prepend(slot)
+        self._length += 1
+        self._save()
+
+    def extend(self, values: Iterable[Any]):
+        """
+        Adds all the `values` at the end of the list.
+
+        Args:
+            values (Iterable): The values to add , a `LinkedList` ( mapped or V1 ) adds it's data.
+
+        * the list itself is read upfront , a walk would reach the records
+            being appended & never end .
+        * the new slots are contiguous , their records are packed & written
+            `_CHUNK` at a time , instead of an `append` per value .
+
+        Complexity:
+            O(K)
+        """
+        if values is self:
+            values = list(self.values())
+        values = iter(values.values() if isinstance(values, (LinkedList, linked_list.LinkedList)) else values)
+        while True:
+            payloads = [self._pack(data) for data in itertools.islice(values, _CHUNK)]
+            if not payloads:
+                break
+            start = self._slots
+            end = start + len(payloads)
+            last_slot = self._prev(TAIL)
+            records = bytearray()
+            for slot, payload in enumerate(payloads, start):
+                prev_slot = slot - 1 if slot > start else (NIL if last_slot == HEAD else last_slot)
+                records += _LINKS.pack(prev_slot, slot + 1 if slot + 1 < end else NIL)
+                records += payload
+            self._mapped.reserve(self._record(end))
+            self._mapped.map[self._record(start):self._record(end)] = records
+            if last_slot == HEAD:
+                self._set_next(HEAD, start)
+            else:
+                self._set_next(last_slot, start)
+            self._set_prev(TAIL, end - 1)
+            self._slots = end
+            self._length += len(payloads)
+            self._index_store.extend(range(start, end))
+            self._save()
+
+    def popleft(self) -> Any:
+        """
+        Removes the first element & returns it's data.
+
+        Raises:
+            IndexError: If the list is empty.
+
+        Complexity:
+            O(1) amortized
+        """
+        first_slot = self._next(HEAD)
+        if first_slot == TAIL:
+            raise IndexError('popleft from an empty list')
+        data = self._read(first_slot)
+        next_slot = self._next(first_slot)
+        if next_slot == NIL:
+            # last remaining element : back to the initial markers state
+            self._set_next(HEAD, TAIL)
+            self._set_prev(TAIL, HEAD)
+        else:
+            self._set_prev(next_slot, NIL)
+            self._set_next(HEAD, next_slot)
+        self._index_store.popleft()
+        self._release(first_slot)
+        self._length -= 1
+        self._save()
+        return data
+
+    def sort(self, *, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False):
+        """
+        Sorts the list in place , like `list.sort` .
+
+        * the data is read in memory & sorted ( timsort , stable ) , then
+            written back into contiguous slots , the handles are invalidated .
+
+        Args:
+            key (Callable): computes the sort key out of an element's data.
+            reverse (bool): sorts in descending order , keeping it stable.
+
+        Complexity:
+            O(N log N) , O(N) memory
+        """
+        values = list(self.values())
+        values.sort(key=key, reverse=reverse)
+        self.clear()
+        self.extend(values)
+
+    def reverse(self):
+        """
+        Reverses the list in place , the links of every record are swapped.
+
+        * the slots are visited in index order , `_CHUNK` at a time ,
+            the index store reverses it's entries in place .
+
+        Complexity:
+            O(N)
+        """
+        if not self._length:
+            return
+        mapped = self._mapped.map
+        first_slot, last_slot = self._next(HEAD), self._prev(TAIL)
+        for slot in self._index_store.values():
+            prev_slot, next_slot = _LINKS.unpack_from(mapped, self._record(slot))
+            _LINKS.pack_into(mapped, self._record(slot), next_slot, prev_slot)
+        self._set_next(HEAD, last_slot)
+        self._set_prev(TAIL, first_slot)
+        self._index_store.reverse()
+        self._save()
+
+    def insert(self, index: int, data: Any):
+        """
+        Adds a new element before position `index` , like `list.insert` .
+
+        Args:
+            index (int): position of the new element , clamped to the list bounds.
+            data (Any): The data to insert.
+
+        Complexity:
+            O(N-index) ( a single `memmove` of the index entries )
+        """
+        if index < 0:
+            index = max(index + self._length, 0)
+        if index >= self._length:
+            return self.append(data)
+        if index == 0:
+            return self.prepend(data)
+        slot = self._allocate(self._pack(data))
+        right_slot = self._index_store[index]
+        left_slot = self._prev(right_slot)
+        self._set_next(left_slot, slot)
+        self._set_prev(slot, left_slot)
+        self._set_next(slot, right_slot)
+        self._set_prev(right_slot, slot)
+        self._index_store.insert(index, slot)
+        self._length += 1
+        self._save()
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        """
+        Position of the first element holding `value` , like `list.index` .
+
+        Raises:
+            ValueError: If no element in `start:stop` holds `value` .
+
+        Complexity:
+            O(index)
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start < stop:
+            slot = self._index_store[start]
+            for index in range(start, stop):
+                if self._read(slot) == value:
+                    return index
+                slot = self._next(slot)
+        raise ValueError(f'{value!r} is not in list')
+
+    def count(self, value: Any) -> int:
+        """
+        Number of elements holding `value` , like `list.count` .
+
+        Complexity:
+            O(N)
+        """
+        return sum(1 for data in self.values() if data == value)
+
+    def copy(self, path: Optional[str] = None) -> Union['LinkedList', linked_list.LinkedList]:
+        """
+        Returns a shallow copy of the list.
+
+        Args:
+            path (str): The data file of the copy , with the same `payload_format` ,
+                `None` copies into a `linked_list.LinkedList` , in memory ( like slices ).
+
+        Complexity:
+            O(N)
+        """
+        if path is None:
+            return linked_list.Operations.ll_from(self.values())
+        _ll = LinkedList(path, self._payload_format, self.root_iterator_cls)
+        _ll.extend(self)
+        return _ll
+
+    def clear(self):
+        """
+        Removes all the elements , like `list.clear` .
+
+        * both files keep their size , the next edits reuse it .
+
+        Complexity:
+            O(1)
+        """
+        self._slots, self._free, self._length = 2, NIL, 0
+        _LINKS.pack_into(self._mapped.map, self._record(HEAD), NIL, TAIL)
+        _LINKS.pack_into(self._mapped.map, self._record(TAIL), HEAD, NIL)
+        self._index_store.clear()
+        self._save()
+
+    def remove(self, value: Any) -> None:
+        """
+        Deletes the first element holding `value` , like `list.remove` .
+
+        Raises:
+            ValueError: If no element holds `value` .
+
+        Complexity:
+            O(index) to find it , plus the cost of `del ll[index]`
+        """
+        del self[self.index(value)]
+
+    def delete(self, node: MappedNode):
+        """
+        Deletes the element of `node` .
+
+        * the slot carries no position , it's found by walking the links ,
+            which also checks that the node is an element of this list .
+
+        Args:
+            node (MappedNode): The node to delete.
+
+        Raises:
+            ValueError: If the node is a marker or not an element of this list.
+
+        Complexity:
+            O(index) to find it , plus the cost of `del ll[index]`
+        """
+        if isinstance(node, MappedNode) and node._ll is self and node._slot > TAIL:
+            slot = self._next(HEAD)
+            for index in range(self._length):
+                if slot == node._slot:
+                    del self[index]
+                    return
+                slot = self._next(slot)
+        raise ValueError('node is not in list')
+
+    def flush(self) -> None:
+        """Forces the edits to the disk."""
+        self._mapped.flush()
+        self._index_store.flush()
+
+    def close(self) -> None:
+        """Flushes & closes both files , the list is unusable afterwards."""
+        self._mapped.close()
+        if self._index_store is not None:
+            self._index_store.close()
+
+    def __enter__(self) -> 'LinkedList':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def values(self) -> Iterator[Any]:
+        """Generates the data of the elements , left to right ( markers excluded )."""
+        return self._values() if self._length else iter(())
+
+    def values_reversed(self) -> Iterator[Any]:
+        """Generates the data of the elements , right to left ( markers excluded )."""
+        return self._values(reverse=True) if self._length else iter(())
+
+    def _values(self, reverse: bool = False) -> Generator[Any, None, None]:
+        """
+        Generates the data of the list , reading the records directly.
+
+        * it walks the links like the iterators do ,
+            an empty list yields the marker it lands on .
+        """
+        # the record reads are inlined , it's the loop of every full scan
+        mapped, record_size, scalar = self._mapped, self._record_size, self._scalar
+        read_slot, read_payload = _SLOT.unpack_from, self._payload.unpack_from
+        link = 0 if reverse else 8
+        slot = read_slot(mapped.map, self._record(TAIL if reverse else HEAD) + link)[0]
+        while slot != NIL:
+            position = _DATA_HEADER_SIZE + slot * record_size
+            if slot > TAIL:
+                values = read_payload(mapped.map, position + _LINKS.size)
+                yield values[0] if scalar else values
+            else:
+                yield self._value(slot)
+            slot = read_slot(mapped.map, position + link)[0]
+
+    def _walk(self, reverse: bool = False) -> Generator[MappedNode, None, None]:
+        """Generates node handles , from either end of the list."""
+        link = self._prev if reverse else self._next
+        slot = link(TAIL if reverse else HEAD)
+        while slot != NIL:
+            yield MappedNode(self, slot)
+            slot = link(slot)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Comapring the data of two linked lists ( of any engine ) for equlity
+        """
+        if not isinstance(other, (LinkedList, linked_list.LinkedList)) and not hasattr(other, 'head'):
+            return NotImplemented
+        other_values = other._values() if isinstance(other, LinkedList) else _values_of(other, markers=True)
+        for self_value, other_value in itertools.zip_longest(self._values(), other_values, fillvalue=_EXHAUSTED):
+            if self_value is _EXHAUSTED or other_value is _EXHAUSTED or self_value != other_value:
+                return False
+        return True
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __delitem__(self, index: int):
+        """
+        Deletes the element at `index` , out of range indices are ignored.
+
+        Complexity:
+            O(min(index, N-index)) ( index store repair , a single `memmove` )
+        """
+        if index not in self._index_store:
+            return
+        slot = self._index_store[index]
+        prev_slot = self._prev(slot)
+        next_slot = self._next(slot)
+        if prev_slot == NIL and next_slot == NIL:
+            # last remaining element : back to the initial markers state
+            self._set_next(HEAD, TAIL)
+            self._set_prev(TAIL, HEAD)
+        else:
+            # link prev --> next
+            if prev_slot != NIL:
+                self._set_next(prev_slot, next_slot)
+            else:   # this means current slot is first slot
+                self._set_next(HEAD, next_slot)
+            # link next <-- prev
+            if next_slot != NIL:
+                self._set_prev(next_slot, prev_slot)
+            else:   # this means current slot is last slot
+                self._set_prev(TAIL, prev_slot)
+        self._release(slot)
+        del self._index_store[index]
+        self._length -= 1
+        self._save()
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, (MappedNode, LinkedListNode)):
+            value = value.data
+        for data in self._values():
+            if data == value:
+                return True
+        return False
+
+    def __getitem__(self, key):
+        """
+        Gets an item from the linked list by index or slice.
+
+        Args:
+            key (int or slice): The index or slice to retrieve.
+
+        Returns:
+            MappedNode or linked_list.LinkedList: The node , or a copy of the
+                sublist in memory.
+
+        Raises:
+            TypeError: If the key is not an integer or slice.
+            KeyError: If the index is out of range.
+        """
+        if isinstance(key, int):
+            # Handle integer indexing
+            if key < 0:
+                key += self._length
+            return MappedNode(self, self._index_store[key])
+        elif isinstance(key, slice):
+            # Handle slicing ( -ve bounds count from the end , as for `list` )
+            store = self._index_store
+            return linked_list.Operations.ll_from(self._read(store[idx]) for idx in range(*key.indices(self._length)))
+        else:
+            raise TypeError("Invalid key type")
+
+    def __iter__(self):
+        """
+        Returns an iterator for the linked list.
+
+        Returns:
+            Iterator: The iterator for the linked list.
+        """
+        if self.root_iterator_cls in (LRIterator, 'LRIterator'):
+            return self._walk()
+        if self.root_iterator_cls in (RLIterator, 'RLIterator'):
+            return self._walk(reverse=True)
+        if inspect.isclass(self.root_iterator_cls):
+            return self.root_iterator_cls(self)
+        raise NotImplementedError('root_iterator_cls specified isn`t supported yet')
+
+    def __len__(self):
+        """
+        Returns the length of the linked list.
+
+        Returns:
+            int: The length of the linked list.
+        """
+        return self._value(TAIL) - self._value(HEAD) + 1
+
+    def _size_breakdown(self) -> Dict[str, int]:
+        """
+        Splits the on-disk footprint of the list into it's components .
+
+        Returns:
+            Dict[str, int]: size in bytes per component ( used part of the files ) .
+        """
+        return {
+            'data_header_size': _DATA_HEADER_SIZE,
+            'records_size': self._slots * self._record_size,
+            'index_header_size': _INDEX_HEADER_SIZE,
+            'index_size': 8 * (self._index_store._offset + len(self._index_store)),
+        }
+
+    def print_detailed_size_information(self):
+        sizes = self._size_breakdown()
+        total = sum(sizes.values())
+        print("-" * 40)
+        for name, size in sizes.items():
+            print(f"| {name:<24} | {size:>9} |")
+        print("-" * 40)
+        print(f"* Total Size on disk : {total}")
+        if self._length:
+            print(f"* Bytes per Element : {(sizes['records_size'] + sizes['index_size'])/self._length:.2f}")
+        print("\n")
+
+    def __reversed__(self):
+        """
+        Returns a reversed iterator for the linked list.
+
+        Returns:
+            Iterator: The reversed iterator for the linked list.
+        """
+        return self._walk(reverse=self.root_iterator_cls not in (RLIterator, 'RLIterator'))
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the linked list.
+
+        Returns:
+            str: The string representation of the linked list.
+        """
+        return f"[{', '.join([str(data) for data in self._values(reverse=self.root_iterator_cls in (RLIterator, 'RLIterator'))])}]"
+
+
+# marks the exhausted side , while comparing lists of different lengths
+_EXHAUSTED = object()
+
+
+class Operations:
+    """
+    Utility class for performing operations on memory mapped linked lists.
+    """
+
+    @staticmethod
+    def enumerate(ll: Union[LinkedList, Generator[MappedNode, None, None]]) -> Generator[Tuple[int, MappedNode], None, None]:
+        """
+        Enumerates the nodes in the linked list.
+
+        Args:
+            ll (LinkedList or Generator): The linked list or generator to enumerate.
+
+        Returns:
+            Generator[Tuple[int, MappedNode], None, None]: A generator for the enumerated nodes.
+        """
+        return zip(itertools.count(), iter(ll))
+
+    @staticmethod
+    def ll_from(obj: Iterable, path: str, payload_format: Optional[str] = None) -> LinkedList:
+        """
+        Converts an iterable to a memory mapped linked list.
+
+        Args:
+            obj (Iterable): The iterable to convert.
+            path (str): The data file of the new list.
+            payload_format (str): `struct` format of the data.
+
+        Returns:
+            LinkedList: The resulting linked list.
+        """
+        _ll = LinkedList(path, payload_format)
+        _ll.extend(obj)
+        return _ll
+
+
+if __name__ == '__main__':
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), 'numbers.ll')
+    with Operations.ll_from(range(10), path) as ll:
+        ll.prepend(-1)
+        print(ll, len(ll))
+    with LinkedList(path) as ll:
+        print(ll[0].data, ll[10].data, ll.payload_format)
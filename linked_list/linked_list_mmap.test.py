@@ -0,0 +1,265 @@
+"""
+Unit Tests for linked_list_mmap.py
+
+This module checks that the memory mapped LinkedList behaves like the
+node based LinkedList of linked_list.py , and survives being reopened .
+"""
+
+import os
+import random
+import shutil
+import struct
+import tempfile
+import unittest
+import linked_list
+from linked_list_mmap import (
+    MappedNode,
+    LinkedList,
+    Operations,
+)
+
+
+class TestMappedLinkedList(unittest.TestCase):
+    """Test cases for the memory mapped LinkedList"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'list.ll')
+        self.ll = LinkedList(self.path)
+
+    def tearDown(self):
+        self.ll.close()
+        shutil.rmtree(self.directory)
+
+    def reopen(self, payload_format=None) -> LinkedList:
+        self.ll.close()
+        self.ll = LinkedList(self.path, payload_format)
+        return self.ll
+
+    def test_empty_list_matches_v1(self):
+        """Test the marker semantics of an empty list"""
+        v1 = linked_list.LinkedList()
+        self.assertEqual(len(self.ll), len(v1))
+        self.assertEqual(str(self.ll), str(v1))
+        self.assertEqual([n.data for n in self.ll], [n.data for n in v1])
+        self.assertEqual(list(self.ll.values()), [])
+
+    def test_append_prepend(self):
+        """Test append and prepend with positional lookups"""
+        self.ll.append(3)
+        self.ll.prepend(4)
+        self.ll.append(8)
+        self.ll.prepend(6)
+        self.assertEqual(str(self.ll), "[6, 4, 3, 8]")
+        self.assertEqual([self.ll[i].data for i in range(4)], [6, 4, 3, 8])
+        self.assertEqual([n.data for n in reversed(self.ll)], [8, 3, 4, 6])
+        node = self.ll[1]
+        self.assertIsInstance(node, MappedNode)
+        self.assertEqual((node.left.data, node.right.data), (6, 3))
+        self.assertIsNone(self.ll[0].left)
+        self.assertIsNone(self.ll[3].right)
+
+    def test_reopen(self):
+        """Test the list & it's index are read back after a restart"""
+        self.ll.extend(range(10000))
+        for value in range(100):
+            self.ll.prepend(-value)
+        del self.ll[5000]
+        self.reopen()
+        expected = [-value for value in range(99, -1, -1)] + list(range(10000))
+        del expected[5000]
+        self.assertEqual(len(self.ll), len(expected))
+        self.assertEqual(list(self.ll.values()), expected)
+        self.assertEqual([self.ll[i].data for i in (0, 99, 5000, len(expected) - 1)], [expected[i] for i in (0, 99, 5000, len(expected) - 1)])
+        self.ll.append(10000)
+        self.assertEqual(self.reopen()[len(expected)].data, 10000)
+
+    def test_delete_reuses_slots(self):
+        """Test released slots are taken back from the free-list"""
+        self.ll.extend(range(5))
+        del self.ll[1]
+        del self.ll[3]
+        del self.ll[10]
+        self.assertEqual(str(self.ll), "[0, 2, 3]")
+        slots = self.ll._slots
+        self.ll.append(5)
+        self.ll.prepend(6)
+        self.assertEqual(self.ll._slots, slots)
+        self.assertEqual(str(self.reopen()), "[6, 0, 2, 3, 5]")
+
+    def test_popleft(self):
+        """Test popleft as a queue keeps the files bounded"""
+        with self.assertRaises(IndexError):
+            self.ll.popleft()
+        for value in range(5000):
+            self.ll.append(value)
+            if value % 2:
+                self.assertEqual(self.ll.popleft(), value // 2)
+        self.assertEqual(len(self.ll), 2500)
+        self.assertLess(self.ll._slots, 2600)
+        self.assertLess(self.ll.index_store._offset, 2 * 2500 + 64)
+        self.assertEqual(self.ll[0].data, 2500)
+
+    def test_payload_formats(self):
+        """Test float , bytes & record payloads , and a format mismatch"""
+        for payload_format, values in (('d', [0.5, -1.25]), ('8s', [b'ab', b'abcdefgh']), ('qd', [(1, 0.5), (2, 1.5)])):
+            path = os.path.join(self.directory, f'{payload_format}.ll')
+            with Operations.ll_from(values, path, payload_format) as ll:
+                ll.prepend(values[0])
+            with LinkedList(path) as ll:
+                self.assertEqual(ll.payload_format, payload_format)
+                expected = [values[0]] + values
+                if payload_format == '8s':
+                    expected = [value.ljust(8, b'\x00') for value in expected]
+                self.assertEqual(list(ll.values()), expected)
+        with self.assertRaises(ValueError):
+            LinkedList(path, 'q')
+        with self.assertRaises(struct.error):
+            self.ll.append('not an int')
+        self.assertEqual(list(self.ll.values()), [])
+
+    def test_v1_methods(self):
+        """Test the list methods give the same result as in V1 , & survive a reopen"""
+        values = [5, 3, 8, 3, 1, 9, 3]
+        ll, v1 = self.ll, linked_list.Operations.ll_from(values)
+        ll.extend(values)
+        self.assertEqual((ll.count(3), ll.count(4)), (v1.count(3), 0))
+        for args in ((3,), (3, 2), (3, -2)):
+            self.assertEqual(ll.index(*args), v1.index(*args))
+        self.assertRaises(ValueError, ll.index, 3, 4, 6)
+        for index, data in ((0, 10), (3, 11), (-2, 12), (-50, 13), (50, 14)):
+            ll.insert(index, data)
+            v1.insert(index, data)
+        self.assertEqual(str(ll), str(v1))
+        ll.remove(3)
+        v1.remove(3)
+        self.assertRaises(ValueError, ll.remove, 42)
+        node = ll[4]
+        ll.delete(node)
+        v1.delete(v1[4])
+        self.assertEqual(str(ll), str(v1))
+        self.assertRaises(ValueError, ll.delete, node)
+        self.assertRaises(ValueError, ll.delete, ll.head)
+        ll.sort(key=lambda data: data % 4, reverse=True)
+        v1.sort(key=lambda data: data % 4, reverse=True)
+        self.assertEqual(str(self.reopen()), str(v1))
+        self.assertEqual([self.ll[i].data for i in range(len(v1))], list(v1.values()))
+        copy = self.ll.copy()
+        self.assertIsInstance(copy, linked_list.LinkedList)
+        with self.ll.copy(os.path.join(self.directory, 'copy.ll')) as mapped_copy:
+            self.assertEqual((str(copy), str(mapped_copy)), (str(v1), str(v1)))
+        self.ll.clear()
+        self.assertEqual((str(self.ll), len(self.ll), len(self.ll.index_store)), (str(linked_list.LinkedList()), 1, 0))
+        self.ll.extend([2, 1])
+        self.assertEqual(str(self.reopen()), "[2, 1]")
+
+    def test_stale_or_mismatched_index(self):
+        """Test a new list resets a left over index , a reopened one checks it"""
+        self.ll.extend(range(5))
+        self.ll.close()
+        os.remove(self.path)
+        ll = self.reopen()
+        self.assertEqual(len(ll.index_store), 0)
+        with self.assertRaises(KeyError):
+            ll[0]
+        ll.extend([7, 8, 9])
+        self.assertEqual((len(ll.index_store), [ll[i].data for i in range(3)]), (3, [7, 8, 9]))
+        with self.assertRaises(KeyError):
+            ll[4]
+        ll.close()
+        os.remove(self.path + '.index')
+        with self.assertRaises(ValueError):
+            LinkedList(self.path)
+
+    def test_invalid_payload_format(self):
+        """Test an invalid format is refused before any file is created"""
+        path = os.path.join(self.directory, 'bad.ll')
+        for payload_format in ('z', 'q' * 17):
+            with self.assertRaises(ValueError):
+                LinkedList(path, payload_format)
+        self.assertFalse(os.path.exists(path) or os.path.exists(path + '.index'))
+
+    def test_not_a_list_file(self):
+        """Test a foreign file is refused"""
+        path = os.path.join(self.directory, 'other')
+        with open(path, 'wb') as file:
+            file.write(b'x' * 128)
+        with self.assertRaises(ValueError):
+            LinkedList(path)
+
+    def test_slice_and_equality(self):
+        """Test slices copy into a v1 list , equality against v1"""
+        self.ll.extend(range(10))
+        part = self.ll[2:8:2]
+        self.assertIsInstance(part, linked_list.LinkedList)
+        self.assertEqual(str(part), "[2, 4, 6]")
+        self.assertEqual(self.ll, linked_list.Operations.ll_from(range(10)))
+        self.assertNotEqual(self.ll, linked_list.Operations.ll_from(range(9)))
+        self.assertIn(4, self.ll)
+        self.assertNotIn(40, self.ll)
+
+    def test_negative_indices_and_slices_match_v1(self):
+        """Test -ve indices & slices behave as in V1 ( & `list` )"""
+        values = list(range(10))
+        self.ll.extend(values)
+        v1 = linked_list.Operations.ll_from(values)
+        for index in (-1, -10):
+            self.assertEqual(self.ll[index].data, v1[index].data)
+        self.assertRaises(KeyError, self.ll.__getitem__, -11)
+        for key in (slice(-3, None), slice(None, 0), slice(None, None, -1), slice(-5, 5), slice(-3, -8, -2), slice(1, 100, 3)):
+            self.assertEqual(list(self.ll[key].values()), values[key])
+            self.assertEqual(self.ll[key], v1[key])
+
+    def test_matches_v1_under_random_operations(self):
+        """Test the same random edits on both engines"""
+        rng = random.Random(11)
+        v1 = linked_list.LinkedList()
+        for step in range(2000):
+            op = rng.random()
+            if op < 0.4:
+                self.ll.append(step)
+                v1.append(step)
+            elif op < 0.7:
+                self.ll.prepend(step)
+                v1.prepend(step)
+            elif op < 0.9:
+                index = rng.randrange(len(v1) + 1)
+                del self.ll[index]
+                del v1[index]
+            else:
+                self.reopen()
+        self.assertEqual(str(self.ll), str(v1))
+        self.assertEqual(len(self.ll), len(v1))
+        self.assertEqual([self.ll[i].data for i in range(len(self.ll.index_store))], [v1[i].data for i in range(len(v1.index_store))])
+        self.assertEqual(list(self.ll.values_reversed()), list(v1.values_reversed()))
+
+
+    def test_extend_with_itself(self):
+        """Test extending a list with itself , over more than a chunk"""
+        self.ll.extend(range(5000))
+        self.ll.extend(self.ll)
+        self.assertEqual(len(self.ll), 10000)
+        self.assertEqual(list(self.ll.values()), list(range(5000)) * 2)
+        self.assertEqual(self.ll[9999].data, 4999)
+
+    def test_reverse(self):
+        """Test reverse relinks the records & the index"""
+        self.ll.reverse()
+        self.assertEqual(str(self.ll), '[-1]')
+        self.ll.extend(range(5000))
+        self.ll.prepend(-1)
+        self.ll.reverse()
+        expected = list(range(4999, -2, -1))
+        self.assertEqual(list(self.ll.values()), expected)
+        self.assertEqual(list(self.ll.values_reversed()), expected[::-1])
+        self.assertEqual([self.ll[i].data for i in (0, 2500, 5000)], [4999, 2499, -1])
+        self.assertIsNone(self.ll[0].left)
+        self.assertIsNone(self.ll[5000].right)
+        self.assertEqual(list(self.reopen().values()), expected)
+        self.ll.append(7)
+        self.assertEqual(self.ll[5001].left.data, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,354 @@
+"""
+Linked List ( Persistent )
+==========================
+
+* An immutable linked list : every "edit" returns a new version ,
+    the old versions stay valid & untouched .
+* Versions share their cells ( structural sharing ) , an edit allocates
+    O(1) cells , never a copy of the list .
+
+Layout :
+--------
+    v1 = PersistentLinkedList().prepend(2).prepend(1).append(3)
+    v2 = v1.prepend(0)
+
+        v2._front : [0] -.
+                          \\
+        v1._front :       [1] -> [2] -> None
+        v1._rear  :       [3] -> None                ( kept reversed )
+        v2._rear  :  ( same cells as v1._rear )
+
+* `_front` holds the leading elements in order , `_rear` the trailing ones
+    in reverse order , so both `prepend` & `append` are a single cons cell .
+* every cell knows the length of the chain it starts , hence `len` is O(1) .
+
+Notes :
+-------
+* `copy()` & `snapshot()` return the list itself : O(1) time , no memory .
+* `hash` is computed once per version & cached .
+* the rear is reversed once per version & memoized ( `_rear_order` ) , as
+    the front is for `reversed()` ( `_front_reversed` ) : iterating again ,
+    or `popleft` again on the same version , doesn't redo it . `prepend`
+    keeps the rear , hence it's memo . the memo holds a copy of the
+    cells of that side , while the version is alive .
+* iteration yields the data , cells are shared between versions and are
+    not handed out .
+"""
+import itertools
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+import linked_list
+
+
+class _Cons:
+    """An immutable cell : data , the next cell & the length of the chain it starts."""
+    __slots__ = ('data', 'next', 'length')
+
+    def __init__(self, data: Any, next: Optional['_Cons'] = None):
+        self.data = data
+        self.next = next
+        self.length = next.length + 1 if next is not None else 1
+
+
+def _chain(cell: Optional['_Cons']) -> Iterator[Any]:
+    """Generates the data of a chain of cells , from `cell` on."""
+    while cell is not None:
+        yield cell.data
+        cell = cell.next
+
+
+def _cons_all(values: Iterable[Any], cell: Optional['_Cons'] = None) -> Optional['_Cons']:
+    """Conses `values` one after the other in front of `cell` ( the last value ends up first )."""
+    for value in values:
+        cell = _Cons(value, cell)
+    return cell
+
+
+def _length(cell: Optional['_Cons']) -> int:
+    return cell.length if cell is not None else 0
+
+
+# marks the end of the shorter side , when comparing
+_EXHAUSTED = object()
+
+
+class PersistentLinkedList:
+    """
+    Immutable & persistent Linked List Implementation
+
+    -----
+    Usage
+    -----
+
+    # Prepare ( every edit returns a new version )
+    >>> empty = PersistentLinkedList()
+    >>> ll = empty.append(3).prepend(4).append(8)
+    >>> print(ll, empty)
+    [4, 3, 8] []
+
+    # Versions share their cells
+    >>> longer = ll.prepend(6)
+    >>> print(longer, ll, len(longer))
+    [6, 4, 3, 8] [4, 3, 8] 4
+
+    # Snapshots are free
+    >>> ll.snapshot() is ll
+    True
+
+    # Fetch data
+    >>> longer[2]
+    3
+    >>> hash(ll) == hash(PersistentLinkedList([4, 3, 8]))
+    True
+    """
+    __slots__ = ('_front', '_rear', '_hash', '_rear_order', '_front_reversed')
+
+    def __init__(self, values: Iterable[Any] = ()):
+        """
+        Initializes a PersistentLinkedList instance.
+
+        Args:
+            values (Iterable): The initial elements , in order.
+        """
+        if isinstance(values, PersistentLinkedList):
+            self._front, self._rear = values._front, values._rear
+            self._rear_order, self._front_reversed = values._rear_order, values._front_reversed
+        else:
+            # all in the reversed rear : one cons per value , no reversal
+            self._front: Optional[_Cons] = None
+            self._rear: Optional[_Cons] = _cons_all(values._values() if isinstance(values, linked_list.LinkedList) else values)
+            # # memoized reversals ( see `_rear_in_order` )
+            self._rear_order: Optional[_Cons] = None
+            self._front_reversed: Optional[_Cons] = None
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _version(cls, front: Optional[_Cons], rear: Optional[_Cons], rear_order: Optional[_Cons] = None) -> 'PersistentLinkedList':
+        """Creates a version out of existing cells ( `rear_order` : the memo of `rear` , if known )."""
+        version = cls.__new__(cls)
+        version._front = front
+        version._rear = rear
+        version._hash = None
+        version._rear_order = rear_order
+        version._front_reversed = None
+        return version
+
+    def _rear_in_order(self) -> Optional[_Cons]:
+        """
+        The rear elements in list order , reversed once per version ( memoized ).
+
+        Complexity:
+            O(rear) the first time , O(1) after
+        """
+        if self._rear_order is None and self._rear is not None:
+            self._rear_order = _cons_all(_chain(self._rear))
+        return self._rear_order
+
+    def _front_in_reverse(self) -> Optional[_Cons]:
+        """The front elements in reverse order , reversed once per version ( memoized )."""
+        if self._front_reversed is None and self._front is not None:
+            self._front_reversed = _cons_all(_chain(self._front))
+        return self._front_reversed
+
+    def prepend(self, data: Any) -> 'PersistentLinkedList':
+        """
+        Returns a new version with `data` before the first element.
+
+        Complexity:
+            O(1)
+        """
+        return self._version(_Cons(data, self._front), self._rear, self._rear_order)
+
+    def append(self, data: Any) -> 'PersistentLinkedList':
+        """
+        Returns a new version with `data` after the last element.
+
+        Complexity:
+            O(1)
+        """
+        return self._version(self._front, _Cons(data, self._rear))
+
+    def extend(self, values: Iterable[Any]) -> 'PersistentLinkedList':
+        """
+        Returns a new version with all the `values` after the last element.
+
+        Complexity:
+            O(K)
+        """
+        if isinstance(values, (PersistentLinkedList, linked_list.LinkedList)):
+            values = values._values()
+        return self._version(self._front, _cons_all(values, self._rear))
+
+    def popleft(self) -> Tuple[Any, 'PersistentLinkedList']:
+        """
+        Returns the first element , along with the version without it.
+
+        Raises:
+            IndexError: If the list is empty.
+
+        Complexity:
+            O(1) , O(N) when the front runs out ( the rear is reversed once per
+            version , popping the same version again reuses it )
+        """
+        front, rear = self._front, self._rear
+        if front is None:
+            if rear is None:
+                raise IndexError('popleft from an empty list')
+            front, rear = self._rear_in_order(), None
+        return front.data, self._version(front.next, rear)
+
+    def snapshot(self) -> 'PersistentLinkedList':
+        """
+        Returns a snapshot , the list itself as it never changes.
+
+        Complexity:
+            O(1)
+        """
+        return self
+
+    copy = snapshot
+
+    def to_linked_list(self) -> linked_list.LinkedList:
+        """
+        Copies the elements into a mutable `linked_list.LinkedList` .
+
+        Complexity:
+            O(N)
+        """
+        return linked_list.Operations.ll_from(self._values())
+
+    def _values(self) -> Iterator[Any]:
+        """Generates the data of the elements , left to right."""
+        if self._rear is None:
+            return _chain(self._front)
+        return itertools.chain(_chain(self._front), _chain(self._rear_in_order()))
+
+    def __len__(self) -> int:
+        return _length(self._front) + _length(self._rear)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._values()
+
+    def __reversed__(self) -> Iterator[Any]:
+        if self._front is None:
+            return _chain(self._rear)
+        return itertools.chain(_chain(self._rear), _chain(self._front_in_reverse()))
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """
+        Gets an element by index , or a new version by slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+            TypeError: If the key is not an integer or slice.
+
+        Complexity:
+            O(index) , a slice copies the selected elements
+        """
+        if isinstance(key, slice):
+            return PersistentLinkedList(list(self._values())[key])
+        if not isinstance(key, int):
+            raise TypeError("Invalid key type")
+        size = len(self)
+        if key < 0:
+            key += size
+        if not 0 <= key < size:
+            raise IndexError('list index out of range')
+        front_size = _length(self._front)
+        if key < front_size:
+            return next(itertools.islice(_chain(self._front), key, None))
+        # the rear is reversed : count from it's start
+        return next(itertools.islice(_chain(self._rear), size - key - 1, None))
+
+    def __contains__(self, value: Any) -> bool:
+        return any(data == value for data in self._values())
+
+    def __add__(self, other: 'PersistentLinkedList') -> 'PersistentLinkedList':
+        if not isinstance(other, PersistentLinkedList):
+            return NotImplemented
+        return self.extend(other)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # a flat tuple of data , not the chain of cells ( no recursion along it )
+        return PersistentLinkedList, (tuple(self._values()),)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self._values()))
+        return self._hash
+
+    def _compare(self, other: Any) -> Any:
+        """Lexicographic comparison : -1 , 0 or 1 ( shorter is smaller )."""
+        if not isinstance(other, PersistentLinkedList):
+            return NotImplemented
+        for left, right in itertools.zip_longest(self._values(), other._values(), fillvalue=_EXHAUSTED):
+            if left is _EXHAUSTED:
+                return -1
+            if right is _EXHAUSTED:
+                return 1
+            if left != right:
+                return -1 if left < right else 1
+        return 0
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PersistentLinkedList):
+            return NotImplemented
+        if self._front is other._front and self._rear is other._rear:
+            return True
+        if len(self) != len(other) or (self._hash is not None and other._hash is not None and self._hash != other._hash):
+            return False
+        return all(left == right for left, right in zip(self._values(), other._values()))
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __lt__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result < 0
+
+    def __le__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result <= 0
+
+    def __gt__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result > 0
+
+    def __ge__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result >= 0
+
+    def __str__(self) -> str:
+        return f"[{', '.join(str(data) for data in self._values())}]"
+
+    def __repr__(self) -> str:
+        return f"PersistentLinkedList({self})"
+
+
+class Operations:
+    """
+    Utility class for performing operations on persistent linked lists.
+    """
+
+    @staticmethod
+    def ll_from(obj: Iterable) -> PersistentLinkedList:
+        """
+        Converts an iterable ( or a `linked_list.LinkedList` ) to a persistent linked list.
+
+        Args:
+            obj (Iterable): The iterable to convert.
+
+        Returns:
+            PersistentLinkedList: The resulting linked list.
+        """
+        return PersistentLinkedList(obj)
+
+
+if __name__ == '__main__':
+    ll = PersistentLinkedList()
+    versions = [ll]
+    for value in range(5):
+        versions.append(versions[-1].append(value))
+    for version in versions:
+        print(version, len(version))
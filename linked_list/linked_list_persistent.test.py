@@ -0,0 +1,120 @@
+"""
+Unit Tests for linked_list_persistent.py
+
+This module checks that every version of the persistent LinkedList stays
+valid & that versions share their cells .
+"""
+
+import pickle
+import unittest
+import unittest.mock
+import linked_list
+import linked_list_persistent
+from linked_list_persistent import (
+    PersistentLinkedList,
+    Operations,
+)
+
+
+class TestPersistentLinkedList(unittest.TestCase):
+    """Test cases for the persistent LinkedList"""
+
+    def test_versions_stay_valid(self):
+        """Test edits return new versions and leave the old ones untouched"""
+        empty = PersistentLinkedList()
+        one = empty.append(1)
+        two = one.prepend(0)
+        three = two.extend([2, 3])
+        self.assertEqual([list(v) for v in (empty, one, two, three)], [[], [1], [0, 1], [0, 1, 2, 3]])
+        self.assertEqual([len(v) for v in (empty, one, two, three)], [0, 1, 2, 4])
+
+    def test_structural_sharing(self):
+        """Test versions share cells instead of copying them"""
+        base = Operations.ll_from(range(1000))
+        left = base.prepend(-1)
+        right = base.append(1000)
+        self.assertIs(left._rear, base._rear)
+        self.assertIs(right._rear.next, base._rear)
+        self.assertEqual(left[1:4], PersistentLinkedList([0, 1, 2]))
+        self.assertEqual(right[-1], 1000)
+
+    def test_snapshot_and_copy_are_free(self):
+        """Test snapshots return the list itself"""
+        ll = Operations.ll_from([1, 2, 3])
+        self.assertIs(ll.snapshot(), ll)
+        self.assertIs(ll.copy(), ll)
+
+    def test_indexing(self):
+        """Test indexing across the front and the rear"""
+        ll = PersistentLinkedList().append(2).append(3).prepend(1).prepend(0)
+        self.assertEqual([ll[i] for i in range(4)], [0, 1, 2, 3])
+        self.assertEqual([ll[-i] for i in range(1, 5)], [3, 2, 1, 0])
+        self.assertEqual(list(reversed(ll)), [3, 2, 1, 0])
+        with self.assertRaises(IndexError):
+            ll[4]
+        with self.assertRaises(TypeError):
+            ll['a']
+
+    def test_popleft(self):
+        """Test popleft leaves the popped version intact"""
+        ll = Operations.ll_from([1, 2, 3])
+        first, rest = ll.popleft()
+        second, rest = rest.popleft()
+        self.assertEqual((first, second, list(rest), list(ll)), (1, 2, [3], [1, 2, 3]))
+        _, rest = rest.popleft()
+        with self.assertRaises(IndexError):
+            rest.popleft()
+
+    def test_reversals_are_memoized(self):
+        """Test a version reverses it's rear ( & front ) once , whatever the number of pops & iterations"""
+        ll = PersistentLinkedList(range(100))
+        with unittest.mock.patch.object(linked_list_persistent, '_cons_all', wraps=linked_list_persistent._cons_all) as reversals:
+            for _ in range(3):
+                self.assertEqual(ll.popleft()[0], 0)
+                self.assertEqual(list(ll), list(range(100)))
+            self.assertEqual(reversals.call_count, 1)
+            # prepend keeps the rear , & it's memo
+            mixed = ll.prepend(-2).prepend(-1)
+            for _ in range(3):
+                self.assertEqual(list(mixed), [-1, -2, *range(100)])
+            self.assertEqual(reversals.call_count, 1)
+            for _ in range(3):
+                self.assertEqual(list(reversed(mixed)), [*range(99, -1, -1), -2, -1])
+            self.assertEqual(reversals.call_count, 2)
+        self.assertEqual(list(ll.append(100))[-2:], [99, 100])
+
+    def test_hash_and_comparisons(self):
+        """Test hashing & comparisons don't depend on how versions were built"""
+        built = PersistentLinkedList().prepend(2).prepend(1).append(3)
+        listed = PersistentLinkedList([1, 2, 3])
+        self.assertEqual(built, listed)
+        self.assertEqual(hash(built), hash(listed))
+        self.assertEqual(len({built, listed}), 1)
+        self.assertTrue(listed < listed.append(0))
+        self.assertTrue(listed > PersistentLinkedList([1, 2]))
+        self.assertTrue(listed <= built)
+        self.assertTrue(listed != listed.append(4))
+        self.assertFalse(listed == [1, 2, 3])
+        self.assertEqual(str(listed + built), "[1, 2, 3, 1, 2, 3]")
+
+    def test_conversions(self):
+        """Test conversions from & to linked_list.LinkedList"""
+        ll = linked_list.Operations.ll_from([1, 2, 3])
+        persistent = Operations.ll_from(ll)
+        self.assertEqual(list(persistent), [1, 2, 3])
+        self.assertIn(2, persistent)
+        mutable = persistent.to_linked_list()
+        self.assertIsInstance(mutable, linked_list.LinkedList)
+        self.assertEqual(str(mutable), "[1, 2, 3]")
+
+    def test_pickle(self):
+        """Test a long chain of cells pickles without recursing"""
+        persistent = Operations.ll_from(range(100000)).prepend(-1)
+        loaded = pickle.loads(pickle.dumps(persistent))
+        self.assertEqual(loaded, persistent)
+        self.assertEqual(hash(loaded), hash(persistent))
+        self.assertEqual(pickle.loads(pickle.dumps(PersistentLinkedList())), PersistentLinkedList())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,655 @@
+"""
+Linked List ( Singly Linked )
+=============================
+
+* It is a forward only variant of linked list V1 : a node links to it's
+    right neighbour only .
+
+Layout :
+--------
+    head -> [1st] -> [2nd] -> [3rd] -> [4th]
+                                         |
+                                       _last
+
+* `head` is a marker , like in linked list V1 , the last element has no right link .
+* `_last` points at the last element , hence `append` doesn't walk the list .
+
+Notes :
+-------
+* a node is two slots ( data , right ) : 48 bytes , where a node of V1 is
+    four ( data , left , right , metadata ) : 64 bytes , plus an index entry .
+* no left link means no reference cycle between two nodes , a list dropped
+    is freed by reference counting alone .
+* `append` , `prepend` & `popleft` are O(1) , a stream buffer or a stack of
+    digits needs nothing else .
+* there is no index : `ll[i]` , `insert` & `del` walk from the head , O(i) .
+* there is no way back : no reversed iteration , `reverse()` relinks in place .
+* not supported : `pop` ( as in linked list V1 ) & `ll[i] = x` , set the
+    data through the node instead ( `ll[i].data = x` ) .
+"""
+import sys
+import itertools
+from typing import Any, Callable, Optional, Dict, Iterable, Generator, Tuple, Union
+
+import linked_list
+import linked_list_array
+from linked_list import (
+    LinkedListNode,
+    LRIterator,
+    Metadata,
+    _gc_paused,
+)
+
+# nodes carry no metadata , they report the default one
+_DEFAULT_METADATA = Metadata()
+
+
+class SinglyNode:
+    """
+    Represents a node in a singly linked list.
+
+    Attributes:
+        data (Any): The data stored in the node.
+        right (Optional[SinglyNode]): The right (next) node.
+    """
+    __slots__ = ('_data', '_right')
+
+    def __init__(self, data: Any, right: Optional['SinglyNode'] = None):
+        """
+        Initializes a SinglyNode instance.
+
+        Args:
+            data (Any): The data to store in the node.
+            right (Optional[SinglyNode]): The right node.
+        """
+        self._data = data
+        self._right = right
+
+    @property
+    def data(self) -> Any:
+        """Gets the data stored in the node."""
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> Any:
+        """Sets the data in the node."""
+        self._data = value
+        return self._data
+
+    @property
+    def right(self) -> Optional['SinglyNode']:
+        """Gets the right node."""
+        return self._right
+
+    @property
+    def metadata(self) -> Metadata:
+        """Gets the metadata associated with the node ( always the default one )."""
+        return _DEFAULT_METADATA
+
+    def __str__(self) -> str:
+        """Returns a string representation of the node."""
+        return f"{self._data}"
+
+    def __repr__(self):
+        """Returns a detailed string representation of the node."""
+        return f"SinglyNode({self._data}, right={self._right})"
+
+
+class SinglyLinkedList:
+    """
+    Singly Linked List Implementation
+
+    -----
+    Usage
+    -----
+
+    # Prepare
+    >>> ll = SinglyLinkedList()
+    >>> ll.append(3)
+    >>> ll.prepend(4)
+    >>> ll.append(8)
+    >>> print(ll)
+    [4, 3, 8]
+
+    # Fetch Node data ( walks from the head )
+    >>> ll[1].data, ll[-1].data
+    (3, 8)
+
+    # Queue
+    >>> ll.popleft()
+    4
+    >>> print(ll, len(ll))
+    [3, 8] 2
+
+    # Iteration
+    >>> [v.data for v in ll]
+    [3, 8]
+
+    ---
+
+    NOTES
+        - forward only : `reversed(ll)` is not supported
+
+    """
+    # no way back
+    __reversed__ = None
+
+    def __init__(self):
+        """
+        Initializes a SinglyLinkedList instance.
+        """
+        # Positioning Markers ( counters as in linked list V1 )
+        self._head = SinglyNode(-1)
+        self._tail = SinglyNode(-1)
+        self._head._right = self._tail
+        # last element , `None` when empty
+        self._last: Optional[SinglyNode] = None
+
+    @property
+    def head(self) -> SinglyNode:
+        """Gets the head node of the list."""
+        return self._head
+
+    @property
+    def tail(self) -> SinglyNode:
+        """Gets the tail node of the list ( a marker , it's data is the last index )."""
+        return self._tail
+
+    def _reset(self) -> None:
+        """Back to the initial markers state."""
+        self._head._right = self._tail
+        self._head._data = self._tail._data = -1
+        self._last = None
+
+    def _attach(self, first: SinglyNode, last: SinglyNode, count: int) -> None:
+        """Links the chain `first` ... `last` of `count` nodes after the last element."""
+        if self._last is None:
+            self._head._right = first
+            self._head._data = 0
+        else:
+            self._last._right = first
+        self._last = last
+        self._tail._data += count
+
+    def append(self, data: Any) -> None:
+        """
+        Adds a new element at the end of the list.
+
+        Args:
+            data (Any): The data to append.
+
+        Complexity:
+            O(1)
+        """
+        # `_attach` inlined , this is the hot path of every queue
+        node = SinglyNode(data)
+        last = self._last
+        if last is None:
+            self._head._right = node
+            self._head._data = 0
+        else:
+            last._right = node
+        self._last = node
+        self._tail._data += 1
+
+    def prepend(self, data: Any) -> None:
+        """
+        Adds a new element at the beginning of the list.
+
+        Args:
+            data (Any): The data to prepend.
+
+        Complexity:
+            O(1)
+        """
+        if self._last is None:
+            return self.append(data)
+        self._head._right = SinglyNode(data, self._head._right)
+        self._tail._data += 1
+
+    def _extend_values(self, values: Iterable[Any]) -> None:
+        """
+        Links all `values` after the last element , in one pass.
+
+        * nodes are created right to left , each one with it's right link ,
+            the garbage collector is paused meanwhile .
+
+        Complexity:
+            O(K)
+        """
+        values = list(values)
+        if not values:
+            return
+        with _gc_paused():
+            last = first = SinglyNode(values[-1])
+            for data in itertools.islice(reversed(values), 1, None):
+                first = SinglyNode(data, first)
+        self._attach(first, last, len(values))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """
+        Appends the data of `values` ( an iterable , or a linked list of any engine ).
+
+        Complexity:
+            O(K)
+        """
+        if hasattr(values, 'head'):
+            # a linked list , it's markers aside
+            values = _values_of(values)
+        self._extend_values(values)
+
+    def popleft(self) -> Any:
+        """
+        Removes the first element & returns it's data , like `deque.popleft` .
+
+        Raises:
+            IndexError: If the list is empty.
+
+        Complexity:
+            O(1)
+        """
+        first = self._head._right
+        if first is self._tail:
+            raise IndexError('popleft from an empty list')
+        if first is self._last:
+            self._reset()
+        else:
+            self._head._right = first._right
+            self._tail._data -= 1
+        first._right = None
+        return first._data
+
+    def _position(self, index: int) -> int:
+        """Counts -ve indices from the end , `-1` if out of range."""
+        size = self._tail._data + 1
+        if index < 0:
+            index += size
+        return index if 0 <= index < size else -1
+
+    def _node_before(self, index: int) -> SinglyNode:
+        """
+        Walks to the node left of position `index` ( the head for `0` ).
+
+        Complexity:
+            O(index)
+        """
+        _pointer = self._head
+        for _ in range(index):
+            _pointer = _pointer._right
+        return _pointer
+
+    def insert(self, index: int, data: Any) -> None:
+        """
+        Inserts a new element before `index` , like `list.insert` .
+
+        * -ve indices count from the end , past the ends it appends / prepends.
+
+        Complexity:
+            O(index)
+        """
+        size = self._tail._data + 1
+        if index < 0:
+            index = max(index + size, 0)
+        if index >= size:
+            return self.append(data)
+        if index == 0:
+            return self.prepend(data)
+        previous = self._node_before(index)
+        previous._right = SinglyNode(data, previous._right)
+        self._tail._data += 1
+
+    def splice(self, other: 'SinglyLinkedList') -> None:
+        """
+        Moves all the elements of `other` to the end of the list.
+
+        * nodes are relinked , not copied , `other` is left empty .
+        * `ll.splice(ll)` appends a copy of the elements instead .
+
+        Complexity:
+            O(1)
+        """
+        if other is self:
+            return self._extend_values(list(self.values()))
+        if other._last is None:
+            # other is empty
+            return
+        self._attach(other._head._right, other._last, other._tail._data + 1)
+        other._reset()
+
+    def reverse(self) -> None:
+        """
+        Reverses a linked list , relinking the nodes in place.
+
+        Complexity:
+            O(N)
+        """
+        if self._last is None:
+            return
+        first = self._head._right
+        previous, _pointer = None, first
+        while _pointer is not None:
+            _pointer._right, previous, _pointer = previous, _pointer, _pointer._right
+        self._head._right, self._last = previous, first
+
+    def sort(self, *, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        """
+        Sorts the list in place , like `list.sort` ( stable ).
+
+        * the data is sorted in a python list & relinked into new nodes .
+
+        Args:
+            key (Callable): computes the sort key out of an element's data.
+            reverse (bool): sorts in descending order , keeping it stable.
+
+        Complexity:
+            O(N log N)
+        """
+        values = list(self.values())
+        values.sort(key=key, reverse=reverse)
+        self._reset()
+        self._extend_values(values)
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        """
+        Position of the first element holding `value` , like `list.index` .
+
+        Raises:
+            ValueError: If no element in `start:stop` holds `value` .
+
+        Complexity:
+            O(index)
+        """
+        start, stop, _ = slice(start, stop).indices(self._tail._data + 1)
+        for index, data in enumerate(itertools.islice(self.values(), start, stop), start):
+            if data == value:
+                return index
+        raise ValueError(f'{value!r} is not in list')
+
+    def count(self, value: Any) -> int:
+        """
+        Number of elements holding `value` , like `list.count` .
+
+        Complexity:
+            O(N)
+        """
+        return sum(1 for data in self.values() if data == value)
+
+    def copy(self) -> 'SinglyLinkedList':
+        """
+        Returns a shallow copy of the list , built in one pass.
+
+        Complexity:
+            O(N)
+        """
+        _ll = SinglyLinkedList()
+        _ll._extend_values(self.values())
+        return _ll
+
+    def clear(self) -> None:
+        """
+        Removes all the elements , like `list.clear` .
+
+        * no link goes back , dropping the first node frees the chain by
+            reference counting .
+
+        Complexity:
+            O(1) , the nodes are freed in O(N)
+        """
+        self._reset()
+
+    def remove(self, value: Any) -> None:
+        """
+        Deletes the first element holding `value` , like `list.remove` .
+
+        Raises:
+            ValueError: If no element holds `value` .
+
+        Complexity:
+            O(index)
+        """
+        previous = self._head
+        _pointer = self._head._right if self._last is not None else None
+        while _pointer is not None:
+            if _pointer._data == value:
+                return self._unlink(previous, _pointer)
+            previous, _pointer = _pointer, _pointer._right
+        raise ValueError(f'{value!r} is not in list')
+
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Generates the data of the elements , left to right ( markers excluded ).
+
+        Complexity:
+            O(N)
+        """
+        _pointer = self._head._right
+        if _pointer is self._tail:
+            return
+        while _pointer is not None:
+            yield _pointer._data
+            _pointer = _pointer._right
+
+    def _values(self) -> Iterable[Any]:
+        """
+        Generates the data of the list.
+
+        * an empty list yields the marker it's iterator lands on .
+        """
+        return self.values() if self._last is not None else iter((self._tail._data,))
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Comapring the data of two linked lists ( of any engine ) for equlity
+        """
+        if not hasattr(other, 'head'):
+            return NotImplemented
+        for self_value, other_value in itertools.zip_longest(self._values(), _values_of(other, markers=True), fillvalue=_EXHAUSTED):
+            if self_value is _EXHAUSTED or other_value is _EXHAUSTED or self_value != other_value:
+                return False
+        return True
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __add__(self, other: Any) -> 'SinglyLinkedList':
+        new_ll = SinglyLinkedList()
+        new_ll._extend_values(self.values())
+        new_ll.extend(other)
+        return new_ll
+
+    def __iadd__(self, other: Any) -> 'SinglyLinkedList':
+        # like linked list V1 , the nodes of a singly linked `other` are moved
+        if isinstance(other, SinglyLinkedList):
+            self.splice(other)
+        else:
+            self.extend(other)
+        return self
+
+    def __delitem__(self, index: int):
+        """
+        Deletes the element at `index` , out of range indices are ignored.
+
+        Complexity:
+            O(index)
+        """
+        size = self._tail._data + 1
+        if not 0 <= index < size:
+            return
+        previous = self._node_before(index)
+        self._unlink(previous, previous._right)
+
+    def _unlink(self, previous: SinglyNode, node: SinglyNode) -> None:
+        """Unlinks `node` , the right neighbour of `previous` ( the head for the first )."""
+        if self._tail._data == 0:
+            return self._reset()
+        previous._right = node._right
+        node._right = None
+        if node is self._last:
+            self._last = previous
+        self._tail._data -= 1
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, (SinglyNode, LinkedListNode)):
+            value = value.data
+        return any(data == value for data in self.values())
+
+    def __getitem__(self, key):
+        """
+        Gets an item from the linked list by index or slice.
+
+        Args:
+            key (int or slice): The index or slice to retrieve , -ve indices
+                count from the end.
+
+        Returns:
+            SinglyNode or SinglyLinkedList: The node or a copy of the sublist.
+
+        Raises:
+            TypeError: If the key is not an integer or slice.
+            KeyError: If the index is out of range.
+
+        Complexity:
+            O(index) , O(1) for the last element
+        """
+        if isinstance(key, int):
+            # Handle integer indexing
+            index = self._position(key)
+            if index < 0:
+                raise KeyError(key)
+            if index == self._tail._data:
+                return self._last
+            return self._node_before(index + 1)
+        elif isinstance(key, slice):
+            # Handle slicing
+            _ll = SinglyLinkedList()
+            _ll._extend_values(list(self.values())[key])
+            return _ll
+        else:
+            raise TypeError("Invalid key type")
+
+    def __iter__(self):
+        """
+        Returns an iterator for the linked list , left to right.
+
+        Returns:
+            Iterator: The iterator for the linked list.
+        """
+        return LRIterator(self)
+
+    def __len__(self):
+        """
+        Returns the length of the linked list.
+
+        Returns:
+            int: The length of the linked list.
+        """
+        return self._tail._data - self._head._data + 1
+
+    def _size_breakdown(self) -> Dict[str, int]:
+        """
+        Splits the memory footprint of the list into it's components .
+
+        Returns:
+            Dict[str, int]: size in bytes per component .
+        """
+        nodes_size = sys.getsizeof(self._head) + sys.getsizeof(self._tail)
+        _pointer = self._head._right
+        while _pointer is not None and _pointer is not self._tail:
+            nodes_size += sys.getsizeof(_pointer)
+            _pointer = _pointer._right
+        return {
+            'base_object_size': super().__sizeof__(),
+            'all_nodes_size': nodes_size,
+        }
+
+    def __sizeof__(self):
+        return sum(self._size_breakdown().values())
+
+    def print_detailed_size_information(self):
+        sizes = self._size_breakdown()
+        total = sum(sizes.values())
+        print("-" * 40)
+        for name, size in sizes.items():
+            print(f"| {name:<24} | {size:>9} |")
+        print("-" * 40)
+        print(f"* Total Size : {total}")
+        if self._last is not None:
+            print(f"* Bytes per Element : {(total - sizes['base_object_size'])/(self._tail._data + 1):.2f}")
+        print("\n")
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the linked list.
+
+        Returns:
+            str: The string representation of the linked list.
+        """
+        return f"[{', '.join([str(data) for data in self._values()])}]"
+
+
+# marks the exhausted side , while comparing lists of different lengths
+_EXHAUSTED = object()
+
+
+def _values_of(ll: Any, markers: bool = False) -> Iterable[Any]:
+    """
+    Generates the data of any linked list , left to right.
+
+    Args:
+        markers (bool): an empty list yields the marker it's iterator lands on.
+    """
+    if not markers and ll.head.data < 0:
+        # empty ( head reads `-1` )
+        return ()
+    if isinstance(ll, SinglyLinkedList):
+        return ll._values()
+    if isinstance(ll, linked_list.LinkedList) and ll.head.data >= 0:
+        return ll._values()
+    return linked_list_array._values_of(ll, markers=True)
+
+
+class Operations:
+    """
+    Utility class for performing operations on singly linked lists.
+    """
+
+    @staticmethod
+    def enumerate(ll: Union[SinglyLinkedList, Generator[SinglyNode, None, None]]) -> Generator[Tuple[int, SinglyNode], None, None]:
+        """
+        Enumerates the nodes in the linked list.
+
+        Args:
+            ll (SinglyLinkedList or Generator): The linked list or generator to enumerate.
+
+        Returns:
+            Generator[Tuple[int, SinglyNode], None, None]: A generator for the enumerated nodes.
+        """
+        return zip(itertools.count(), iter(ll))
+
+    @staticmethod
+    def ll_from(obj: Iterable) -> SinglyLinkedList:
+        """
+        Converts an iterable to a singly linked list.
+
+        Args:
+            obj (Iterable): The iterable to convert.
+
+        Returns:
+            SinglyLinkedList: The resulting linked list.
+        """
+        _ll = SinglyLinkedList()
+        _ll._extend_values(obj)
+        return _ll
+
+
+if __name__ == '__main__':
+    ll = Operations.ll_from([2, 3])
+    ll.prepend(4)
+    ll.append(8)
+    print(ll)
+    ll.reverse()
+    print(ll)
+    ll.print_detailed_size_information()
@@ -0,0 +1,211 @@
+"""
+Unit Tests for linked_list_singly.py
+
+This module checks that the SinglyLinkedList behaves like the
+node based LinkedList of linked_list.py , going forward only .
+"""
+
+import gc
+import random
+import unittest
+import weakref
+import linked_list
+from linked_list_singly import (
+    SinglyNode,
+    SinglyLinkedList,
+    Operations,
+)
+
+
+class Payload:
+    """Data that can be weakly referenced"""
+
+
+class TestSinglyLinkedList(unittest.TestCase):
+    """Test cases for the SinglyLinkedList"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ll = SinglyLinkedList()
+
+    def test_empty_list_matches_v1(self):
+        """Test the marker semantics of an empty list"""
+        v1 = linked_list.LinkedList()
+        self.assertEqual(len(self.ll), len(v1))
+        self.assertEqual(str(self.ll), str(v1))
+        self.assertEqual([n.data for n in self.ll], [n.data for n in v1])
+        self.assertEqual(list(self.ll.values()), [])
+        self.assertEqual(self.ll, v1)
+        with self.assertRaises(KeyError):
+            self.ll[0]
+
+    def test_append_prepend(self):
+        """Test append and prepend with positional lookups"""
+        self.ll.append(3)
+        self.ll.prepend(4)
+        self.ll.append(8)
+        self.ll.prepend(6)
+        self.assertEqual(str(self.ll), "[6, 4, 3, 8]")
+        self.assertEqual([self.ll[i].data for i in range(4)], [6, 4, 3, 8])
+        self.assertEqual([self.ll[i].data for i in range(-1, -5, -1)], [8, 3, 4, 6])
+        self.assertEqual(len(self.ll), 4)
+        self.assertEqual((self.ll.head.data, self.ll.tail.data), (0, 3))
+        node = self.ll[1]
+        self.assertIsInstance(node, SinglyNode)
+        self.assertEqual(node.right.data, 3)
+        self.assertFalse(hasattr(node, 'left'))
+        self.assertIsNone(self.ll[3].right)
+        with self.assertRaises(KeyError):
+            self.ll[4]
+        with self.assertRaises(TypeError):
+            reversed(self.ll)
+
+    def test_insert_and_delete(self):
+        """Test insert & del , the tail pointer follows the last element"""
+        self.ll.extend(range(5))
+        self.ll.insert(2, 'a')
+        self.ll.insert(-1, 'b')
+        self.ll.insert(100, 'c')
+        self.ll.insert(-100, 'd')
+        self.assertEqual(str(self.ll), "[d, 0, 1, a, 2, 3, b, 4, c]")
+        del self.ll[8]
+        del self.ll[0]
+        del self.ll[3]
+        del self.ll[100]
+        del self.ll[-1]
+        self.assertEqual(str(self.ll), "[0, 1, a, 3, b, 4]")
+        self.ll.append(5)
+        self.assertEqual(self.ll[-1].data, 5)
+        for _ in range(7):
+            del self.ll[0]
+        self.assertEqual(str(self.ll), str(linked_list.LinkedList()))
+        self.ll.append(1)
+        self.assertEqual(str(self.ll), "[1]")
+
+    def test_popleft(self):
+        """Test popleft as a queue"""
+        with self.assertRaises(IndexError):
+            self.ll.popleft()
+        for value in range(100):
+            self.ll.append(value)
+            if value % 2:
+                self.assertEqual(self.ll.popleft(), value // 2)
+        self.assertEqual(list(self.ll.values()), list(range(50, 100)))
+        while len(self.ll) > 1:
+            self.ll.popleft()
+        self.assertEqual(self.ll.popleft(), 99)
+        self.assertEqual(len(self.ll), len(linked_list.LinkedList()))
+        self.ll.prepend(7)
+        self.assertEqual((str(self.ll), self.ll[-1].data), ("[7]", 7))
+
+    def test_reverse_and_splice(self):
+        """Test reverse relinks in place , += moves the nodes of a singly list"""
+        self.ll.reverse()
+        self.ll.extend(range(5))
+        self.ll.reverse()
+        self.assertEqual(str(self.ll), "[4, 3, 2, 1, 0]")
+        self.ll.append(-1)
+        other = Operations.ll_from('ab')
+        self.ll += other
+        self.assertEqual(str(self.ll), "[4, 3, 2, 1, 0, -1, a, b]")
+        self.assertEqual(str(other), str(linked_list.LinkedList()))
+        self.ll += self.ll
+        self.assertEqual(len(self.ll), 16)
+        self.ll += linked_list.Operations.ll_from([9])
+        self.ll += linked_list.LinkedList()
+        self.assertEqual(self.ll[-1].data, 9)
+
+    def test_operations_and_comparisons(self):
+        """Test ll_from , enumerate & == against the other engines"""
+        ll = Operations.ll_from([1, 2, 3])
+        self.assertEqual([(i, n.data) for i, n in Operations.enumerate(ll)], [(0, 1), (1, 2), (2, 3)])
+        self.assertEqual(ll, linked_list.Operations.ll_from([1, 2, 3]))
+        self.assertNotEqual(ll, linked_list.Operations.ll_from([1, 2]))
+        self.assertEqual(ll, Operations.ll_from(iter([1, 2, 3])))
+        self.assertEqual(str(ll + linked_list.Operations.ll_from([4])), "[1, 2, 3, 4]")
+        self.assertEqual(str(ll[::2]), "[1, 3]")
+        self.assertIn(2, ll)
+        self.assertIn(linked_list.LinkedListNode(2), ll)
+        self.assertNotIn(5, ll)
+
+    def test_v1_methods(self):
+        """Test the list methods give the same result as in V1"""
+        values = [5, 3, 8, 3, 1, 9, 3]
+        ll, v1 = SinglyLinkedList(), linked_list.Operations.ll_from(values)
+        ll.extend(values)
+        self.assertEqual((ll.count(3), ll.count(4)), (v1.count(3), 0))
+        for args in ((3,), (3, 2), (3, -2)):
+            self.assertEqual(ll.index(*args), v1.index(*args))
+        self.assertRaises(ValueError, ll.index, 3, 4, 6)
+        self.assertRaises(ValueError, ll.index, 3, 1, 1)
+        copy = ll.copy()
+        for value in (3, 3, 9, 5):
+            ll.remove(value)
+            v1.remove(value)
+            self.assertEqual(str(ll), str(v1))
+        self.assertRaises(ValueError, ll.remove, 42)
+        self.assertEqual(ll[-1].data, v1[-1].data)
+        ll.append(0)
+        self.assertEqual(ll[-1].data, 0)
+        self.assertEqual(list(copy.values()), values)
+        copy.sort(key=lambda data: data % 4, reverse=True)
+        v1 = linked_list.Operations.ll_from(sorted(values, key=lambda data: data % 4, reverse=True))
+        self.assertEqual((str(copy), copy[-1].data), (str(v1), v1[-1].data))
+        copy.clear()
+        self.assertEqual((str(copy), len(copy)), (str(linked_list.LinkedList()), len(linked_list.LinkedList())))
+        self.assertRaises(ValueError, copy.remove, -1)
+        copy.append(1)
+        copy.remove(1)
+        self.assertEqual(str(copy), str(linked_list.LinkedList()))
+        self.assertFalse(hasattr(copy, 'pop') or hasattr(copy, '__setitem__'))
+
+    def test_dropped_list_needs_no_gc(self):
+        """Test a dropped list is freed by reference counting alone"""
+        payload = Payload()
+        ll = Operations.ll_from(range(1000))
+        ll.append(payload)
+        last = weakref.ref(payload)
+        del payload
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            del ll
+            self.assertIsNone(last())
+        finally:
+            if enabled:
+                gc.enable()
+
+    def test_matches_list_under_random_operations(self):
+        """Test random edits against a python list"""
+        rng = random.Random(23)
+        expected = []
+        for step in range(2000):
+            op = rng.random()
+            if op < 0.3:
+                self.ll.append(step)
+                expected.append(step)
+            elif op < 0.5:
+                self.ll.prepend(step)
+                expected.insert(0, step)
+            elif op < 0.65:
+                index = rng.randrange(-len(expected) - 1, len(expected) + 1)
+                self.ll.insert(index, step)
+                expected.insert(index, step)
+            elif op < 0.9 and expected:
+                if op < 0.8:
+                    index = rng.randrange(len(expected))
+                    del self.ll[index]
+                    del expected[index]
+                else:
+                    self.assertEqual(self.ll.popleft(), expected.pop(0))
+            elif op < 0.95:
+                self.ll.reverse()
+                expected.reverse()
+        self.assertEqual(list(self.ll.values()), expected)
+        self.assertEqual(len(self.ll), len(expected) or 1)
+        if expected:
+            self.assertEqual(self.ll[-1].data, expected[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,968 @@
+"""
+Linked List ( Unrolled )
+========================
+
+* It is an alternative engine for linked list V1 , where a node ( `Block` )
+    holds up to `block_size` elements in a python list , instead of one.
+
+Layout :
+--------
+    block_size = 4
+
+      _first                                        _last
+        |                                             |
+    [ a b c d ] <=> [ e f ] <=> [ g h i ] <=> [ j k l m ]
+
+* blocks are linked like the nodes of linked list V1 : the first block has
+    no left link , the last block has no right link .
+* a block is never empty , a block left under half full by a delete is
+    merged with a neighbour whenever both fit in one block .
+* a full block is split in two halves to take an insert .
+
+Notes :
+-------
+* a full scan ( `values()` , `==` , `str` ) chases one link per block ,
+    the elements of a block are read by the C loop of the python list .
+* a block & it's list cost ~ 112 bytes , shared by up to `block_size` elements ,
+    where linked list V1 allocates a node ( 64 bytes ) per element , plus an
+    index entry .
+* `ll[i]` walks the blocks from the closer end , skipping a whole block per
+    step : O(N / block_size) .
+* the ends are O(block_size) , i.e independent of N : `append` is O(1) ,
+    `prepend` & `popleft` shift the elements of the first block .
+* `ll[i]` & iteration hand out `UnrolledNode` handles ( block , offset ) ,
+    created on demand , a handle is valid until the next insert / delete .
+* `linked_list.LinkedList(block_size=K)` creates a list of this engine .
+"""
+import sys
+import inspect
+import itertools
+from typing import Any, Callable, Optional, Dict, List, Union, Iterable, Generator, Tuple, Type
+from collections.abc import Iterator
+
+import linked_list
+import linked_list_array
+from linked_list import (
+    LinkedListNode,
+    Metadata,
+    LRIterator,
+    RLIterator,
+)
+from linked_list_array import (
+    HEAD,
+    TAIL,
+)
+
+# elements per block , unless told otherwise ( see benchmarks.unrolled )
+DEFAULT_BLOCK_SIZE = 128
+
+# blocks carry no metadata , handles report the default one
+_DEFAULT_METADATA = Metadata()
+
+
+class Block:
+    """
+    A node of an unrolled linked list , holding up to `block_size` elements.
+
+    Attributes:
+        items (List[Any]): The data of the elements , in order.
+        left (Optional[Block]): The block on the left.
+        right (Optional[Block]): The block on the right.
+    """
+    __slots__ = ('_items', '_left', '_right')
+
+    def __init__(self, items: List[Any], left: Optional['Block'] = None, right: Optional['Block'] = None):
+        """
+        Initializes a Block instance.
+
+        Args:
+            items (List[Any]): The data of the elements ( taken over , not copied ).
+            left (Optional[Block]): The block on the left.
+            right (Optional[Block]): The block on the right.
+        """
+        self._items = items
+        self._left = left
+        self._right = right
+
+    @property
+    def items(self) -> List[Any]:
+        """Gets the data of the elements of the block."""
+        return self._items
+
+    @property
+    def left(self) -> Optional['Block']:
+        """Gets the block on the left."""
+        return self._left
+
+    @property
+    def right(self) -> Optional['Block']:
+        """Gets the block on the right."""
+        return self._right
+
+    def __repr__(self):
+        """Returns a detailed string representation of the block."""
+        return f"Block({self._items})"
+
+
+class UnrolledNode:
+    """
+    Handle to an element of an unrolled linked list.
+
+    * It reads like `linked_list.LinkedListNode` : `data` , `left` , `right` .
+    * Handles are created on demand & are not stored anywhere ,
+        two handles to the same element compare equal .
+    * the markers have no block : `offset` is `HEAD` or `TAIL` then .
+
+    Attributes:
+        ll (LinkedList): The list owning the element.
+        block (Optional[Block]): The block holding the element.
+        offset (int): The position of the element in it's block.
+    """
+    __slots__ = ('_ll', '_block', '_offset')
+
+    def __init__(self, ll: 'LinkedList', block: Optional[Block], offset: int):
+        """
+        Initializes an UnrolledNode instance.
+
+        Args:
+            ll (LinkedList): The list owning the element.
+            block (Optional[Block]): The block holding the element , `None` for a marker.
+            offset (int): The position of the element in it's block.
+        """
+        self._ll = ll
+        self._block = block
+        self._offset = offset
+
+    @property
+    def block(self) -> Optional[Block]:
+        """Gets the block holding the node."""
+        return self._block
+
+    @property
+    def offset(self) -> int:
+        """Gets the position of the node in it's block."""
+        return self._offset
+
+    @property
+    def data(self) -> Any:
+        """Gets the data stored in the node."""
+        if self._block is None:
+            return self._ll._marker_value(self._offset)
+        return self._block._items[self._offset]
+
+    @data.setter
+    def data(self, value: Any) -> Any:
+        """Sets the data in the node."""
+        self._block._items[self._offset] = value
+        return value
+
+    @property
+    def left(self) -> Optional['UnrolledNode']:
+        """Gets the left node."""
+        return self._ll._neighbour(self._block, self._offset, -1)
+
+    @property
+    def right(self) -> Optional['UnrolledNode']:
+        """Gets the right node."""
+        return self._ll._neighbour(self._block, self._offset, 1)
+
+    @property
+    def metadata(self) -> Metadata:
+        """Gets the metadata associated with the node ( always the default one )."""
+        return _DEFAULT_METADATA
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, UnrolledNode):
+            return self._ll is other._ll and self._block is other._block and self._offset == other._offset
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._ll), id(self._block), self._offset))
+
+    def __str__(self) -> str:
+        """Returns a string representation of the node."""
+        return f"{self.data}"
+
+    def __repr__(self):
+        """Returns a detailed string representation of the node."""
+        return f"UnrolledNode({self.data}, left={self.left}, right={self.right})"
+
+
+class LinkedList:
+    """
+    Doubly Linked List Implementation ( unrolled , `block_size` elements per node )
+
+    -----
+    Usage
+    -----
+
+    # Prepare
+    >>> ll = LinkedList(block_size=4)
+    >>> ll.extend(range(10))
+    >>> ll.prepend(-1)
+    >>> print(ll)
+    [-1, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    # Blocks
+    >>> [block.items for block in ll.blocks()]
+    [[-1], [0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    # Fetch Node data ( whole blocks are skipped )
+    >>> ll[6].data, ll[-1].data
+    (5, 9)
+
+    # Insert & Delete in the middle
+    >>> ll.insert(3, 'x')
+    >>> del ll[1]
+    >>> print(ll)
+    [-1, 1, x, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    # Length
+    >>> len(ll)
+    11
+
+    # Reverse Iteration
+    >>> print([v.data for v in reversed(ll)][:3])
+    [9, 8, 7]
+
+    # Through the constructor of linked list V1
+    >>> type(linked_list.LinkedList(block_size=16)).__module__
+    'linked_list_unrolled'
+
+    ---
+
+    NOTES
+        - node handles are valid until the next insert / delete
+        - slices are copied into a new unrolled list
+
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE, root_iterator_cls: Union[str, Type[Iterator]] = 'LRIterator'):
+        """
+        Initializes a LinkedList instance.
+
+        Args:
+            block_size (int): The most elements a block holds.
+            root_iterator_cls (Iterator): The iterator class used for traversal.
+
+        Raises:
+            ValueError: If `block_size` is lower than 2.
+        """
+        if block_size < 2:
+            raise ValueError('block_size must be at least 2')
+        self._block_size: int = block_size
+        # Blocks
+        self._first: Optional[Block] = None
+        self._last: Optional[Block] = None
+        self._size: int = 0
+        # Config
+        # # Root Iterator
+        self.root_iterator_cls: Iterator = root_iterator_cls
+
+    def _new_like(self) -> 'LinkedList':
+        """Creates an empty list with the same block size."""
+        return LinkedList(self._block_size)
+
+    def __reduce__(self):
+        """
+        Pickles the config & a flat list of data ( no blocks , no recursion on long lists ).
+        """
+        return _rebuild, (self._block_size, self.root_iterator_cls, list(self.values()))
+
+    @property
+    def block_size(self) -> int:
+        """Gets the most elements a block holds."""
+        return self._block_size
+
+    @property
+    def head(self) -> UnrolledNode:
+        """Gets the head node of the list."""
+        return UnrolledNode(self, None, HEAD)
+
+    @property
+    def tail(self) -> UnrolledNode:
+        """Gets the tail node of the list."""
+        return UnrolledNode(self, None, TAIL)
+
+    def blocks(self, reverse: bool = False) -> Generator[Block, None, None]:
+        """Generates the blocks , from either end of the list."""
+        block = self._last if reverse else self._first
+        while block is not None:
+            yield block
+            block = block._left if reverse else block._right
+
+    def _marker_value(self, marker: int) -> int:
+        """
+        Reads the data of a marker.
+
+        * markers read as the index counters of linked list V1 :
+            head is `0` ( `-1` when empty ) , tail is the last index .
+        """
+        if marker == HEAD:
+            return 0 if self._size else -1
+        return self._size - 1
+
+    def _neighbour(self, block: Optional[Block], offset: int, step: int) -> Optional[UnrolledNode]:
+        """
+        Creates a handle for the element next to ( `block` , `offset` ).
+
+        Args:
+            step (int): `1` for the right neighbour , `-1` for the left one.
+        """
+        if block is None:
+            # markers : head --> first element , last element <-- tail
+            if (offset == HEAD) != (step == 1):
+                return None
+            if not self._size:
+                return UnrolledNode(self, None, TAIL if step == 1 else HEAD)
+            if step == 1:
+                return UnrolledNode(self, self._first, 0)
+            return UnrolledNode(self, self._last, len(self._last._items) - 1)
+        offset += step
+        if 0 <= offset < len(block._items):
+            return UnrolledNode(self, block, offset)
+        block = block._right if step == 1 else block._left
+        if block is None:
+            # first element has no left link , last element has no right link
+            return None
+        return UnrolledNode(self, block, 0 if step == 1 else len(block._items) - 1)
+
+    def _link_block(self, left: Optional[Block], items: List[Any]) -> Block:
+        """Links a new block holding `items` after `left` ( first when `None` )."""
+        right = self._first if left is None else left._right
+        block = Block(items, left, right)
+        if left is None:
+            self._first = block
+        else:
+            left._right = block
+        if right is None:
+            self._last = block
+        else:
+            right._left = block
+        return block
+
+    def _unlink_block(self, block: Block) -> None:
+        """Unlinks `block` from the list , it's links are cleared."""
+        left, right = block._left, block._right
+        if left is None:
+            self._first = right
+        else:
+            left._right = right
+        if right is None:
+            self._last = left
+        else:
+            right._left = left
+        block._left = block._right = None
+
+    def _locate(self, index: int) -> Tuple[Block, int]:
+        """
+        Finds the block & offset of the element at `index` ( in range ).
+
+        * walks from the closer end , a whole block per step .
+
+        Complexity:
+            O(min(index, N-index) / block_size)
+        """
+        if index < self._size // 2:
+            block = self._first
+            while index >= len(block._items):
+                index -= len(block._items)
+                block = block._right
+            return block, index
+        # position counted from the end
+        index = self._size - 1 - index
+        block = self._last
+        while index >= len(block._items):
+            index -= len(block._items)
+            block = block._left
+        return block, len(block._items) - 1 - index
+
+    def _rebalance(self, block: Block) -> None:
+        """
+        Drops `block` once empty , merges it with a neighbour once under half full.
+
+        * the merge only happens if both fit in one block , hence no block is
+            ever over `block_size` .
+        """
+        if not block._items:
+            self._unlink_block(block)
+            return
+        if len(block._items) >= self._block_size // 2:
+            return
+        for left, right in ((block, block._right), (block._left, block)):
+            if left is not None and right is not None and len(left._items) + len(right._items) <= self._block_size:
+                left._items.extend(right._items)
+                self._unlink_block(right)
+                return
+
+    def _extend_values(self, values: Iterable[Any]) -> None:
+        """
+        Appends all `values` in one pass.
+
+        * the last block is filled up , then the values are cut into full blocks .
+
+        Complexity:
+            O(K)
+        """
+        values = iter(values)
+        last = self._last
+        if last is not None and len(last._items) < self._block_size:
+            before = len(last._items)
+            last._items.extend(itertools.islice(values, self._block_size - before))
+            self._size += len(last._items) - before
+        while True:
+            items = list(itertools.islice(values, self._block_size))
+            if not items:
+                return
+            self._link_block(self._last, items)
+            self._size += len(items)
+
+    def append(self, data: Any):
+        """
+        Adds a new element at the end of the list.
+
+        Args:
+            data (Any): The data to append.
+
+        Complexity:
+            O(1) amortized
+        """
+        last = self._last
+        if last is None or len(last._items) >= self._block_size:
+            self._link_block(last, [data])
+        else:
+            last._items.append(data)
+        self._size += 1
+
+    def prepend(self, data: Any):
+        """
+        Adds a new element at the beginning of the list.
+
+        Args:
+            data (Any): The data to prepend.
+
+        Complexity:
+            O(block_size)
+        """
+        first = self._first
+        if first is None or len(first._items) >= self._block_size:
+            self._link_block(None, [data])
+        else:
+            first._items.insert(0, data)
+        self._size += 1
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """
+        Appends the data of `values` ( an iterable , or a linked list of any engine ).
+
+        Complexity:
+            O(K)
+        """
+        if hasattr(values, 'head'):
+            # a linked list , it's markers aside ( head reads `-1` when empty )
+            values = list(_values_of(values)) if values.head.data >= 0 else []
+        self._extend_values(values)
+
+    def insert(self, index: int, data: Any) -> None:
+        """
+        Inserts a new element before `index` , like `list.insert` .
+
+        * -ve indices count from the end , past the ends it appends / prepends.
+        * a full block is split in two halves first.
+
+        Complexity:
+            O(block_size + min(index, N-index) / block_size)
+        """
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index >= self._size:
+            return self.append(data)
+        if index == 0:
+            return self.prepend(data)
+        block, offset = self._locate(index)
+        if len(block._items) >= self._block_size:
+            half = len(block._items) // 2
+            right = self._link_block(block, block._items[half:])
+            del block._items[half:]
+            if offset >= half:
+                block, offset = right, offset - half
+        block._items.insert(offset, data)
+        self._size += 1
+
+    def popleft(self) -> Any:
+        """
+        Removes the first element & returns it's data , like `deque.popleft` .
+
+        Raises:
+            IndexError: If the list is empty.
+
+        Complexity:
+            O(block_size)
+        """
+        first = self._first
+        if first is None:
+            raise IndexError('popleft from an empty list')
+        data = first._items.pop(0)
+        self._size -= 1
+        self._rebalance(first)
+        return data
+
+    def sort(self, *, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False):
+        """
+        Sorts the list in place , like `list.sort` .
+
+        * the data is sorted by timsort ( stable ) , then cut into full blocks
+            again , the existing handles are invalidated .
+
+        Args:
+            key (Callable): computes the sort key out of an element's data.
+            reverse (bool): sorts in descending order , keeping it stable.
+
+        Complexity:
+            O(N log N)
+        """
+        values = list(self.values())
+        values.sort(key=key, reverse=reverse)
+        self.clear()
+        self._extend_values(values)
+
+    def reverse(self):
+        """
+        Reverses a linked list
+
+        * every block is reversed in place & it's links swapped .
+
+        Complexity:
+            O(N) , a `list.reverse` per block
+        """
+        for block in list(self.blocks()):
+            block._items.reverse()
+            block._left, block._right = block._right, block._left
+        self._first, self._last = self._last, self._first
+
+    def pop(self):
+        raise NotImplementedError('...')
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        """
+        Position of the first element holding `value` , like `list.index` .
+
+        * each block in `start:stop` is searched by `list.index` .
+
+        Raises:
+            ValueError: If no element in `start:stop` holds `value` .
+
+        Complexity:
+            O(index)
+        """
+        start, stop, _ = slice(start, stop).indices(self._size)
+        position = 0
+        for block in self.blocks():
+            if position >= stop:
+                break
+            size = len(block._items)
+            if position + size > start:
+                try:
+                    return position + block._items.index(value, max(start - position, 0), stop - position)
+                except ValueError:
+                    pass
+            position += size
+        raise ValueError(f'{value!r} is not in list')
+
+    def count(self, value: Any) -> int:
+        """
+        Number of elements holding `value` , like `list.count` .
+
+        Complexity:
+            O(N) , a `list.count` per block
+        """
+        return sum(block._items.count(value) for block in self.blocks())
+
+    def copy(self) -> 'LinkedList':
+        """
+        Returns a shallow copy of the list , built in one pass.
+
+        Complexity:
+            O(N)
+        """
+        _ll = self._new_like()
+        _ll.root_iterator_cls = self.root_iterator_cls
+        _ll._extend_values(self.values())
+        return _ll
+
+    def clear(self):
+        """
+        Removes all the elements , like `list.clear` .
+
+        * the links of every block are broken , so the blocks are freed by
+            reference counting ( see `linked_list.LinkedList.clear` ).
+
+        Complexity:
+            O(N / block_size)
+        """
+        for block in list(self.blocks()):
+            block._left = block._right = None
+        self._first = self._last = None
+        self._size = 0
+
+    def remove(self, value: Any) -> None:
+        """
+        Deletes the first element holding `value` , like `list.remove` .
+
+        Raises:
+            ValueError: If no element holds `value` .
+
+        Complexity:
+            O(index) to find it , plus O(block_size)
+        """
+        for block in self.blocks():
+            try:
+                offset = block._items.index(value)
+            except ValueError:
+                continue
+            del block._items[offset]
+            self._size -= 1
+            self._rebalance(block)
+            return
+        raise ValueError(f'{value!r} is not in list')
+
+    def delete(self, node: UnrolledNode):
+        """
+        Deletes the element of `node` , without searching for it.
+
+        Raises:
+            ValueError: If the node is a marker or not an element of this list.
+
+        Complexity:
+            O(block_size)
+        """
+        block = node._block
+        if (
+            node._ll is not self or block is None
+            or not 0 <= node._offset < len(block._items)
+            or (block._left is None and block is not self._first)
+        ):
+            raise ValueError('node is not in list')
+        del block._items[node._offset]
+        self._size -= 1
+        self._rebalance(block)
+
+    def values(self) -> Iterator[Any]:
+        """
+        Generates the data of the elements , left to right ( markers excluded ).
+
+        Complexity:
+            O(N) , one link per block
+        """
+        return itertools.chain.from_iterable(block._items for block in self.blocks())
+
+    def values_reversed(self) -> Iterator[Any]:
+        """Generates the data of the elements , right to left ( markers excluded )."""
+        return itertools.chain.from_iterable(reversed(block._items) for block in self.blocks(reverse=True))
+
+    def _values(self, reverse: bool = False) -> Iterator[Any]:
+        """
+        Generates the data of the list.
+
+        * an empty list yields the marker it's iterators land on .
+        """
+        if not self._size:
+            return iter((self._marker_value(HEAD if reverse else TAIL),))
+        return self.values_reversed() if reverse else self.values()
+
+    def _walk(self, reverse: bool = False) -> Generator[UnrolledNode, None, None]:
+        """Generates node handles , from either end of the list."""
+        if not self._size:
+            yield UnrolledNode(self, None, HEAD if reverse else TAIL)
+            return
+        for block in self.blocks(reverse):
+            offsets = range(len(block._items))
+            for offset in (reversed(offsets) if reverse else offsets):
+                yield UnrolledNode(self, block, offset)
+
+    def _compare(self, other: Any) -> int:
+        """
+        Compares two linked lists element by element.
+
+        Returns:
+            int: -1 , 0 or 1 as `self` is lower , equal or greater than `other` .
+        """
+        for self_value, other_value in itertools.zip_longest(self._values(), _values_of(other), fillvalue=_EXHAUSTED):
+            if self_value is _EXHAUSTED:
+                # LHS shorter
+                return -1
+            if other_value is _EXHAUSTED:
+                # RHS shorter
+                return 1
+            if self_value < other_value:
+                return -1
+            if self_value > other_value:
+                return 1
+        return 0
+
+    def __rmul__(self):
+        raise NotImplementedError('...')
+
+    def __mul__(self, value: int) -> 'LinkedList':
+        _ll = self._new_like()
+        _ll._extend_values(itertools.chain.from_iterable(itertools.repeat(list(self.values()), value)))
+        return _ll
+
+    def __imul__(self, value: int) -> 'LinkedList':
+        # same as linked list V1 : `value` more copies are appended
+        self._extend_values(list(self.values()) * value)
+        return self
+
+    def __add__(self, other: 'LinkedList') -> 'LinkedList':
+        new_ll = self._new_like()
+        new_ll._extend_values(self.values())
+        new_ll.extend(other)
+        return new_ll
+
+    def __iadd__(self, other: 'LinkedList') -> 'LinkedList':
+        # blocks can't be shared between lists , values are copied
+        self.extend(other)
+        return self
+
+    def __lt__(self, other: 'LinkedList') -> bool:
+        return self._compare(other) < 0
+
+    def __ge__(self, other: 'LinkedList') -> bool:
+        return self._compare(other) >= 0
+
+    def __gt__(self, other: 'LinkedList') -> bool:
+        return self._compare(other) > 0
+
+    def __le__(self, other: 'LinkedList') -> bool:
+        return self._compare(other) <= 0
+
+    def __eq__(self, other: 'LinkedList') -> bool:
+        """
+        Comapring the data of two linked lists ( of any engine ) for equlity
+        """
+        if not isinstance(other, (LinkedList, linked_list.LinkedList)) and not hasattr(other, 'head'):
+            return NotImplemented
+        for self_value, other_value in itertools.zip_longest(self._values(), _values_of(other), fillvalue=_EXHAUSTED):
+            if self_value is _EXHAUSTED or other_value is _EXHAUSTED or self_value != other_value:
+                return False
+        return True
+
+    def __ne__(self, other: 'LinkedList') -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __delitem__(self, index: int):
+        """
+        Deletes the element at `index` , out of range indices are ignored.
+
+        Complexity:
+            O(block_size + min(index, N-index) / block_size)
+        """
+        if not 0 <= index < self._size:
+            return
+        block, offset = self._locate(index)
+        del block._items[offset]
+        self._size -= 1
+        self._rebalance(block)
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, (UnrolledNode, LinkedListNode)):
+            value = value.data
+        return any(data == value for data in self.values())
+
+    def __getitem__(self, key):
+        """
+        Gets an item from the linked list by index or slice.
+
+        Args:
+            key (int or slice): The index or slice to retrieve , -ve indices
+                count from the end.
+
+        Returns:
+            UnrolledNode or LinkedList: The node or a copy of the sublist.
+
+        Raises:
+            TypeError: If the key is not an integer or slice.
+            KeyError: If the index is out of range.
+
+        Complexity:
+            O(min(index, N-index) / block_size) for an index
+        """
+        if isinstance(key, int):
+            # Handle integer indexing
+            index = key + self._size if key < 0 else key
+            if not 0 <= index < self._size:
+                raise KeyError(key)
+            return UnrolledNode(self, *self._locate(index))
+        elif isinstance(key, slice):
+            # Handle slicing
+            _ll = self._new_like()
+            _ll._extend_values(list(self.values())[key])
+            return _ll
+        else:
+            raise TypeError("Invalid key type")
+
+    def __setitem__(self):
+        raise NotImplementedError('...')
+
+    def __iter__(self):
+        """
+        Returns an iterator for the linked list.
+
+        Returns:
+            Iterator: The iterator for the linked list.
+        """
+        if self.root_iterator_cls in (LRIterator, 'LRIterator'):
+            return self._walk()
+        if self.root_iterator_cls in (RLIterator, 'RLIterator'):
+            return self._walk(reverse=True)
+        if inspect.isclass(self.root_iterator_cls):
+            return self.root_iterator_cls(self)
+        raise NotImplementedError('root_iterator_cls specified isn`t supported yet')
+
+    def __len__(self):
+        """
+        Returns the length of the linked list.
+
+        Returns:
+            int: The length of the linked list.
+        """
+        return self._marker_value(TAIL) - self._marker_value(HEAD) + 1
+
+    def _size_breakdown(self) -> Dict[str, int]:
+        """
+        Splits the memory footprint of the list into it's components .
+
+        Returns:
+            Dict[str, int]: size in bytes per component .
+        """
+        blocks = list(self.blocks())
+        return {
+            'base_object_size': super().__sizeof__(),
+            'iterator_class_ref_size': sys.getsizeof(self.root_iterator_cls),
+            'blocks_size': sum(sys.getsizeof(block) for block in blocks),
+            'block_lists_size': sum(sys.getsizeof(block._items) for block in blocks),
+        }
+
+    def __sizeof__(self):
+        return sum(self._size_breakdown().values())
+
+    def print_detailed_size_information(self):
+        sizes = self._size_breakdown()
+        total = sum(sizes.values())
+        print("-" * 40)
+        for name, size in sizes.items():
+            print(f"| {name:<24} | {size:>9} |")
+        print("-" * 40)
+        print(f"* Total Size : {total}")
+        if self._size:
+            print(f"* Bytes per Element : {(total - sizes['base_object_size'])/self._size:.2f}")
+        print("\n")
+
+    def __reversed__(self):
+        """
+        Returns a reversed iterator for the linked list.
+
+        Returns:
+            Iterator: The reversed iterator for the linked list.
+        """
+        return self._walk(reverse=self.root_iterator_cls not in (RLIterator, 'RLIterator'))
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the linked list.
+
+        Returns:
+            str: The string representation of the linked list.
+        """
+        return f"[{', '.join([str(data) for data in self._values(reverse=self.root_iterator_cls in (RLIterator, 'RLIterator'))])}]"
+
+
+def _rebuild(block_size: int, root_iterator_cls: Union[str, Type[Iterator]], values: List[Any]) -> LinkedList:
+    """Unpickles a list : `LinkedList(block_size, root_iterator_cls)` , then it's data in one bulk pass."""
+    _ll = LinkedList(block_size, root_iterator_cls)
+    _ll._extend_values(values)
+    return _ll
+
+
+# marks the exhausted side , while comparing lists of different lengths
+_EXHAUSTED = object()
+
+
+def _values_of(ll: Any) -> Iterable[Any]:
+    """Generates the data of any linked list ( unrolled , array backed or node based )."""
+    if isinstance(ll, LinkedList):
+        return ll._values()
+    if isinstance(ll, linked_list.LinkedList):
+        # markers included , like the node walk below
+        return ll._values() if ll._tail._data >= 0 else iter((ll._tail._data,))
+    return linked_list_array._values_of(ll, markers=True)
+
+
+class Operations:
+    """
+    Utility class for performing operations on unrolled linked lists.
+    """
+
+    @staticmethod
+    def reversed(ll: LinkedList, method=1) -> Generator[UnrolledNode, None, None]:
+        """
+        Generates linked list nodes in reverse order.
+
+        Args:
+            ll (LinkedList): The linked list to reverse.
+            method (int): kept for parity with linked list V1 , both methods walk the blocks.
+
+        Returns:
+            Generator[UnrolledNode, None, None]: A generator for the reversed nodes.
+
+        Complexity:
+            O(N)
+        """
+        if not issubclass(ll.root_iterator_cls, Iterator):
+            raise Exception('must implement typing.Iterator class')
+        if ll.root_iterator_cls == LRIterator:
+            yield from ll._walk(reverse=True)
+        elif ll.root_iterator_cls == RLIterator:
+            yield from ll._walk()
+        else:
+            raise NotImplementedError('`root_iterator_cls` not specified')
+
+    @staticmethod
+    def enumerate(ll: Union[LinkedList, Generator[UnrolledNode, None, None]]) -> Generator[Tuple[int, UnrolledNode], None, None]:
+        """
+        Enumerates the nodes in the linked list.
+
+        Args:
+            ll (LinkedList or Generator): The linked list or generator to enumerate.
+
+        Returns:
+            Generator[Tuple[int, UnrolledNode], None, None]: A generator for the enumerated nodes.
+        """
+        return zip(itertools.count(), iter(ll))
+
+    @staticmethod
+    def ll_from(obj: Iterable, block_size: int = DEFAULT_BLOCK_SIZE) -> LinkedList:
+        """
+        Converts an iterable to an unrolled linked list.
+
+        Args:
+            obj (Iterable): The iterable to convert.
+            block_size (int): The most elements a block holds.
+
+        Returns:
+            LinkedList: The resulting linked list.
+        """
+        _ll = LinkedList(block_size)
+        _ll._extend_values(obj)
+        return _ll
+
+
+if __name__ == '__main__':
+    ll = Operations.ll_from(range(10), block_size=4)
+    ll.prepend(-1)
+    print(ll)
+    print([block.items for block in ll.blocks()])
+    ll.print_detailed_size_information()
@@ -0,0 +1,261 @@
+"""
+Unit Tests for linked_list_unrolled.py
+
+This module checks that the unrolled LinkedList behaves like the
+node based LinkedList of linked_list.py , and keeps it's blocks in shape .
+"""
+
+import pickle
+import random
+import unittest
+import linked_list
+import linked_list_array
+from linked_list_unrolled import (
+    Block,
+    UnrolledNode,
+    LinkedList,
+    Operations,
+)
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    """Test cases for the unrolled LinkedList"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ll = LinkedList(block_size=4)
+
+    def assertBlocks(self, ll: LinkedList, expected: list):
+        """Checks the data , the links & the fill of every block"""
+        blocks = list(ll.blocks())
+        self.assertEqual(list(ll.values()), expected)
+        self.assertEqual(list(ll.values_reversed()), expected[::-1])
+        self.assertEqual(sum(len(block.items) for block in blocks), len(expected))
+        self.assertEqual([block.left for block in blocks], [None] + blocks[:-1])
+        self.assertEqual([block.right for block in blocks], blocks[1:] + [None])
+        for block in blocks:
+            self.assertTrue(0 < len(block.items) <= ll.block_size)
+
+    def test_empty_list_matches_v1(self):
+        """Test the marker semantics of an empty list"""
+        v1 = linked_list.LinkedList()
+        self.assertEqual(len(self.ll), len(v1))
+        self.assertEqual(str(self.ll), str(v1))
+        self.assertEqual([n.data for n in self.ll], [n.data for n in v1])
+        self.assertEqual([n.data for n in reversed(self.ll)], [n.data for n in reversed(v1)])
+        self.assertEqual(list(self.ll.values()), [])
+        self.assertEqual(self.ll, v1)
+        self.assertEqual(self.ll.head.right, self.ll.tail)
+        self.assertEqual(self.ll.tail.left, self.ll.head)
+        with self.assertRaises(ValueError):
+            LinkedList(block_size=1)
+
+    def test_append_prepend(self):
+        """Test append and prepend fill the end blocks , with positional lookups"""
+        for value in range(6):
+            self.ll.append(value)
+        for value in range(-1, -4, -1):
+            self.ll.prepend(value)
+        self.assertEqual([block.items for block in self.ll.blocks()], [[-3, -2, -1], [0, 1, 2, 3], [4, 5]])
+        self.assertEqual([self.ll[i].data for i in range(9)], list(range(-3, 6)))
+        self.assertEqual([self.ll[i].data for i in range(-1, -10, -1)], list(range(5, -4, -1)))
+        self.assertEqual(len(self.ll), 9)
+        with self.assertRaises(KeyError):
+            self.ll[9]
+        with self.assertRaises(KeyError):
+            self.ll[-10]
+
+    def test_node_handles(self):
+        """Test node handles read like LinkedListNode , across blocks"""
+        self.ll.extend(range(8))
+        node = self.ll[3]
+        self.assertIsInstance(node, UnrolledNode)
+        self.assertIsInstance(node.block, Block)
+        self.assertEqual((node.left.data, node.right.data), (2, 4))
+        self.assertEqual(node.right.block, self.ll[4].block)
+        self.assertIsNone(self.ll[0].left)
+        self.assertIsNone(self.ll[7].right)
+        self.assertEqual(self.ll.head.right, self.ll[0])
+        self.assertEqual(self.ll.tail.left, self.ll[7])
+        self.assertEqual((self.ll.head.data, self.ll.tail.data), (0, 7))
+        node.data = 30
+        self.assertEqual(str(self.ll), "[0, 1, 2, 30, 4, 5, 6, 7]")
+        self.assertIn(30, self.ll)
+        self.assertIn(linked_list.LinkedListNode(30), self.ll)
+        self.assertNotIn(3, self.ll)
+
+    def test_insert_splits_full_blocks(self):
+        """Test inserts into full blocks split them in halves"""
+        self.ll.extend(range(8))
+        self.ll.insert(1, 'a')
+        self.ll.insert(7, 'b')
+        self.ll.insert(-1, 'c')
+        self.ll.insert(-100, 'd')
+        self.ll.insert(100, 'e')
+        self.assertEqual([block.items for block in self.ll.blocks()], [['d', 0, 'a', 1], [2, 3], [4, 5], ['b', 6, 'c', 7], ['e']])
+        self.assertBlocks(self.ll, ['d', 0, 'a', 1, 2, 3, 4, 5, 'b', 6, 'c', 7, 'e'])
+
+    def test_delete_merges_blocks(self):
+        """Test deletes drop empty blocks & merge the ones under half full"""
+        self.ll.extend(range(12))
+        del self.ll[5]
+        del self.ll[4]
+        self.assertEqual([block.items for block in self.ll.blocks()], [[0, 1, 2, 3], [6, 7], [8, 9, 10, 11]])
+        # under half full , but too many for either neighbour
+        del self.ll[4]
+        self.assertEqual([block.items for block in self.ll.blocks()], [[0, 1, 2, 3], [7], [8, 9, 10, 11]])
+        del self.ll[4]
+        del self.ll[-1]
+        del self.ll[100]
+        self.assertEqual([block.items for block in self.ll.blocks()], [[0, 1, 2, 3], [8, 9, 10, 11]])
+        self.assertEqual([self.ll.popleft() for _ in range(3)], [0, 1, 2])
+        self.assertBlocks(self.ll, [3, 8, 9, 10, 11])
+        self.ll.delete(self.ll[0])
+        with self.assertRaises(ValueError):
+            self.ll.delete(self.ll.head)
+        with self.assertRaises(ValueError):
+            self.ll.delete(Operations.ll_from([1]).head.right)
+        for _ in range(4):
+            self.ll.popleft()
+        with self.assertRaises(IndexError):
+            self.ll.popleft()
+        self.assertEqual(str(self.ll), str(linked_list.LinkedList()))
+        self.ll.append(5)
+        self.assertBlocks(self.ll, [5])
+
+    def test_reverse(self):
+        """Test reverse flips the blocks & their order"""
+        self.ll.reverse()
+        self.assertEqual(str(self.ll), str(linked_list.LinkedList()))
+        self.ll.extend(range(10))
+        self.ll.reverse()
+        self.assertBlocks(self.ll, list(range(9, -1, -1)))
+        self.assertEqual([n.data for n in reversed(self.ll)], list(range(10)))
+        self.ll.prepend(10)
+        self.ll.append(-1)
+        self.assertBlocks(self.ll, list(range(10, -2, -1)))
+
+    def test_iterators(self):
+        """Test iteration with the iterators of linked_list.py"""
+        ll = Operations.ll_from([1, 2, 3], block_size=2)
+        ll.root_iterator_cls = linked_list.RLIterator
+        self.assertEqual([n.data for n in ll], [3, 2, 1])
+        self.assertEqual([n.data for n in reversed(ll)], [1, 2, 3])
+        self.assertEqual(str(ll), "[3, 2, 1]")
+        self.assertEqual([n.data for n in Operations.reversed(ll)], [1, 2, 3])
+        ll.root_iterator_cls = linked_list.LRIterator
+        self.assertEqual([n.data for n in Operations.reversed(ll, method=2)], [3, 2, 1])
+        self.assertEqual([(i, n.data) for i, n in Operations.enumerate(ll)], [(0, 1), (1, 2), (2, 3)])
+
+    def test_comparisons_and_arithmetic(self):
+        """Test comparisons & arithmetic against every engine"""
+        a = Operations.ll_from([1, 5, 10], block_size=2)
+        self.assertEqual(a, linked_list.Operations.ll_from([1, 5, 10]))
+        self.assertEqual(a, linked_list_array.Operations.ll_from([1, 5, 10]))
+        self.assertNotEqual(a, linked_list.Operations.ll_from([1, 5]))
+        self.assertTrue(a > linked_list.Operations.ll_from([1, 2, 20]))
+        self.assertTrue(Operations.ll_from([1, 5]) < a)
+        self.assertEqual(str(a + linked_list.Operations.ll_from([3])), "[1, 5, 10, 3]")
+        self.assertEqual(str(a + linked_list.LinkedList()), "[1, 5, 10]")
+        self.assertEqual(str(a * 2), "[1, 5, 10, 1, 5, 10]")
+        a += a
+        self.assertEqual(str(a), "[1, 5, 10, 1, 5, 10]")
+        a *= 1
+        self.assertEqual(len(a), 12)
+
+    def test_slices(self):
+        """Test slices copy into an unrolled list of the same block size"""
+        ll = Operations.ll_from(range(10), block_size=3)
+        part = ll[2:8:2]
+        self.assertIsInstance(part, LinkedList)
+        self.assertEqual((str(part), part.block_size), ("[2, 4, 6]", 3))
+        self.assertEqual(list(ll[-3:].values()), [7, 8, 9])
+        self.assertEqual(list(ll[::-1].values()), list(range(9, -1, -1)))
+
+    def test_selected_through_v1_constructor(self):
+        """Test `linked_list.LinkedList(block_size=K)` gives this engine"""
+        ll = linked_list.LinkedList('RLIterator', block_size=8)
+        self.assertIsInstance(ll, LinkedList)
+        self.assertEqual((ll.block_size, ll.root_iterator_cls), (8, 'RLIterator'))
+        self.assertIsInstance(linked_list.LinkedList(block_size=None), linked_list.LinkedList)
+        with self.assertRaises(NotImplementedError):
+            linked_list.LinkedList(value_index=True, block_size=8)
+
+    def test_v1_methods(self):
+        """Test sort , copy , clear , remove , index & count against V1"""
+        values = [random.Random(3).randrange(20) for _ in range(60)]
+        ll, v1 = Operations.ll_from(values, block_size=4), linked_list.Operations.ll_from(values)
+        self.assertEqual([ll.count(v) for v in range(20)], [v1.count(v) for v in range(20)])
+        for value, start, stop in ((values[30], 0, 60), (values[30], 31, -1), (values[50], -15, 55), (values[5], 5, 6)):
+            self.assertEqual(ll.index(value, start, stop), v1.index(value, start, stop))
+        self.assertRaises(ValueError, ll.index, values[0], 1, 1)
+        self.assertRaises(ValueError, ll.index, 99)
+        for value in (values[0], values[-1], values[30]):
+            ll.remove(value)
+            v1.remove(value)
+        self.assertRaises(ValueError, ll.remove, 99)
+        self.assertBlocks(ll, list(v1.values()))
+        copied, before = ll.copy(), list(v1.values())
+        ll.sort(key=lambda value: -value)
+        v1.sort(key=lambda value: -value)
+        self.assertBlocks(ll, list(v1.values()))
+        self.assertBlocks(copied, before)
+        self.assertEqual(copied.block_size, 4)
+        ll.sort()
+        self.assertBlocks(ll, sorted(before))
+        blocks = list(ll.blocks())
+        ll.clear()
+        self.assertEqual((str(ll), len(ll), list(ll.values())), ('[-1]', 1, []))
+        self.assertTrue(all(block.left is None and block.right is None for block in blocks))
+        ll.extend([2, 1])
+        ll.sort()
+        self.assertBlocks(ll, [1, 2])
+
+    def test_pickle(self):
+        """Test pickling keeps the config & the data"""
+        ll = Operations.ll_from(range(50000), block_size=16)
+        ll.root_iterator_cls = linked_list.RLIterator
+        loaded = pickle.loads(pickle.dumps(ll))
+        self.assertEqual((loaded.block_size, loaded.root_iterator_cls), (16, linked_list.RLIterator))
+        self.assertEqual(list(loaded.values()), list(range(50000)))
+
+    def test_matches_list_under_random_operations(self):
+        """Test random edits against a python list"""
+        rng = random.Random(22)
+        expected = []
+        for step in range(3000):
+            op = rng.random()
+            if op < 0.2:
+                self.ll.append(step)
+                expected.append(step)
+            elif op < 0.35:
+                self.ll.prepend(step)
+                expected.insert(0, step)
+            elif op < 0.6:
+                index = rng.randrange(-len(expected) - 1, len(expected) + 1)
+                self.ll.insert(index, step)
+                expected.insert(index, step)
+            elif op < 0.9 and expected:
+                index = rng.randrange(len(expected))
+                if op < 0.75:
+                    del self.ll[index]
+                elif op < 0.85:
+                    self.ll.delete(self.ll[index])
+                else:
+                    self.assertEqual(self.ll.popleft(), expected[0])
+                    index = 0
+                del expected[index]
+            elif op < 0.93:
+                self.ll.reverse()
+                expected.reverse()
+            else:
+                values = [step] * rng.randrange(10)
+                self.ll.extend(values)
+                expected.extend(values)
+        self.assertBlocks(self.ll, expected)
+        self.assertEqual([self.ll[i].data for i in range(len(expected))], expected)
+        self.assertEqual(len(self.ll), len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
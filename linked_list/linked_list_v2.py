@@ -12,11 +12,26 @@ Experiment Idea :
     list opeartions which is associated
     with maintaining the indexes
 
+Layout :
+--------
+    label      :  0    1    2    3    4    5    6    7
+    node       :  -    -    a    b    -    c    -    -     ( `-` : free label )
+    live       :  0    0    1    1    0    1    0    0     <- Fenwick tree
+
+* Every node keeps a label ( `metadata.indexation.label` ) , labels grow
+    along the list , gaps are left by deletes & relabels .
+* positions are prefix sums of `live` : `from_start` of `c` is 2 ,
+    `ll[i]` is a descent of the tree , both O(log N) .
+* `prepend` / `append` take the label next to the end , `insert` the
+    middle of the gap between it's neighbours , nothing is renumbered ,
+    the labels are spread again only when there's no free label left .
+
 """
 import sys
 import inspect
 import dataclasses
-from typing import Any, Optional, TypeVar, Dict, Union, Iterable, Generator, Tuple, Type
+from array import array
+from typing import Any, Optional, TypeVar, Dict, List, Union, Iterable, Generator, Tuple, Type
 from collections.abc import Iterator
 
 T = TypeVar('T')
@@ -29,7 +44,11 @@ class MemoryBlock:
         data (Any): The data stored in the memory block.
         left (Optional[MemoryBlock]): The left (previous) memory block.
         right (Optional[MemoryBlock]): The right (next) memory block.
+
+    Notes:
+        * `__slots__` keeps the block free of a per-instance `__dict__` .
     """
+    __slots__ = ('_data', '_left', '_right')
 
     def __init__(self, data: Any, left: Optional['MemoryBlock'] = None, right: Optional['MemoryBlock'] = None):
         """
@@ -89,39 +108,53 @@ class Index:
     """
     Represents the index of a node in the linked list.
 
+    * the positions are not stored , they are read off the index store
+        of the list with the label of the node , in O(log N) .
+
     Attributes:
+        label (int): The label of the node in the index store.
         from_start (int): The index from the start of the list.
         from_end (int): The index from the end of the list.
         parent (Optional[MemoryBlock]): The parent memory block.
     """
+    __slots__ = ('_label', '_store', '_parent')
 
-    def __init__(self, from_start: int, from_end: int, parent: Optional['MemoryBlock'] = None):
+    def __init__(self, label: int = -1, store: Optional['FenwickIndexStore'] = None, parent: Optional['MemoryBlock'] = None):
         """
         Initializes an Index instance.
 
         Args:
-            from_start (int): The index from the start of the list.
-            from_end (int): The index from the end of the list.
+            label (int): The label of the node , given by the index store.
+            store (FenwickIndexStore): The index store counting the node.
             parent (Optional[MemoryBlock]): The parent memory block.
         """
-        self._from_start = from_start
-        self._from_end = from_end
+        self._label = label
+        self._store = store
         self._parent = parent
 
     @property
     def parent(self):
         """Gets the parent memory block."""
         return self._parent
+
+    @property
+    def label(self) -> int:
+        """Gets the label of the node in the index store."""
+        return self._label
     
     @property
-    def from_start(self):
-        """Gets the index from the start of the list."""
-        return self._from_start
+    def from_start(self) -> Optional[int]:
+        """Gets the index from the start of the list ( `None` once the node is removed )."""
+        if self._store is None:
+            return None
+        return self._store.rank(self._label)
     
     @property
-    def from_end(self):
-        """Gets the index from the end of the list."""
-        return self._from_end
+    def from_end(self) -> Optional[int]:
+        """Gets the index from the end of the list ( `None` once the node is removed )."""
+        if self._store is None:
+            return None
+        return len(self._store) - 1 - self._store.rank(self._label)
     
     @parent.setter
     def parent(self, value: 'MemoryBlock') -> 'MemoryBlock':
@@ -129,23 +162,11 @@ class Index:
         self._parent = value
         return self._parent
 
-    @from_start.setter
-    def from_start(self, value: int) -> int:
-        """Sets the index from the start of the list."""
-        self._from_start = value
-        return self._from_start
-
-    @from_end.setter
-    def from_end(self, value: int) -> int:
-        """Sets the index from the end of the list."""
-        self._from_end = value
-        return self._from_end
-
     def __repr__(self):
         """Returns a detailed string representation of the index."""
         return f"{self.__class__.__name__}(from_start={self.from_start}, from_end={self.from_end}, parent={self.parent})"
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Metadata:
     """
     Metadata for a LinkedList Node.
@@ -163,6 +184,7 @@ class LinkedListNode(MemoryBlock):
     Attributes:
         metadata (Metadata): Metadata associated with the node.
     """
+    __slots__ = ('_metadata',)
 
     def __init__(self, data, left=None, right=None, metadata: Metadata = Metadata()):
         """
@@ -185,6 +207,254 @@ class LinkedListNode(MemoryBlock):
         return self._metadata
 
 
+class FenwickIndexStore:
+    """
+    Positions of the nodes of a list , as prefix sums over their labels.
+
+    * `_nodes[label]` is the node holding `label` ( `None` when free ) ,
+        `_tree` is a Fenwick tree ( 1-based ) counting the taken labels .
+    * maps positions to nodes like the `dict` it replaces :
+        `store[i]` , `i in store` , `len(store)` , `items()` .
+
+    >>> store = FenwickIndexStore()
+    >>> a, b = LinkedListNode('a', metadata=Metadata(Index())), LinkedListNode('b', metadata=Metadata(Index()))
+    >>> store.add(a, None, None)
+    >>> store.add(b, None, a)
+    >>> store
+    {0: MemoryBlock(b, left=None, right=None), 1: MemoryBlock(a, left=None, right=None)}
+    >>> a.metadata.indexation.from_start, a.metadata.indexation.from_end
+    (1, 0)
+    """
+    __slots__ = ('_nodes', '_tree', '_size')
+
+    def __init__(self):
+        """Initializes an empty FenwickIndexStore instance."""
+        self._nodes: List[Optional[LinkedListNode]] = []
+        self._tree: array = array('q', [0])
+        self._size: int = 0
+
+    def _add(self, label: int, delta: int) -> None:
+        """Adds `delta` to the count of `label` ( O(log N) )."""
+        tree = self._tree
+        size = len(tree)
+        position = label + 1
+        while position < size:
+            tree[position] += delta
+            position += position & -position
+
+    def rank(self, label: int) -> int:
+        """
+        Position of the node holding `label` : taken labels before it.
+
+        Complexity:
+            O(log N)
+        """
+        tree = self._tree
+        position = label
+        total = 0
+        while position:
+            total += tree[position]
+            position &= position - 1
+        return total
+
+    def _label_of(self, node: Optional[LinkedListNode], default: int) -> int:
+        """Label of an element node , `default` for `None` ( an end of the list )."""
+        return default if node is None else node._metadata.indexation._label
+
+    def _free_label(self, left: Optional[LinkedListNode], right: Optional[LinkedListNode]) -> Optional[int]:
+        """
+        Picks a free label between the ones of `left` & `right` .
+
+        * next to the end for `append` / `prepend` ( keeps the labels
+            dense ) , the middle of the gap otherwise .
+
+        Returns:
+            Optional[int]: the label , `None` when the gap is closed.
+        """
+        low = self._label_of(left, -1)
+        high = self._label_of(right, len(self._nodes))
+        if high - low < 2:
+            return None
+        if right is None and left is not None:
+            return low + 1
+        if left is None and right is not None:
+            return high - 1
+        return (low + high) // 2
+
+    @staticmethod
+    def _even_labels(low: int, size: int, count: int) -> Iterable[int]:
+        """`count` labels spread evenly over `low .. low+size-1` ."""
+        return (low + (2 * step + 1) * size // (2 * count) for step in range(count))
+
+    def _relabel(self, nodes: List[LinkedListNode]) -> None:
+        """
+        Spreads the labels of `nodes` ( in list order ) over the middle half
+        of a new label space , then builds the tree.
+
+        * the space is a power of two , 4 to 8 labels per node : a free
+            quarter at each end for `append` / `prepend` , a free label
+            at least between neighbours for `insert` .
+
+        Complexity:
+            O(N)
+        """
+        capacity = 8
+        while capacity < 4 * len(nodes):
+            capacity *= 2
+        labels = [None] * capacity
+        tree = array('q', bytes(8 * (capacity + 1)))
+        for label, node in zip(self._even_labels(capacity // 4, capacity // 2, len(nodes)), nodes):
+            labels[label] = node
+            node._metadata.indexation._label = label
+            tree[label + 1] = 1
+        # each entry adds itself to it's parent , in O(N)
+        for position in range(1, capacity + 1):
+            parent = position + (position & -position)
+            if parent <= capacity:
+                tree[parent] += tree[position]
+        self._nodes, self._tree = labels, tree
+
+    def _spread(self, left: LinkedListNode) -> Optional[int]:
+        """
+        Frees a label right after `left` , spreading the labels of the
+        smallest aligned window around it that isn't too dense.
+
+        * a window of `2**level` labels may be filled up to
+            `1 - level / (2 * levels)` : full for the smallest windows , half
+            full for the whole space , hence a spread window leaves room in
+            every window under it ( packed memory array ) .
+
+        Returns:
+            Optional[int]: the free label , `None` when the whole space is too dense.
+
+        Complexity:
+            O(log² N) amortized
+        """
+        nodes = self._nodes
+        anchor = left._metadata.indexation._label
+        levels = len(nodes).bit_length() - 1
+        for level in range(1, levels + 1):
+            size = 1 << level
+            low = anchor & -size
+            count = self.rank(low + size) - self.rank(low) + 1
+            if count * 2 * levels > size * (2 * levels - level):
+                continue
+            window = [node for node in nodes[low:low + size] if node is not None]
+            window.insert(window.index(left) + 1, None)
+            for node in window:
+                if node is not None:
+                    nodes[node._metadata.indexation._label] = None
+                    self._add(node._metadata.indexation._label, -1)
+            for label, node in zip(self._even_labels(low, size, count), window):
+                if node is None:
+                    free_label = label
+                    continue
+                nodes[label] = node
+                node._metadata.indexation._label = label
+                self._add(label, 1)
+            return free_label
+        return None
+
+    def add(self, node: LinkedListNode, left: Optional[LinkedListNode], right: Optional[LinkedListNode]) -> None:
+        """
+        Labels & counts `node` , linked between the elements `left` & `right`
+        ( `None` at the ends of the list ).
+
+        * a closed gap in the middle is opened by `_spread` , the whole
+            space is relabeled ( & grown ) when an end or the space is full .
+
+        Complexity:
+            O(log² N) amortized
+        """
+        label = self._free_label(left, right)
+        if label is None and left is not None and right is not None:
+            label = self._spread(left)
+        if label is None:
+            self._relabel(list(self.values()))
+            label = self._free_label(left, right)
+        indexation: Index = node._metadata.indexation
+        indexation._label = label
+        indexation._store = self
+        self._nodes[label] = node
+        self._add(label, 1)
+        self._size += 1
+
+    def remove(self, node: LinkedListNode) -> None:
+        """
+        Frees the label of `node` , it's positions read `None` afterwards.
+
+        Complexity:
+            O(log N)
+        """
+        indexation: Index = node._metadata.indexation
+        self._nodes[indexation._label] = None
+        self._add(indexation._label, -1)
+        indexation._store = None
+        self._size -= 1
+
+    def reverse(self) -> None:
+        """
+        Labels the nodes in reverse , after the links were reversed.
+
+        Complexity:
+            O(N)
+        """
+        nodes = list(self.values())
+        nodes.reverse()
+        self._relabel(nodes)
+
+    def __getitem__(self, position: int) -> LinkedListNode:
+        """
+        Node at `position` , a descent of the tree.
+
+        Raises:
+            KeyError: If `position` is out of range.
+
+        Complexity:
+            O(log N)
+        """
+        if not 0 <= position < self._size:
+            raise KeyError(position)
+        tree = self._tree
+        capacity = len(tree) - 1
+        label = 0
+        remaining = position + 1
+        # the label space is a power of two
+        step = capacity
+        while step:
+            candidate = label + step
+            if candidate <= capacity and tree[candidate] < remaining:
+                label = candidate
+                remaining -= tree[candidate]
+            step >>= 1
+        return self._nodes[label]
+
+    def __contains__(self, position: int) -> bool:
+        return isinstance(position, int) and 0 <= position < self._size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._size))
+
+    def keys(self) -> Iterable[int]:
+        return range(self._size)
+
+    def values(self) -> Generator[LinkedListNode, None, None]:
+        """Generates the nodes , in list order."""
+        return (node for node in self._nodes if node is not None)
+
+    def items(self) -> Iterable[Tuple[int, LinkedListNode]]:
+        return zip(range(self._size), self.values())
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._nodes) + sys.getsizeof(self._tree)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
 class LRIterator(Iterator):
     """
     Iterator for traversing a linked list from left to right.
@@ -282,6 +552,13 @@ class LinkedList:
     # Index Map
     >>> ll.index_store
     {0: MemoryBlock(6, left=None, right=4), 1: MemoryBlock(4, left=6, right=3), 2: MemoryBlock(3, left=4, right=8), 3: MemoryBlock(8, left=3, right=None)}
+
+    # Node Positions ( nothing is renumbered on edits )
+    >>> node = ll[2]
+    >>> ll.insert(1, 5)
+    >>> node.metadata.indexation.from_start, node.metadata.indexation.from_end
+    (3, 1)
+    >>> del ll[1]
     
     # Length
     >>> len(ll)
@@ -332,7 +609,7 @@ class LinkedList:
         self._tail._left = self._head
         self._tail._right = None
         # Index Map
-        self._index_store: Dict[int, LinkedListNode] = {}
+        self._index_store: FenwickIndexStore = FenwickIndexStore()
         # Config
         # # Root Iterator
         self.root_iterator_cls: Iterator = root_iterator_cls
@@ -348,7 +625,7 @@ class LinkedList:
         return self._tail
     
     @property
-    def index_store(self) -> LinkedListNode:
+    def index_store(self) -> FenwickIndexStore:
         """Gets the index store of the list."""
         return self._index_store
     
@@ -360,29 +637,25 @@ class LinkedList:
             data (Any): The data to append.
 
         Complexity:
-            O(1)
+            O(log N) amortized
         """
         # current : last-element <--- Tail
         # new : last-element <--- . <--- Tail
         last_element: LinkedListNode = self._tail.left
-        
-        # adjusting indexes
-        index = self._tail.data
-        index += 1
-        new_node_index = Index(from_start=index, from_end=None)
         # creation
-        new_node: LinkedListNode = LinkedListNode(data, metadata=Metadata(indexation=new_node_index))
+        new_node: LinkedListNode = LinkedListNode(data, metadata=Metadata(indexation=Index()))
         self._tail.left = new_node
         if last_element is self._head:
             # last_element is head
             last_element.right = new_node
             new_node.left = None
             self._head.data += 1
+            last_element = None
         else:
             self._joint(last_element, new_node)
-        # storing adjusted indexes
-        self._index_store[index] = new_node
-        self._tail.data = index
+        # labeling , nothing else is renumbered
+        self._index_store.add(new_node, last_element, None)
+        self._tail.data += 1
     
     def prepend(self, data: Any):
         """
@@ -392,31 +665,53 @@ class LinkedList:
             data (Any): The data to prepend.
 
         Complexity:
-            O(N)
+            O(log N) amortized
         """
         # current : Head ---> first-element
         # new : Head ---> . ---> first-element
         first_element: LinkedListNode = self._head.right
-        new_node_index = Index(from_start=0, from_end=None)
         # creation
-        new_node: LinkedListNode = LinkedListNode(data, metadata=Metadata(indexation=new_node_index))
+        new_node: LinkedListNode = LinkedListNode(data, metadata=Metadata(indexation=Index()))
         self._head.right = new_node
         if first_element is self._tail:
             # first_element is tail
             self._tail.left = new_node
             new_node.right = None
             self._head.data += 1
+            first_element = None
         else:
             self._joint(new_node, first_element)
-        # adjusting indexes
-        index = self._tail.data
-        index += 1
-        for idx in range(index, 0, -1):
-            self._index_store[idx] = self._index_store[idx-1]
-            self._index_store[idx].metadata.indexation.from_start = idx
-        else:
-            self._index_store[0] = new_node
-        self._tail.data = index
+        # labeling , nothing else is renumbered
+        self._index_store.add(new_node, None, first_element)
+        self._tail.data += 1
+
+    def insert(self, index: int, data: Any):
+        """
+        Adds a new element before position `index` , like `list.insert` .
+
+        Args:
+            index (int): position of the new element , clamped to the list bounds.
+            data (Any): The data to insert.
+
+        Complexity:
+            O(log N) amortized
+        """
+        size = len(self._index_store)
+        if index < 0:
+            index = max(index + size, 0)
+        if index >= size:
+            return self.append(data)
+        if index == 0:
+            return self.prepend(data)
+        # current : left-node <=> right-node
+        # new : left-node <=> . <=> right-node
+        right_node: LinkedListNode = self._index_store[index]
+        left_node: LinkedListNode = right_node.left
+        new_node: LinkedListNode = LinkedListNode(data, metadata=Metadata(indexation=Index()))
+        self._joint(left_node, new_node)
+        self._joint(new_node, right_node)
+        self._index_store.add(new_node, left_node, right_node)
+        self._tail.data += 1
     
     def sort(self):
         raise NotImplementedError('...')
@@ -426,8 +721,10 @@ class LinkedList:
         Reverses a linked list
 
         Complexity:
-            O(1)
+            O(N)
         """
+        if not len(self._index_store):
+            return
         temp = self._head._right
         while temp:
             current_node = temp
@@ -435,13 +732,11 @@ class LinkedList:
             current_node._left, current_node._right = current_node._right, current_node._left
             temp = next_node
         self._head._right, self._tail._left = self._tail._left, self._head._right
+        self._index_store.reverse()
     
     def pop(self):
         raise NotImplementedError('...')
     
-    def insert(self):
-        raise NotImplementedError('...')
-    
     def index(self):
         raise NotImplementedError('...')
     
@@ -464,8 +759,43 @@ class LinkedList:
         """
         special functionality
             - it saves the time to search the node
+
+        Raises:
+            ValueError: If `node` isn't an element of the list.
+
+        Complexity:
+            O(log N)
         """
-        raise NotImplementedError('...')
+        indexation: Optional[Index] = node.metadata.indexation
+        if indexation is None or indexation._store is not self._index_store:
+            raise ValueError('node is not an element of the list')
+        self._unlink(node)
+
+    def _unlink(self, node: LinkedListNode) -> None:
+        """Takes an element node out of the links & the index store."""
+        prev_node = node.left
+        next_node = node.right
+        if prev_node is None and next_node is None:
+            # last remaining element : back to the initial markers state
+            self._head.right = self._tail
+            self._tail.left = self._head
+            self._head.data = -1
+        else:
+            # link prev --> next
+            if prev_node:
+                prev_node.right = next_node
+            else:
+                # this means current node is first node
+                self._head.right = next_node
+            # link next <-- prev
+            if next_node:
+                next_node.left = prev_node
+            else:
+                # this means current node is last node
+                self._tail.left = prev_node
+        node.left = node.right = None
+        self._index_store.remove(node)
+        self._tail.data -= 1
     
     def _joint(self, left_node: LinkedListNode, right_node: LinkedListNode) -> None:
         """
@@ -614,44 +944,15 @@ class LinkedList:
         return not self.__eq__(other)
     
     def __delitem__(self, index: int):
+        """
+        Deletes the element at `index` , out of range indices are ignored.
 
-        _pointer = self._head._right
-        while _pointer:
-            if _pointer.metadata.indexation.from_start == index:
-                prev_node = _pointer.left
-                next_node = _pointer.right
-                # link prev --> next
-                if prev_node:
-                    prev_node.right = next_node
-                else:
-                    # this means current pointer is first node
-                    self._head.right = next_node
-                # link next <-- prev
-                if next_node:
-                    next_node.left = prev_node
-                else:
-                    # this means current pointer is last node
-                    self._tail.left = prev_node
-                # resume the pointer
-                _pointer = _pointer.right
-                break # break from here & resume in next loop --- (1)
-            _pointer = _pointer.right
-        else:
-            # if loop completes without being able to search a valid index
+        Complexity:
+            O(log N)
+        """
+        if index not in self._index_store:
             return
-        
-        # decrement the indexes of remaining nodes --- (1) resuming from prev loop break
-        while _pointer:
-            _pointer.metadata.indexation.from_start -= 1
-            self._index_store[_pointer.metadata.indexation.from_start] = _pointer
-            _pointer = _pointer.right
-        else:
-            # new last node index stored in metadata of last node
-            new_last_index = self._tail._left.metadata.indexation.from_start
-            # updating tail with last index value
-            self._tail._data = new_last_index
-            # removing the stale index entry from index_store
-            self._index_store.pop(self._tail._left.metadata.indexation.from_start+1, None)
+        self._unlink(self._index_store[index])
         
     def __contains__(self, value: Union[Any, LinkedListNode]) -> bool:
         _pointer = self._head.right
@@ -720,11 +1021,33 @@ class LinkedList:
         """
         return self._tail.data - self._head.data + 1
     
-    def __sizeof__(self):
-        # Calculate the size of all nodes
-        all_nodes_size = sys.getsizeof(self._head) + sys.getsizeof(self._tail)
-        for node in iter(self):
+    def _size_breakdown(self) -> Dict[str, int]:
+        """
+        Splits the memory footprint of the list into it's components .
+
+        Returns:
+            Dict[str, int]: size in bytes per component .
+        """
+        # Calculate the size of all nodes ( head & tail markers included )
+        nodes = [self._head, self._tail]
+        _pointer = self._head._right
+        while _pointer is not None and _pointer is not self._tail:
+            nodes.append(_pointer)
+            _pointer = _pointer._right
+        all_nodes_size = 0
+        metadata_size = 0
+        shared_metadata = set()
+        for node in nodes:
             all_nodes_size += sys.getsizeof(node)
+            # slotted nodes don't have it , subclasses without `__slots__` do
+            if hasattr(node, '__dict__'):
+                all_nodes_size += sys.getsizeof(node.__dict__)
+            # the default metadata is shared , count every object once
+            if id(node._metadata) not in shared_metadata:
+                shared_metadata.add(id(node._metadata))
+                metadata_size += sys.getsizeof(node._metadata)
+                if node._metadata.indexation is not None:
+                    metadata_size += sys.getsizeof(node._metadata.indexation)
 
         # Calculate the size of the idex store
         index_store_size = sys.getsizeof(self._index_store)
@@ -734,44 +1057,46 @@ class LinkedList:
         
         # Add the size of the object itself (base object size)
         # This is typically the size of an empty instance of the class
-        base_object_size = super().__sizeof__() 
+        base_object_size = super().__sizeof__()
 
-        return base_object_size + iterator_class_ref_size + index_store_size + all_nodes_size
+        return {
+            'base_object_size': base_object_size,
+            'iterator_class_ref_size': iterator_class_ref_size,
+            'index_store_size': index_store_size,
+            'all_nodes_size': all_nodes_size,
+            'metadata_size': metadata_size,
+        }
+
+    def __sizeof__(self):
+        return sum(self._size_breakdown().values())
     
     def print_detailed_size_information(self):
-        # Calculate the size of all nodes
-        all_nodes_size = sys.getsizeof(self._head) + sys.getsizeof(self._tail)
-        for node in iter(self):
-            all_nodes_size += sys.getsizeof(node)
-
-        # Calculate the size of the idex store
-        index_store_size = sys.getsizeof(self._index_store)
-
-        # Calculate the size of the iterator class reference
-        iterator_class_ref_size = sys.getsizeof(self.root_iterator_cls)
-        
-        # Add the size of the object itself (base object size)
-        # This is typically the size of an empty instance of the class
-        base_object_size = super().__sizeof__()
-        
-        total = base_object_size + iterator_class_ref_size + index_store_size + all_nodes_size
-        percent = lambda field: field/total*100 
-        cols = ['base_object_size', 'iterator_class_ref_size', 'index_store_size', 'all_nodes_size']
+        sizes = self._size_breakdown()
+        total = sum(sizes.values())
+        percent = lambda field: field/total*100
+        cols = list(sizes) + ['unit']
         data = [
             cols,
-            [locals()[v_name] for v_name in cols] + ['bytes'],
-            [percent(locals()[v_name]) for v_name in cols] + ['%']
+            [sizes[v_name] for v_name in sizes] + ['bytes'],
+            [percent(sizes[v_name]) for v_name in sizes] + ['%']
         ]
 
         # Using f-strings (Python 3.6+)
-        header = f"| {data[0][0]:<10} | {data[0][1]:^5} | {data[0][2]:>10} | {data[0][3]:>10} |"
+        widths = [max(len(col), 6) for col in cols]
+        header = "| " + " | ".join(f"{col:^{width}}" for col, width in zip(cols, widths)) + " |"
         print("-" * len(header))
         print(header)
         print("-" * len(header))
         for row in data[1:]:
-            print(f"| {row[0]:^16.2f} | {row[1]:^23.2f} | {row[2]:^16.2f} | {row[3]:^14.2f} | {row[4]:^16} | ")
+            cells = [f"{value:^{width}.2f}" for value, width in zip(row[:-1], widths)]
+            print("| " + " | ".join(cells + [f"{row[-1]:^{widths[-1]}}"]) + " |")
         print("-" * len(header))
         print(f"* Total Size : {total}")
+        # markers are not elements , an empty list still has them
+        elements = len(self._index_store)
+        if elements:
+            per_element = sizes['all_nodes_size'] + sizes['metadata_size'] + sizes['index_store_size']
+            print(f"* Bytes per Element : {per_element/elements:.2f}")
         print("\n")
     
     def __reversed__(self):
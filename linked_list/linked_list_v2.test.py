@@ -0,0 +1,136 @@
+"""
+Unit Tests for linked_list_v2.py
+
+This module checks that the positions read off the Fenwick index store
+stay right after edits anywhere in the list .
+"""
+
+import random
+import unittest
+import linked_list
+from linked_list_v2 import (
+    FenwickIndexStore,
+    LinkedList,
+    Operations,
+)
+
+
+class TestFenwickLinkedList(unittest.TestCase):
+    """Test cases for the Fenwick indexed LinkedList"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ll = LinkedList()
+
+    def assertPositions(self, ll: LinkedList, expected: list):
+        """Checks the data , `ll[i]` & both positions of every node"""
+        self.assertEqual([node.data for node in ll], expected)
+        self.assertEqual([ll[i].data for i in range(len(ll.index_store))], expected)
+        self.assertEqual(
+            [(node.metadata.indexation.from_start, node.metadata.indexation.from_end) for node in ll],
+            [(i, len(expected) - 1 - i) for i in range(len(expected))],
+        )
+
+    def test_empty_list_matches_v1(self):
+        """Test the marker semantics of an empty list"""
+        v1 = linked_list.LinkedList()
+        self.assertEqual(len(self.ll), len(v1))
+        self.assertEqual(str(self.ll), str(v1))
+        self.assertIsInstance(self.ll.index_store, FenwickIndexStore)
+        self.assertEqual(len(self.ll.index_store), 0)
+        with self.assertRaises(KeyError):
+            self.ll[0]
+
+    def test_prepend_renumbers_nothing(self):
+        """Test a held node reads it's new position after prepends"""
+        self.ll.append(1)
+        node = self.ll[0]
+        for value in range(100):
+            self.ll.prepend(value)
+        self.assertEqual(node.metadata.indexation.from_start, 100)
+        self.assertEqual(node.metadata.indexation.from_end, 0)
+        self.assertPositions(self.ll, list(range(99, -1, -1)) + [1])
+
+    def test_insert(self):
+        """Test insert at the ends , in the middle & out of range"""
+        self.ll.insert(0, 'b')
+        self.ll.insert(5, 'd')
+        self.ll.insert(1, 'c')
+        self.ll.insert(-10, 'a')
+        self.ll.insert(-1, 'x')
+        self.assertPositions(self.ll, ['a', 'b', 'c', 'x', 'd'])
+
+    def test_same_gap_keeps_relabeling(self):
+        """Test inserts hammering the same gap close it & get relabeled"""
+        for value in range(10):
+            self.ll.append(value)
+        expected = list(range(10))
+        for value in range(200):
+            self.ll.insert(5, value)
+            expected.insert(5, value)
+        self.assertPositions(self.ll, expected)
+
+    def test_delete(self):
+        """Test `del ll[i]` & `delete(node)` , the removed node has no position"""
+        for value in range(6):
+            self.ll.append(value)
+        node = self.ll[2]
+        del self.ll[2]
+        del self.ll[10]
+        self.assertIsNone(node.metadata.indexation.from_start)
+        self.assertIsNone(node.metadata.indexation.from_end)
+        self.ll.delete(self.ll[0])
+        self.assertPositions(self.ll, [1, 3, 4, 5])
+        with self.assertRaises(ValueError):
+            self.ll.delete(node)
+        with self.assertRaises(ValueError):
+            Operations.ll_from([1]).delete(self.ll[0])
+        for _ in range(4):
+            self.ll.delete(self.ll[len(self.ll.index_store) - 1])
+        self.assertEqual(str(self.ll), str(linked_list.LinkedList()))
+        self.ll.append(7)
+        self.assertPositions(self.ll, [7])
+
+    def test_reverse(self):
+        """Test positions follow a reverse"""
+        self.ll.reverse()
+        self.assertEqual(str(self.ll), str(linked_list.LinkedList()))
+        ll = Operations.ll_from(range(5))
+        ll.reverse()
+        self.assertPositions(ll, [4, 3, 2, 1, 0])
+        ll.prepend(5)
+        ll.append(-1)
+        self.assertPositions(ll, [5, 4, 3, 2, 1, 0, -1])
+
+    def test_matches_list_under_random_operations(self):
+        """Test random edits against a python list"""
+        rng = random.Random(20)
+        expected = []
+        for step in range(3000):
+            op = rng.random()
+            if op < 0.25:
+                self.ll.append(step)
+                expected.append(step)
+            elif op < 0.45:
+                self.ll.prepend(step)
+                expected.insert(0, step)
+            elif op < 0.7:
+                index = rng.randrange(len(expected) + 1)
+                self.ll.insert(index, step)
+                expected.insert(index, step)
+            elif op < 0.95 and expected:
+                index = rng.randrange(len(expected))
+                if op < 0.85:
+                    del self.ll[index]
+                else:
+                    self.ll.delete(self.ll[index])
+                del expected[index]
+            elif expected:
+                self.ll.reverse()
+                expected.reverse()
+        self.assertPositions(self.ll, expected)
+        self.assertEqual(len(self.ll), len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ Tests
     python3 -m doctest -v palindrome.py
 """
 from linked_list import LinkedList, Operations
+from linked_list_singly import SinglyLinkedList
 from functools import singledispatch
 
 def digits_reversed(number):
@@ -25,13 +26,16 @@ def digits(number):
     """
     Fetching Digits in original order
     Complexity : O(N+M) => O(N)
+        - each digit is pushed in front of a singly linked list ,
+          which then reads left to right ( no left links , no reversed walk )
 
     >>> print([d for d in digits(123456789)])
     [1, 2, 3, 4, 5, 6, 7, 8, 9]
     """
-    all_digits: LinkedList = Operations.ll_from(digits_reversed(number))
-    for digit in reversed(all_digits):
-        yield digit.data
+    all_digits: SinglyLinkedList = SinglyLinkedList()
+    for digit in digits_reversed(number):
+        all_digits.prepend(digit)
+    yield from all_digits.values()
 
 def two_pointer_loop(container, logic):
     """